@@ -6,9 +6,10 @@ import pytz
 from erm import is_management, is_staff, is_admin
 from utils.advanced import FakeMessage
 from utils.constants import BLANK_COLOR, GREEN_COLOR
-from menus import ManageActions, CounterButton, ViewVotersButton
+from utils.view_registry import get_view
 from discord import app_commands
 from utils.autocompletes import action_autocomplete
+from utils.internal_events import ShiftEvent
 from utils.paginators import CustomPage, SelectPagination
 from utils.utils import get_prefix, interpret_content, interpret_embed, log_command_usage
 
@@ -60,7 +61,7 @@ class Actions(commands.Cog):
 
         embeds.append(current_embed)
 
-        view = ManageActions(self.bot, ctx.author.id)
+        view = get_view("ManageActions")(self.bot, ctx.author.id)
         if len(embeds) > 9:
             paginator = SelectPagination(
                 self.bot, ctx.author.id, [CustomPage(
@@ -260,8 +261,8 @@ class Actions(commands.Cog):
         view = discord.ui.View()
         for item in selected.get("buttons", []):
             if item["label"] == "0" and "row" in item:
-                counter_button = CounterButton(row=item["row"])
-                view_voters_button = ViewVotersButton(
+                counter_button = get_view("CounterButton")(row=item["row"])
+                view_voters_button = get_view("ViewVotersButton")(
                     row=item["row"], counter_button=counter_button
                 )
                 view.add_item(counter_button)
@@ -309,18 +310,11 @@ class Actions(commands.Cog):
     async def pause_reminder(bot, guild_id: int, context, reminder_name: str):
         reminder_data = await bot.reminders.find_by_id(guild_id) or []
 
-        for index, item in enumerate(reminder_data["reminders"]):
+        for item in reminder_data["reminders"]:
             if item["name"] == reminder_name:
-                if item.get("paused") is True:
-                    item["paused"] = False
-                    reminder_data["reminders"][index] = item
-                    await bot.reminders.upsert(reminder_data)
-                    return 0
-                else:
-                    item["paused"] = True
-                    reminder_data["reminders"][index] = item
-                    await bot.reminders.upsert(reminder_data)
-                    return 0
+                item["paused"] = item.get("paused") is not True
+                await bot.reminders.update_reminder(guild_id, item)
+                return 0
 
         return 1
 
@@ -332,17 +326,14 @@ class Actions(commands.Cog):
                 {"Guild": guild_id, "EndEpoch": 0}
             )
         ]
+        settings = await bot.settings.find_by_id(guild_id) if docs else None
         for item in docs:
             id = item["_id"]
+            item["EndEpoch"] = int(datetime.datetime.now(tz=pytz.UTC).timestamp())
             await bot.shift_management.shifts.db.update_one(
-                {"_id": id},
-                {
-                    "$set": {
-                        "EndEpoch": int(datetime.datetime.now(tz=pytz.UTC).timestamp())
-                    }
-                },
+                {"_id": id}, {"$set": {"EndEpoch": item["EndEpoch"]}}
             )
-            bot.dispatch("shift_end", id)
+            bot.dispatch("shift_end", ShiftEvent(document=item, settings=settings))
             if context.verbose:
                 await context.send(item)
         return 0
@@ -5,7 +5,7 @@ import pytz
 from discord import app_commands
 from discord.ext import commands
 import typing
-from menus import CustomExecutionButton
+from utils.view_registry import get_view
 from utils.constants import BLANK_COLOR, GREEN_COLOR, RED_COLOR
 from erm import is_management
 from utils.paginators import SelectPagination, CustomPage
@@ -224,7 +224,7 @@ class ActivityMonitoring(commands.Cog):
                 embed=embeds[0], view=paginator, ephemeral=True
             )
 
-        button = CustomExecutionButton(
+        button = get_view("CustomExecutionButton")(
             ctx.author.id,
             "View LOAs",
             style=discord.ButtonStyle.secondary,
@@ -8,14 +8,7 @@ from discord.ext import commands
 from reactionmenu import ViewButton, ViewMenu
 
 from erm import is_management, is_admin, system_code_gen, is_staff
-from menus import (
-    ActivityNoticeModification,
-    CustomModalView,
-    CustomSelectMenu,
-    LOAMenu,
-    YesNoColourMenu,
-    ActivityNoticeAdministration,
-)
+from utils.view_registry import get_view
 from utils.constants import BLANK_COLOR, GREEN_COLOR
 from utils.paginators import CustomPage, SelectPagination
 from utils.timestamp import td_format
@@ -115,7 +108,7 @@ class ActivityCoreCommands:
             ),
         )
 
-        view = LOAMenu(
+        view = get_view("LOAMenu")(
             self.bot,
             management_roles,
             loa_roles,
@@ -199,7 +192,7 @@ class ActivityCoreCommands:
             }
         )
 
-        view = ActivityNoticeAdministration(
+        view = get_view("ActivityNoticeAdministration")(
             self.bot,
             ctx.author.id,
             victim=victim.id,
@@ -453,6 +446,7 @@ class ActivityCoreCommands:
             await self.bot.loas.db.update_one(
                 {"_id": current_notice["_id"]}, {"$set": {"expiry": new_expiry}}
             )
+            self.bot.loas.schedule_expiry({**current_notice, "expiry": new_expiry})
 
             return await respond(
                 embed=discord.Embed(
@@ -8,29 +8,7 @@ from copy import deepcopy
 
 from erm import check_privacy, generator, is_management
 from utils.constants import blank_color, BLANK_COLOR
-from menus import (
-    ChannelSelect,
-    CustomSelectMenu,
-    ERLCIntegrationConfiguration,
-    RoleSelect,
-    YesNoColourMenu,
-    NextView,
-    BasicConfiguration,
-    LOAConfiguration,
-    ShiftConfiguration,
-    RAConfiguration,
-    PunishmentsConfiguration,
-    GameSecurityConfiguration,
-    GameLoggingConfiguration,
-    AntipingConfiguration,
-    ActivityNoticeManagement,
-    PunishmentManagement,
-    ShiftLoggingManagement,
-    ERMCommandLog,
-    WhitelistVehiclesManagement,
-    PriorityRequestConfiguration,
-)
-from ui.MapleCounty import MapleCountyConfiguration
+from utils.view_registry import get_view
 from utils.paginators import CustomPage, SelectPagination
 from utils.utils import require_settings, generator, log_command_usage
 
@@ -67,7 +45,7 @@ class Configuration(commands.Cog):
                     description="You've already setup ERM in this server! Are you sure you would like to go through the setup process again?",
                     color=blank_color,
                 ),
-                view=(confirmation_view := YesNoColourMenu(ctx.author.id)),
+                view=(confirmation_view := get_view("YesNoColourMenu")(ctx.author.id)),
             )
             timeout = await confirmation_view.wait()
             if confirmation_view.value is False:
@@ -87,7 +65,7 @@ class Configuration(commands.Cog):
                     description="To setup ERM, press the arrow button below!",
                     color=blank_color,
                 ),
-                view=(next_view := NextView(bot, ctx.author.id)),
+                view=(next_view := get_view("NextView")(bot, ctx.author.id)),
             )
         else:
             await msg.edit(
@@ -96,7 +74,7 @@ class Configuration(commands.Cog):
                     description="To setup ERM, press the arrow button below!",
                     color=blank_color,
                 ),
-                view=(next_view := NextView(bot, ctx.author.id)),
+                view=(next_view := get_view("NextView")(bot, ctx.author.id)),
             )
 
         timeout = await next_view.wait()
@@ -177,29 +155,29 @@ class Configuration(commands.Cog):
             await interaction.response.defer()
 
         basic_settings = discord.ui.View()
-        next_button = NextView(bot, ctx.author.id).children[0]
+        next_button = get_view("NextView")(bot, ctx.author.id).children[0]
         next_button.row = 4
         next_button.disabled = True
 
-        staff_roles = RoleSelect(ctx.author.id).children[0]
+        staff_roles = get_view("RoleSelect")(ctx.author.id).children[0]
         staff_roles.row = 0
         staff_roles.placeholder = "Staff Roles"
         staff_roles.callback = check_unlock_override
         staff_roles.min_values = 0
 
-        admin_roles = RoleSelect(ctx.author.id).children[0]
+        admin_roles = get_view("RoleSelect")(ctx.author.id).children[0]
         admin_roles.row = 1
         admin_roles.placeholder = "Admin Roles"
         admin_roles.callback = discard_unlock_override
         admin_roles.min_values = 0
 
-        management_roles = RoleSelect(ctx.author.id).children[0]
+        management_roles = get_view("RoleSelect")(ctx.author.id).children[0]
         management_roles.row = 2
         management_roles.placeholder = "Management Roles"
         management_roles.callback = check_unlock_override
         management_roles.min_values = 0
 
-        prefix_view = CustomSelectMenu(
+        prefix_view = get_view("CustomSelectMenu")(
             ctx.author.id,
             [
                 discord.SelectOption(
@@ -275,17 +253,17 @@ class Configuration(commands.Cog):
 
         loa_requests_settings = discord.ui.View()
 
-        loa_channel_view = ChannelSelect(ctx.author.id, limit=1)
+        loa_channel_view = get_view("ChannelSelect")(ctx.author.id, limit=1)
         loa_channel_select = loa_channel_view.children[0]
         loa_channel_select.placeholder = "LOA Channel"
         loa_channel_select.row = 1
 
-        loa_role_view = RoleSelect(ctx.author.id, limit=1)
+        loa_role_view = get_view("RoleSelect")(ctx.author.id, limit=1)
         loa_role_select = loa_role_view.children[0]
         loa_role_select.placeholder = "LOA Role"
         loa_role_select.row = 2
 
-        loa_enabled_view = CustomSelectMenu(
+        loa_enabled_view = get_view("CustomSelectMenu")(
             ctx.author.id,
             [
                 discord.SelectOption(
@@ -305,7 +283,7 @@ class Configuration(commands.Cog):
         loa_enabled_select.row = 0
         loa_enabled_select.placeholder = "LOA Requests"
 
-        next_view = NextView(bot, ctx.author.id)
+        next_view = get_view("NextView")(bot, ctx.author.id)
         next_button = next_view.children[0]
         next_button.callback = stop_override
         next_button.row = 4
@@ -354,13 +332,13 @@ class Configuration(commands.Cog):
 
         ra_requests_settings = discord.ui.View()
 
-        ra_role_view = RoleSelect(ctx.author.id, limit=1)
+        ra_role_view = get_view("RoleSelect")(ctx.author.id, limit=1)
         ra_role_select = ra_role_view.children[0]
         ra_role_select.placeholder = "RA Role"
         ra_role_select.row = 2
         ra_role_select.min_values = 0
 
-        next_view = NextView(bot, ctx.author.id)
+        next_view = get_view("NextView")(bot, ctx.author.id)
         next_button = next_view.children[0]
         next_button.callback = stop_override
         next_button.row = 4
@@ -393,12 +371,12 @@ class Configuration(commands.Cog):
 
         punishment_settings = discord.ui.View()
 
-        next_view = NextView(bot, ctx.author.id)
+        next_view = get_view("NextView")(bot, ctx.author.id)
         next_button = next_view.children[0]
         next_button.callback = stop_override
         next_button.row = 4
 
-        punishment_channel_view = ChannelSelect(ctx.author.id, limit=1)
+        punishment_channel_view = get_view("ChannelSelect")(ctx.author.id, limit=1)
         punishment_channel_select: discord.ui.ChannelSelect = (
             punishment_channel_view.children[0]
         )
@@ -406,7 +384,7 @@ class Configuration(commands.Cog):
         punishment_channel_select.placeholder = "Punishments Channel"
         punishment_channel_select.row = 1
 
-        punishments_enabled_view = CustomSelectMenu(
+        punishments_enabled_view = get_view("CustomSelectMenu")(
             ctx.author.id,
             [
                 discord.SelectOption(
@@ -464,7 +442,7 @@ class Configuration(commands.Cog):
 
         shift_management_settings = discord.ui.View()
 
-        shift_enabled_view = CustomSelectMenu(
+        shift_enabled_view = get_view("CustomSelectMenu")(
             ctx.author.id,
             [
                 discord.SelectOption(
@@ -484,19 +462,19 @@ class Configuration(commands.Cog):
         shift_enabled_select.row = 0
         shift_enabled_select.callback = callback_override
 
-        shift_channel_view = ChannelSelect(ctx.author.id, limit=1)
+        shift_channel_view = get_view("ChannelSelect")(ctx.author.id, limit=1)
         shift_channel_select = shift_channel_view.children[0]
         shift_channel_select.row = 1
         shift_channel_select.placeholder = "Shift Channel"
         shift_channel_select.min_values = 0
 
-        shift_role_view = RoleSelect(ctx.author.id, limit=5)
+        shift_role_view = get_view("RoleSelect")(ctx.author.id, limit=5)
         shift_role_select = shift_role_view.children[0]
         shift_role_select.row = 2
         shift_role_select.placeholder = "On-Duty Role"
         shift_channel_select.min_values = 0
 
-        next_menu = NextView(bot, ctx.author.id)
+        next_menu = get_view("NextView")(bot, ctx.author.id)
         next_button = next_menu.children[0]
         next_button.disabled = False
         next_button.callback = stop_override
@@ -572,7 +550,7 @@ class Configuration(commands.Cog):
 
         await log_command_usage(self.bot, ctx.guild, ctx.author, f"Config")
 
-        basic_settings_view = BasicConfiguration(
+        basic_settings_view = get_view("BasicConfiguration")(
             bot,
             ctx.author.id,
             [
@@ -624,7 +602,7 @@ class Configuration(commands.Cog):
         else:
             loa_roles = [0]
 
-        loa_configuration_view = LOAConfiguration(
+        loa_configuration_view = get_view("LOAConfiguration")(
             bot,
             ctx.author.id,
             [
@@ -653,7 +631,7 @@ class Configuration(commands.Cog):
             ],
         )
 
-        shift_management_view = ShiftConfiguration(
+        shift_management_view = get_view("ShiftConfiguration")(
             bot,
             ctx.author.id,
             [
@@ -696,9 +674,9 @@ class Configuration(commands.Cog):
         else:
             ra_roles = [0]
 
-        ra_view = RAConfiguration(bot, ctx.author.id, [("RA Role", ra_roles)])
+        ra_view = get_view("RAConfiguration")(bot, ctx.author.id, [("RA Role", ra_roles)])
 
-        roblox_punishments = PunishmentsConfiguration(
+        roblox_punishments = get_view("PunishmentsConfiguration")(
             bot,
             ctx.author.id,
             [
@@ -726,7 +704,7 @@ class Configuration(commands.Cog):
             ],
         )
 
-        security_view = GameSecurityConfiguration(
+        security_view = get_view("GameSecurityConfiguration")(
             bot,
             ctx.author.id,
             [
@@ -781,7 +759,7 @@ class Configuration(commands.Cog):
             ],
         )
 
-        logging_view = GameLoggingConfiguration(
+        logging_view = get_view("GameLoggingConfiguration")(
             bot,
             ctx.author.id,
             [
@@ -830,7 +808,7 @@ class Configuration(commands.Cog):
             ],
         )
 
-        antiping_view = AntipingConfiguration(
+        antiping_view = get_view("AntipingConfiguration")(
             bot,
             ctx.author.id,
             [
@@ -876,7 +854,7 @@ class Configuration(commands.Cog):
             ],
         )
 
-        erlc_view = ERLCIntegrationConfiguration(
+        erlc_view = get_view("ERLCIntegrationConfiguration")(
             bot,
             ctx.author.id,
             [
@@ -925,7 +903,7 @@ class Configuration(commands.Cog):
             ],
         )
 
-        erm_command_log_view = ERMCommandLog(
+        erm_command_log_view = get_view("ERMCommandLog")(
             bot,
             ctx.author.id,
             [
@@ -950,7 +928,7 @@ class Configuration(commands.Cog):
             {"guild_id": str(ctx.guild.id)}
         )
 
-        priority_requests = PriorityRequestConfiguration(
+        priority_requests = get_view("PriorityRequestConfiguration")(
             bot,
             ctx.author.id,
             [
@@ -985,7 +963,7 @@ class Configuration(commands.Cog):
             ],
         )
 
-        maple_county_configuration = MapleCountyConfiguration(
+        maple_county_configuration = get_view("MapleCountyConfiguration")(
             bot,
             ctx.author.id,
             settings.get("MC", {})
@@ -1205,9 +1183,9 @@ class Configuration(commands.Cog):
         ]
         views = [
             discord.ui.View(),
-            ActivityNoticeManagement(self.bot, ctx.author.id),
-            PunishmentManagement(self.bot, ctx.author.id),
-            ShiftLoggingManagement(self.bot, ctx.author.id),
+            get_view("ActivityNoticeManagement")(self.bot, ctx.author.id),
+            get_view("PunishmentManagement")(self.bot, ctx.author.id),
+            get_view("ShiftLoggingManagement")(self.bot, ctx.author.id),
         ]
 
         paginator = SelectPagination(
@@ -5,20 +5,9 @@ from discord.ext import commands
 from erm import is_management, is_admin
 from utils.constants import BLANK_COLOR, GREEN_COLOR
 from utils.utils import generator
-from menus import (
-    ChannelSelect,
-    CustomModalView,
-    CustomSelectMenu,
-    EmbedCustomisation,
-    MessageCustomisation,
-    RemoveCustomCommand,
-    YesNoColourMenu,
-    CustomCommandOptionSelect,
-    CustomCommandModification,
-    CounterButton,
-    ViewVotersButton,
-)
+from utils.view_registry import get_view
 from utils.autocompletes import command_autocomplete
+from utils.templates import TemplateRenderer
 from utils.utils import (
     interpret_content,
     interpret_embed,
@@ -82,7 +71,7 @@ class CustomCommands(commands.Cog):
 
         embeds.append(current_embed)
 
-        view = CustomCommandOptionSelect(ctx.author.id)
+        view = get_view("CustomCommandOptionSelect")(ctx.author.id)
 
         new_msg = await ctx.reply(
             embeds=embeds,
@@ -101,7 +90,7 @@ class CustomCommands(commands.Cog):
                 "message": None,
                 "author": ctx.author.id,
             }
-            view = CustomCommandModification(ctx.author.id, data)
+            view = get_view("CustomCommandModification")(ctx.author.id, data)
             # timeout = await view.wait()
             # if timeout:
             #     return
@@ -207,7 +196,7 @@ class CustomCommands(commands.Cog):
                     )
                 )
                 return
-            view = CustomCommandModification(ctx.author.id, data)
+            view = get_view("CustomCommandModification")(ctx.author.id, data)
             await new_msg.edit(
                 view=view,
                 embed=discord.Embed(
@@ -318,11 +307,16 @@ class CustomCommands(commands.Cog):
         elif channel is None:
             channel = ctx.channel
 
+        # One renderer for the whole message, so each data source
+        # is only fetched once across the content and all embeds.
+        renderer = TemplateRenderer(bot, ctx, channel)
         embeds = []
         if selected["message"]["embeds"] is not None:
             for embed in selected["message"]["embeds"]:
                 embeds.append(
-                    await interpret_embed(bot, ctx, channel, embed, selected["id"])
+                    await interpret_embed(
+                        bot, ctx, channel, embed, selected["id"], renderer=renderer
+                    )
                 )
         elif selected["message"]["embeds"] is None:
             pass
@@ -330,8 +324,8 @@ class CustomCommands(commands.Cog):
         view = discord.ui.View()
         for item in selected.get("buttons", []):
             if item["label"] == "0" and "row" in item:
-                counter_button = CounterButton(row=item["row"])
-                view_voters_button = ViewVotersButton(
+                counter_button = get_view("CounterButton")(row=item["row"])
+                view_voters_button = get_view("ViewVotersButton")(
                     row=item["row"], counter_button=counter_button
                 )
                 view.add_item(counter_button)
@@ -367,7 +361,12 @@ class CustomCommands(commands.Cog):
             )
             msg = await channel.send(
                 content=await interpret_content(
-                    bot, ctx, channel, selected["message"]["content"], selected["id"]
+                    bot,
+                    ctx,
+                    channel,
+                    selected["message"]["content"],
+                    selected["id"],
+                    renderer=renderer,
                 ),
                 embeds=embeds,
                 view=view,
@@ -409,7 +408,12 @@ class CustomCommands(commands.Cog):
 
             msg = await channel.send(
                 content=await interpret_content(
-                    bot, ctx, channel, selected["message"]["content"], selected["id"]
+                    bot,
+                    ctx,
+                    channel,
+                    selected["message"]["content"],
+                    selected["id"],
+                    renderer=renderer,
                 ),
                 embeds=embeds,
                 view=view,
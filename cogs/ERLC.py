@@ -12,7 +12,7 @@ import logging
 from typing import List
 from erm import admin_check, is_staff, is_management, management_predicate
 from utils.paginators import CustomPage, SelectPagination
-from menus import CustomModal, ReloadView, RefreshConfirmation, RiskyUsersMenu, CustomExecutionButton
+from utils.view_registry import get_view
 import copy
 from utils.constants import *
 from utils.prc_api import (
@@ -166,7 +166,7 @@ class ERLC(commands.Cog):
             )
 
             if msg is None:
-                view = ReloadView(
+                view = get_view("ReloadView")(
                     self.bot,
                     ctx.author.id,
                     operate_and_reload_serverinfo,
@@ -210,7 +210,7 @@ class ERLC(commands.Cog):
             embed.set_author(name=ctx.guild.name, icon_url=ctx.guild.icon)
 
             if msg is None:
-                view = ReloadView(
+                view = get_view("ReloadView")(
                     self.bot,
                     ctx.author.id,
                     operate_and_reload_commandlogs,
@@ -564,7 +564,7 @@ class ERLC(commands.Cog):
             if ctx.author != interaction.user:
                 return
 
-            modal = CustomModal(
+            modal = get_view("CustomModal")(
                 f"Teleport To Player",
                 [
                     (
@@ -616,7 +616,7 @@ class ERLC(commands.Cog):
             if ctx.author != interaction.user:
                 return
             
-            modal = CustomModal(
+            modal = get_view("CustomModal")(
                 f"PM Player",
                 [
                     (
@@ -758,21 +758,21 @@ class ERLC(commands.Cog):
                 section.add_item("### Vehicle Information\n> No active vehicle found for this player.")
 
             log_actions = discord.ui.ActionRow(
-                CustomExecutionButton(ctx.author.id, label="View Kills", style=discord.ButtonStyle.gray, func=view_kills_callback),
-                CustomExecutionButton(ctx.author.id, label="View Commands", style=discord.ButtonStyle.gray, func=view_commands_callback),
-                CustomExecutionButton(ctx.author.id, label="View Modcalls", style=discord.ButtonStyle.gray, func=view_modcalls_callback),
+                get_view("CustomExecutionButton")(ctx.author.id, label="View Kills", style=discord.ButtonStyle.gray, func=view_kills_callback),
+                get_view("CustomExecutionButton")(ctx.author.id, label="View Commands", style=discord.ButtonStyle.gray, func=view_commands_callback),
+                get_view("CustomExecutionButton")(ctx.author.id, label="View Modcalls", style=discord.ButtonStyle.gray, func=view_modcalls_callback),
             )
 
             active_actions = discord.ui.ActionRow(
-                CustomExecutionButton(ctx.author.id, label="Refresh Player", style=discord.ButtonStyle.gray, disabled=disable_online_buttons, func=refresh_player_callback),
-                CustomExecutionButton(ctx.author.id, label="Respawn Player", style=discord.ButtonStyle.gray, disabled=disable_online_buttons, func=respawn_player_callback),
-                CustomExecutionButton(ctx.author.id, label="PM Player", style=discord.ButtonStyle.gray, disabled=disable_online_buttons, func=pm_player_callback),
-                CustomExecutionButton(ctx.author.id, label="Teleport To Player", style=discord.ButtonStyle.gray, disabled=disable_online_buttons, func=teleport_to_callback),
+                get_view("CustomExecutionButton")(ctx.author.id, label="Refresh Player", style=discord.ButtonStyle.gray, disabled=disable_online_buttons, func=refresh_player_callback),
+                get_view("CustomExecutionButton")(ctx.author.id, label="Respawn Player", style=discord.ButtonStyle.gray, disabled=disable_online_buttons, func=respawn_player_callback),
+                get_view("CustomExecutionButton")(ctx.author.id, label="PM Player", style=discord.ButtonStyle.gray, disabled=disable_online_buttons, func=pm_player_callback),
+                get_view("CustomExecutionButton")(ctx.author.id, label="Teleport To Player", style=discord.ButtonStyle.gray, disabled=disable_online_buttons, func=teleport_to_callback),
             )
 
             destructive_actions = discord.ui.ActionRow(
-                CustomExecutionButton(ctx.author.id, label="Kick Player", style=discord.ButtonStyle.red, disabled=disable_online_buttons, func=kick_player_callback),
-                CustomExecutionButton(ctx.author.id, label="Ban Player", style=discord.ButtonStyle.red, func=ban_player_callback), # bans can be done offline
+                get_view("CustomExecutionButton")(ctx.author.id, label="Kick Player", style=discord.ButtonStyle.red, disabled=disable_online_buttons, func=kick_player_callback),
+                get_view("CustomExecutionButton")(ctx.author.id, label="Ban Player", style=discord.ButtonStyle.red, func=ban_player_callback), # bans can be done offline
             )
 
         class TestView(discord.ui.LayoutView):
@@ -1044,7 +1044,7 @@ class ERLC(commands.Cog):
     @is_server_linked()
     async def server_unlink(self, ctx: commands.Context):
         await log_command_usage(self.bot, ctx.guild, ctx.author, f"ER:LC Unlink")
-        await self.bot.server_keys.delete_one({"_id": ctx.guild.id})
+        await self.bot.server_keys.delete_by_id(ctx.guild.id)
         await ctx.send(
             embed=discord.Embed(
                 title=f"{self.bot.emoji_controller.get_emoji('success')} Successfully Unlinked",
@@ -1185,7 +1185,7 @@ class ERLC(commands.Cog):
             )
 
             if msg is None:
-                view = ReloadView(
+                view = get_view("ReloadView")(
                     self.bot,
                     ctx.author.id,
                     operate_and_reload_serverinfo,
@@ -1276,7 +1276,7 @@ class ERLC(commands.Cog):
             # embed.set_footer(icon_url="https://cdn.discordapp.com/emojis/1176999148084535326.webp?size=128&quality=lossless",
             #                   text="Last updated 5 seconds ago")
             if msg is None:
-                view = ReloadView(
+                view = get_view("ReloadView")(
                     self.bot, ctx.author.id, operate_and_reload_kills, [None, guild_id]
                 )
                 msg = await ctx.send(embed=embed, view=view)
@@ -1321,7 +1321,7 @@ class ERLC(commands.Cog):
             # embed.set_footer(icon_url="https://cdn.discordapp.com/emojis/1176999148084535326.webp?size=128&quality=lossless",
             #                   text="Last updated 5 seconds ago")
             if msg is None:
-                view = ReloadView(
+                view = get_view("ReloadView")(
                     self.bot,
                     ctx.author.id,
                     operate_and_reload_playerlogs,
@@ -1367,7 +1367,7 @@ class ERLC(commands.Cog):
             # embed.set_footer(icon_url="https://cdn.discordapp.com/emojis/1176999148084535326.webp?size=128&quality=lossless",
             #                   text="Last updated 5 seconds ago")
             if msg is None:
-                view = ReloadView(
+                view = get_view("ReloadView")(
                     self.bot,
                     ctx.author.id,
                     operate_and_reload_commandlogs,
@@ -1765,7 +1765,7 @@ class ERLC(commands.Cog):
             ),
         )
 
-        view = RefreshConfirmation(ctx.author.id)
+        view = get_view("RefreshConfirmation")(ctx.author.id)
         msg = await ctx.send(embed=embed, view=view)
         view.message = msg
 
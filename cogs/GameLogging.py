@@ -7,7 +7,7 @@ from discord import app_commands
 from discord.ext import commands
 
 from erm import is_staff, admin_predicate, management_predicate, staff_predicate
-from menus import CustomModalView, UserSelect
+from utils.view_registry import get_view
 from utils.constants import BLANK_COLOR, GREEN_COLOR
 from utils.timestamp import td_format
 from utils.utils import invis_embed, require_settings, time_converter
@@ -281,7 +281,7 @@ class GameLogging(commands.Cog):
                     color=BLANK_COLOR,
                 )
             )
-        view = UserSelect(ctx.author.id)
+        view = get_view("UserSelect")(ctx.author.id)
 
         sts_msg = await ctx.reply(
             embed=discord.Embed(
@@ -386,7 +386,7 @@ class GameLogging(commands.Cog):
                 )
             )
 
-        view = CustomModalView(
+        view = get_view("CustomModalView")(
             ctx.author.id,
             "User List",
             "User List",
@@ -1,7 +1,7 @@
 import discord
 from discord.ext import commands
 
-from menus import YesNoMenu, AccountLinkingMenu
+from utils.view_registry import get_view
 from utils.constants import BLANK_COLOR, GREEN_COLOR
 import asyncio
 import time
@@ -29,7 +29,7 @@ class OAuth2(commands.Cog):
                     description=f"You have already linked your account with `{user.name}`. Are you sure you would like to relink?",
                     color=BLANK_COLOR,
                 ),
-                view=(view := YesNoMenu(ctx.author.id)),
+                view=(view := get_view("YesNoMenu")(ctx.author.id)),
             )
             timeout = await view.wait()
             if timeout or not view.value:
@@ -49,7 +49,7 @@ class OAuth2(commands.Cog):
                 description="**To link your account with ERM, click the button below.**\nIf you encounter an error, please contact ERM Support by running `/support`.",
                 color=BLANK_COLOR,
             ),
-            "view": AccountLinkingMenu(self.bot, ctx.author, ctx.interaction),
+            "view": get_view("AccountLinkingMenu")(self.bot, ctx.author, ctx.interaction),
         }
 
         await self.bot.pending_oauth2.db.insert_one({"discord_id": ctx.author.id})
@@ -1,7 +1,7 @@
 import datetime
 import discord
 from discord.ext import commands
-from menus import CustomExecutionButton, CustomSelectMenu
+from utils.view_registry import get_view
 from utils.constants import BLANK_COLOR
 
 
@@ -64,7 +64,7 @@ class Privacy(commands.Cog):
             nonlocal punishments_enabled
             if interaction.user.id == ctx.author.id:
                 await interaction.response.defer()
-                view = CustomSelectMenu(
+                view = get_view("CustomSelectMenu")(
                     ctx.author.id,
                     [
                         discord.SelectOption(
@@ -163,7 +163,7 @@ class Privacy(commands.Cog):
                 nonlocal selected
                 nonlocal shift_reports_enabled
                 await interaction.response.defer()
-                view = CustomSelectMenu(
+                view = get_view("CustomSelectMenu")(
                     ctx.author.id,
                     [
                         discord.SelectOption(
@@ -261,7 +261,7 @@ class Privacy(commands.Cog):
                 nonlocal selected
                 nonlocal automatic_shifts_enabled
                 await interaction.response.defer()
-                view = CustomSelectMenu(
+                view = get_view("CustomSelectMenu")(
                     ctx.author.id,
                     [
                         discord.SelectOption(
@@ -353,7 +353,7 @@ class Privacy(commands.Cog):
                 )
 
         buttons = [
-            CustomExecutionButton(
+            get_view("CustomExecutionButton")(
                 ctx.author.id,
                 label="Punishment Alerts",
                 style=(
@@ -363,7 +363,7 @@ class Privacy(commands.Cog):
                 ),
                 func=punishment_alerts,
             ),
-            CustomExecutionButton(
+            get_view("CustomExecutionButton")(
                 ctx.author.id,
                 label="Shift Reports",
                 style=(
@@ -373,7 +373,7 @@ class Privacy(commands.Cog):
                 ),
                 func=shift_reports,
             ),
-            CustomExecutionButton(
+            get_view("CustomExecutionButton")(
                 ctx.author.id,
                 label="Automatic Shifts",
                 style=(
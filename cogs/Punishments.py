@@ -22,26 +22,11 @@ from erm import (
     is_staff,
     management_predicate,
 )
-from menus import (
-    ChannelSelect,
-    CustomisePunishmentType,
-    CustomModalView,
-    CustomSelectMenu,
-    EditWarning,
-    RemoveWarning,
-    RequestDataView,
-    CustomExecutionButton,
-    UserSelect,
-    YesNoMenu,
-    ManagementOptions,
-    ManageTypesView,
-    PunishmentTypeCreator,
-    PunishmentModifier,
-    CustomModal,
-)
+from utils.view_registry import get_view
 from utils.AI import AI
 from utils.autocompletes import punishment_autocomplete, user_autocomplete
 from utils.constants import BLANK_COLOR, GREEN_COLOR
+from utils.internal_events import PunishmentEvent
 from utils.paginators import SelectPagination, CustomPage
 from utils.utils import (
     admin_check,
@@ -199,7 +184,7 @@ class Punishments(commands.Cog):
                 )
             )
 
-        oid = await self.bot.punishments.insert_warning(
+        warning: WarningItem = await self.bot.punishments.create_warning(
             ctx.author.id,
             ctx.author.name,
             roblox_player.id,
@@ -216,12 +201,11 @@ class Punishments(commands.Cog):
         is_online = bool(current_shift)
         if is_online:
             await self.bot.shift_management.shifts.db.update_one(
-                {"_id": current_shift["_id"]}, {"$push": {"Moderations": oid}}
+                {"_id": current_shift["_id"]}, {"$push": {"Moderations": warning.id}}
             )
 
-        self.bot.dispatch("punishment", oid)
+        self.bot.dispatch("punishment", PunishmentEvent(warning=warning, settings=settings))
 
-        warning: WarningItem = await self.bot.punishments.fetch_warning(oid)
         newline = "\n"
         if "autoban" in flags and (await admin_predicate(ctx) or await management_predicate(ctx) or roblox_username in [i.username for i in list(filter(lambda x: x.permission != "Server Moderator", server_staff))]):
             try:
@@ -297,7 +281,7 @@ class Punishments(commands.Cog):
             color=BLANK_COLOR,
         )
         embed.set_author(name=ctx.guild.name, icon_url=ctx.guild.icon)
-        view = ManagementOptions(ctx.author.id)
+        view = get_view("ManagementOptions")(ctx.author.id)
         settings = await self.bot.settings.find_by_id(ctx.guild.id)
 
         msg = await ctx.send(embed=embed, view=view)
@@ -342,7 +326,7 @@ class Punishments(commands.Cog):
                     )
                 )
 
-            view = PunishmentModifier(self.bot, ctx.author.id, punishment)
+            view = get_view("PunishmentModifier")(self.bot, ctx.author.id, punishment)
             await view.refresh_ui(msg)
             await view.wait()
             await msg.edit(
@@ -409,7 +393,7 @@ class Punishments(commands.Cog):
                     value="There are no custom punishment types in this server.",
                     inline=False,
                 )
-            manage_types_view = ManageTypesView(self.bot, ctx.author.id)
+            manage_types_view = get_view("ManageTypesView")(self.bot, ctx.author.id)
             await msg.edit(embed=embeds[0], view=manage_types_view)
             await manage_types_view.wait()
             if manage_types_view.value == "create":
@@ -428,7 +412,7 @@ class Punishments(commands.Cog):
                     color=BLANK_COLOR,
                 )
 
-                view = PunishmentTypeCreator(ctx.author.id, data)
+                view = get_view("PunishmentTypeCreator")(ctx.author.id, data)
                 await msg.edit(view=view, embed=embed)
                 await view.wait()
                 if view.cancelled is True:
@@ -525,7 +509,7 @@ class Punishments(commands.Cog):
     async def active(self, ctx, user: str = None):
 
         async def task(interaction: discord.Interaction, _):
-            modal = CustomModal(
+            modal = get_view("CustomModal")(
                 "Mark as Complete",
                 [
                     (
@@ -601,7 +585,7 @@ class Punishments(commands.Cog):
             return
 
         async def deny_task(interaction: discord.Interaction, _):
-            modal = CustomModal(
+            modal = get_view("CustomModal")(
                 "Mark as Denied",
                 [
                     (
@@ -734,7 +718,7 @@ class Punishments(commands.Cog):
 
             view = discord.ui.View()
             view.add_item(
-                CustomExecutionButton(
+                get_view("CustomExecutionButton")(
                     ctx.author.id,
                     "Mark as Complete",
                     discord.ButtonStyle.secondary,
@@ -742,7 +726,7 @@ class Punishments(commands.Cog):
                 )
             )
             view.add_item(
-                CustomExecutionButton(
+                get_view("CustomExecutionButton")(
                     ctx.author.id,
                     "Deny BOLO",
                     discord.ButtonStyle.danger,
@@ -858,7 +842,7 @@ class Punishments(commands.Cog):
 
             view = discord.ui.View()
             view.add_item(
-                CustomExecutionButton(
+                get_view("CustomExecutionButton")(
                     ctx.author.id,
                     "Mark as Complete",
                     discord.ButtonStyle.secondary,
@@ -866,7 +850,7 @@ class Punishments(commands.Cog):
                 )
             )
             view.add_item(
-                CustomExecutionButton(
+                get_view("CustomExecutionButton")(
                     ctx.author.id,
                     "Deny BOLO",
                     discord.ButtonStyle.danger,
@@ -908,35 +892,16 @@ class Punishments(commands.Cog):
             color=BLANK_COLOR,
         )
         embed.set_author(name=ctx.guild.name, icon_url=ctx.guild.icon)
-        pipeline = [
-            {
-                "$match": {
-                    "Guild": ctx.guild.id,
-                    "Epoch": {"$gte": gt_time}
-                }
-            },
-            {
-                "$group": {
-                    "_id": {
-                        "moderator": "$ModeratorID",
-                        "guild": "$Guild"
-                    },
-                    "moderationCount": {"$sum": 1}
-                }
-            },
-            {
-                "$project": {
-                    "_id": 0,
-                    "ModeratorID": "$_id.moderator",
-                    "Guild": "$_id.guild",
-                    "ModerationCount": "$moderationCount"
-                }
-            }
-        ]
-
-        results = [i async for i in self.bot.punishments.db.aggregate(pipeline)]
+        counts = await self.bot.punishments.stats.moderator_counts(
+            ctx.guild.id, since=gt_time
+        )
         sorted_results = sorted(
-            results, key=lambda x: x["ModerationCount"], reverse=True
+            (
+                {"ModeratorID": moderator_id, "ModerationCount": count}
+                for moderator_id, count in counts.items()
+            ),
+            key=lambda x: x["ModerationCount"],
+            reverse=True,
         )
         pages = []
         for index, item in enumerate(sorted_results):
@@ -1023,7 +988,7 @@ class Punishments(commands.Cog):
         )
         thumbnail = thumbnails[0].image_url
 
-        oid = await self.bot.punishments.insert_warning(
+        warning: WarningItem = await self.bot.punishments.create_warning(
             ctx.author.id,
             ctx.author.name,
             roblox_player.id,
@@ -1034,10 +999,8 @@ class Punishments(commands.Cog):
             datetime.datetime.now(tz=pytz.UTC).timestamp(),
             datetime.datetime.now(tz=pytz.UTC).timestamp() + amount,
         )
+        self.bot.dispatch("punishment", PunishmentEvent(warning=warning))
 
-        self.bot.dispatch("punishment", oid)
-
-        warning: WarningItem = await self.bot.punishments.fetch_warning(oid)
         newline = "\n"
         await ctx.send(
             embed=discord.Embed(
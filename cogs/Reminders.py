@@ -2,11 +2,7 @@ import datetime
 import discord
 from discord.ext import commands
 from erm import is_management, is_admin
-from menus import (
-    ManageReminders,
-    YesNoColourMenu,
-    ReminderCreationToolkit,
-)
+from utils.view_registry import get_view
 from utils.constants import BLANK_COLOR, GREEN_COLOR
 from utils.timestamp import td_format
 from utils.utils import generator, time_converter, require_settings, log_command_usage
@@ -57,7 +53,7 @@ class Reminders(commands.Cog):
         if len(embed.fields) == 0:
             embed.add_field(name="No Reminders", value="This server has no reminders.")
 
-        view = ManageReminders(ctx.author.id)
+        view = get_view("ManageReminders")(ctx.author.id)
 
         msg = await ctx.reply(
             embed=embed,
@@ -73,8 +69,7 @@ class Reminders(commands.Cog):
                 ):
                     if item.get("paused") is True:
                         item["paused"] = False
-                        reminder_data["reminders"][index] = item
-                        await bot.reminders.upsert(reminder_data)
+                        await bot.reminders.update_reminder(ctx.guild.id, item)
                         return await msg.edit(
                             embed=discord.Embed(
                                 title=f"{self.bot.emoji_controller.get_emoji('success')} Reminder Resumed",
@@ -85,8 +80,7 @@ class Reminders(commands.Cog):
                         )
                     else:
                         item["paused"] = True
-                        reminder_data["reminders"][index] = item
-                        await bot.reminders.upsert(reminder_data)
+                        await bot.reminders.update_reminder(ctx.guild.id, item)
                         return await msg.edit(
                             embed=discord.Embed(
                                 title=f"{self.bot.emoji_controller.get_emoji('success')} Reminder Paused",
@@ -134,7 +128,7 @@ class Reminders(commands.Cog):
                     "style": discord.ButtonStyle.danger,
                 }
 
-            view = ReminderCreationToolkit(
+            view = get_view("ReminderCreationToolkit")(
                 ctx.author.id,
                 dataset,
                 "edit",
@@ -182,12 +176,7 @@ class Reminders(commands.Cog):
             if view.cancelled is True:
                 return
 
-            # Update the reminder
-            for index, item in enumerate(reminder_data["reminders"]):
-                if item["id"] == dataset["id"]:
-                    reminder_data["reminders"][index] = dataset
-
-            await bot.reminders.upsert(reminder_data)
+            await bot.reminders.update_reminder(ctx.guild.id, dataset)
             await msg.edit(
                 embed=discord.Embed(
                     title=f"{self.bot.emoji_controller.get_emoji('success')} Reminder Edited",
@@ -225,7 +214,7 @@ class Reminders(commands.Cog):
                 "paused": False,
             }
 
-            view = ReminderCreationToolkit(ctx.author.id, dataset, "create")
+            view = get_view("ReminderCreationToolkit")(ctx.author.id, dataset, "create")
             await msg.edit(
                 embed=discord.Embed(
                     title="Reminder Creation",
@@ -247,9 +236,7 @@ class Reminders(commands.Cog):
             if view.cancelled is True:
                 return
 
-            reminder_data["reminders"].append(view.dataset)
-
-            await bot.reminders.upsert(reminder_data)
+            await bot.reminders.add_reminder(ctx.guild.id, view.dataset)
             await msg.edit(
                 embed=discord.Embed(
                     title=f"{self.bot.emoji_controller.get_emoji('success')} Reminder Created",
@@ -265,8 +252,7 @@ class Reminders(commands.Cog):
                 if item["id"] == int(
                     name if all(n for n in name if n.isdigit()) else 0
                 ):
-                    reminder_data["reminders"].remove(item)
-                    await bot.reminders.upsert(reminder_data)
+                    await bot.reminders.remove_reminder(ctx.guild.id, item["id"])
                     return await msg.edit(
                         embed=discord.Embed(
                             title=f"{self.bot.emoji_controller.get_emoji('success')} Reminder Deleted",
@@ -168,27 +168,19 @@ class Search(commands.Cog):
 
             moderator_id = user.id if user else ctx.author.id
 
-            moderations = list(
-                filter(
-                    lambda x: x is not None,
-                    [
-                        await bot.punishments.fetch_warning(i["_id"])
-                        async for i in bot.punishments.db.find(
-                            {"ModeratorID": moderator_id, "Guild": guild_id}
-                        )
-                    ],
-                )
+            type_counts = await bot.punishments.stats.moderator_type_counts(
+                guild_id, moderator_id
             )
 
             embed_list[0].add_field(
                 name="Staff Information",
                 value=(
-                    f"> **Total Moderations:** {len(moderations)}\n"
-                    f"> **Warnings:** {len(list(filter(lambda x: x.warning_type == 'Warning', moderations)))}\n"
-                    f"> **Kicks:** {len(list(filter(lambda x: x.warning_type == 'Kick', moderations)))}\n"
-                    f"> **Bans:** {len(list(filter(lambda x: x.warning_type == 'Ban', moderations)))}\n"
-                    f"> **BOLOs:** {len(list(filter(lambda x: x.warning_type.upper() == 'BOLO', moderations)))}\n"
-                    f"> **Other:** {len(list(filter(lambda x: x.warning_type.upper() not in ['WARNING', 'KICK', 'BAN', 'BOLO'], moderations)))}"
+                    f"> **Total Moderations:** {sum(type_counts.values())}\n"
+                    f"> **Warnings:** {type_counts.get('Warning', 0)}\n"
+                    f"> **Kicks:** {type_counts.get('Kick', 0)}\n"
+                    f"> **Bans:** {type_counts.get('Ban', 0)}\n"
+                    f"> **BOLOs:** {sum(count for warning_type, count in type_counts.items() if warning_type.upper() == 'BOLO')}\n"
+                    f"> **Other:** {sum(count for warning_type, count in type_counts.items() if warning_type.upper() not in ['WARNING', 'KICK', 'BAN', 'BOLO'])}"
                 ),
                 inline=False,
             )
@@ -1,6 +1,7 @@
 import datetime
 from io import BytesIO
 import logging
+import tempfile
 import typing
 
 import discord
@@ -18,16 +19,10 @@ from erm import (
     management_predicate,
     scope,
 )
-from menus import (
-    CustomExecutionButton,
-    CustomSelectMenu,
-    RequestGoogleSpreadsheet,
-    ShiftMenu,
-    AdministratedShiftMenu,
-)
+from utils.view_registry import get_view
 from utils.autocompletes import shift_type_autocomplete, all_shift_type_autocomplete
 from utils.constants import BLANK_COLOR, GREEN_COLOR, ORANGE_COLOR, RED_COLOR
-from utils.paginators import SelectPagination, CustomPage
+from utils.paginators import SelectPagination, CustomPage, CursorPagination
 from utils.timestamp import td_format
 from utils.utils import (
     get_elapsed_time,
@@ -86,7 +81,7 @@ class ShiftLogging(commands.Cog):
 
         if shift_types and len(shift_types) > 1:
             if shift_type_value != "all" and shift_type_value not in [st["name"].lower() for st in shift_types]:
-                view = CustomSelectMenu(
+                view = get_view("CustomSelectMenu")(
                     ctx.author.id,
                     [
                         discord.SelectOption(label=st["name"], value=st["name"]) for st in shift_types
@@ -112,18 +107,13 @@ class ShiftLogging(commands.Cog):
             if not selected_shift_type:
                 return await new_failure_embed(ctx, "Error", "Invalid shift type selected.")
 
-        total_seconds = 0
         active_shift = await bot.shift_management.get_current_shift(member, ctx.guild.id)
-        shifts = []
-        query = {"UserID": member.id, "Guild": ctx.guild.id}
-        if selected_shift_type:
-            query["Type"] = selected_shift_type["name"]
-
-        storage_item = [i async for i in bot.shift_management.shifts.db.find(query)]
-        for s in storage_item:
-            if s["EndEpoch"] != 0:
-                shifts.append(s)
-                total_seconds += get_elapsed_time(s)
+        totals = await bot.shift_management.shift_totals(
+            ctx.guild.id,
+            member.id,
+            selected_shift_type["name"] if selected_shift_type else None,
+        )
+        total_seconds = totals.total_seconds
 
         selected_quota = configItem.get("shift_management", {}).get("quota", 0)
         for role in sorted(member.roles, key=lambda r: r.position, reverse=True):
@@ -151,7 +141,7 @@ class ShiftLogging(commands.Cog):
         newline = "\n"
 
         embed.add_field(
-            name=f"Shift Time [{len(shifts)}]",
+            name=f"Shift Time [{totals.count}]",
             value=f"{td_format(datetime.timedelta(seconds=total_seconds))} {'{}*Met Quota*'.format(newline) if met_quota else '{}*Not Met Quota*'.format(newline) if met_quota is not None else ''}",
         )
 
@@ -200,7 +190,7 @@ class ShiftLogging(commands.Cog):
                         color=BLANK_COLOR,
                     ),
                     view=(
-                        view := CustomSelectMenu(
+                        view := get_view("CustomSelectMenu")(
                             ctx.author.id,
                             [
                                 discord.SelectOption(
@@ -258,20 +248,15 @@ class ShiftLogging(commands.Cog):
         await log_command_usage(
             self.bot, ctx.guild, ctx.author, f"Duty Admin for {member.name}"
         )
-        previous_shifts = [
-            i
-            async for i in self.bot.shift_management.shifts.db.find(
-                {"UserID": member.id, "Guild": ctx.guild.id, "EndEpoch": {"$ne": 0}}
-            )
-        ]
+        totals = await self.bot.shift_management.shift_totals(ctx.guild.id, member.id)
         embed = discord.Embed(color=BLANK_COLOR)
 
         embed.add_field(
             name="Current Statistics",
             value=(
-                f"> **Total Shift Duration:** {td_format(datetime.timedelta(seconds=sum([get_elapsed_time(item) for item in previous_shifts])))}\n"
-                f"> **Total Shifts:** {len(previous_shifts)}\n"
-                f"> **Average Shift Duration:** {td_format(datetime.timedelta(seconds=(sum([get_elapsed_time(item) for item in previous_shifts]).__truediv__(len(previous_shifts) or 1))))}\n"
+                f"> **Total Shift Duration:** {td_format(datetime.timedelta(seconds=totals.total_seconds))}\n"
+                f"> **Total Shifts:** {totals.count}\n"
+                f"> **Average Shift Duration:** {td_format(datetime.timedelta(seconds=totals.average_seconds))}\n"
             ),
             inline=False,
         )
@@ -345,7 +330,7 @@ class ShiftLogging(commands.Cog):
                 f"{self.bot.emoji_controller.get_emoji('ShiftEnded')} **Off-Duty**"
             )
         try:
-            view = AdministratedShiftMenu(
+            view = get_view("AdministratedShiftMenu")(
                 self.bot,
                 status,
                 ctx.author.id,
@@ -353,9 +338,10 @@ class ShiftLogging(commands.Cog):
                 (shift_type_item or {}).get("name") or type,
                 shift,
                 contained_document,
+                settings=settings,
             )
         except UnboundLocalError:
-            view = AdministratedShiftMenu(
+            view = get_view("AdministratedShiftMenu")(
                 self.bot,
                 status,
                 ctx.author.id,
@@ -363,6 +349,7 @@ class ShiftLogging(commands.Cog):
                 type,
                 shift,
                 contained_document,
+                settings=settings,
             )
 
         if not msg:
@@ -403,7 +390,7 @@ class ShiftLogging(commands.Cog):
                         color=BLANK_COLOR,
                     ),
                     view=(
-                        view := CustomSelectMenu(
+                        view := get_view("CustomSelectMenu")(
                             ctx.author.id,
                             [
                                 discord.SelectOption(
@@ -499,20 +486,15 @@ class ShiftLogging(commands.Cog):
             ctx.author, ctx.guild.id
         )
         # view = ModificationSelectMenu(ctx.author.id)
-        previous_shifts = [
-            i
-            async for i in self.bot.shift_management.shifts.db.find(
-                {"UserID": ctx.author.id, "Guild": ctx.guild.id, "EndEpoch": {"$ne": 0}}
-            )
-        ]
+        totals = await self.bot.shift_management.shift_totals(ctx.guild.id, ctx.author.id)
         embed = discord.Embed(color=BLANK_COLOR)
 
         embed.add_field(
             name="Current Statistics",
             value=(
-                f"> **Total Shift Duration:** {td_format(datetime.timedelta(seconds=sum([get_elapsed_time(item) for item in previous_shifts])))}\n"
-                f"> **Total Shifts:** {len(previous_shifts)}\n"
-                f"> **Average Shift Duration:** {td_format(datetime.timedelta(seconds=(sum([get_elapsed_time(item) for item in previous_shifts]).__truediv__(len(previous_shifts) or 1))))}\n"
+                f"> **Total Shift Duration:** {td_format(datetime.timedelta(seconds=totals.total_seconds))}\n"
+                f"> **Total Shifts:** {totals.count}\n"
+                f"> **Average Shift Duration:** {td_format(datetime.timedelta(seconds=totals.average_seconds))}\n"
             ),
             inline=False,
         )
@@ -593,13 +575,14 @@ class ShiftLogging(commands.Cog):
                 f"{self.bot.emoji_controller.get_emoji('ShiftEnded')} **Off-Duty**"
             )
 
-        view = ShiftMenu(
+        view = get_view("ShiftMenu")(
             self.bot,
             status,
             ctx.author.id,
             shift_type_item["name"] if shift_type_item else type,
             starting_document=shift,
             starting_container=contained_document,
+            settings=settings,
         )
 
         if not msg:
@@ -640,7 +623,7 @@ class ShiftLogging(commands.Cog):
             if len(shift_types.get("types")) > 1:
                 shift_types = shift_types.get("types")
 
-                view = CustomSelectMenu(
+                view = get_view("CustomSelectMenu")(
                     ctx.author.id,
                     [
                         discord.SelectOption(
@@ -863,7 +846,7 @@ class ShiftLogging(commands.Cog):
             if len(shift_types.get("types")) > 1:
                 shift_types = shift_types.get("types")
 
-                view = CustomSelectMenu(
+                view = get_view("CustomSelectMenu")(
                     ctx.author.id,
                     [
                         discord.SelectOption(
@@ -977,13 +960,12 @@ class ShiftLogging(commands.Cog):
             staff["id"] for staff in all_staff.values() if staff["moderations"] == 0
         ]
         if mod_ids:
-            mod_pipeline = [
-                {"$match": {"ModeratorID": {"$in": mod_ids}, "Guild": ctx.guild.id}},
-                {"$group": {"_id": "$ModeratorID", "mod_count": {"$sum": 1}}},
-            ]
-            async for doc in bot.punishments.db.aggregate(mod_pipeline):
-                if doc["_id"] in all_staff:
-                    all_staff[doc["_id"]]["moderations"] = doc["mod_count"]
+            mod_counts = await bot.punishments.stats.moderator_counts(
+                ctx.guild.id, moderator_ids=mod_ids
+            )
+            for moderator_id, mod_count in mod_counts.items():
+                if moderator_id in all_staff:
+                    all_staff[moderator_id]["moderations"] = mod_count
 
         if len(all_staff) == 0:
             return await ctx.send(
@@ -1260,7 +1242,7 @@ class ShiftLogging(commands.Cog):
             for i in embeds:
                 new_embeds.append(i)
             if await management_predicate(ctx):
-                view = RequestGoogleSpreadsheet(
+                view = get_view("RequestGoogleSpreadsheet")(
                     self.bot,
                     ctx.author.id,
                     credentials_dict,
@@ -1278,7 +1260,7 @@ class ShiftLogging(commands.Cog):
             )
         else:
             if await management_predicate(ctx):
-                view = RequestGoogleSpreadsheet(
+                view = get_view("RequestGoogleSpreadsheet")(
                     self.bot,
                     ctx.author.id,
                     credentials_dict,
@@ -1300,7 +1282,7 @@ class ShiftLogging(commands.Cog):
 
             if view:
                 view.add_item(
-                    CustomExecutionButton(
+                    get_view("CustomExecutionButton")(
                         ctx.author.id,
                         "Download Shift Leaderboard",
                         discord.ButtonStyle.gray,
@@ -1369,7 +1351,7 @@ class ShiftLogging(commands.Cog):
                         color=BLANK_COLOR,
                     ),
                     view=(
-                        view := CustomSelectMenu(
+                        view := get_view("CustomSelectMenu")(
                             ctx.author.id,
                             [
                                 discord.SelectOption(
@@ -1405,11 +1387,9 @@ class ShiftLogging(commands.Cog):
                     )
                 )
 
-        shift_cursor = self.bot.shift_management.shifts.db.find(
-            {"UserID": user.id, "Guild": ctx.guild.id, "Type": shift_type_item["name"]}
-        )
-        shifts = await shift_cursor.to_list(length=None)
-        if not shifts:
+        query = {"UserID": user.id, "Guild": ctx.guild.id, "Type": shift_type_item["name"]}
+        total = await self.bot.shift_management.shifts.db.count_documents(query)
+        if not total:
             return await ctx.send(
                 embed=discord.Embed(
                     title="No Shifts",
@@ -1418,39 +1398,87 @@ class ShiftLogging(commands.Cog):
                 )
             )
 
-        embeds = []
-        for shift in shifts:
-            embed = discord.Embed(title=f"{user.name}'s Shifts", color=BLANK_COLOR)
-            embed.add_field(
-                name="Shift Information",
-                value=(
-                    f"> **Started:** <t:{int(shift['StartEpoch'])}:R>\n"
-                    f"> **Ended:** <t:{int(shift['EndEpoch'])}:R>\n"
-                    f"> **Total Time:** {td_format(datetime.timedelta(seconds=get_elapsed_time(shift)))}\n"
-                    f"> **Moderations:** {len(shift.get('Moderations', []))}\n"
-                    f"> **Breaks:** {len(shift.get('Breaks', []))}"
-                ),
-                inline=False,
-            ).set_author(
-                name=f"{ctx.guild.name}",
-                icon_url=ctx.guild.icon,
-            ).set_footer(
-                text=f"Shift Type: {shift_type_item['name']}"
-            ).set_thumbnail(
-                url=user.display_avatar.url
+        async def fetch_page(cursor):
+            shifts, next_cursor = await self.bot.shift_management.shift_page(
+                query, after=cursor
             )
-            embeds.append(embed)
+            embeds = []
+            for shift in shifts:
+                embed = discord.Embed(title=f"{user.name}'s Shifts", color=BLANK_COLOR)
+                embed.add_field(
+                    name="Shift Information",
+                    value=(
+                        f"> **Started:** <t:{int(shift['StartEpoch'])}:R>\n"
+                        f"> **Ended:** <t:{int(shift['EndEpoch'])}:R>\n"
+                        f"> **Total Time:** {td_format(datetime.timedelta(seconds=get_elapsed_time(shift)))}\n"
+                        f"> **Moderations:** {len(shift.get('Moderations', []))}\n"
+                        f"> **Breaks:** {len(shift.get('Breaks', []))}"
+                    ),
+                    inline=False,
+                ).set_author(
+                    name=f"{ctx.guild.name}",
+                    icon_url=ctx.guild.icon,
+                ).set_footer(
+                    text=f"Shift Type: {shift_type_item['name']}"
+                ).set_thumbnail(
+                    url=user.display_avatar.url
+                )
+                embeds.append(embed)
+            return embeds, next_cursor
 
-        paginator = SelectPagination(
-            self.bot,
-            ctx.author.id,
-            [
-                CustomPage(embeds=[embed], identifier=str(index + 1))
-                for index, embed in enumerate(embeds)
-            ],
-        )
-        await ctx.reply(embed=embeds[0], view=paginator.get_current_view())
+        paginator = CursorPagination(self.bot, ctx.author.id, fetch_page, total_pages=total)
+        embeds = await paginator.start()
+        await ctx.reply(embeds=embeds, view=paginator)
+
+    @commands.guild_only()
+    @duty.command(
+        name="export",
+        description="Export all past shifts of a user as a file",
+        extras={"category": "Shift Management"},
+    )
+    @require_settings()
+    @is_management()
+    @app_commands.describe(
+        user="The staff member to export shifts for.",
+        format="CSV for spreadsheets, NDJSON for one JSON object per line.",
+    )
+    async def duty_export(
+        self,
+        ctx: commands.Context,
+        user: discord.User,
+        format: typing.Literal["csv", "ndjson"] = "csv",
+    ):
+        if self.bot.shift_management_disabled is True:
+            return await new_failure_embed(
+                ctx,
+                "Maintenance",
+                "This command is currently disabled as ERM is currently undergoing maintenance updates. This command will be turned off briefly to ensure that no data is lost during the maintenance.",
+            )
 
+        await log_command_usage(
+            self.bot, ctx.guild, ctx.author, f"Duty Export for {user.name}"
+        )
+        # Spills to disk past 1MB, so large exports aren't held in memory.
+        with tempfile.SpooledTemporaryFile(max_size=1024 * 1024) as fp:
+            count = await self.bot.shift_management.export_shifts(
+                {"UserID": user.id, "Guild": ctx.guild.id}, fp, format
+            )
+            if not count:
+                return await ctx.send(
+                    embed=discord.Embed(
+                        title="No Shifts",
+                        description="No shifts have been found for this user.",
+                        color=BLANK_COLOR,
+                    )
+                )
+            await ctx.reply(
+                embed=discord.Embed(
+                    title=f"{self.bot.emoji_controller.get_emoji('success')} Shifts Exported",
+                    description=f"I've exported **{count}** shifts of {user.mention}.",
+                    color=GREEN_COLOR,
+                ),
+                file=discord.File(fp=fp, filename=f"shifts_{user.id}.{format}"),
+            )
 
 async def setup(bot):
     await bot.add_cog(ShiftLogging(bot))
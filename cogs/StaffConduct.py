@@ -3,19 +3,7 @@ import discord
 import pytz
 from discord.ext import commands
 from erm import is_management
-from menus import (
-    YesNoMenu,
-    AcknowledgeMenu,
-    YesNoExpandedMenu,
-    CustomModalView,
-    CustomSelectMenu,
-    MultiSelectMenu,
-    RoleSelect,
-    ExpandedRoleSelect,
-    MessageCustomisation,
-    EmbedCustomisation,
-    ChannelSelect,
-)
+from utils.view_registry import get_view
 
 successEmoji = "<:ERMCheck:1111089850720976906>"
 pendingEmoji = "<:ERMPending:1111097561588183121>"
@@ -67,7 +55,7 @@ class StaffConduct(commands.Cog):
         first_time_setup = bool(not result)
 
         if first_time_setup:
-            view = YesNoExpandedMenu(ctx.author.id)
+            view = get_view("YesNoExpandedMenu")(ctx.author.id)
             message = await ctx.reply(
                 f"{pendingEmoji} **{ctx.author.name},** it looks like your server hasn't setup **Staff Conduct**! Do you want to run the **First-time Setup** wizard?",
                 view=view,
@@ -109,7 +97,7 @@ class StaffConduct(commands.Cog):
             embed.timestamp = datetime.datetime.now()
             embed.set_author(name=ctx.author.name, icon_url=ctx.author.display_avatar)
 
-            view = AcknowledgeMenu(
+            view = get_view("AcknowledgeMenu")(
                 ctx.author.id, "Read the information in full before acknowledging."
             )
             await message.edit(
@@ -125,7 +113,7 @@ class StaffConduct(commands.Cog):
                 content=f"{pendingEmoji} **{ctx.author.name},** let's begin!",
                 embed=None,
                 view=(
-                    view := CustomModalView(
+                    view := get_view("CustomModalView")(
                         ctx.author.id,
                         "Add an Infraction Type",
                         "Add Infraction Type",
@@ -153,7 +141,7 @@ class StaffConduct(commands.Cog):
             await message.edit(
                 content=f"{pendingEmoji} **{ctx.author.name},** what actions do you want to add to **{infraction_type_name}**?",
                 view=(
-                    view := CustomSelectMenu(
+                    view := get_view("CustomSelectMenu")(
                         ctx.author.id,
                         [
                             discord.SelectOption(
@@ -212,7 +200,7 @@ class StaffConduct(commands.Cog):
                     await message.edit(
                         content=f"{pendingEmoji} **{ctx.author.name},** what roles do you wish to be assigned when \
                     a user receives a **{infraction_type_name}**?",
-                        view=(view := ExpandedRoleSelect(ctx.author.id, limit=25)),
+                        view=(view := get_view("ExpandedRoleSelect")(ctx.author.id, limit=25)),
                     )
                     await view.wait()
                     addRoleList = view.value
@@ -220,7 +208,7 @@ class StaffConduct(commands.Cog):
                     await message.edit(
                         content=f"{pendingEmoji} **{ctx.author.name},** what roles do you wish to be removed when \
 a user receives a **{infraction_type_name}**?",
-                        view=(view := ExpandedRoleSelect(ctx.author.id, limit=25)),
+                        view=(view := get_view("ExpandedRoleSelect")(ctx.author.id, limit=25)),
                     )
                     await view.wait()
                     removeRoleList = view.value
@@ -228,7 +216,7 @@ a user receives a **{infraction_type_name}**?",
                     await message.edit(
                         content=f"{pendingEmoji} **{ctx.author.name},** what staff roles do you wish to be affected \
 when a user receives a **{infraction_type_name}**?",
-                        view=(view := ExpandedRoleSelect(ctx.author.id, limit=25)),
+                        view=(view := get_view("ExpandedRoleSelect")(ctx.author.id, limit=25)),
                     )
                     await view.wait()
                     staffRoleList = view.value
@@ -236,14 +224,14 @@ when a user receives a **{infraction_type_name}**?",
                     constant_msg_data = None
                     while True:
                         if not constant_msg_data:
-                            view = MessageCustomisation(
+                            view = get_view("MessageCustomisation")(
                                 ctx.author.id, persist=True, external=True
                             )
                         else:
                             if constant_msg_data.get("embeds"):
-                                view = EmbedCustomisation(
+                                view = get_view("EmbedCustomisation")(
                                     ctx.author.id,
-                                    MessageCustomisation(
+                                    get_view("MessageCustomisation")(
                                         ctx.author.id,
                                         {"message": constant_msg_data},
                                         persist=True,
@@ -252,7 +240,7 @@ when a user receives a **{infraction_type_name}**?",
                                     external=True,
                                 )
                             else:
-                                view = MessageCustomisation(
+                                view = get_view("MessageCustomisation")(
                                     ctx.author.id,
                                     {"message": constant_msg_data},
                                     persist=True,
@@ -290,7 +278,7 @@ a user upon receiving a **{infraction_type_name}**."
                             ),
                             "embeds": [i.to_dict() for i in updated_message.embeds],
                         }
-                        yesNoValue = YesNoMenu(ctx.author.id)
+                        yesNoValue = get_view("YesNoMenu")(ctx.author.id)
                         await message.edit(
                             content=f"{pendingEmoji} **{ctx.author.name},** please confirm below that you wish to use the content shown below.\n\n{message_data['content']}",
                             embeds=[
@@ -308,12 +296,12 @@ a user upon receiving a **{infraction_type_name}**."
                     # Get Channel(s) to Send Message To
                     await message.edit(
                         content=f"{pendingEmoji} **{ctx.author.name},** please select the channel(s) you wish to send a message to upon a user receiving a **{infraction_type_name}**.",
-                        view=(view := ChannelSelect(ctx.author.id, limit=5)),
+                        view=(view := get_view("ChannelSelect")(ctx.author.id, limit=5)),
                     )
                     await view.wait()
 
                     # Get Custom Message
-                    view = MessageCustomisation(
+                    view = get_view("MessageCustomisation")(
                         ctx.author.id, persist=True, external=True
                     )
                     await message.edit(content=None, view=view)
@@ -321,13 +309,13 @@ a user upon receiving a **{infraction_type_name}**."
                 elif item == "send_escalation":  # Add to Database
                     await message.edit(
                         content=f"{pendingEmoji} **{ctx.author.name},** please select the channel you wish to send an escalation request to upon a user recieving a **{infraction_type_name}**.",
-                        view=(view := ChannelSelect(ctx.author.id, limit=1)),
+                        view=(view := get_view("ChannelSelect")(ctx.author.id, limit=1)),
                     )
                     await view.wait()
                     # print(view.value)
                     await message.edit(
                         content=f"{pendingEmoji} **{ctx.author.name},** should the member responsible for issuing the infraction that triggers an escalation request also have the authority to approve the escalation request? **{infraction_type_name}**.",
-                        view=(view := YesNoMenu(ctx.author.id)),
+                        view=(view := get_view("YesNoMenu")(ctx.author.id)),
                     )
                     # print(view.value)
             else:
@@ -10,7 +10,7 @@ from discord.app_commands import AppCommandGroup
 from discord.ext import commands
 import pytz
 
-from menus import LinkView, CustomSelectMenu, MultiPaginatorMenu, APIKeyConfirmation
+from utils.view_registry import get_view
 from utils.constants import BLANK_COLOR, GREEN_COLOR
 from utils.timestamp import td_format
 from utils.utils import invis_embed, failure_embed, require_settings, time_converter
@@ -93,6 +93,7 @@ class Utility(commands.Cog):
                 continue
 
             await self.bot.punishments.db.insert_one(punishment)
+            await self.bot.punishments.stats.record([punishment], 1)
             success += 1
             logging.info(f"Imported punishment: {punishment}")
             if success % 100 == 0:
@@ -358,7 +359,7 @@ class Utility(commands.Cog):
                 color=BLANK_COLOR,
                 description="Visit your server's Moderation Panel using the button below.",
             ).set_author(name=ctx.guild.name, icon_url=guild_icon),
-            view=LinkView(
+            view=get_view("LinkView")(
                 label="Mod Panel", url=f"https://ermbot.xyz/{ctx.guild.id}/panel"
             ),
         )
@@ -378,7 +379,7 @@ class Utility(commands.Cog):
                 color=BLANK_COLOR,
                 description="Visit your server's Dashboard using the button below.",
             ).set_author(name=ctx.guild.name, icon_url=guild_icon),
-            view=LinkView(
+            view=get_view("LinkView")(
                 label="Dashboard", url=f"https://ermbot.xyz/{ctx.guild.id}/dashboard"
             ),
         )
@@ -399,7 +400,7 @@ class Utility(commands.Cog):
                 description="You can join the ERM Systems Discord server using the button below.",
                 color=BLANK_COLOR,
             ),
-            view=LinkView(label="Support Server", url="https://discord.gg/FAC629TzBy"),
+            view=get_view("LinkView")(label="Support Server", url="https://discord.gg/FAC629TzBy"),
         )
 
     @commands.hybrid_command(
@@ -447,7 +448,7 @@ class Utility(commands.Cog):
     @is_management()
     @require_settings()
     async def api_generate(self, ctx: commands.Context):
-        view = APIKeyConfirmation(ctx.author.id)
+        view = get_view("APIKeyConfirmation")(ctx.author.id)
         msg = await ctx.send(
             embed=discord.Embed(
                 title="Generate API Key",
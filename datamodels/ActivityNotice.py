@@ -4,4 +4,21 @@ from utils.mongo import Document
 
 
 class ActivityNotices(Document):
-    pass
+    def __init__(self, connection, document_name, scheduler=None):
+        super().__init__(connection, document_name)
+        self.scheduler = scheduler
+
+    def schedule_expiry(self, notice: dict):
+        if self.scheduler is None:
+            return
+        if notice.get("accepted") and not notice.get("expired") and "expiry" in notice:
+            self.scheduler.schedule("loa", notice["_id"], notice["expiry"])
+
+    async def insert(self, dict):
+        await super().insert(dict)
+        self.schedule_expiry(dict)
+
+    async def update_by_id(self, dict):
+        notice_id = dict.get("_id")  # popped by update_by_id
+        await super().update_by_id(dict)
+        self.schedule_expiry({**dict, "_id": notice_id})
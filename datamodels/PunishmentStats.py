@@ -0,0 +1,289 @@
+import logging
+import time
+from collections import defaultdict
+
+from pymongo import ReplaceOne, UpdateOne
+
+from utils.mongo import Document
+
+BUCKET_SECONDS = 86400
+
+
+def bucket_start(epoch: int) -> int:
+    return epoch - epoch % BUCKET_SECONDS
+
+
+def _encode_key(value) -> str:
+    # Punishment types are user defined, and Mongo field paths can't contain
+    # dots or start with a dollar sign.
+    return str(value).replace(".", "．").replace("$", "＄") or "-"
+
+
+def _decode_key(key: str):
+    key = key.replace("．", ".").replace("＄", "$")
+    return int(key) if key.isdigit() else key
+
+
+class PunishmentStats(Document):
+    """
+    Per-guild punishment counters, bucketed by day.
+
+    Each bucket counts the punishments issued in a guild on one (UTC) day, in
+    total, per moderator, per punished user and per moderator and type. They
+    are updated as punishments are created and removed, so leaderboards and
+    counts only merge a handful of buckets instead of aggregating every
+    punishment in the guild. Guilds are backfilled from the `punishments`
+    collection the first time they are read, and periodically rebuilt by
+    `reconcile` to correct any drift.
+    """
+
+    def __init__(self, connection, punishments):
+        super().__init__(connection, "punishment_stats")
+        self.state = Document(connection, "punishment_stats_state")
+        self.punishments = punishments
+        self._backfilled: set[int] = set()
+
+    async def record(self, documents: list[dict], delta: int):
+        """
+        Adds (or with a negative `delta`, removes) punishment documents to
+        their buckets.
+        """
+        increments = defaultdict(lambda: defaultdict(int))
+        for document in documents:
+            try:
+                guild_id = document["Guild"]
+                day = bucket_start(int(document["Epoch"]))
+                moderator = _encode_key(document["ModeratorID"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            bucket = increments[(guild_id, day)]
+            bucket["Total"] += delta
+            bucket[f"Moderators.{moderator}"] += delta
+            bucket[f"Users.{_encode_key(document.get('UserID'))}"] += delta
+            bucket[
+                f"ModeratorTypes.{moderator}.{_encode_key(document.get('Type'))}"
+            ] += delta
+
+        if not increments:
+            return
+        await self.db.bulk_write(
+            [
+                UpdateOne(
+                    {"_id": f"{guild_id}:{day}"},
+                    {"$inc": dict(inc), "$set": {"Guild": guild_id, "Day": day}},
+                    upsert=True,
+                )
+                for (guild_id, day), inc in increments.items()
+            ],
+            ordered=False,
+        )
+
+    async def rebuild(self, guild_id: int):
+        """
+        Recomputes every bucket of a guild from its punishments.
+        """
+        buckets = {}
+        async for item in self.punishments.aggregate(
+            [
+                {"$match": {"Guild": guild_id}},
+                {
+                    "$group": {
+                        "_id": {
+                            "Day": {
+                                "$subtract": [
+                                    "$Epoch",
+                                    {"$mod": ["$Epoch", BUCKET_SECONDS]},
+                                ]
+                            },
+                            "Moderator": "$ModeratorID",
+                            "User": "$UserID",
+                            "Type": "$Type",
+                        },
+                        "Count": {"$sum": 1},
+                    }
+                },
+            ],
+            allowDiskUse=True,
+        ):
+            key, count = item["_id"], item["Count"]
+            if not isinstance(key.get("Day"), (int, float)) or key.get("Moderator") is None:
+                continue
+            day = int(key["Day"])
+            bucket = buckets.setdefault(
+                day,
+                {
+                    "_id": f"{guild_id}:{day}",
+                    "Guild": guild_id,
+                    "Day": day,
+                    "Total": 0,
+                    "Moderators": defaultdict(int),
+                    "Users": defaultdict(int),
+                    "ModeratorTypes": defaultdict(lambda: defaultdict(int)),
+                },
+            )
+            moderator = _encode_key(key["Moderator"])
+            bucket["Total"] += count
+            bucket["Moderators"][moderator] += count
+            bucket["Users"][_encode_key(key.get("User"))] += count
+            bucket["ModeratorTypes"][moderator][_encode_key(key.get("Type"))] += count
+
+        if buckets:
+            await self.db.bulk_write(
+                [
+                    ReplaceOne(
+                        {"_id": bucket["_id"]},
+                        {
+                            **bucket,
+                            "Moderators": dict(bucket["Moderators"]),
+                            "Users": dict(bucket["Users"]),
+                            "ModeratorTypes": {
+                                moderator: dict(types)
+                                for moderator, types in bucket["ModeratorTypes"].items()
+                            },
+                        },
+                        upsert=True,
+                    )
+                    for bucket in buckets.values()
+                ],
+                ordered=False,
+            )
+        await self.db.delete_many(
+            {"Guild": guild_id, "Day": {"$nin": list(buckets)}}
+        )
+        await self.state.db.update_one(
+            {"_id": guild_id}, {"$set": {"ReconciledAt": int(time.time())}}, upsert=True
+        )
+        self._backfilled.add(guild_id)
+
+    async def ensure(self, guild_id: int):
+        if guild_id in self._backfilled:
+            return
+        if await self.state.find_by_id(guild_id) is None:
+            await self.rebuild(guild_id)
+        self._backfilled.add(guild_id)
+
+    async def reconcile(self, partition, batch: int = 25, max_age: int = 86400) -> int:
+        """
+        Rebuilds every guild owned by `partition` which has gone more than
+        `max_age` seconds without a rebuild, oldest first and `batch` at a
+        time. Returns how many guilds were rebuilt.
+        """
+        cutoff = int(time.time()) - max_age
+        failed = []
+        rebuilt = 0
+        while True:
+            # Rebuilt guilds move past the cutoff, so each batch is new.
+            stale = [
+                document["_id"]
+                async for document in self.state.db.find(
+                    partition.query(
+                        {"ReconciledAt": {"$lt": cutoff}, "_id": {"$nin": failed}}
+                    )
+                )
+                .sort("ReconciledAt", 1)
+                .limit(batch)
+            ]
+            for guild_id in stale:
+                try:
+                    await self.rebuild(guild_id)
+                except Exception as e:
+                    failed.append(guild_id)
+                    logging.error(f"Error reconciling punishment stats of {guild_id}: {e}")
+                else:
+                    rebuilt += 1
+            if len(stale) < batch:
+                return rebuilt
+
+    async def moderator_counts(
+        self,
+        guild_id: int,
+        since: int = 0,
+        moderator_ids: list[int] | None = None,
+    ) -> dict:
+        """
+        Returns the number of punishments issued by each moderator of a guild
+        since `since`. Whole days are read from the buckets, and the partial
+        day `since` falls in is counted from the punishments themselves.
+        """
+        await self.ensure(guild_id)
+        first_day = bucket_start(since)
+        query = {"Guild": guild_id}
+        if since > first_day:
+            first_day += BUCKET_SECONDS
+        if first_day > 0:
+            query["Day"] = {"$gte": first_day}
+
+        wanted = (
+            None
+            if moderator_ids is None
+            else {_encode_key(moderator_id) for moderator_id in moderator_ids}
+        )
+        projection = (
+            {"Moderators": 1}
+            if wanted is None
+            else {f"Moderators.{moderator}": 1 for moderator in wanted}
+        )
+
+        counts = defaultdict(int)
+        async for bucket in self.db.find(query, projection):
+            for moderator, count in bucket.get("Moderators", {}).items():
+                counts[_decode_key(moderator)] += count
+
+        if since < first_day:
+            match = {"Guild": guild_id, "Epoch": {"$gte": since, "$lt": first_day}}
+            if moderator_ids is not None:
+                match["ModeratorID"] = {"$in": moderator_ids}
+            async for item in self.punishments.aggregate(
+                [
+                    {"$match": match},
+                    {"$group": {"_id": "$ModeratorID", "Count": {"$sum": 1}}},
+                ]
+            ):
+                counts[item["_id"]] += item["Count"]
+
+        return {moderator: count for moderator, count in counts.items() if count > 0}
+
+    async def moderator_type_counts(self, guild_id: int, moderator_id: int) -> dict[str, int]:
+        """
+        Returns how many punishments of each type a moderator has issued.
+        """
+        await self.ensure(guild_id)
+        path = f"ModeratorTypes.{_encode_key(moderator_id)}"
+        counts = defaultdict(int)
+        async for bucket in self.db.find(
+            {"Guild": guild_id, path: {"$exists": True}}, {path: 1}
+        ):
+            types = bucket.get("ModeratorTypes", {}).get(_encode_key(moderator_id), {})
+            for warning_type, count in types.items():
+                counts[str(_decode_key(warning_type))] += count
+        return {warning_type: count for warning_type, count in counts.items() if count > 0}
+
+    async def count(
+        self,
+        guild_id: int,
+        moderator_id: int | None = None,
+        user_id: int | None = None,
+    ) -> int:
+        """
+        Counts the punishments in a guild, optionally only those issued by a
+        moderator or to a user.
+        """
+        await self.ensure(guild_id)
+        if moderator_id is None and user_id is None:
+            field = "Total"
+        elif moderator_id is not None and user_id is None:
+            field = f"Moderators.{_encode_key(moderator_id)}"
+        elif user_id is not None and moderator_id is None:
+            field = f"Users.{_encode_key(user_id)}"
+        else:
+            raise ValueError("Buckets can't count a moderator and user together.")
+
+        total = 0
+        async for item in self.db.aggregate(
+            [
+                {"$match": {"Guild": guild_id}},
+                {"$group": {"_id": None, "Count": {"$sum": f"${field}"}}},
+            ]
+        ):
+            total = item["Count"]
+        return total
@@ -4,4 +4,73 @@ from utils.mongo import Document
 
 
 class Reminders(Document):
-    pass
+    def __init__(self, connection, document_name, scheduler=None):
+        super().__init__(connection, document_name)
+        self.scheduler = scheduler
+
+    async def upsert(self, dict):
+        guild_id = dict["_id"]  # update_by_id pops it
+        await super().upsert(dict)
+        if self.scheduler is None:
+            return
+        for item in dict.get("reminders", []):
+            if item.get("paused") is not True and "id" in item:
+                self.scheduler.schedule(
+                    "reminder", (guild_id, item["id"]), item.get("lastTriggered", 0)
+                )
+
+    # The methods below each touch a single reminder, so that a reminder
+    # firing and a reminder being edited never overwrite each other.
+
+    def _schedule(self, guild_id: int, reminder: dict):
+        if self.scheduler is not None and reminder.get("paused") is not True:
+            self.scheduler.schedule(
+                "reminder", (guild_id, reminder["id"]), reminder.get("lastTriggered", 0)
+            )
+
+    async def add_reminder(self, guild_id: int, reminder: dict):
+        await self.db.update_one(
+            {"_id": guild_id}, {"$push": {"reminders": reminder}}, upsert=True
+        )
+        self._schedule(guild_id, reminder)
+
+    async def update_reminder(self, guild_id: int, reminder: dict):
+        """
+        Updates a reminder's settings. `lastTriggered` is left alone, as it
+        belongs to the reminder task.
+        """
+        fields = {
+            f"reminders.$.{key}": value
+            for key, value in reminder.items()
+            if key not in ("id", "lastTriggered")
+        }
+        await self.db.update_one(
+            {"_id": guild_id, "reminders.id": reminder["id"]}, {"$set": fields}
+        )
+        self._schedule(guild_id, reminder)
+
+    async def remove_reminder(self, guild_id: int, reminder_id: int):
+        await self.db.update_one(
+            {"_id": guild_id}, {"$pull": {"reminders": {"id": reminder_id}}}
+        )
+        if self.scheduler is not None:
+            self.scheduler.cancel("reminder", (guild_id, reminder_id))
+
+    async def mark_triggered(
+        self, guild_id: int, reminder_id: int, previous: float, next: float
+    ) -> bool:
+        """
+        Moves a reminder's `lastTriggered` from `previous` to `next`. Returns
+        False if the reminder changed in the meantime, in which case it
+        shouldn't be sent.
+        """
+        result = await self.db.update_one(
+            {
+                "_id": guild_id,
+                "reminders": {
+                    "$elemMatch": {"id": reminder_id, "lastTriggered": previous}
+                },
+            },
+            {"$set": {"reminders.$.lastTriggered": next}},
+        )
+        return result.modified_count == 1
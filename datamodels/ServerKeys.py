@@ -1,6 +1,7 @@
 from discord.ext import commands
 import discord
 from utils.mongo import Document
+from utils.linked_guilds import ERLC
 
 
 class BaseDataClass:
@@ -15,6 +16,27 @@ class ServerKey(BaseDataClass):
 
 
 class ServerKeys(Document):
+    def __init__(self, connection, document_name, linked_guilds=None):
+        super().__init__(connection, document_name)
+        self.linked_guilds = linked_guilds
+
+    async def _changed(self, guild_id):
+        if self.linked_guilds is not None:
+            await self.linked_guilds.key_changed(ERLC, guild_id)
+
+    async def insert(self, dict):
+        await super().insert(dict)
+        await self._changed(dict["_id"])
+
+    async def upsert(self, dict):
+        guild_id = dict["_id"]  # update_by_id pops it
+        await super().upsert(dict)
+        await self._changed(guild_id)
+
+    async def delete_by_id(self, id):
+        await super().delete_by_id(id)
+        await self._changed(id)
+
     async def get_server_key(self, guild_id: int):
         doc = await self.find_by_id(guild_id)
         if not doc:
@@ -15,6 +15,37 @@ class PunishmentType:
 
 
 class Settings(Document):
+    def __init__(
+        self, connection, document_name, permission_resolver=None, linked_guilds=None
+    ):
+        super().__init__(connection, document_name)
+        self.permission_resolver = permission_resolver
+        self.linked_guilds = linked_guilds
+
+    async def _changed(self, guild_id):
+        if self.permission_resolver is not None:
+            self.permission_resolver.settings_changed(guild_id)
+        if self.linked_guilds is not None:
+            await self.linked_guilds.settings_changed(guild_id)
+
+    async def insert(self, dict):
+        await super().insert(dict)
+        await self._changed(dict["_id"])
+
+    async def upsert(self, dict):
+        guild_id = dict["_id"]  # update_by_id pops it
+        await super().upsert(dict)
+        await self._changed(guild_id)
+
+    async def update_by_id(self, dict):
+        guild_id = dict["_id"]
+        await super().update_by_id(dict)
+        await self._changed(guild_id)
+
+    async def delete_by_id(self, id):
+        await super().delete_by_id(id)
+        await self._changed(id)
+
     async def get_settings(self, guild_id: int) -> dict:
         """
         Gets the settings for a guild.
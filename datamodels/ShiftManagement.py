@@ -1,16 +1,41 @@
+import csv
 import datetime
-import asyncio
+import io
+import json
 import logging
+import time
 from typing import Optional
 
-import aiohttp
 from bson import ObjectId
 from discord.ext import commands
 import discord
 from utils.mongo import Document
-from decouple import config
 
 from utils.basedataclass import BaseDataClass
+from utils.sync_bus import SyncBus, SyncEvent
+
+
+class ShiftTotals(BaseDataClass):
+    count: int
+    total_seconds: float
+
+    @property
+    def average_seconds(self) -> float:
+        return self.total_seconds / (self.count or 1)
+
+
+EXPORT_FIELDS = [
+    "ID",
+    "Type",
+    "Username",
+    "StartEpoch",
+    "EndEpoch",
+    "Duration",
+    "Breaks",
+    "Moderations",
+    "AddedTime",
+    "RemovedTime",
+]
 
 
 class BreakItem(BaseDataClass):
@@ -38,14 +63,13 @@ class ShiftItem:
 
 
 class ShiftManagement:
-    def __init__(self, connection, current_shifts):
+    def __init__(self, connection, current_shifts, sync_bus: SyncBus | None = None):
         self.shifts = Document(connection, current_shifts)
+        self.sync_bus = sync_bus
         self.logger = logging.getLogger(__name__)
 
-    async def fetch_shift(self, object_id: ObjectId) -> Optional[ShiftItem]:
-        shift = await self.shifts.find_by_id(object_id)
-        if not shift:
-            return None
+    @staticmethod
+    def shift_item_from_document(shift: dict) -> ShiftItem:
         return ShiftItem(
             id=shift["_id"],
             username=shift["Username"],
@@ -64,6 +88,12 @@ class ShiftManagement:
             removed_time=shift["RemovedTime"],
         )
 
+    async def fetch_shift(self, object_id: ObjectId) -> Optional[ShiftItem]:
+        shift = await self.shifts.find_by_id(object_id)
+        if not shift:
+            return None
+        return self.shift_item_from_document(shift)
+
     async def add_shift_by_user(
         self,
         member: discord.Member,
@@ -73,7 +103,21 @@ class ShiftManagement:
         timestamp: int = 0,
     ) -> ObjectId:
         """
-        Adds a shift for the specified user to the database and syncs with external APIs.
+        Adds a shift for the specified user, returning its ID. See `create_shift`.
+        """
+        document = await self.create_shift(member, shift_type, breaks, guild, timestamp)
+        return document["_id"]
+
+    async def create_shift(
+        self,
+        member: discord.Member,
+        shift_type: str,
+        breaks: list,
+        guild: int,
+        timestamp: int = 0,
+    ) -> dict:
+        """
+        Adds a shift for the specified user to the database and queues a sync with external APIs.
 
         Args:
             member: Discord member starting the shift
@@ -83,10 +127,7 @@ class ShiftManagement:
             timestamp: Optional custom start timestamp
 
         Returns:
-            ObjectId of the created shift document
-
-        Raises:
-            aiohttp.ClientError: If API sync fails
+            The created shift document
         """
         data = {
             "_id": ObjectId(),
@@ -109,45 +150,12 @@ class ShiftManagement:
 
         await self.shifts.db.insert_one(data)
 
-        url_var = config("BASE_API_URL")
-        panel_url_var = config("PANEL_API_URL")
-
-        async def sync_with_apis():
-            async with aiohttp.ClientSession() as session:
-                tasks = []
-
-                if url_var not in ["", None]:
-                    tasks.append(
-                        session.get(
-                            f"{url_var}/Internal/SyncStartShift/{data['_id']}",
-                            headers={"Authorization": config("INTERNAL_API_AUTH")},
-                            raise_for_status=True,
-                        )
-                    )
-
-                if panel_url_var not in ["", None]:
-                    tasks.append(
-                        session.post(
-                            f"{panel_url_var}/{guild}/SyncStartShift?ID={data['_id']}",
-                            headers={"X-Static-Token": config("PANEL_STATIC_AUTH")},
-                            raise_for_status=True,
-                        )
-                    )
-
-                if tasks:
-                    responses = await asyncio.gather(*tasks, return_exceptions=True)
-                    for response in responses:
-                        if isinstance(response, Exception):
-                            self.logger.error(f"API sync failed: {str(response)}")
-
-        try:
-            await sync_with_apis()
-        except aiohttp.ClientError as e:
-            self.logger.error(f"Failed to sync shift start with APIs: {str(e)}")
-        except Exception as e:
-            self.logger.error(f"Unexpected error during API sync: {str(e)}")
-
-        return data["_id"]
+        if self.sync_bus is not None:
+            await self.sync_bus.publish(
+                SyncEvent("SyncStartShift", guild, shift_id=str(data["_id"]))
+            )
+
+        return data
 
     async def add_time_to_shift(self, identifier: str, seconds: int):
         """
@@ -204,8 +212,125 @@ class ShiftManagement:
                 breaks["EndEpoch"] = int(current_time)
 
         await self.shifts.update_by_id(document)
+        document["_id"] = ObjectId(identifier)  # update_by_id pops the _id
         return document
 
+    async def shift_totals(
+        self, guild_id: int, user_id: int, shift_type: str | None = None
+    ) -> ShiftTotals:
+        """
+        The number and total duration of a user's ended shifts, summed by
+        MongoDB so the shifts themselves are never loaded. Durations are
+        worked out as in `get_elapsed_time`.
+        """
+        match = {"Guild": guild_id, "UserID": user_id, "EndEpoch": {"$ne": 0}}
+        if shift_type is not None:
+            match["Type"] = shift_type
+        break_seconds = {
+            "$sum": {
+                "$map": {
+                    "input": {"$ifNull": ["$Breaks", []]},
+                    "as": "break",
+                    "in": {
+                        "$subtract": [
+                            {
+                                "$cond": [
+                                    {"$eq": ["$$break.EndEpoch", 0]},
+                                    int(time.time()),
+                                    {"$toLong": "$$break.EndEpoch"},
+                                ]
+                            },
+                            {"$toLong": "$$break.StartEpoch"},
+                        ]
+                    },
+                }
+            }
+        }
+        pipeline = [
+            {"$match": match},
+            {
+                "$group": {
+                    "_id": None,
+                    "count": {"$sum": 1},
+                    "total_seconds": {
+                        "$sum": {
+                            "$subtract": [
+                                {
+                                    "$add": [
+                                        {"$toLong": "$EndEpoch"},
+                                        {"$multiply": [{"$toLong": "$StartEpoch"}, -1]},
+                                        {"$ifNull": ["$AddedTime", 0]},
+                                        {"$multiply": [{"$ifNull": ["$RemovedTime", 0]}, -1]},
+                                    ]
+                                },
+                                break_seconds,
+                            ]
+                        }
+                    },
+                }
+            },
+        ]
+        async for document in self.shifts.db.aggregate(pipeline):
+            return ShiftTotals(
+                count=document["count"], total_seconds=document["total_seconds"]
+            )
+        return ShiftTotals(count=0, total_seconds=0)
+
+    async def shift_page(
+        self, query: dict, after: ObjectId | None = None, limit: int = 1
+    ) -> tuple[list[dict], ObjectId | None]:
+        """
+        One page of the shifts matching `query`, starting after the shift
+        `after`. Returns the page and the cursor of the next page, or None
+        if this is the last one.
+        """
+        if after is not None:
+            query = {"$and": [query, {"_id": {"$gt": after}}]}
+        documents = (
+            await self.shifts.db.find(query).sort("_id", 1).to_list(length=limit + 1)
+        )
+        next_cursor = documents[limit - 1]["_id"] if len(documents) > limit else None
+        return documents[:limit], next_cursor
+
+    async def export_shifts(self, query: dict, fp, format: str = "csv") -> int:
+        """
+        Writes the shifts matching `query` to the binary file `fp` as CSV or
+        NDJSON, one shift at a time straight from the cursor. Returns the
+        number of shifts written.
+        """
+        from utils.utils import get_elapsed_time
+
+        line = io.StringIO()
+        writer = csv.writer(line)
+        if format == "csv":
+            writer.writerow(EXPORT_FIELDS)
+
+        count = 0
+        async for shift in self.shifts.db.find(query).sort("_id", 1).batch_size(500):
+            row = [
+                str(shift["_id"]),
+                shift.get("Type"),
+                shift.get("Username"),
+                shift.get("StartEpoch"),
+                shift.get("EndEpoch"),
+                get_elapsed_time(shift),
+                len(shift.get("Breaks") or []),
+                len(shift.get("Moderations") or []),
+                shift.get("AddedTime", 0),
+                shift.get("RemovedTime", 0),
+            ]
+            if format == "csv":
+                writer.writerow(row)
+            else:
+                line.write(json.dumps(dict(zip(EXPORT_FIELDS, row)), default=str) + "\n")
+            fp.write(line.getvalue().encode())
+            line.seek(0)
+            line.truncate()
+            count += 1
+        fp.write(line.getvalue().encode())
+        fp.seek(0)
+        return count
+
     async def get_current_shift(self, member: discord.Member, guild_id: int):
         """
         Gets the current shift for the specified user.
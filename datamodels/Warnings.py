@@ -1,13 +1,13 @@
 import typing
 from copy import copy
 
-import aiohttp
 import pymongo.operations
 from bson import ObjectId
-from decouple import config
 from discord.ext import commands
 import discord
 
+from datamodels.PunishmentStats import PunishmentStats
+from utils.sync_bus import SyncEvent
 from utils.utils import generator
 from utils.mongo import Document
 
@@ -54,25 +54,30 @@ class Warnings(Document):
         self.bot = bot
         super().__init__(bot.db, "punishments")
         self.recovery = Document(bot.db, "recovery")
+        self.stats = PunishmentStats(bot.db, self.db)
+
+    @staticmethod
+    def warning_item_from_document(i: dict) -> WarningItem:
+        return WarningItem(
+            id=i["_id"],
+            snowflake=i["Snowflake"],
+            username=i["Username"],
+            user_id=i["UserID"],
+            warning_type=i["Type"],
+            reason=i["Reason"],
+            moderator_name=i["Moderator"],
+            moderator_id=i["ModeratorID"],
+            guild_id=i["Guild"],
+            time_epoch=i["Epoch"],
+            until_epoch=None if i.get("UntilEpoch") == 0 else i["UntilEpoch"],
+        )
 
     async def get_warnings(self, user: int, guild: int) -> list[WarningItem]:
         """
         Gets the warnings for a user in a guild.
         """
         return [
-            WarningItem(
-                id=i["_id"],
-                snowflake=i["Snowflake"],
-                username=i["Username"],
-                user_id=i["UserID"],
-                warning_type=i["Type"],
-                reason=i["Reason"],
-                moderator_name=i["Moderator"],
-                moderator_id=i["ModeratorID"],
-                guild_id=i["Guild"],
-                time_epoch=i["Epoch"],
-                until_epoch=None if i.get("UntilEpoch") == 0 else i["UntilEpoch"],
-            )
+            self.warning_item_from_document(i)
             async for i in self.db.find({"Guild": guild, "UserID": user})
         ]
 
@@ -83,19 +88,21 @@ class Warnings(Document):
         i = await self.db.find_one({"_id": ObjectId(warning_id)})
         if i is None:
             return None
-        return WarningItem(
-            id=i["_id"],
-            snowflake=i["Snowflake"],
-            username=i["Username"],
-            user_id=i["UserID"],
-            warning_type=i["Type"],
-            reason=i["Reason"],
-            moderator_name=i["Moderator"],
-            moderator_id=i["ModeratorID"],
-            guild_id=i["Guild"],
-            time_epoch=i["Epoch"],
-            until_epoch=None if i.get("UntilEpoch") == 0 else i["UntilEpoch"],
-        )
+        return self.warning_item_from_document(i)
+
+    async def fetch_warnings(self, warning_ids: list) -> list[WarningItem]:
+        """
+        Fetches many warnings by their IDs in a single query.
+        Missing warnings are left out.
+        """
+        if not warning_ids:
+            return []
+        return [
+            self.warning_item_from_document(i)
+            async for i in self.db.find(
+                {"_id": {"$in": [ObjectId(str(w)) for w in warning_ids]}}
+            )
+        ]
 
     async def get_warning(self, warning_id: str) -> dict:
         """
@@ -107,7 +114,9 @@ class Warnings(Document):
         """
         Removes a warning by its ID.
         """
-        await self.db.delete_one({"_id": ObjectId(warning_id)})
+        document = await self.db.find_one_and_delete({"_id": ObjectId(warning_id)})
+        if document is not None:
+            await self.stats.record([document], -1)
 
     async def get_warning_by_snowflake(self, snowflake: int) -> dict:
         """
@@ -145,7 +154,35 @@ class Warnings(Document):
         until_epoch: int | None = None,
     ) -> ObjectId | ValueError:
         """
-        Inserts a warning into the database.
+        Inserts a warning into the database, returning its ID.
+        """
+        warning = await self.create_warning(
+            staff_id,
+            staff_name,
+            user_id,
+            user_name,
+            guild_id,
+            reason,
+            moderation_type,
+            time_epoch,
+            until_epoch,
+        )
+        return warning if isinstance(warning, ValueError) else warning.id
+
+    async def create_warning(
+        self,
+        staff_id: int,
+        staff_name: str,
+        user_id: int,
+        user_name: str,
+        guild_id: int,
+        reason: str,
+        moderation_type: str,
+        time_epoch: int,
+        until_epoch: int | None = None,
+    ) -> WarningItem | ValueError:
+        """
+        Inserts a warning into the database, returning it as a WarningItem.
         {
           "_id": 123456789012345678,
           "Username": "1friendlydoge",
@@ -177,44 +214,28 @@ class Warnings(Document):
             return ValueError("All arguments must be provided.")
 
         identifier = ObjectId()
+        document = {
+            "_id": identifier,
+            "Snowflake": next(generator),
+            "Username": user_name,
+            "UserID": user_id,
+            "Type": moderation_type,
+            "Reason": reason,
+            "Moderator": staff_name,
+            "ModeratorID": staff_id,
+            "Guild": guild_id,
+            "Epoch": int(time_epoch),
+            "UntilEpoch": int(until_epoch if until_epoch is not None else 0),
+        }
+
+        await self.db.insert_one(document)
+        await self.stats.record([document], 1)
 
-        await self.db.insert_one(
-            {
-                "_id": identifier,
-                "Snowflake": next(generator),
-                "Username": user_name,
-                "UserID": user_id,
-                "Type": moderation_type,
-                "Reason": reason,
-                "Moderator": staff_name,
-                "ModeratorID": staff_id,
-                "Guild": guild_id,
-                "Epoch": int(time_epoch),
-                "UntilEpoch": int(until_epoch if until_epoch is not None else 0),
-            }
+        await self.bot.sync_bus.publish(
+            SyncEvent("SyncCreatePunishment", guild_id, punishment_id=str(identifier))
         )
 
-        try:
-            url_var = config("BASE_API_URL")
-            panel_url_var = config("PANEL_API_URL")
-            if url_var not in ["", None]:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(
-                        f"{url_var}/Internal/SyncCreatePunishment/{identifier}",
-                        headers={"Authorization": config("INTERNAL_API_AUTH")},
-                    ):
-                        pass
-            if panel_url_var not in ["", None]:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(
-                        f"{panel_url_var}/{guild_id}/SyncCreatePunishment?ID={identifier}",
-                        headers={"Authorization": config("INTERNAL_API_AUTH")},
-                    ):
-                        pass
-        except:
-            pass
-
-        return identifier
+        return self.warning_item_from_document(document)
 
     async def find_warning_by_spec(
         self,
@@ -365,7 +386,10 @@ class Warnings(Document):
                 guild_id is None,
             ]
         ):
-            return await self.db.delete_many({"Snowflake": identifier})
+            documents = [i async for i in self.db.find({"Snowflake": identifier})]
+            result = await self.db.delete_many({"Snowflake": identifier})
+            await self.stats.record(documents, -1)
+            return result
 
         map = {
             "Snowflake": identifier,
@@ -384,6 +408,10 @@ class Warnings(Document):
             storage.append(i)
             await self.db.delete_one({"_id": i["_id"]})
 
+        if not storage:
+            return
+        await self.stats.record(storage, -1)
+
         bulk_writes = []
         for i in storage:
             l = copy(i)
@@ -406,26 +434,18 @@ class Warnings(Document):
 
         selected_item = await self.db.find_one({"Snowflake": identifier})
         if selected_item["Guild"] == (guild_id or selected_item["Guild"]):
-            try:
-                url_var = config("BASE_API_URL")
-                panel_url_var = config("PANEL_API_URL")
-                if url_var not in ["", None]:
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(
-                            f"{url_var}/Internal/SyncDeletePunishment/{selected_item['_id']}",
-                            headers={"Authorization": config("INTERNAL_API_AUTH")},
-                        ):
-                            pass
-                if panel_url_var not in ["", None]:
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(
-                            f"{panel_url_var}/{guild_id}/SyncDeletePunishment?ID={identifier}",
-                            headers={"Authorization": config("INTERNAL_API_AUTH")},
-                        ):
-                            pass
-            except ValueError:
-                pass
-            return await self.db.delete_one({"Snowflake": identifier})
+            await self.bot.sync_bus.publish(
+                SyncEvent(
+                    "SyncDeletePunishment",
+                    selected_item["Guild"],
+                    punishment_id=str(selected_item["_id"]),
+                    snowflake=identifier,
+                )
+            )
+            result = await self.db.delete_one({"Snowflake": identifier})
+            if result.deleted_count:
+                await self.stats.record([selected_item], -1)
+            return result
         else:
             return ValueError("Warning does not exist.")
 
@@ -438,8 +458,18 @@ class Warnings(Document):
         guild_id: int | None = None,
     ):
         """
-        Counts the warnings in the database.
+        Counts the warnings in the database. Counts within a guild by
+        moderator or user are served from the punishment statistics.
         """
+        if (
+            guild_id is not None
+            and identifier is None
+            and warning_type is None
+            and (moderator_id is None or user_id is None)
+        ):
+            return await self.stats.count(
+                guild_id, moderator_id=moderator_id, user_id=user_id
+            )
 
         map = {
             "Snowflake": identifier,
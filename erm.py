@@ -11,9 +11,13 @@ import asyncio
 from datamodels.MapleKeys import MapleKeys
 from datamodels.Whitelabel import Whitelabel
 from tasks.iterate_ics import iterate_ics
-from tasks.check_loa import check_loa
-from tasks.check_reminders import check_reminders
-from tasks.check_infractions import check_infractions
+from tasks.check_loa import load_loas, expire_loa
+from tasks.check_reminders import load_reminders, fire_reminder
+from tasks.check_infractions import (
+    check_infractions,
+    load_temporary_roles,
+    expire_temporary_roles,
+)
 from tasks.iterate_prc_logs import iterate_prc_logs
 from tasks.tempban_checks import tempban_checks
 from tasks.process_scheduled_pms import process_scheduled_pms
@@ -24,8 +28,26 @@ from tasks.sync_weather import sync_weather
 from tasks.iterate_conditions import iterate_conditions
 from tasks.prc_automations import prc_automations
 from tasks.mc_discord_checks import mc_discord_checks
+from tasks.reconcile_punishment_stats import reconcile_punishment_stats
 from utils.accounts import Accounts
 from utils.emojis import EmojiController
+from utils.whitelabel import WhitelabelCache
+from utils.permissions import PermissionResolver
+from utils.sync_bus import SyncBus
+from utils.permission_sync import PermissionSync
+from utils.linked_guilds import LinkedGuildRegistry
+from utils.guild_sweep import GuildCircuitBreaker
+from utils import metrics
+from utils.scheduler import DeadlineScheduler
+from utils.ttl_store import CounterStore
+from utils.partition import WorkPartition, shard_config
+from utils.startup import (
+    StartupOrchestrator,
+    GATEWAY,
+    GUILD_CACHE,
+    DATABASE,
+    LINKED_GUILDS,
+)
 
 from utils.log_tracker import LogTracker
 from utils.mc_api import MCApiClient
@@ -68,7 +90,7 @@ from datamodels.PendingOAuth2 import PendingOAuth2
 from datamodels.OAuth2Users import OAuth2Users
 from datamodels.IntegrationCommandStorage import IntegrationCommandStorage
 from datamodels.SavedLogs import SavedLogs
-from menus import CompleteReminder, LOAMenu, RDMActions
+from utils.view_registry import get_view
 from utils.viewstatemanger import ViewStateManager
 from utils.bloxlink import Bloxlink
 from utils.prc_api import PRCApiClient
@@ -132,6 +154,19 @@ class Bot(commands.AutoShardedBot):
         self._cache_timeout = 300
 
     async def close(self):
+        if getattr(self, "whitelabel_cache", None) is not None:
+            self.whitelabel_cache.stop()
+        if getattr(self, "linked_guilds", None) is not None:
+            self.linked_guilds.stop()
+        if getattr(self, "permission_sync", None) is not None:
+            await self.permission_sync.stop()
+        if getattr(self, "sync_bus", None) is not None:
+            await self.sync_bus.stop()
+        if getattr(self, "scheduler", None) is not None:
+            self.scheduler.stop()
+        for counter in ("pm_counter", "discord_check_counter"):
+            if getattr(self, counter, None) is not None:
+                await getattr(self, counter).flush()
         for session in self.external_http_sessions:
             if session is not None and session.closed is False:
                 await session.close()
@@ -162,7 +197,10 @@ class Bot(commands.AutoShardedBot):
                     self.user.name
                 )
             )
-            self.mongo = motor.motor_asyncio.AsyncIOMotorClient(str(mongo_url))
+            self.mongo = motor.motor_asyncio.AsyncIOMotorClient(
+                str(mongo_url), event_listeners=[metrics.MongoCommandListener()]
+            )
+            metrics.install_discord_rate_limit_handler()
             if environment == "DEVELOPMENT":
                 self.db = self.mongo["erm"]
             elif environment == "PRODUCTION":
@@ -184,15 +222,42 @@ class Bot(commands.AutoShardedBot):
 
             self.log_tracker = LogTracker(self)
             self.scheduled_pm_queue = asyncio.Queue()
-            self.pm_counter = {}
+            # Warnings sent per player, per guild. A count decays after an
+            # hour without another warning.
+            self.pm_counter = CounterStore(
+                "pm_counter", window=3600, collection=self.db.violation_counters
+            )
+            self.discord_check_counter = CounterStore(
+                "discord_check_counter",
+                window=3600,
+                collection=self.db.violation_counters,
+            )
             self.team_restrictions_infractions = (
                 {}
             )  # Guild ID => [ { Username: Count } ]
 
-            self.shift_management = ShiftManagement(self.db, "shift_management")
+            self.sync_bus = SyncBus(self)
+            self.sync_bus.start()
+            self.permission_sync = PermissionSync(self)
+            self.permission_sync.start()
+
+            self.shift_management = ShiftManagement(
+                self.db, "shift_management", sync_bus=self.sync_bus
+            )
+            self.partition = WorkPartition(self)
+            self.guild_breaker = GuildCircuitBreaker()
+            self.scheduler = DeadlineScheduler(self)
+            self.scheduler.register("reminder", load_reminders, fire_reminder)
+            self.scheduler.register("loa", load_loas, expire_loa)
+            self.scheduler.register(
+                "temporary_roles", load_temporary_roles, expire_temporary_roles
+            )
+
             self.errors = Errors(self.db, "errors")
-            self.loas = ActivityNotices(self.db, "leave_of_absences")
-            self.reminders = Reminders(self.db, "reminders")
+            self.loas = ActivityNotices(
+                self.db, "leave_of_absences", scheduler=self.scheduler
+            )
+            self.reminders = Reminders(self.db, "reminders", scheduler=self.scheduler)
             self.custom_commands = CustomCommands(self.db, "custom_commands")
             self.analytics = Analytics(self.db, "analytics")
             self.punishment_types = PunishmentTypes(self.db, "punishment_types")
@@ -203,11 +268,22 @@ class Bot(commands.AutoShardedBot):
             self.fivem_links = FiveMLinks(self.db, "fivem_links")
             self.consent = Consent(self.db, "consent")
             self.punishments = Warnings(self)
-            self.settings = Settings(self.db, "settings")
-            self.server_keys = ServerKeys(self.db, "server_keys")
+            self.permission_resolver = PermissionResolver(self)
+            self.linked_guilds = LinkedGuildRegistry(self)
+            self.settings = Settings(
+                self.db,
+                "settings",
+                permission_resolver=self.permission_resolver,
+                linked_guilds=self.linked_guilds,
+            )
+            self.server_keys = ServerKeys(
+                self.db, "server_keys", linked_guilds=self.linked_guilds
+            )
 
             self.maple_county = self.mongo["MapleCounty"]
             self.mc_keys = MapleKeys(self.maple_county, "Auth")
+            self.linked_guilds.start()
+            metrics.register_bot_gauges(self)
 
             self.staff_connections = StaffConnections(self.db, "staff_connections")
             self.ics = IntegrationCommandStorage(self.db, "logged_command_data")
@@ -215,6 +291,8 @@ class Bot(commands.AutoShardedBot):
             self.prohibited = ProhibitedUseKeys(self.db, "prohibited_keys")
             self.saved_logs = SavedLogs(self.db, "saved_logs")
             self.whitelabel = Whitelabel(self.mongo["ERMProcessing"], "Instances")
+            self.whitelabel_cache = WhitelabelCache(self)
+            await self.whitelabel_cache.start()
 
             self.pending_oauth2 = PendingOAuth2(self.db, "pending_oauth2")
             self.oauth2_users = OAuth2Users(self.db, "oauth2")
@@ -305,55 +383,46 @@ class Bot(commands.AutoShardedBot):
                             await self.views.delete_by_id(document["_id"])
                             continue
                     self.add_view(
-                        LOAMenu(*document["args"]), message_id=document["message_id"]
+                        get_view("LOAMenu")(*document["args"]),
+                        message_id=document["message_id"],
                     )
             self.setup_status = True
 
+    async def start_scheduler(self):
+        await asyncio.gather(
+            self.db.leave_of_absences.create_index(
+                [("expired", 1), ("accepted", 1), ("expiry", 1)]
+            ),
+            self.db.infractions.create_index("temp_roles_expire_at", sparse=True),
+        )
+        await self.scheduler.start()
+        logging.info(
+            f"Started the deadline scheduler with {len(self.scheduler)} reminders, LOAs and temporary roles..."
+        )
+
     async def start_tasks(self):
         logging.info("Starting tasks...")
-        check_reminders.start(bot)
-        logging.info("Startng the Check Reminders task...")
-        await asyncio.sleep(30)
-        check_loa.start(bot)
-        logging.info("Starting the Check LOA task...")
-        await asyncio.sleep(30)
-        iterate_ics.start(bot)
-        logging.info("Starting the Iterate ICS task...")
-        await asyncio.sleep(30)
-        iterate_prc_logs.start(bot)
-        logging.info("Starting the Iterate PRC Logs task...")
-        await asyncio.sleep(30)
-        statistics_check.start(bot)
-        logging.info("Starting the Statistics Check task...")
-        await asyncio.sleep(30)
-        tempban_checks.start(bot)
-        logging.info("Starting the Tempban Checks task...")
-        await asyncio.sleep(30)
-        check_whitelisted_car.start(bot)
-        logging.info("Starting the Check Whitelisted Car task...")
+        startup = self.startup = StartupOrchestrator(self)
+        startup.add("deadline_scheduler", self.start_scheduler, GATEWAY, DATABASE)
+        startup.add_loop("iterate_ics", iterate_ics, GUILD_CACHE)
+        startup.add_loop("iterate_prc_logs", iterate_prc_logs, GUILD_CACHE, LINKED_GUILDS)
+        startup.add_loop("statistics_check", statistics_check, GATEWAY)
+        startup.add_loop("tempban_checks", tempban_checks, GATEWAY, DATABASE)
+        startup.add_loop(
+            "check_whitelisted_car", check_whitelisted_car, GUILD_CACHE, LINKED_GUILDS
+        )
         if self.environment != "CUSTOM":
-            await asyncio.sleep(30)
-            change_status.start(bot)
-        logging.info("Starting the Change Status task...")
-        await asyncio.sleep(30)
-        process_scheduled_pms.start(bot)
-        logging.info("Starting the Process Scheduled PMs task...")
-        await asyncio.sleep(30)
-        sync_weather.start(bot)
-        logging.info("Starting the Sync Weather task...")
-        await asyncio.sleep(30)
-        iterate_conditions.start(bot)
-        logging.info("Starting the Iterate Conditions task...")
-        await asyncio.sleep(30)
-        check_infractions.start(bot)
-        logging.info("Starting the Check Infractions task...")
-        await asyncio.sleep(30)
-        prc_automations.start(bot)
-        logging.info("Starting the ER:LC Discord Checks task...")
-        await asyncio.sleep(30)
-        mc_discord_checks.start(bot)
-        logging.info("Starting the MC Discord Checks task...")
-        logging.info("All tasks are now running!")
+            startup.add_loop("change_status", change_status, GATEWAY)
+        startup.add_loop("process_scheduled_pms", process_scheduled_pms, GATEWAY)
+        startup.add_loop("sync_weather", sync_weather, GATEWAY, LINKED_GUILDS)
+        startup.add_loop("iterate_conditions", iterate_conditions, GUILD_CACHE)
+        startup.add_loop("check_infractions", check_infractions, GUILD_CACHE)
+        startup.add_loop("prc_automations", prc_automations, GUILD_CACHE, LINKED_GUILDS)
+        startup.add_loop(
+            "mc_discord_checks", mc_discord_checks, GUILD_CACHE, LINKED_GUILDS
+        )
+        startup.add_loop("reconcile_punishment_stats", reconcile_punishment_stats, DATABASE)
+        await startup.run()
 
 
 if config("ENVIRONMENT") == "CUSTOM":
@@ -367,6 +436,7 @@ bot = Bot(
     allowed_mentions=discord.AllowedMentions(
         replied_user=False, everyone=False, roles=False
     ),
+    **(shard_config() if config("ENVIRONMENT") != "CUSTOM" else {}),
 )
 bot.is_synced = False
 bot.shift_management_disabled = False
@@ -439,6 +509,7 @@ async def loggingCommandExecution(ctx: commands.Context):
             datetime.datetime.now(tz=pytz.UTC).timestamp()
             - internal_command_storage[ctx]
         )
+        metrics.command_seconds.observe(duration, command_name)
         logging.info(
             f"Command {command_name} was run by {ctx.author.name} ({ctx.author.id}) and lasted {duration} seconds"
         )
@@ -480,7 +551,7 @@ async def on_message(
                 )
                 return
 
-    if environment == "PRODUCTION" and await bot.whitelabel.db.find_one({"GuildID": str(message.guild.id)}) is not None:
+    if environment == "PRODUCTION" and message.guild.id in bot.whitelabel_cache:
         return
 
     await bot.process_commands(message)
@@ -490,83 +561,15 @@ client = roblox.Client()
 
 
 async def staff_check(bot_obj, guild, member):
-    guild_settings = await bot_obj.settings.find_by_id(guild.id)
-    if guild_settings:
-        if "role" in guild_settings["staff_management"].keys():
-            if guild_settings["staff_management"]["role"] != "":
-                if isinstance(guild_settings["staff_management"]["role"], list):
-                    for role in guild_settings["staff_management"]["role"]:
-                        if role in [role.id for role in member.roles]:
-                            return True
-                elif isinstance(guild_settings["staff_management"]["role"], int):
-                    if guild_settings["staff_management"]["role"] in [
-                        role.id for role in member.roles
-                    ]:
-                        return True
-                    
-    if await admin_check(bot_obj, guild, member):
-        return True
-    
-    if member.guild_permissions.manage_messages:
-        return True
-    return False
+    return (await bot_obj.permission_resolver.permissions(guild, member)).staff
 
 
 async def management_check(bot_obj, guild, member):
-    guild_settings = await bot_obj.settings.find_by_id(guild.id)
-    if guild_settings:
-        if "management_role" in guild_settings["staff_management"].keys():
-            if guild_settings["staff_management"]["management_role"] != "":
-                if isinstance(
-                    guild_settings["staff_management"]["management_role"], list
-                ):
-                    for role in guild_settings["staff_management"]["management_role"]:
-                        if role in [role.id for role in member.roles]:
-                            return True
-                elif isinstance(
-                    guild_settings["staff_management"]["management_role"], int
-                ):
-                    if guild_settings["staff_management"]["management_role"] in [
-                        role.id for role in member.roles
-                    ]:
-                        return True
-    if member.guild_permissions.manage_guild:
-        return True
-    return False
+    return (await bot_obj.permission_resolver.permissions(guild, member)).management
 
 
 async def admin_check(bot_obj, guild, member):
-    guild_settings = await bot_obj.settings.find_by_id(guild.id)
-    if guild_settings:
-        if "admin_role" in guild_settings["staff_management"].keys():
-            if guild_settings["staff_management"]["admin_role"] != "":
-                if isinstance(guild_settings["staff_management"]["admin_role"], list):
-                    for role in guild_settings["staff_management"]["admin_role"]:
-                        if role in [role.id for role in member.roles]:
-                            return True
-                elif isinstance(guild_settings["staff_management"]["admin_role"], int):
-                    if guild_settings["staff_management"]["admin_role"] in [
-                        role.id for role in member.roles
-                    ]:
-                        return True
-        if "management_role" in guild_settings["staff_management"].keys():
-            if guild_settings["staff_management"]["management_role"] != "":
-                if isinstance(
-                    guild_settings["staff_management"]["management_role"], list
-                ):
-                    for role in guild_settings["staff_management"]["management_role"]:
-                        if role in [role.id for role in member.roles]:
-                            return True
-                elif isinstance(
-                    guild_settings["staff_management"]["management_role"], int
-                ):
-                    if guild_settings["staff_management"]["management_role"] in [
-                        role.id for role in member.roles
-                    ]:
-                        return True
-    if member.guild_permissions.administrator:
-        return True
-    return False
+    return (await bot_obj.permission_resolver.permissions(guild, member)).admin
 
 
 async def staff_predicate(ctx):
@@ -5,6 +5,7 @@ from bson import ObjectId
 from discord.ext import commands
 from datamodels.ShiftManagement import ShiftItem
 from utils.constants import BLANK_COLOR
+from utils.internal_events import ShiftEvent
 from utils.timestamp import td_format
 
 
@@ -13,18 +14,18 @@ class OnBreakStart(commands.Cog):
         self.bot = bot
 
     @commands.Cog.listener()
-    async def on_break_start(self, object_id: ObjectId):
+    async def on_break_start(self, payload: ShiftEvent | ObjectId):
 
-        document = await self.bot.shift_management.shifts.find_by_id(object_id)
-        if not document:
+        event = await ShiftEvent.resolve(self.bot, payload)
+        if event is None:
             return
-        shift: ShiftItem = await self.bot.shift_management.fetch_shift(object_id)
+        shift: ShiftItem = event.shift
 
         guild: discord.Guild = self.bot.get_guild(shift.guild)
         if guild is None:
             return
 
-        guild_settings = await self.bot.settings.find_by_id(guild.id)
+        guild_settings = event.settings
         if not guild_settings:
             return
 
@@ -260,10 +260,23 @@ class OnInfractionCreate(commands.Cog):
             if roles_removed:
                 update_data["roles_removed"] = roles_removed
 
+            expiries = []
+            for field in ("temp_roles_added", "temp_roles_removed"):
+                if infraction_doc.get(field):
+                    update_data[field] = infraction_doc[field]
+                    update_data[f"{field}_expiry"] = infraction_doc[f"{field}_expiry"]
+                    expiries.append(infraction_doc[f"{field}_expiry"])
+            if expiries:
+                update_data["temp_roles_expire_at"] = min(expiries)
+
             try:
                 await self.bot.db.infractions.update_one(
                     {"_id": infraction_doc["_id"]}, {"$set": update_data}
                 )
+                if expiries:
+                    self.bot.scheduler.schedule(
+                        "temporary_roles", infraction_doc["_id"], min(expiries)
+                    )
             except Exception as e:
                 logger.error(
                     f"Failed to update infraction document with role changes: {e}"
@@ -11,6 +11,7 @@ class OnMemberRemove(commands.Cog):
 
     @commands.Cog.listener("on_member_remove")
     async def on_member_remove(self, member: discord.Member):
+        self.bot.permission_resolver.invalidate(member.guild.id, member.id)
         try:
             url_var = config("BASE_API_URL")
             if url_var in ["", None]:
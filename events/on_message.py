@@ -16,7 +16,7 @@ from utils.prc_api import Player
 from utils.constants import BLANK_COLOR, GREEN_COLOR
 from utils.utils import generator, has_whitelabel
 from utils.utils import interpret_content, interpret_embed
-from menus import CustomSelectMenu, GameSecurityActions
+from utils.view_registry import get_view
 from utils.timestamp import td_format
 from utils.utils import get_guild_icon, get_prefix, invis_embed
 
@@ -206,7 +206,7 @@ class OnMessage(commands.Cog):
                                                         )
                                                         .set_thumbnail(url=thumbnail)
                                                     )
-                                                    view = GameSecurityActions(bot)
+                                                    view = get_view("GameSecurityActions")(bot)
                                                     if not "kicked" in raw_content:
                                                         view.enable_reflective_action()
 
@@ -4,6 +4,7 @@ from bson import ObjectId
 from roblox.client import Client
 from datamodels.Warnings import WarningItem
 from utils.constants import BLANK_COLOR
+from utils.internal_events import PunishmentEvent
 import roblox
 import logging
 
@@ -13,14 +14,17 @@ class OnPunishment(commands.Cog):
         self.bot = bot
 
     @commands.Cog.listener()
-    async def on_punishment(self, objectid: ObjectId):
-        warning: WarningItem = await self.bot.punishments.fetch_warning(objectid)
+    async def on_punishment(self, payload: PunishmentEvent | ObjectId):
+        event = await PunishmentEvent.resolve(self.bot, payload)
+        if event is None:
+            return
+        warning: WarningItem = event.warning
         guild = self.bot.get_guild(warning.guild_id)
         if guild is None:
             logging.error(f"Guild with ID {warning.guild_id} not found.")
             return
 
-        guild_settings = await self.bot.settings.find_by_id(guild.id)
+        guild_settings = event.settings
         if not guild_settings:
             logging.error(f"Settings for guild ID {guild.id} not found.")
             return
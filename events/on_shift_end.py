@@ -1,14 +1,13 @@
-import asyncio
 import datetime
 
-import aiohttp
 import discord
 from bson import ObjectId
 from discord.ext import commands
 from datamodels.ShiftManagement import ShiftItem
 from utils.constants import BLANK_COLOR
+from utils.internal_events import ShiftEvent
+from utils.sync_bus import SyncEvent
 from utils.timestamp import td_format
-from decouple import config
 
 
 class OnShiftEnd(commands.Cog):
@@ -16,60 +15,28 @@ class OnShiftEnd(commands.Cog):
         self.bot = bot
 
     @commands.Cog.listener()
-    async def on_shift_end(self, object_id: ObjectId):
+    async def on_shift_end(self, payload: ShiftEvent | ObjectId):
 
-        document = await self.bot.shift_management.shifts.find_by_id(object_id)
-        if not document:
+        event = await ShiftEvent.resolve(self.bot, payload)
+        if event is None:
             return
-        shift: ShiftItem = await self.bot.shift_management.fetch_shift(object_id)
-
-        url_var = config("BASE_API_URL")
-        panel_url_var = config("PANEL_API_URL")
-
-        guild_id = document["Guild"]
-        
-        async def sync_end_with_apis():
-            async with aiohttp.ClientSession() as session:
-                tasks = []
-
-                if url_var not in ["", None]:
-                    tasks.append(
-                        session.get(
-                            f"{url_var}/Internal/SyncEndShift/{document['UserID']}/{guild_id}",
-                            headers={"Authorization": config("INTERNAL_API_AUTH")},
-                            raise_for_status=True,
-                        )
-                    )
-
-                if panel_url_var not in ["", None]:
-                    tasks.append(
-                        session.delete(
-                            f"{panel_url_var}/{guild_id}/SyncEndShift?ID={document['_id']}",
-                            headers={"X-Static-Token": config("PANEL_STATIC_AUTH")},
-                            raise_for_status=True,
-                        )
-                    )
-
-                if tasks:
-                    responses = await asyncio.gather(*tasks, return_exceptions=True)
-                    for response in responses:
-                        if isinstance(response, Exception):
-                            self.logger.error(
-                                f"End shift API sync failed: {str(response)}"
-                            )
-
-        try:
-            await sync_end_with_apis()
-        except aiohttp.ClientError as e:
-            self.logger.error(f"Failed to sync shift end with APIs: {str(e)}")
-        except Exception as e:
-            self.logger.error(f"Unexpected error during end shift API sync: {str(e)}")
+        document = event.document
+        shift: ShiftItem = event.shift
+
+        await self.bot.sync_bus.publish(
+            SyncEvent(
+                "SyncEndShift",
+                document["Guild"],
+                shift_id=str(document["_id"]),
+                user_id=document["UserID"],
+            )
+        )
 
         guild: discord.Guild = self.bot.get_guild(shift.guild)
         if guild is None:
             return
 
-        guild_settings = await self.bot.settings.find_by_id(guild.id)
+        guild_settings = event.settings
         if not guild_settings:
             return
 
@@ -143,9 +110,7 @@ class OnShiftEnd(commands.Cog):
                 pass
 
         moderation_counts = {}
-        for entry in shift.moderations:
-            entry = await self.bot.punishments.fetch_warning(str(entry))
-
+        for entry in await self.bot.punishments.fetch_warnings(shift.moderations):
             if entry.warning_type in moderation_counts:
                 moderation_counts[entry.warning_type] += 1
             else:
@@ -192,12 +157,9 @@ class OnShiftEnd(commands.Cog):
                 .set_thumbnail(url=staff_member.display_avatar.url)
             )
         shift_reports_enabled = True
-        async for document in self.bot.consent.db.find({"_id": staff_member.id}):
-            shift_reports_enabled = (
-                document.get("shift_reports")
-                if document.get("shift_reports") is not None
-                else True
-            )
+        consent = await self.bot.consent.db.find_one({"_id": staff_member.id})
+        if consent is not None and consent.get("shift_reports") is not None:
+            shift_reports_enabled = consent.get("shift_reports")
         if shift_reports_enabled:
             embed = (
                 discord.Embed(title="Shift Report", color=BLANK_COLOR)
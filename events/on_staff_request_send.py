@@ -6,7 +6,7 @@ from erm import Bot
 from bson import ObjectId
 from decouple import config
 
-from menus import AcknowledgeStaffRequest
+from utils.view_registry import get_view
 from utils import prc_api
 from utils.constants import BLANK_COLOR
 
@@ -82,7 +82,7 @@ class OnStaffRequestSend(commands.Cog):
             ", ".join(["<@&{0}>".format(role) for role in mentioned_roles]),
             embed=embed,
             allowed_mentions=discord.AllowedMentions.all(),
-            view=AcknowledgeStaffRequest(self.bot, o_id),
+            view=get_view("AcknowledgeStaffRequest")(self.bot, o_id),
         )
 
 
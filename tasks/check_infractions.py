@@ -8,68 +8,98 @@ import datetime
 from utils.constants import BLANK_COLOR
 import pytz
 
+# How long to wait before trying again to revert the roles of a member who
+# can't be resolved, such as one Discord is failing to return.
+MEMBER_RETRY_SECONDS = 3600
 
-@tasks.loop(hours=1)
-async def check_infractions(bot):
-    try:
-        current_time = datetime.datetime.now(tz=pytz.UTC).timestamp()
-        initial_time = time.time()
 
+async def load_temporary_roles(bot) -> dict:
+    """
+    Returns when the temporary roles of each infraction expire.
+    """
+    return {
+        infraction["_id"]: infraction["temp_roles_expire_at"]
         async for infraction in bot.db.infractions.find(
-            {"temp_roles_expire_at": {"$exists": True}}
-        ):
-            if infraction["temp_roles_expire_at"] <= current_time:
-                try:
-                    guild = bot.get_guild(infraction["guild_id"])
-                    if not guild:
-                        continue
+            bot.partition.query({"temp_roles_expire_at": {"$exists": True}}, "guild_id"),
+            {"temp_roles_expire_at": 1},
+        )
+    }
+
+
+async def expire_temporary_roles(bot, infraction_id) -> float | None:
+    """
+    Reverts the temporary role changes of an infraction whose duration has
+    passed. Roles added and roles removed can expire at different times, in
+    which case this returns when the remaining ones expire. If the member
+    can't be resolved, the roles are kept and retried later.
+    """
+    infraction = await bot.db.infractions.find_one({"_id": infraction_id})
+    if not infraction or "temp_roles_expire_at" not in infraction:
+        return None
+    current_time = datetime.datetime.now(tz=pytz.UTC).timestamp()
+    if infraction["temp_roles_expire_at"] > current_time:
+        return infraction["temp_roles_expire_at"]
+
+    guild = bot.get_guild(infraction["guild_id"])
+    if not guild:
+        return None
+    member = guild.get_member(infraction["user_id"])
+    if member is None:
+        try:
+            member = await guild.fetch_member(infraction["user_id"])
+        except discord.HTTPException:
+            return current_time + MEMBER_RETRY_SECONDS
+
+    unset = {}
+    remaining = []
+    for field, action in (("temp_roles_added", "remove"), ("temp_roles_removed", "add")):
+        if not infraction.get(field):
+            continue
+        expiry = infraction.get(f"{field}_expiry", infraction["temp_roles_expire_at"])
+        if expiry > current_time:
+            remaining.append(expiry)
+            continue
+
+        roles = [
+            role
+            for role_id in infraction[field]
+            if (role := guild.get_role(int(role_id)))
+        ]
+        if roles and action == "remove":
+            await member.remove_roles(
+                *roles, reason="Temporary infraction role duration expired"
+            )
+        elif roles:
+            await member.add_roles(
+                *roles, reason="Temporary infraction role removal expired"
+            )
+        unset[field] = ""
+        unset[f"{field}_expiry"] = ""
 
-                    member = guild.get_member(infraction["user_id"])
-                    if not member:
-                        continue
+    if remaining:
+        await bot.db.infractions.update_one(
+            {"_id": infraction["_id"]},
+            {"$set": {"temp_roles_expire_at": min(remaining)}, "$unset": unset},
+        )
+        return min(remaining)
 
-                    if infraction.get("temp_roles_added"):
-                        roles_to_remove = []
-                        for role_id in infraction["temp_roles_added"]:
-                            role = guild.get_role(int(role_id))
-                            if role:
-                                roles_to_remove.append(role)
-                        if roles_to_remove:
-                            await member.remove_roles(
-                                *roles_to_remove,
-                                reason="Temporary infraction role duration expired",
-                            )
+    unset["temp_roles_expire_at"] = ""
+    await bot.db.infractions.update_one({"_id": infraction["_id"]}, {"$unset": unset})
+    return None
 
-                    if infraction.get("temp_roles_removed"):
-                        roles_to_add = []
-                        for role_id in infraction["temp_roles_removed"]:
-                            role = guild.get_role(int(role_id))
-                            if role:
-                                roles_to_add.append(role)
-                        if roles_to_add:
-                            await member.add_roles(
-                                *roles_to_add,
-                                reason="Temporary infraction role removal expired",
-                            )
 
-                    await bot.db.infractions.update_one(
-                        {"_id": infraction["_id"]},
-                        {
-                            "$unset": {
-                                "temp_roles_expire_at": "",
-                                "temp_roles_added": "",
-                                "temp_roles_removed": "",
-                            }
-                        },
-                    )
-                except Exception as e:
-                    logging.error(
-                        f"Error processing temporary roles for infraction {infraction['_id']}: {str(e)}"
-                    )
+@tasks.loop(hours=1)
+async def check_infractions(bot):
+    try:
+        current_time = datetime.datetime.now(tz=pytz.UTC).timestamp()
+        initial_time = time.time()
 
         cached_settings = {}
         async for infraction in bot.db.infractions.find(
-            {"revoked": {"$ne": True}, "check_executed": {"$exists": False}}
+            bot.partition.query(
+                {"revoked": {"$ne": True}, "check_executed": {"$exists": False}},
+                "guild_id",
+            )
         ):
             try:
                 guild_id = infraction["guild_id"]
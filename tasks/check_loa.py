@@ -1,24 +1,18 @@
 import datetime
-import asyncio
-from collections import defaultdict
-
 import discord
 from decouple import config
-from discord.ext import commands, tasks
+from discord.ext import commands
 
 from utils.constants import RED_COLOR, BLANK_COLOR
+from utils.ttl_store import MISSING, TTLStore
 
-_member_cache = defaultdict(dict)
-_member_cache_timeout = 300
+_member_cache = TTLStore("loa_members", ttl=300, max_entries=20_000)
 
 async def get_cached_member(guild, user_id):
     """Get member with caching to reduce API calls"""
-    now = datetime.datetime.now().timestamp()
-
-    if user_id in _member_cache[guild.id]:
-        member_obj, cached_time = _member_cache[guild.id][user_id]
-        if now - cached_time < _member_cache_timeout:
-            return member_obj
+    member = _member_cache.get(guild.id, user_id, MISSING)
+    if member is not MISSING:
+        return member
 
     member = guild.get_member(user_id)
     if not member:
@@ -27,64 +21,60 @@ async def get_cached_member(guild, user_id):
         except discord.HTTPException:
             member = None
 
-    _member_cache[guild.id][user_id] = (member, now)
+    _member_cache.set(guild.id, user_id, member)
     return member
 
 
-@tasks.loop(minutes=1, reconnect=True)
-async def check_loa(bot):
-    try:
-        guild_loas = defaultdict(list)
+def get_loa_roles(guild, settings) -> list:
+    roles = [None]
+    if "loa_role" in settings.get("staff_management", {}):
+        try:
+            loa_role_config = settings["staff_management"]["loa_role"]
+            if isinstance(loa_role_config, int):
+                role = guild.get_role(loa_role_config)
+                roles = [role] if role else [None]
+            elif isinstance(loa_role_config, list):
+                roles = [
+                    guild.get_role(role_id) for role_id in loa_role_config
+                ]
+                roles = [r for r in roles if r is not None]
+        except KeyError:
+            pass
+    return roles
+
 
+async def load_loas(bot) -> dict:
+    """
+    Returns the expiry of every accepted LOA which hasn't expired yet.
+    """
+    return {
+        loaObject["_id"]: loaObject["expiry"]
         async for loaObject in bot.loas.db.find(
-            {"expired": False, "expiry": {"$lt": datetime.datetime.now().timestamp()}}
-        ):
-            guild_loas[loaObject["guild_id"]].append(loaObject)
-
-        for guild_id, loas in guild_loas.items():
-            try:
-                guild = bot.get_guild(guild_id)
-                if not guild:
-                    continue
-
-                settings = await bot.settings.find_by_id(guild.id)
-                if not settings:
-                    continue
-
-                roles = [None]
-                if "loa_role" in settings.get("staff_management", {}):
-                    try:
-                        loa_role_config = settings["staff_management"]["loa_role"]
-                        if isinstance(loa_role_config, int):
-                            role = guild.get_role(loa_role_config)
-                            roles = [role] if role else [None]
-                        elif isinstance(loa_role_config, list):
-                            roles = [
-                                guild.get_role(role_id) for role_id in loa_role_config
-                            ]
-                            roles = [r for r in roles if r is not None]
-                    except KeyError:
-                        pass
-
-                batch_size = 5
-                for i in range(0, len(loas), batch_size):
-                    batch = loas[i : i + batch_size]
-                    await asyncio.gather(
-                        *[
-                            process_loa(bot, guild, loa, settings, roles)
-                            for loa in batch
-                        ],
-                        return_exceptions=True,
-                    )
-
-                    if i + batch_size < len(loas):
-                        await asyncio.sleep(1)
-
-            except Exception as e:
-                print(f"Error processing guild {guild_id}: {e}")
-
-    except ValueError:
-        pass
+            bot.partition.query(
+                {"expired": False, "accepted": True, "expiry": {"$exists": True}},
+                "guild_id",
+            ),
+            {"expiry": 1},
+        )
+    }
+
+
+async def expire_loa(bot, loa_id) -> float | None:
+    loaObject = await bot.loas.db.find_one({"_id": loa_id})
+    if not loaObject or loaObject.get("expired") or not loaObject.get("accepted"):
+        return None
+    if loaObject["expiry"] > datetime.datetime.now().timestamp():
+        return loaObject["expiry"]  # extended since it was scheduled
+
+    guild = bot.get_guild(loaObject["guild_id"])
+    if not guild:
+        return None
+    settings = await bot.settings.find_by_id(guild.id)
+    if not settings:
+        return None
+
+    await process_loa(bot, guild, loaObject, settings, get_loa_roles(guild, settings))
+    return None
 
 
 async def process_loa(bot, guild, loaObject, settings, roles):
@@ -1,5 +1,4 @@
 import datetime
-import re
 import time
 import discord
 import pytz
@@ -8,16 +7,19 @@ from discord.ext import commands, tasks
 import logging
 import asyncio
 import roblox
-from collections import defaultdict
 
 from utils.constants import RED_COLOR, BLANK_COLOR
 from utils.prc_api import Player
 from utils import prc_api
-from utils.utils import is_whitelisted, run_command
+from utils.ttl_store import MISSING, TTLStore
+from utils.utils import run_command
+from utils.vehicle_whitelist import get_vehicle_whitelist
+from utils.guild_sweep import GuildSweep
 
 _guild_cache = {}
-_member_search_cache = defaultdict(dict)
+_member_search_cache = TTLStore("whitelisted_car_members", ttl=300, max_entries=20_000)
 _cache_timeout = 300
+_sweep = GuildSweep("check_whitelisted_car", concurrency=3, budget=120)
 
 
 @tasks.loop(minutes=10, reconnect=True)
@@ -25,115 +27,88 @@ async def check_whitelisted_car(bot):
     initial_time = time.time()
     logging.info("Starting check_whitelisted_car task")
 
-    base = {"ERLC.vehicle_restrictions.enabled": True}
-    pipeline = [
-        {"$match": base},
-        {
-            "$lookup": {
-                "from": "server_keys",
-                "localField": "_id",
-                "foreignField": "_id",
-                "as": "server_key",
-            }
-        },
-        {"$match": {"server_key": {"$ne": []}}},
-    ]
-
-    semaphore = asyncio.Semaphore(3)
     async def process_guild(items):
-        async with semaphore:
-            guild_id = items["_id"]
-            logging.info(f"Processing guild ID: {guild_id}")
+        guild_id = items["_id"]
+        logging.info(f"Processing guild ID: {guild_id}")
 
-            try:
-                settings = items["ERLC"].get("vehicle_restrictions", {})
-                if not settings:
-                    return
-
-                whitelisted_vehicle_roles = settings.get("roles", [])
-                alert_channel_id = settings.get("channel")
-                whitelisted_vehicles = settings.get("cars", [])
-                alert_message = settings.get(
-                    "message", "You do not have the required role to use this vehicle."
-                )
-
-                if (
-                    not whitelisted_vehicle_roles
-                    or not alert_channel_id
-                    or not whitelisted_vehicles
-                ):
-                    return
+        try:
+            settings = items["ERLC"].get("vehicle_restrictions", {})
+            if not settings:
+                return
 
-                guild = await get_cached_guild(bot, guild_id)
-                if not guild:
-                    return
+            whitelisted_vehicle_roles = settings.get("roles", [])
+            alert_channel_id = settings.get("channel")
+            whitelisted_vehicles = settings.get("cars", [])
+            alert_message = settings.get(
+                "message", "You do not have the required role to use this vehicle."
+            )
+
+            if (
+                not whitelisted_vehicle_roles
+                or not alert_channel_id
+                or not whitelisted_vehicles
+            ):
+                return
 
-                alert_channel = await get_cached_channel(bot, alert_channel_id)
-                if not alert_channel:
-                    return
+            guild = await get_cached_guild(bot, guild_id)
+            if not guild:
+                return
 
-                exotic_roles = await get_cached_roles(guild, whitelisted_vehicle_roles)
-                if not exotic_roles:
-                    return
+            alert_channel = await get_cached_channel(bot, alert_channel_id)
+            if not alert_channel:
+                return
 
-                try:
-                    players, vehicles = await asyncio.gather(
-                        bot.prc_api.get_server_players(guild_id),
-                        bot.prc_api.get_server_vehicles(guild_id),
-                        return_exceptions=True,
-                    )
+            exotic_roles = await get_cached_roles(guild, whitelisted_vehicle_roles)
+            if not exotic_roles:
+                return
 
-                    if isinstance(players, Exception) or isinstance(vehicles, Exception):
-                        logging.error(f"Failed to fetch server data for guild {guild_id}")
-                        return
+            try:
+                players, vehicles = await asyncio.gather(
+                    bot.prc_api.get_server_players(guild_id),
+                    bot.prc_api.get_server_vehicles(guild_id),
+                    return_exceptions=True,
+                )
 
-                except Exception as e:
-                    logging.error(f"Failed to fetch server data for guild {guild_id}: {e}")
+                if isinstance(players, Exception) or isinstance(vehicles, Exception):
+                    logging.error(f"Failed to fetch server data for guild {guild_id}")
                     return
 
-                player_lookup = {p.username: p for p in players}
-
-                batch_size = 5
-                for i in range(0, len(vehicles), batch_size):
-                    batch = vehicles[i : i + batch_size]
-                    await asyncio.gather(
-                        *[
-                            process_vehicle(
-                                bot,
-                                guild,
-                                player_lookup,
-                                vehicle,
-                                whitelisted_vehicles,
-                                exotic_roles,
-                                alert_channel,
-                                alert_message,
-                            )
-                            for vehicle in batch
-                        ],
-                        return_exceptions=True,
-                    )
-
-                    if i + batch_size < len(vehicles):
-                        await asyncio.sleep(1)
-
-            except discord.errors.NotFound:
-                logging.error(f"Guild or channel not found: {guild_id}")
-                return
             except Exception as e:
-                logging.error(f"Error processing guild {guild_id}: {e}", exc_info=True)
+                logging.error(f"Failed to fetch server data for guild {guild_id}: {e}")
                 return
 
-    guild_tasks = []
-    async for items in bot.settings.db.aggregate(pipeline):
-        guild_tasks.append(process_guild(items))
+            player_lookup = {p.username: p for p in players}
+            whitelist = get_vehicle_whitelist(guild_id, whitelisted_vehicles)
+            vehicles = [v for v in vehicles if whitelist.matches(v.vehicle)]
+
+            batch_size = 5
+            for i in range(0, len(vehicles), batch_size):
+                batch = vehicles[i : i + batch_size]
+                await asyncio.gather(
+                    *[
+                        process_vehicle(
+                            bot,
+                            guild,
+                            player_lookup,
+                            vehicle,
+                            exotic_roles,
+                            alert_channel,
+                            alert_message,
+                        )
+                        for vehicle in batch
+                    ],
+                    return_exceptions=True,
+                )
+
+                if i + batch_size < len(vehicles):
+                    await asyncio.sleep(1)
 
-        if len(guild_tasks) >= 5:
-            await asyncio.gather(*guild_tasks, return_exceptions=True)
-            guild_tasks = []
-            await asyncio.sleep(2)
+        except discord.errors.NotFound:
+            logging.error(f"Guild or channel not found: {guild_id}")
+            return
 
-    if guild_tasks:
-        await asyncio.gather(*guild_tasks, return_exceptions=True)
+    await _sweep.run(bot, bot.linked_guilds.guilds("vehicle_restrictions"), process_guild)
+    await bot.pm_counter.flush()
 
     end_time = time.time()
     logging.info(
@@ -197,40 +172,14 @@ async def get_cached_roles(guild, role_ids):
 
 
 async def process_vehicle(
-    bot, guild, player_lookup, vehicle, whitelisted_vehicles, exotic_roles, alert_channel, alert_message
+    bot, guild, player_lookup, vehicle, exotic_roles, alert_channel, alert_message
 ):
-    """Process individual vehicle check"""
+    """Process individual whitelisted vehicle check"""
     try:
         player = player_lookup.get(vehicle.username)
         if not player:
             return
 
-        def normalize_vehicle_name(name):
-            name = name.lower().strip()
-            year = None
-            year_match = re.search(r"\b(19|20)\d{2}\b", name)
-            if year_match:
-                year = year_match.group(0)
-                name = name.replace(year, "").strip()
-            name = " ".join(name.split())
-            return name, year
-
-        vehicle_name, vehicle_year = normalize_vehicle_name(vehicle.vehicle)
-        is_whitelisted = False
-
-        for wv in whitelisted_vehicles:
-            whitelist_name, whitelist_year = normalize_vehicle_name(str(wv))
-            if vehicle_name == whitelist_name and (
-                not vehicle_year
-                or not whitelist_year
-                or vehicle_year == whitelist_year
-            ):
-                is_whitelisted = True
-                break
-
-        if not is_whitelisted:
-            return
-
         member = await get_cached_member_by_username(bot, guild, player.username, [i.id for i in exotic_roles])
 
         if member:
@@ -246,29 +195,20 @@ async def process_vehicle(
 
 async def get_cached_member_by_username(bot, guild, username, exotic_roles):
     """Get member by username with caching"""
-    now = time.time()
-    cache_key = f"{guild.id}_{username.lower()}"
-
-    if cache_key in _member_search_cache[guild.id]:
-        member_obj, cached_time = _member_search_cache[guild.id][cache_key]
-        if now - cached_time < _cache_timeout:
-            return member_obj
+    member = _member_search_cache.get(guild.id, username.lower(), MISSING)
+    if member is not MISSING:
+        return member
 
     member = await bot.accounts.roblox_to_discord(guild, username, roles=exotic_roles)
 
-    _member_search_cache[guild.id][cache_key] = (member, now)
+    _member_search_cache.set(guild.id, username.lower(), member)
     return member
 
 
 async def handle_pm_counter(bot, player, guild, alert_channel):
-    if player.username not in bot.pm_counter:
-        bot.pm_counter[player.username] = 1
-    else:
-        bot.pm_counter[player.username] += 1
-
-    if bot.pm_counter[player.username] >= 4:
+    if await bot.pm_counter.incr(guild.id, player.username) >= 4:
         await send_warning_embed(bot, player, guild, alert_channel)
-        bot.pm_counter.pop(player.username)
+        await bot.pm_counter.reset(guild.id, player.username)
 
 
 async def handle_non_member(bot, player, guild, alert_channel, alert_message):
@@ -206,7 +206,7 @@ async def iterate_conditions(bot):
     actions = [
         i
         async for i in bot.actions.db.find(
-            {"Conditions": {"$exists": True, "$ne": []}}
+            bot.partition.query({"Conditions": {"$exists": True, "$ne": []}}, "Guild")
         )
     ]
     
@@ -1,119 +1,217 @@
+import collections
+import hashlib
+import json
+import logging
+import time
+
 import discord
 from decouple import config
 from discord.ext import commands, tasks
 
 from utils import prc_api
+from utils.basedataclass import BaseDataClass
+from utils.metrics import guild_processing_seconds
 from utils.prc_api import ServerStatus, Player
-from utils.utils import interpret_content, interpret_embed
+from utils.templates import TemplateRenderer, erlc_data
 
 
-@tasks.loop(minutes=15, reconnect=True)
-async def iterate_ics(bot):
-    # This will aim to constantly update the Integration Command Storage
-    # and the relevant storage data.
+class ICSRefreshStats(BaseDataClass):
+    started_at: float
+    duration: float
+    guilds: int
+    items: int
+    skipped_guilds: int
+    unchanged_items: int
+    edited: int
+    skipped: int
+    removed: int
+    failed: int
+
+
+class ICSContext(BaseDataClass):
+    # What the renderer needs of a context, for messages which aren't fetched.
+    author: discord.abc.User
+    guild: discord.Guild
+
+
+# Stats of the most recent cycles, newest last.
+cycle_history: collections.deque[ICSRefreshStats] = collections.deque(maxlen=24)
+
+
+def _digest(value) -> str:
+    return hashlib.sha256(
+        json.dumps(value, sort_keys=True, default=str).encode()
+    ).hexdigest()
 
-    async for item in bot.ics.db.find({} if bot.environment in ["PRODUCTION", "ALPHA", "DEVELOPMENT"] else {"guild": config("CUSTOM_GUILD_ID")}):
-        guild = bot.get_guild(item["guild"])
 
-        if not guild:
-            try:
-                guild = await bot.fetch_guild(item["guild"])
-            except discord.HTTPException:
-                continue
+def render_hash(content: str | None, embeds: list[discord.Embed]) -> str:
+    return _digest({"content": content, "embeds": [embed.to_dict() for embed in embeds]})
 
-        selected = None
-        custom_command_data = await bot.custom_commands.find_by_id(item["guild"]) or {}
-        for command in custom_command_data.get("commands", []):
-            if command["id"] == item["_id"]:
-                selected = command
 
-        if not selected:
+def template_hash(selected: dict) -> str:
+    # Custom command edits don't touch the ICS document, so the template is
+    # tracked alongside the data it was last rendered with.
+    return _digest(selected["message"])
+
+
+async def _refresh_item(bot, guild, item, selected, data, stats: ICSRefreshStats):
+    hashes = dict(item.get("rendered") or {})
+    removed = []
+    rendered = {}
+    failed = False
+
+    for channel_id, message_id in item.get("associated_messages") or []:
+        channel = guild.get_channel(channel_id)
+        if channel is None:
+            stats.failed += 1
+            failed = True
+            continue
+
+        # Messages of one command only differ by the channel they're in.
+        if channel_id not in rendered:
+            ctx = ICSContext(author=guild.me or bot.user, guild=guild)
+            renderer = TemplateRenderer(bot, ctx, channel, values=data)
+            content = await renderer.render(selected["message"]["content"])
+            embeds = [
+                await renderer.render_embed(embed)
+                for embed in selected["message"]["embeds"] or []
+            ]
+            rendered[channel_id] = (content, embeds, render_hash(content, embeds))
+        content, embeds, digest = rendered[channel_id]
+
+        if hashes.get(str(message_id)) == digest:
+            stats.skipped += 1
             continue
 
+        # Partial messages are edited without fetching them first.
         try:
-            status: ServerStatus = await bot.prc_api.get_server_status(guild.id)
-        except prc_api.ResponseFailure:
-            status = None
+            await channel.get_partial_message(message_id).edit(
+                content=content, embeds=embeds
+            )
+        except discord.NotFound:
+            removed.append([channel_id, message_id])
+            hashes.pop(str(message_id), None)
+            stats.removed += 1
+            continue
+        except discord.HTTPException as e:
+            logging.warning(f"Failed to edit ICS message {message_id}: {e}")
+            stats.failed += 1
+            failed = True
+            continue
+        hashes[str(message_id)] = digest
+        stats.edited += 1
+
+    # The data is only recorded once every message shows it, so failed edits
+    # are retried next cycle; the per-message hashes skip the ones that worked.
+    update = {"$set": {"rendered": hashes}}
+    if not failed:
+        update["$set"].update(data=data, template=template_hash(selected))
+    if removed:
+        update["$pull"] = {"associated_messages": {"$in": removed}}
+    await bot.ics.db.update_one({"_id": item["_id"]}, update)
 
-        if not isinstance(status, ServerStatus):
-            continue  # Invalid key
 
+async def _refresh_guild(bot, guild_id: int, items: list[dict], stats: ICSRefreshStats):
+    guild = bot.get_guild(guild_id)
+    if not guild:
         try:
-            queue: int = await bot.prc_api.get_server_queue(guild.id, minimal=True)
-            players: list[Player] = await bot.prc_api.get_server_players(guild.id)
-        except prc_api.ResponseFailure:
-            continue  # fuck knows why
+            guild = await bot.fetch_guild(guild_id)
+        except discord.HTTPException:
+            stats.skipped_guilds += 1
+            return
 
-        mods: int = len(
-            list(filter(lambda x: x.permission == "Server Moderator", players))
-        )
-        admins: int = len(
-            list(filter(lambda x: x.permission == "Server Administrator", players))
-        )
-        total_staff: int = len(
-            list(filter(lambda x: x.permission != "Normal", players))
-        )
-        onduty: int = len(
-            [
-                i
-                async for i in bot.shift_management.shifts.db.find(
-                    {"Guild": guild.id, "EndEpoch": 0}
-                )
-            ]
+    custom_command_data = await bot.custom_commands.find_by_id(guild_id) or {}
+    commands_by_id = {
+        command["id"]: command for command in custom_command_data.get("commands", [])
+    }
+    items = [item for item in items if item["_id"] in commands_by_id]
+    if not items:
+        return
+
+    # One snapshot of the server is shared by every ICS item of the guild.
+    try:
+        status: ServerStatus = await bot.prc_api.get_server_status(guild_id)
+    except prc_api.ResponseFailure:
+        status = None
+
+    if not isinstance(status, ServerStatus):
+        stats.skipped_guilds += 1
+        return  # Invalid key
+
+    try:
+        queue: int = await bot.prc_api.get_server_queue(guild_id, minimal=True)
+        players: list[Player] = await bot.prc_api.get_server_players(guild_id)
+    except prc_api.ResponseFailure:
+        stats.skipped_guilds += 1
+        return
+
+    onduty: int = await bot.shift_management.shifts.db.count_documents(
+        {"Guild": guild_id, "EndEpoch": 0}
+    )
+    data = {**erlc_data(status, queue, players), "onduty": onduty}
+
+    for item in items:
+        selected = commands_by_id[item["_id"]]
+        if data == item.get("data") and template_hash(selected) == item.get("template"):
+            stats.unchanged_items += 1
+            stats.skipped += len(item.get("associated_messages") or [])
+            continue
+        await _refresh_item(bot, guild, item, selected, data, stats)
+
+
+@tasks.loop(minutes=15, reconnect=True)
+async def iterate_ics(bot):
+    # This will aim to constantly update the Integration Command Storage
+    # and the messages which display it, editing only the messages whose
+    # rendered output changed since it was last sent.
+
+    initial_time = time.time()
+    by_guild = collections.defaultdict(list)
+    async for item in bot.ics.db.find(
+        bot.partition.query(
+            {}
+            if bot.environment in ["PRODUCTION", "ALPHA", "DEVELOPMENT"]
+            else {"guild": int(config("CUSTOM_GUILD_ID"))},
+            "guild",
         )
+    ):
+        by_guild[item["guild"]].append(item)
+
+    stats = ICSRefreshStats(
+        started_at=initial_time,
+        duration=0,
+        guilds=len(by_guild),
+        items=sum(len(items) for items in by_guild.values()),
+        skipped_guilds=0,
+        unchanged_items=0,
+        edited=0,
+        skipped=0,
+        removed=0,
+        failed=0,
+    )
 
-        new_data = {
-            "join_code": status.join_key,
-            "players": status.current_players,
-            "max_players": status.max_players,
-            "queue": queue,
-            "staff": total_staff,
-            "admins": admins,
-            "mods": mods,
-            "onduty": onduty,
-        }
-        # print(json.dumps(new_data, indent=4))
-
-        if new_data != item["data"]:
-            # Updated data
-            for arr in item["associated_messages"]:
-                channel, message_id = arr[0], arr[1]
-                
-                channel = guild.get_channel(channel)
-                message = await channel.fetch_message(message_id)
-                if channel and not message:
-                    try:
-                        message = await channel.fetch_message(message_id)
-                    except discord.NotFound:
-                        continue
-                    except discord.HTTPException:
-                        continue
-
-                if not message or not channel:
-                    continue
-
-                await message.edit(
-                    content=await interpret_content(
-                        bot,
-                        await bot.get_context(message),
-                        channel,
-                        selected["message"]["content"],
-                        item["_id"],
-                    ),
-                    embeds=(
-                        [
-                            (
-                                await interpret_embed(
-                                    bot,
-                                    await bot.get_context(message),
-                                    channel,
-                                    embed,
-                                    item["_id"],
-                                )
-                            )
-                            for embed in selected["message"]["embeds"]
-                        ]
-                        if selected["message"]["embeds"] is not None
-                        else []
-                    ),
-                )
+    for guild_id, items in by_guild.items():
+        try:
+            with guild_processing_seconds.time("iterate_ics"):
+                await _refresh_guild(bot, guild_id, items, stats)
+        except Exception as e:
+            stats.skipped_guilds += 1
+            logging.error(f"Error refreshing ICS for {guild_id}: {e}")
+
+    stats.duration = time.time() - initial_time
+    cycle_history.append(stats)
+    logging.warning(
+        "Event iterate_ics took {:.2f} seconds: {} items across {} guilds, "
+        "{} messages edited, {} skipped ({} items unchanged), {} removed, "
+        "{} failed, {} guilds skipped".format(
+            stats.duration,
+            stats.items,
+            stats.guilds,
+            stats.edited,
+            stats.skipped,
+            stats.unchanged_items,
+            stats.removed,
+            stats.failed,
+            stats.skipped_guilds,
+        )
+    )
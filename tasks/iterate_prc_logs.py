@@ -11,66 +11,30 @@ import roblox
 import datetime
 from decouple import config
 
+from utils.internal_events import ShiftEvent
 from utils.prc_api import JoinLeaveLog, Player
 from utils.utils import fetch_get_channel, has_whitelabel, staff_check
 from utils import prc_api
 from utils.constants import BLANK_COLOR, GREEN_COLOR, RED_COLOR
-from menus import AvatarCheckView
+from utils.view_registry import get_view
 from utils.username_check import UsernameChecker
+from utils.guild_sweep import GuildSweep
 
-global_aggregate = [
-    {
-        "$match": {
-            "ERLC": {"$exists": True},
-            "$or": [
-                {"ERLC.rdm_channel": {"$type": "long", "$ne": 0}},
-                {"ERLC.kill_logs": {"$type": "long", "$ne": 0}},
-                {"ERLC.player_logs": {"$type": "long", "$ne": 0}},
-                {"ERLC.welcome_message": {"$exists": True}},
-                {"ERLC.automatic_shifts.enabled": {"$eq": True}},
-                {"ERLC.team_restrictions": {"$exists": True}},
-            ],
-        }
-    },
-    {
-        "$lookup": {
-            "from": "server_keys",
-            "localField": "_id",
-            "foreignField": "_id",
-            "as": "server_key",
-        }
-    },
-    {"$match": {"server_key": {"$ne": []}}},
-]
-
-count_aggregate = global_aggregate + [{"$count": "total"}]
+_sweep = GuildSweep("iterate_prc_logs", concurrency=10, budget=120, slow_budget=300)
 
 
 async def iterate_prc_logs_global(bot):
     try:
-        server_count = await bot.settings.db.aggregate(count_aggregate).to_list(1)
-        server_count = server_count[0]["total"] if server_count else 0
+        guilds = bot.linked_guilds.guilds("prc_logs")
+        server_count = len(guilds)
 
         logging.warning(f"[ITERATE] Starting iteration for {server_count} servers")
-        processed = 0
         start_time = time.time()
 
-        pipeline = global_aggregate
-
-        semaphore = asyncio.Semaphore(10)
-        tasks = []
-
-
-        async for items in bot.settings.db.aggregate(pipeline):
-            tasks.append(process_guild(bot, items, semaphore))
-            processed += 1
-            if processed % 10 == 0:
-                logging.warning(f"[ITERATE] Queued {processed}/{server_count} servers")
-
-        await asyncio.gather(*tasks, return_exceptions=True)
+        stats = await _sweep.run(bot, guilds, lambda items: process_guild(bot, items))
         end_time = time.time()
         logging.warning(
-            f"[ITERATE] Completed task! Processed {processed} servers in {end_time - start_time:.2f} seconds"
+            f"[ITERATE] Completed task! Processed {stats.processed}/{server_count} servers in {end_time - start_time:.2f} seconds"
         )
 
     except Exception as e:
@@ -204,15 +168,11 @@ async def unprimitive_guild_process(items, bot):
     if subtasks:
         await asyncio.gather(*subtasks, return_exceptions=True)
 
-async def process_guild(bot, items, semaphore):
-    async with semaphore:
-        await asyncio.sleep(
-            0.25
-        )  # we need to slow things down a bit for discord
-        try:
-            await unprimitive_guild_process(items, bot)
-        except Exception as e:
-            logging.warning(f"error processing guild: {e}")
+async def process_guild(bot, items):
+    await asyncio.sleep(
+        0.25
+    )  # we need to slow things down a bit for discord
+    await unprimitive_guild_process(items, bot)
 
 
 @tasks.loop(minutes=7, reconnect=True)
@@ -477,7 +437,7 @@ async def process_player_logs(bot, settings, guild_id, player_logs, last_timesta
                                             )
                                             return embeds, latest_timestamp
 
-                                        view = AvatarCheckView(
+                                        view = get_view("AvatarCheckView")(
                                             bot,
                                             user_id,
                                             settings["ERLC"]["avatar_check"].get(
@@ -619,8 +579,8 @@ async def check_automatic_shifts(bot, settings, guild_id, join_logs, ts: int) ->
     for item in temp_linked:
         if item in discordid_to_shift:
             shift = discordid_to_shift[item]
-            await bot.shift_management.end_shift(shift["_id"], guild.id)
-            bot.dispatch("shift_end", shift["_id"])
+            ended_shift = await bot.shift_management.end_shift(shift["_id"], guild.id)
+            bot.dispatch("shift_end", ShiftEvent(document=ended_shift, settings=settings))
             member = guild.get_member(int(item))
             if not member:
                 try:
@@ -684,10 +644,10 @@ async def check_automatic_shifts(bot, settings, guild_id, join_logs, ts: int) ->
 
     for item in staff_members:
         if await bot.shift_management.get_current_shift(item, guild.id) is None:
-            oid = await bot.shift_management.add_shift_by_user(
+            shift = await bot.shift_management.create_shift(
                 item, automatic_shifts.get("type", "Default") or "Default", [], guild.id
             )
-            bot.dispatch("shift_start", oid)
+            bot.dispatch("shift_start", ShiftEvent(document=shift, settings=settings))
             try:
                 await item.send(
                     embed=discord.Embed(
@@ -4,30 +4,27 @@ import discord
 from discord.ext import tasks
 import logging
 import asyncio
-from collections import defaultdict
 import datetime
 import pytz
 
 from utils.constants import BLANK_COLOR
+from utils.ttl_store import MISSING, TTLStore
+from utils.metrics import guild_processing_seconds
 
 
 _guild_cache = {}
-_member_search_cache = defaultdict(dict)
+_member_search_cache = TTLStore("mc_discord_checks_members", ttl=300, max_entries=20_000)
 _cache_timeout = 300
 
 async def get_cached_member_by_username(bot, guild, username):
     """Get member by username with caching"""
-    now = time.time()
-    cache_key = f"{guild.id}_{username.lower()}"
-
-    if cache_key in _member_search_cache[guild.id]:
-        member_obj, cached_time = _member_search_cache[guild.id][cache_key]
-        if now - cached_time < _cache_timeout:
-            return member_obj
+    member = _member_search_cache.get(guild.id, username.lower(), MISSING)
+    if member is not MISSING:
+        return member
 
     member = await bot.accounts.roblox_to_discord(guild, username)
 
-    _member_search_cache[guild.id][cache_key] = (member, now)
+    _member_search_cache.set(guild.id, username.lower(), member)
     return member
 
 async def get_cached_guild(bot, guild_id):
@@ -79,23 +76,9 @@ async def mc_discord_checks(bot):
     """
     initial_time = time.time()
 
-    base = {"MC.discord_checks.enabled": True}
-    pipeline = [
-        {"$match": base},
-        {
-            "$lookup": {
-                "from": "mc_keys",
-                "localField": "_id",
-                "foreignField": "_id",
-                "as": "server_key",
-            }
-        },
-        {"$match": {"server_key": {"$ne": []}}},
-    ]
-    
     semaphore = asyncio.Semaphore(3)
     async def process_guild(items):
-        async with semaphore:
+        async with semaphore, guild_processing_seconds.time("mc_discord_checks"):
             guild_id = items["_id"]
             logging.info(f"Processing guild ID: {guild_id}")
 
@@ -143,7 +126,7 @@ async def mc_discord_checks(bot):
                 return
 
     guild_tasks = []
-    async for items in bot.settings.db.aggregate(pipeline):
+    for items in bot.linked_guilds.guilds("mc_discord_checks"):
         guild_tasks.append(process_guild(items))
 
         if len(guild_tasks) >= 5:
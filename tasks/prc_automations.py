@@ -4,33 +4,30 @@ import discord
 from discord.ext import tasks
 import logging
 import asyncio
-from collections import defaultdict
 import datetime
 import pytz
 
 from utils.constants import BLANK_COLOR
+from utils.ttl_store import MISSING, TTLStore
+from utils.metrics import guild_processing_seconds
 
 
 _guild_cache = {}
-_member_search_cache = defaultdict(dict)
+_member_search_cache = TTLStore("prc_automations_members", ttl=300, max_entries=20_000)
 _cache_timeout = 300
 
 async def get_cached_member_by_username(guild, username):
     """Get member by username with caching"""
-    now = time.time()
-    cache_key = f"{guild.id}_{username.lower()}"
-
-    if cache_key in _member_search_cache[guild.id]:
-        member_obj, cached_time = _member_search_cache[guild.id][cache_key]
-        if now - cached_time < _cache_timeout:
-            return member_obj
+    member = _member_search_cache.get(guild.id, username.lower(), MISSING)
+    if member is not MISSING:
+        return member
 
     member = None
     members = await guild.query_members(query=username, limit=1)
     if members:
         member = members[0] if members else None
 
-    _member_search_cache[guild.id][cache_key] = (member, now)
+    _member_search_cache.set(guild.id, username.lower(), member)
     return member
 
 async def get_cached_guild(bot, guild_id):
@@ -201,29 +198,15 @@ async def prc_automations(bot):
     """
     initial_time = time.time()
 
-    base = {"ERLC": {"$exists": True, "$ne": None}}
-    pipeline = [
-        {"$match": base},
-        {
-            "$lookup": {
-                "from": "server_keys",
-                "localField": "_id",
-                "foreignField": "_id",
-                "as": "server_key",
-            }
-        },
-        {"$match": {"server_key": {"$ne": []}}},
-    ]
-
     semaphore = asyncio.Semaphore(3)
     async def process_guild(items):
-        async with semaphore:
+        async with semaphore, guild_processing_seconds.time("prc_automations"):
             guild_id = items["_id"]
             logging.info(f"Processing guild ID: {guild_id} | PRC Automations: Discord Checks & Callsign Checks")
             await process_discord_checks(bot, items, guild_id)
 
     guild_tasks = []
-    async for items in bot.settings.db.aggregate(pipeline):
+    for items in bot.linked_guilds.guilds("prc_automations"):
         guild_tasks.append(process_guild(items))
 
         if len(guild_tasks) >= 5:
@@ -233,6 +216,7 @@ async def prc_automations(bot):
 
     if guild_tasks:
         await asyncio.gather(*guild_tasks, return_exceptions=True)
+    await bot.discord_check_counter.flush()
     
     execution_time = time.time() - initial_time
     logging.info(f"PRC Automations completed in {execution_time:.2f} seconds.")
@@ -249,20 +233,12 @@ async def handle_discord_check_batch(bot, guild, players_not_in_discord, alert_c
 
         await bot.prc_api.run_command(guild.id, command)
 
-        if not hasattr(bot, 'discord_check_counter'):
-            bot.discord_check_counter = {}
-        
         players_to_kick = []
         for player in players_not_in_discord:
-            key = f"{guild.id}_{player.username}"
-            if key not in bot.discord_check_counter:
-                bot.discord_check_counter[key] = 1
-            else:
-                bot.discord_check_counter[key] += 1
-
-            if bot.discord_check_counter[key] >= kick_after and kick_after > 0:
+            count = await bot.discord_check_counter.incr(guild.id, player.username)
+            if count >= kick_after and kick_after > 0:
                 players_to_kick.append(player)
-                bot.discord_check_counter.pop(key)
+                await bot.discord_check_counter.reset(guild.id, player.username)
 
         if players_to_kick and alert_channel is not None:
             await send_batch_warning_embed(players_to_kick, alert_channel)
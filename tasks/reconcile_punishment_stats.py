@@ -0,0 +1,23 @@
+import logging
+import time
+
+from discord.ext import tasks
+
+
+@tasks.loop(hours=1)
+async def reconcile_punishment_stats(bot):
+    """
+    Rebuilds the punishment statistics of every guild which hasn't been
+    reconciled for a day, correcting any drift from writes which bypassed
+    the counters.
+    """
+    initial_time = time.time()
+    try:
+        rebuilt = await bot.punishments.stats.reconcile(bot.partition)
+    except Exception as e:
+        logging.error(f"Error reconciling punishment statistics: {e}")
+        return
+    if rebuilt:
+        logging.info(
+            f"Reconciled punishment statistics for {rebuilt} guilds in {time.time() - initial_time:.2f}s"
+        )
@@ -9,10 +9,12 @@ from discord.ext import tasks
 from utils import prc_api
 from utils.prc_api import Player, ServerStatus
 from utils.utils import fetch_get_channel
+from utils.guild_sweep import GuildSweep
 
 _guild_cache = {}
 _channel_cache = {}
 _cache_timeout = 300
+_sweep = GuildSweep("statistics_check", concurrency=3, budget=60, slow_budget=120)
 
 async def get_cached_guild(bot, guild_id):
     """Get guild with caching"""
@@ -86,89 +88,69 @@ async def statistics_check(bot):
     """
     initial_time = time.time()
     
-    semaphore = asyncio.Semaphore(3)
-    
     async def process_guild(guild_data):
-        async with semaphore:
-            guild_id = guild_data["_id"]
-            logging.info(f"Processing statistics for guild {guild_id}")
-            
-            try:
-                guild = await get_cached_guild(bot, guild_id)
-                if not guild:
-                    logging.error(f"Guild {guild_id} not found")
-                    return
-
-                settings = await bot.settings.find_by_id(guild_id)
-                if (
-                    not settings
-                    or "ERLC" not in settings
-                    or "statistics" not in settings["ERLC"]
-                ):
-                    logging.debug(f"No statistics configuration for guild {guild_id}")
-                    return
-
-                statistics = settings["ERLC"]["statistics"]
-                
-                try:
-                    players: list[Player] = await bot.prc_api.get_server_players(guild_id)
-                    status: ServerStatus = await bot.prc_api.get_server_status(guild_id)
-                    queue: int = await bot.prc_api.get_server_queue(guild_id, minimal=True)
-                except prc_api.ResponseFailure as e:
-                    logging.error(f"PRC ResponseFailure for guild {guild_id}: {e}")
-                    return
-
-                on_duty = await bot.shift_management.shifts.db.count_documents(
-                    {"Guild": guild_id, "EndEpoch": 0}
-                )
-                moderators = len(
-                    list(filter(lambda x: x.permission == "Server Moderator", players))
-                )
-                admins = len(
-                    list(filter(lambda x: x.permission == "Server Administrator", players))
-                )
-                staff_ingame = len(list(filter(lambda x: x.permission != "Normal", players)))
-                current_player = status.current_players
-                join_code = status.join_key
-                max_players = status.max_players
-
-                placeholders = {
-                    "onduty": on_duty,
-                    "staff": staff_ingame,
-                    "mods": moderators,
-                    "admins": admins,
-                    "players": current_player,
-                    "join_code": join_code,
-                    "max_players": max_players,
-                    "queue": queue,
-                }
-
-                channel_tasks = [
-                    update_channel(bot, guild, channel_id, stat_config, placeholders)
-                    for channel_id, stat_config in statistics.items()
-                ]
-                await asyncio.gather(*channel_tasks, return_exceptions=True)
-                
-            except Exception as e:
-                logging.error(f"Error processing guild {guild_id}: {e}", exc_info=True)
-                return
-
-    # Process guilds in batches
-    guild_tasks = []
-    async for guild_data in bot.settings.db.find(
-        {"ERLC.statistics": {"$exists": True}}
-    ):
-        guild_tasks.append(process_guild(guild_data))
-        
-        # Process in batches of 5 to avoid overwhelming the system
-        if len(guild_tasks) >= 5:
-            await asyncio.gather(*guild_tasks, return_exceptions=True)
-            guild_tasks = []
-            await asyncio.sleep(1)  # Small delay between batches
-    
-    # Process remaining guilds
-    if guild_tasks:
-        await asyncio.gather(*guild_tasks, return_exceptions=True)
+        guild_id = guild_data["_id"]
+        logging.info(f"Processing statistics for guild {guild_id}")
+
+        guild = await get_cached_guild(bot, guild_id)
+        if not guild:
+            logging.error(f"Guild {guild_id} not found")
+            return
+
+        settings = await bot.settings.find_by_id(guild_id)
+        if (
+            not settings
+            or "ERLC" not in settings
+            or "statistics" not in settings["ERLC"]
+        ):
+            logging.debug(f"No statistics configuration for guild {guild_id}")
+            return
+
+        statistics = settings["ERLC"]["statistics"]
+
+        try:
+            players: list[Player] = await bot.prc_api.get_server_players(guild_id)
+            status: ServerStatus = await bot.prc_api.get_server_status(guild_id)
+            queue: int = await bot.prc_api.get_server_queue(guild_id, minimal=True)
+        except prc_api.ResponseFailure as e:
+            logging.error(f"PRC ResponseFailure for guild {guild_id}: {e}")
+            return
+
+        on_duty = await bot.shift_management.shifts.db.count_documents(
+            {"Guild": guild_id, "EndEpoch": 0}
+        )
+        moderators = len(
+            list(filter(lambda x: x.permission == "Server Moderator", players))
+        )
+        admins = len(
+            list(filter(lambda x: x.permission == "Server Administrator", players))
+        )
+        staff_ingame = len(list(filter(lambda x: x.permission != "Normal", players)))
+        current_player = status.current_players
+        join_code = status.join_key
+        max_players = status.max_players
+
+        placeholders = {
+            "onduty": on_duty,
+            "staff": staff_ingame,
+            "mods": moderators,
+            "admins": admins,
+            "players": current_player,
+            "join_code": join_code,
+            "max_players": max_players,
+            "queue": queue,
+        }
+
+        channel_tasks = [
+            update_channel(bot, guild, channel_id, stat_config, placeholders)
+            for channel_id, stat_config in statistics.items()
+        ]
+        await asyncio.gather(*channel_tasks, return_exceptions=True)
+
+    guilds = await bot.settings.db.find(
+        bot.partition.query({"ERLC.statistics": {"$exists": True}}), {"_id": 1}
+    ).to_list(None)
+    await _sweep.run(bot, guilds, process_guild)
 
     execution_time = time.time() - initial_time
     logging.info(f"Statistics check completed in {execution_time:.2f} seconds")
@@ -9,69 +9,32 @@ from utils.prc_api import ResponseFailure
 
 @tasks.loop(minutes=2, reconnect=True)
 async def sync_weather(bot):
-    chosen_filter = {
-        "CUSTOM": {"_id": int(config("CUSTOM_GUILD_ID", default=0))},
-        "_": {
-            "_id": {
-                "$nin": [
-                    int(item["GuildID"] or 0)
-                    async for item in bot.whitelabel.db.find({})
-                ]
-            }
-        },
-    }["CUSTOM" if config("ENVIRONMENT") == "CUSTOM" else "_"]
+    if config("ENVIRONMENT") == "CUSTOM":
+        custom_guild_id = int(config("CUSTOM_GUILD_ID", default=0))
+        eligible = lambda guild_id: guild_id == custom_guild_id
+    else:
+        eligible = lambda guild_id: guild_id not in bot.whitelabel_cache
     try:
         logging.info("Starting weather sync task...")
 
-        logging.info("Querying for servers with weather sync settings...")
-        pipeline = [
-            {
-                "$match": {
-                    "ERLC.weather": {"$exists": True},
-                    "$or": [
-                        {"ERLC.weather.sync_time": True},
-                        {"ERLC.weather.sync_weather": True},
-                    ],
-                    "ERLC.weather.location": {"$exists": True, "$ne": ""},
-                    **chosen_filter,
-                }
-            },
-            {
-                "$lookup": {
-                    "from": "server_keys",
-                    "localField": "_id",
-                    "foreignField": "_id",
-                    "as": "server_key",
-                }
-            },
-            {"$match": {"server_key": {"$ne": []}}},
+        guilds = [
+            guild_data
+            for guild_data in bot.linked_guilds.guilds("weather")
+            if eligible(guild_data["_id"])
         ]
 
         weather_service_url = config("WEATHER_SERVICE_URL")
         logging.info(f"Using weather service URL: {weather_service_url}")
 
-        server_count = await bot.settings.db.count_documents(
-            {
-                "ERLC.weather": {"$exists": True},
-                "$or": [
-                    {"ERLC.weather.sync_time": True},
-                    {"ERLC.weather.sync_weather": True},
-                ],
-                "ERLC.weather.location": {"$exists": True, "$ne": ""},
-            }
-        )
+        server_count = len(guilds)
         logging.info(f"Found {server_count} servers with weather sync enabled")
 
         processed = 0
         async with aiohttp.ClientSession() as session:
-            async for guild_data in bot.settings.db.aggregate(pipeline):
+            for guild_data in guilds:
                 processed += 1
                 guild_id = guild_data["_id"]
 
-                if config("ENVIRONMENT") == "CUSTOM":
-                    if guild_id != config("CUSTOM_GUILD_ID", default=0):
-                        continue
-
                 weather_settings = guild_data["ERLC"]["weather"]
                 location = weather_settings["location"]
 
@@ -1,12 +1,98 @@
+import asyncio
+import collections
 import discord
 import logging
 
 from decouple import config
 from discord.ext import commands, tasks
+from pymongo import UpdateOne
 import time
 import datetime
 import pytz
 
+from utils.basedataclass import BaseDataClass
+
+
+class TempbanCycleStats(BaseDataClass):
+    started_at: float
+    duration: float
+    guilds: int
+    expired: int
+    skipped_guilds: int
+    superseded: int
+    not_banned: int
+    unbanned: int
+    failed_unbans: int
+
+
+# Stats of the most recent cycles, newest last.
+cycle_history: collections.deque[TempbanCycleStats] = collections.deque(maxlen=24)
+
+
+async def _process_guild(bot, guild_id: int, items: list[dict], stats: TempbanCycleStats):
+    try:
+        guild = bot.get_guild(guild_id)
+        if guild is None:
+            guild = await bot.fetch_guild(guild_id)
+    except discord.HTTPException:
+        stats.skipped_guilds += 1
+        return
+
+    try:
+        bans = await bot.prc_api.fetch_bans(guild_id)
+    except Exception:
+        stats.skipped_guilds += 1
+        return
+
+    await bot.punishments.db.bulk_write(
+        [UpdateOne({"_id": i["_id"]}, {"$set": {"CheckExecuted": True}}) for i in items],
+        ordered=False,
+    )
+
+    banned_ids = {ban.user_id for ban in bans}
+    candidates = [i for i in items if i["UserID"] in banned_ids]
+    stats.not_banned += len(items) - len(candidates)
+    if not candidates:
+        return
+
+    # A user stays banned if they received a ban or temporary ban after the
+    # one which expired, so only their latest ban matters.
+    latest_bans = {
+        doc["_id"]: doc["LatestEpoch"]
+        async for doc in bot.punishments.db.aggregate(
+            [
+                {
+                    "$match": {
+                        "Guild": guild_id,
+                        "UserID": {"$in": list({i["UserID"] for i in candidates})},
+                        "Type": {"$in": ["Ban", "Temporary Ban"]},
+                    }
+                },
+                {"$group": {"_id": "$UserID", "LatestEpoch": {"$max": "$Epoch"}}},
+            ]
+        )
+    }
+
+    to_unban = []
+    for item in candidates:
+        if latest_bans.get(item["UserID"], item["Epoch"]) > item["Epoch"]:
+            stats.superseded += 1
+        elif item["UserID"] not in to_unban:
+            to_unban.append(item["UserID"])
+
+    # Commands for one server share its rate limit, so they are sent one at
+    # a time; unban_user waits out any 429s it receives.
+    for user_id in to_unban:
+        try:
+            status_code = await bot.prc_api.unban_user(guild_id, user_id)
+        except Exception as e:
+            logging.warning(f"Failed to unban {user_id} in {guild_id}: {e}")
+            status_code = None
+        if status_code == 200:
+            stats.unbanned += 1
+        else:
+            stats.failed_unbans += 1
+
 
 @tasks.loop(minutes=10, reconnect=True)
 async def tempban_checks(bot):
@@ -15,80 +101,67 @@ async def tempban_checks(bot):
     # to automatically remove the ban in-game
     # using POST /server/command
 
-    # This will also use a GET request before
-    # sending that POST request, particularly
-    # GET /server/bans
+    # Expired bans are grouped by guild, so each
+    # server's ban list (GET /server/bans) is only
+    # fetched once per cycle
 
     # We also check if the punishment item is
     # before the update date, because else we'd
     # have too high influx of invalid
     # temporary bans
 
-    # For diagnostic purposes, we also choose to
-    # capture the amount of time it takes for this
-    # event to run, as it may cause issues in
-    # time registration.
-
-    cached_servers = {}
     initial_time = time.time()
+    expired = collections.defaultdict(list)
     async for punishment_item in bot.punishments.db.find(
-        {
-            "Epoch": {"$gt": 1709164800},
-            "CheckExecuted": {"$exists": False},
-            "UntilEpoch": {"$lt": int(datetime.datetime.now(tz=pytz.UTC).timestamp())},
-            "Type": "Temporary Ban",
-        }
+        bot.partition.query(
+            {
+                "Epoch": {"$gt": 1709164800},
+                "CheckExecuted": {"$exists": False},
+                "UntilEpoch": {"$lt": int(datetime.datetime.now(tz=pytz.UTC).timestamp())},
+                "Type": "Temporary Ban",
+            },
+            "Guild",
+        ),
+        {"Guild": 1, "UserID": 1, "Epoch": 1},
     ):
-        try:
-            guild = bot.get_guild(punishment_item["Guild"])
-            if guild is None:
-                guild = await bot.fetch_guild(punishment_item["Guild"])
-        except discord.HTTPException:
-            continue
-
-        if not cached_servers.get(punishment_item["Guild"]):
-            try:
-                cached_servers[punishment_item["Guild"]] = await bot.prc_api.fetch_bans(
-                    punishment_item["Guild"]
-                )
-            except:
-                continue
+        expired[punishment_item["Guild"]].append(punishment_item)
 
-        punishment_item["CheckExecuted"] = True
-        await bot.punishments.update_by_id(punishment_item)
+    stats = TempbanCycleStats(
+        started_at=initial_time,
+        duration=0,
+        guilds=len(expired),
+        expired=sum(len(items) for items in expired.values()),
+        skipped_guilds=0,
+        superseded=0,
+        not_banned=0,
+        unbanned=0,
+        failed_unbans=0,
+    )
 
-        if punishment_item["UserID"] not in [
-            i.user_id for i in cached_servers[punishment_item["Guild"]]
-        ]:
-            continue
+    semaphore = asyncio.Semaphore(5)
 
-        sorted_punishments = sorted(
-            [
-                i
-                async for i in bot.punishments.db.find(
-                    {
-                        "UserID": punishment_item["UserID"],
-                        "Guild": punishment_item["Guild"],
-                    }
-                )
-            ],
-            key=lambda x: x["Epoch"],
-            reverse=True,
-        )
-        new_sorted_punishments = []
-        for item in sorted_punishments:
-            if item == punishment_item:
-                break
-            new_sorted_punishments.append(item)
+    async def run(guild_id, items):
+        async with semaphore:
+            try:
+                await _process_guild(bot, guild_id, items, stats)
+            except Exception as e:
+                stats.skipped_guilds += 1
+                logging.error(f"Error processing temporary bans for {guild_id}: {e}")
 
-        if any([i["Type"] in ["Ban", "Temporary Ban"] for i in new_sorted_punishments]):
-            continue
+    await asyncio.gather(*[run(guild_id, items) for guild_id, items in expired.items()])
 
-        await bot.prc_api.unban_user(
-            punishment_item["Guild"], punishment_item["user_id"]
-        )
-    del cached_servers
-    end_time = time.time()
+    stats.duration = time.time() - initial_time
+    cycle_history.append(stats)
     logging.warning(
-        "Event tempban_checks took {} seconds".format(str(end_time - initial_time))
+        "Event tempban_checks took {:.2f} seconds: {} expired bans across {} guilds, "
+        "{} unbanned, {} superseded, {} no longer banned, {} failed, {} guilds skipped".format(
+            stats.duration,
+            stats.expired,
+            stats.guilds,
+            stats.unbanned,
+            stats.superseded,
+            stats.not_banned,
+            stats.failed_unbans,
+            stats.skipped_guilds,
+        )
     )
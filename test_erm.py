@@ -1,11 +1,34 @@
+import asyncio
+import csv
+import io
+import json
+import subprocess
+import sys
+import time
 import unittest
 from typing import Union
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
-from discord import DMChannel
+from bson import ObjectId
+from discord import DMChannel, NotFound, Permissions
 from discord.ext.commands import CheckFailure, Context, NoPrivateMessage, has_any_role
+from pymongo.errors import PyMongoError
 
-from helpers import MockContext, MockRole
+from datamodels.ShiftManagement import EXPORT_FIELDS, ShiftManagement
+from helpers import MockContext, MockGuild, MockMember, MockRole
+from tasks.check_infractions import MEMBER_RETRY_SECONDS, expire_temporary_roles
+from utils.guild_sweep import GuildCircuitBreaker, GuildSweep
+from utils.linked_guilds import ERLC, LinkedGuildRegistry
+from utils.member_index import DASHBOARD_PRIORITY, MemberIndexManager
+from utils.metrics import Histogram
+from utils.paginators import CursorPagination
+from utils.permission_sync import PermissionSync
+from utils.permissions import MemberPermissions, PermissionResolver
+from utils.rate_limiter import RateLimitExceeded, SlidingWindowRateLimiter
+from utils.templates import compile_template
+from utils.ttl_store import CounterStore, TTLStore
+from utils.utils import get_elapsed_time
+from utils.vehicle_whitelist import VehicleWhitelist, normalize_vehicle_name
 
 
 async def has_any_role_check(ctx: Context, *roles: Union[str, int]) -> bool:
@@ -60,3 +83,663 @@ class ChecksTests(unittest.IsolatedAsyncioTestCase):
         self.ctx.channel = MagicMock(DMChannel)
         self.ctx.guild = None
         self.assertFalse(await has_no_roles_check(self.ctx))
+
+
+class RateLimiterTests(unittest.TestCase):
+    """Tests the sliding window limiter used by the internal API."""
+
+    def test_limit_and_retry_after(self):
+        """Requests over the quota raise with a positive `retry_after`."""
+        limiter = SlidingWindowRateLimiter(default_quota=(5, 60))
+        for i in range(5):
+            limiter.hit("route", 1, now=1000 + i)
+        with self.assertRaises(RateLimitExceeded) as ctx:
+            limiter.hit("route", 1, now=1006)
+        self.assertGreater(ctx.exception.retry_after, 0)
+
+    def test_idle_keys_are_evicted(self):
+        """Memory stays flat when 100k distinct keys pass through."""
+        limiter = SlidingWindowRateLimiter(default_quota=(5, 60), max_keys=10_000)
+        for key in range(100_000):
+            limiter.hit("route", key, now=1000 + key * 0.01)
+        self.assertLessEqual(len(limiter), 10_000)
+
+
+class TemplateTests(unittest.TestCase):
+    """Tests the compiled templates used by custom commands."""
+
+    def test_variables_are_collected(self):
+        """Only known variables are tokens; other braces stay literal."""
+        source = "{user} joined {server}, {unknown} {players}/{max_players}"
+        template = compile_template(source)
+        self.assertEqual(
+            template.variables, {"user", "server", "players", "max_players"}
+        )
+        self.assertEqual(template.render({}), source)
+        self.assertIs(compile_template(source), template)
+
+    def test_missing_values_are_left_as_is(self):
+        """Variables without a value render as they were written."""
+        template = compile_template("{players}/{max_players} in {server}")
+        self.assertEqual(
+            template.render({"server": "ERM", "players": 3}), "3/{max_players} in ERM"
+        )
+
+
+class TTLStoreTests(unittest.IsolatedAsyncioTestCase):
+    """Tests the bounded stores behind the violation counters and member caches."""
+
+    def test_least_recently_used_are_evicted(self):
+        """The store never grows past `max_entries`."""
+        store = TTLStore("test_lru", ttl=60, max_entries=100)
+        store.set(1, "kept", True)
+        for key in range(1000):
+            store.get(1, "kept")
+            store.set(2, key, key)
+        self.assertEqual(len(store), 100)
+        self.assertTrue(store.get(1, "kept"))
+        self.assertEqual(store.evictions, 901)
+
+    async def test_counts_decay(self):
+        """Counts are per namespace and reset once their window passes."""
+        counter = CounterStore("test_counter", window=60)
+        self.assertEqual(await counter.incr(1, "player"), 1)
+        self.assertEqual(await counter.incr(1, "player"), 2)
+        self.assertEqual(await counter.incr(2, "player"), 1)
+        counter.set(1, "player", 2, expires_at=0)
+        self.assertEqual(await counter.incr(1, "player"), 1)
+
+    async def test_counts_are_flushed_in_one_write(self):
+        """A sweep's changes reach MongoDB in one bulk write, retried if it fails."""
+        collection = MagicMock()
+        collection.find.return_value.__aiter__.return_value = []
+        collection.create_index = AsyncMock()
+        collection.bulk_write = AsyncMock(side_effect=[PyMongoError("down"), None])
+        counter = CounterStore("test_flush", window=60, collection=collection)
+        for player in ("a", "b", "c"):
+            await counter.incr(1, player)
+        await counter.reset(1, "c")
+
+        await counter.flush()
+        await counter.flush()
+        await counter.flush()
+        self.assertEqual(collection.bulk_write.await_count, 2)
+        operations = collection.bulk_write.await_args.args[0]
+        self.assertEqual(
+            sorted(type(operation).__name__ for operation in operations),
+            ["DeleteOne", "UpdateOne", "UpdateOne"],
+        )
+
+
+class PermissionResolverTests(unittest.IsolatedAsyncioTestCase):
+    """Tests the role-set permission checks behind `is_staff` and friends."""
+
+    def setUp(self):
+        self.bot = MagicMock()
+        self.bot.settings.find_by_id = AsyncMock(
+            return_value={
+                "staff_management": {"role": [1], "admin_role": 2, "management_role": [3]}
+            }
+        )
+        self.resolver = PermissionResolver(self.bot)
+        self.guild = MockGuild()
+
+    def member(self, *role_ids):
+        member = MockMember(roles=[MockRole(id=role_id) for role_id in role_ids])
+        member.guild_permissions = Permissions.none()
+        return member
+
+    async def test_role_levels(self):
+        """Management roles count as admin, and both count as staff."""
+        staff = await self.resolver.permissions(self.guild, self.member(1))
+        admin = await self.resolver.permissions(self.guild, self.member(2))
+        management = await self.resolver.permissions(self.guild, self.member(3))
+        nobody = await self.resolver.permissions(self.guild, self.member(4))
+        self.assertEqual(tuple(staff), (True, False, False))
+        self.assertEqual(tuple(admin), (True, True, False))
+        self.assertEqual(tuple(management), (True, True, True))
+        self.assertEqual(tuple(nobody), (False, False, False))
+
+    async def test_settings_are_read_once(self):
+        """Checks reuse the compiled roles until the settings change."""
+        member = self.member(1)
+        for _ in range(100):
+            await self.resolver.permissions(self.guild, member)
+        self.assertEqual(self.bot.settings.find_by_id.await_count, 1)
+        self.resolver.settings_changed(self.guild.id)
+        await self.resolver.permissions(self.guild, member)
+        self.assertEqual(self.bot.settings.find_by_id.await_count, 2)
+
+
+class PermissionSyncTests(unittest.IsolatedAsyncioTestCase):
+    """Tests that role changes are coalesced before being propagated."""
+
+    async def test_changes_are_coalesced(self):
+        """Many changes to one member publish at most one update."""
+        bot = MagicMock()
+        bot.sync_bus.publish = AsyncMock()
+        bot.permission_resolver.permissions = AsyncMock(
+            return_value=MemberPermissions(True, False, False)
+        )
+        sync = PermissionSync(bot)
+        for _ in range(50):
+            sync.mark(1, 2, previous_level=0)
+        sync.mark(1, 3, previous_level=1)
+        self.assertEqual(sync.queue_depth, 2)
+        self.assertEqual(sync.coalesced, 49)
+
+        await sync.flush([(1, 2), (1, 3)])
+        self.assertEqual(sync.queue_depth, 0)
+        self.assertEqual(bot.sync_bus.publish.await_count, 1)
+        self.assertEqual(sync.unchanged, 1)
+
+
+class LinkedGuildRegistryTests(unittest.TestCase):
+    """Tests the feature index of the linked guild registry."""
+
+    def test_index_follows_settings_and_keys(self):
+        """A guild is only eligible while it is linked and the feature is enabled."""
+        bot = MagicMock()
+        bot.partition.owns = lambda guild_id: True
+        registry = LinkedGuildRegistry(bot)
+
+        registry.update_settings(1, {"_id": 1, "ERLC": {"vehicle_restrictions": {"enabled": True}}})
+        self.assertEqual(registry.guilds("vehicle_restrictions"), [])
+
+        registry.update_key(ERLC, 1, True)
+        self.assertEqual(registry.count("vehicle_restrictions"), 1)
+        self.assertEqual(registry.count("prc_automations"), 1)
+        self.assertEqual(registry.count("weather"), 0)
+
+        registry.update_settings(1, {"_id": 1, "ERLC": {}})
+        self.assertEqual(registry.count("vehicle_restrictions"), 0)
+        registry.update_key(ERLC, 1, False)
+        self.assertEqual(registry.guilds("prc_automations"), [])
+
+
+class MetricsTests(unittest.TestCase):
+    """Tests the Prometheus exposition of in-process metrics."""
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Each bucket counts every observation up to its bound."""
+        histogram = Histogram("test_seconds", "Test.", ("task",), buckets=(0.1, 1))
+        for value in (0.05, 0.1, 0.5, 3):
+            histogram.observe(value, "sweep")
+        samples = list(histogram.samples())
+        self.assertIn('test_seconds_bucket{task="sweep",le="0.1"} 2', samples)
+        self.assertIn('test_seconds_bucket{task="sweep",le="1.0"} 3', samples)
+        self.assertIn('test_seconds_bucket{task="sweep",le="+Inf"} 4', samples)
+        self.assertIn('test_seconds_count{task="sweep"} 4', samples)
+
+
+class GuildSweepTests(unittest.IsolatedAsyncioTestCase):
+    """Tests that slow and failing guilds don't hold up a sweep."""
+
+    async def test_slow_guild_is_cancelled_and_isolated(self):
+        """A guild over budget is cancelled and moved to the slow lane."""
+        bot = MagicMock()
+        bot.guild_breaker = GuildCircuitBreaker()
+        sweep = GuildSweep("test", concurrency=2, budget=0.05, slow_budget=0.05)
+
+        async def process(item):
+            if item["_id"] == 1:
+                await asyncio.sleep(10)
+
+        start = time.perf_counter()
+        stats = await sweep.run(bot, [{"_id": i} for i in range(1, 6)], process)
+        self.assertLess(time.perf_counter() - start, 1)
+        self.assertEqual((stats.processed, stats.timed_out), (4, 1))
+        self.assertIn(1, sweep.slow)
+
+        stats = await sweep.run(bot, [{"_id": i} for i in range(1, 6)], process)
+        self.assertEqual((stats.processed, stats.slow_lane), (4, 1))
+
+    async def test_failing_guild_opens_breaker(self):
+        """Errors raised by `process` count towards the guild's breaker."""
+        bot = MagicMock()
+        bot.guild_breaker = GuildCircuitBreaker(threshold=2)
+        sweep = GuildSweep("test")
+
+        async def process(item):
+            if item["_id"] == 1:
+                raise ValueError("bad settings")
+
+        for _ in range(2):
+            stats = await sweep.run(bot, [{"_id": 1}, {"_id": 2}], process)
+            self.assertEqual((stats.processed, stats.failed), (1, 1))
+        self.assertFalse(bot.guild_breaker.allows(1))
+        self.assertTrue(bot.guild_breaker.allows(2))
+
+        stats = await sweep.run(bot, [{"_id": 1}, {"_id": 2}], process)
+        self.assertEqual((stats.processed, stats.backed_off), (1, 1))
+
+    def test_breaker_backs_off_after_threshold(self):
+        """Repeated failures skip a guild until a success closes the breaker."""
+        breaker = GuildCircuitBreaker(threshold=2)
+        breaker.record_failure(1, "PRC 403")
+        self.assertTrue(breaker.allows(1))
+        breaker.record_failure(1, "PRC 403")
+        self.assertFalse(breaker.allows(1))
+        breaker.record_success(1)
+        self.assertTrue(breaker.allows(1))
+
+
+class TemporaryRoleTests(unittest.IsolatedAsyncioTestCase):
+    """Tests that expired temporary roles are reverted for uncached members."""
+
+    def make_bot(self):
+        bot = MagicMock()
+        bot.db.infractions.find_one = AsyncMock(
+            return_value={
+                "_id": 1,
+                "guild_id": 10,
+                "user_id": 20,
+                "temp_roles_added": [30],
+                "temp_roles_added_expiry": 0,
+                "temp_roles_expire_at": 0,
+            }
+        )
+        bot.db.infractions.update_one = AsyncMock()
+        guild = bot.get_guild.return_value
+        guild.get_member.return_value = None
+        return bot, guild
+
+    async def test_uncached_member_is_fetched(self):
+        """A member missing from the cache is fetched and has the role removed."""
+        bot, guild = self.make_bot()
+        member = MagicMock(remove_roles=AsyncMock())
+        guild.fetch_member = AsyncMock(return_value=member)
+
+        self.assertIsNone(await expire_temporary_roles(bot, 1))
+        member.remove_roles.assert_awaited_once()
+        bot.db.infractions.update_one.assert_awaited_once()
+
+    async def test_unresolved_member_keeps_roles(self):
+        """A member that can't be fetched keeps the roles to revert for a retry."""
+        bot, guild = self.make_bot()
+        guild.fetch_member = AsyncMock(side_effect=NotFound(MagicMock(), ""))
+
+        retry_at = await expire_temporary_roles(bot, 1)
+        self.assertGreater(retry_at, time.time() + MEMBER_RETRY_SECONDS - 60)
+        bot.db.infractions.update_one.assert_not_awaited()
+
+
+class VehicleWhitelistTests(unittest.TestCase):
+    """Tests the compiled vehicle whitelist used by `check_whitelisted_car`."""
+
+    def setUp(self):
+        self.whitelist = [f"Falcon Model {i} {2000 + i % 25}" for i in range(290)] + [
+            f"Bullhorn Variant {i}" for i in range(10)
+        ]
+        self.vehicles = [f"Falcon Model {i * 7} {2000 + i % 30}" for i in range(90)] + [
+            f"Bullhorn Variant {i} 2015" for i in range(10)
+        ]
+
+    def brute_force(self, vehicle):
+        name, year = normalize_vehicle_name(vehicle)
+        for entry in self.whitelist:
+            entry_name, entry_year = normalize_vehicle_name(entry)
+            if name == entry_name and (not year or not entry_year or year == entry_year):
+                return True
+        return False
+
+    def test_matches_pairwise_check(self):
+        """The index agrees with comparing every vehicle to every entry."""
+        whitelist = VehicleWhitelist(self.whitelist)
+        for vehicle in self.vehicles:
+            self.assertEqual(whitelist.matches(vehicle), self.brute_force(vehicle), vehicle)
+
+    def test_matches_years(self):
+        """Years only have to agree when both the vehicle and the entry have one."""
+        whitelist = VehicleWhitelist(["Falcon Advance 2020", "Bullhorn Prancer"])
+        self.assertTrue(whitelist.matches("Falcon Advance 2020"))
+        self.assertFalse(whitelist.matches("Falcon Advance 2015"))
+        self.assertTrue(whitelist.matches("falcon  advance"))
+        self.assertTrue(whitelist.matches("Bullhorn Prancer 1998"))
+        self.assertFalse(whitelist.matches("Falcon Advanced 2020"))
+
+    def test_benchmark(self):
+        """A 100 vehicle server is checked against 300 entries in microseconds."""
+        whitelist = VehicleWhitelist(self.whitelist)
+        runs = 200
+        started = time.perf_counter()
+        for _ in range(runs):
+            whitelist._results.clear()
+            for vehicle in self.vehicles:
+                whitelist.matches(vehicle)
+        per_server = (time.perf_counter() - started) / runs
+        self.assertLess(per_server, 0.005)
+
+
+class MemberIndexManagerTests(unittest.IsolatedAsyncioTestCase):
+    """Tests the bounded member indexes and the background chunk queue."""
+
+    def guild(self, guild_id, chunked=False):
+        guild = MagicMock()
+        guild.id = guild_id
+        guild.chunked = chunked
+        guild.members = [MockMember(id=guild_id * 10, name=f"member{guild_id}", nick=None)]
+
+        async def chunk(cache):
+            self.chunked.append(guild_id)
+            guild.chunked = True
+
+        guild.chunk = chunk
+        return guild
+
+    def setUp(self):
+        self.chunked = []
+        self.guilds = {guild_id: self.guild(guild_id) for guild_id in range(1, 5)}
+        self.guilds[4].chunked = True
+        self.bot = MagicMock()
+        self.bot.guilds = list(self.guilds.values())
+        self.bot.get_guild = self.guilds.get
+        self.bot.wait_until_ready = AsyncMock()
+
+    async def test_least_recently_used_indexes_are_evicted(self):
+        """Only the `max_indexes` most recently requested guilds keep an index."""
+        manager = MemberIndexManager(self.bot, max_indexes=2)
+        for guild_id in (1, 2, 1, 3):
+            await manager.get(self.guilds[guild_id])
+        self.assertEqual(list(manager.indexes), [1, 3])
+
+    async def test_dashboard_guilds_are_warmed_up_first(self):
+        """The warm-up queues unchunked guilds behind those the dashboard asks for."""
+        manager = MemberIndexManager(self.bot, background_delay=0)
+        await manager._warm_up()
+        manager.request_chunk(self.guilds[3], DASHBOARD_PRIORITY)
+        manager.start()
+        for _ in range(100):
+            await asyncio.sleep(0)
+        manager.stop()
+        self.assertEqual(self.chunked, [3, 1, 2])
+
+
+def evaluate(expression, document, variables=None):
+    """Evaluates the aggregation expressions used by `shift_totals`."""
+    variables = variables or {}
+    if isinstance(expression, str) and expression.startswith("$$"):
+        name, _, field = expression[2:].partition(".")
+        return variables[name][field] if field else variables[name]
+    if isinstance(expression, str) and expression.startswith("$"):
+        return document.get(expression[1:])
+    if not isinstance(expression, dict):
+        return expression
+    ((operator, args),) = expression.items()
+    if operator == "$map":
+        return [
+            evaluate(args["in"], document, {**variables, args["as"]: item})
+            for item in evaluate(args["input"], document, variables)
+        ]
+    if not isinstance(args, list):
+        args = [args]
+    values = [evaluate(arg, document, variables) for arg in args]
+    if operator == "$cond":
+        return values[1] if values[0] else values[2]
+    if operator == "$ifNull":
+        return values[0] if values[0] is not None else values[1]
+    return {
+        "$sum": lambda: sum(values[0]),
+        "$add": lambda: sum(values),
+        "$subtract": lambda: values[0] - values[1],
+        "$multiply": lambda: values[0] * values[1],
+        "$eq": lambda: values[0] == values[1],
+        "$toLong": lambda: int(values[0]),
+    }[operator]()
+
+
+def query_matches(query, document):
+    for field, condition in query.items():
+        if field == "$and":
+            if not all(query_matches(part, document) for part in condition):
+                return False
+        elif isinstance(condition, dict):
+            value = document.get(field)
+            if "$gt" in condition and not value > condition["$gt"]:
+                return False
+            if "$ne" in condition and value == condition["$ne"]:
+                return False
+        elif document.get(field) != condition:
+            return False
+    return True
+
+
+class FakeCursor:
+    def __init__(self, documents):
+        self.documents = documents
+
+    def sort(self, key, direction):
+        self.documents = sorted(
+            self.documents, key=lambda document: document[key], reverse=direction == -1
+        )
+        return self
+
+    def batch_size(self, size):
+        return self
+
+    async def to_list(self, length):
+        return self.documents[:length]
+
+    async def __aiter__(self):
+        for document in self.documents:
+            yield document
+
+
+class FakeShiftCollection:
+    """Just enough of a Motor collection for the shift queries."""
+
+    def __init__(self, documents):
+        self.documents = documents
+
+    def find(self, query):
+        return FakeCursor([d for d in self.documents if query_matches(query, d)])
+
+    def aggregate(self, pipeline):
+        documents = self.documents
+        for stage in pipeline:
+            if "$match" in stage:
+                documents = [d for d in documents if query_matches(stage["$match"], d)]
+            else:
+                group = stage["$group"]
+                documents = [
+                    {
+                        name: sum(evaluate(spec["$sum"], d) for d in documents)
+                        for name, spec in group.items()
+                        if name != "_id"
+                    }
+                ] if documents else []
+        return FakeCursor(documents)
+
+
+class ShiftManagementTests(unittest.IsolatedAsyncioTestCase):
+    """Tests the aggregated totals, cursor paging and exports of shifts."""
+
+    def setUp(self):
+        now = int(time.time())
+
+        def shift(user_id=10, shift_type="Patrol", start=0, end=3600, **fields):
+            return {
+                "_id": ObjectId(),
+                "Guild": 1,
+                "UserID": user_id,
+                "Username": f"user{user_id}",
+                "Type": shift_type,
+                "StartEpoch": start,
+                "EndEpoch": end,
+                "Breaks": [],
+                "Moderations": [],
+                "AddedTime": 0,
+                "RemovedTime": 0,
+                **fields,
+            }
+
+        self.shifts = [
+            shift(),
+            shift(start=1000.7, end=9000.2, AddedTime=300, RemovedTime=120),
+            shift(
+                start=0,
+                end=7200,
+                Breaks=[
+                    {"StartEpoch": 600, "EndEpoch": 1200},
+                    {"StartEpoch": 1800, "EndEpoch": 2100},
+                ],
+                Moderations=[ObjectId()],
+            ),
+            shift(shift_type="Default", start=now - 3600, end=now - 100, RemovedTime=60),
+            shift(
+                shift_type="Default",
+                start=now - 7200,
+                end=now - 60,
+                Breaks=[{"StartEpoch": now - 500, "EndEpoch": 0}],
+            ),
+            shift(end=0),
+            shift(user_id=20),
+        ]
+        # Documents written before AddedTime existed.
+        del self.shifts[3]["AddedTime"]
+        self.shift_management = ShiftManagement(
+            {"shift_management": FakeShiftCollection(self.shifts)}, "shift_management"
+        )
+
+    async def test_totals_match_elapsed_time(self):
+        """The aggregated total agrees with `get_elapsed_time` on every shift."""
+        ended = [s for s in self.shifts if s["UserID"] == 10 and s["EndEpoch"] != 0]
+        totals = await self.shift_management.shift_totals(1, 10)
+        self.assertEqual(totals.count, len(ended))
+        self.assertAlmostEqual(
+            totals.total_seconds, sum(get_elapsed_time(s) for s in ended), delta=2
+        )
+
+        patrol = [s for s in ended if s["Type"] == "Patrol"]
+        totals = await self.shift_management.shift_totals(1, 10, "Patrol")
+        self.assertEqual(totals.count, len(patrol))
+        self.assertEqual(totals.total_seconds, sum(get_elapsed_time(s) for s in patrol))
+
+    async def test_pages_return_every_shift_once(self):
+        """Following the cursors visits every matching shift exactly once."""
+        query = {"Guild": 1, "UserID": 10}
+        expected = sorted(s["_id"] for s in self.shifts if query_matches(query, s))
+        for limit in (1, 2, 3, len(expected), len(expected) + 1):
+            seen, cursor = [], None
+            while True:
+                page, cursor = await self.shift_management.shift_page(
+                    query, after=cursor, limit=limit
+                )
+                seen.extend(s["_id"] for s in page)
+                if cursor is None:
+                    break
+            self.assertEqual(seen, expected, limit)
+
+    async def test_paginator_goes_back_and_forth(self):
+        """`CursorPagination` shows the same shift for a page every time."""
+        query = {"Guild": 1, "UserID": 10}
+        expected = sorted(s["_id"] for s in self.shifts if query_matches(query, s))
+
+        async def fetch_page(cursor):
+            page, next_cursor = await self.shift_management.shift_page(query, after=cursor)
+            return [s["_id"] for s in page], next_cursor
+
+        bot = MagicMock()
+        bot.emoji_controller.get_emoji.return_value = "<:arrow:1169695690784518154>"
+        paginator = CursorPagination(bot, 1, fetch_page, total_pages=len(expected))
+        interaction = MagicMock()
+        interaction.user.id = 1
+        interaction.response.defer = AsyncMock()
+        interaction.message.edit = AsyncMock()
+
+        pages = [await paginator.start()]
+        while not paginator.next_button.disabled:
+            await paginator._go_to(interaction, paginator.current_index + 1)
+            pages.append(interaction.message.edit.await_args.kwargs["embeds"])
+        self.assertEqual([page[0] for page in pages], expected)
+
+        for index in reversed(range(len(expected) - 1)):
+            await paginator._go_to(interaction, index)
+            self.assertEqual(interaction.message.edit.await_args.kwargs["embeds"], pages[index])
+        self.assertTrue(paginator.back_button.disabled)
+
+    async def test_export_csv(self):
+        """CSV exports have a header and one row per shift, in order."""
+        fp = io.BytesIO()
+        count = await self.shift_management.export_shifts({"Type": "Patrol"}, fp)
+        rows = list(csv.reader(io.StringIO(fp.read().decode())))
+        patrol = sorted(
+            (s for s in self.shifts if s["Type"] == "Patrol"), key=lambda s: s["_id"]
+        )
+        self.assertEqual(count, len(patrol))
+        self.assertEqual(rows[0], EXPORT_FIELDS)
+        self.assertEqual(len(rows), len(patrol) + 1)
+        for row, shift in zip(rows[1:], patrol):
+            row = dict(zip(EXPORT_FIELDS, row))
+            self.assertEqual(row["ID"], str(shift["_id"]))
+            self.assertEqual(row["Username"], shift["Username"])
+            self.assertEqual(int(row["Duration"]), get_elapsed_time(shift))
+            self.assertEqual(int(row["Breaks"]), len(shift["Breaks"]))
+            self.assertEqual(int(row["Moderations"]), len(shift["Moderations"]))
+
+    async def test_export_ndjson(self):
+        """NDJSON exports are one object per line, keyed by the CSV header."""
+        fp = io.BytesIO()
+        count = await self.shift_management.export_shifts(
+            {"Guild": 1, "UserID": 10}, fp, format="ndjson"
+        )
+        lines = fp.read().decode().splitlines()
+        self.assertEqual(count, 6)
+        self.assertEqual(len(lines), 6)
+        shift = json.loads(lines[0])
+        self.assertEqual(list(shift), EXPORT_FIELDS)
+        self.assertEqual(shift["ID"], str(self.shifts[0]["_id"]))
+        self.assertEqual(shift["Duration"], 3600)
+        self.assertEqual(json.loads(lines[3])["AddedTime"], 0)
+
+
+class ImportTimeTests(unittest.TestCase):
+    """Keeps the views out of the import path of startup and hot reloads."""
+
+    # Imports `erm`, then loads and reloads every cog and event extension as
+    # `Bot.setup_hook` and `HotReload` do, timing each step.
+    SCRIPT = """
+import asyncio, json, sys, time
+from pkgutil import iter_modules
+
+started = time.perf_counter()
+import erm
+timings = {"import": time.perf_counter() - started}
+extensions = [m.name for m in iter_modules(["cogs"], prefix="cogs.")] + [
+    m.name for m in iter_modules(["events"], prefix="events.")
+]
+
+
+async def main():
+    started = time.perf_counter()
+    for extension in extensions:
+        await erm.bot.load_extension(extension)
+    timings["load"] = time.perf_counter() - started
+    started = time.perf_counter()
+    for extension in extensions:
+        await erm.bot.reload_extension(extension)
+    timings["reload"] = time.perf_counter() - started
+
+
+asyncio.run(main())
+timings["views"] = sorted(
+    name for name in sys.modules if name == "menus" or name.startswith("ui.")
+)
+print(json.dumps(timings))
+"""
+    IMPORT_BUDGET_SECONDS = 3
+    LOAD_BUDGET_SECONDS = 2
+    RELOAD_BUDGET_SECONDS = 1
+
+    def test_startup_and_reload_budget(self):
+        """Loading the extensions imports no views, and each step stays within budget."""
+        result = subprocess.run(
+            [sys.executable, "-c", self.SCRIPT], capture_output=True, text=True
+        )
+        self.assertEqual(result.returncode, 0, result.stderr[-2000:])
+        timings = json.loads(result.stdout.splitlines()[-1])
+
+        self.assertEqual(timings["views"], [])
+        self.assertLess(timings["import"], self.IMPORT_BUDGET_SECONDS)
+        self.assertLess(timings["load"], self.LOAD_BUDGET_SECONDS)
+        self.assertLess(timings["reload"], self.RELOAD_BUDGET_SECONDS)
@@ -0,0 +1,1064 @@
+import typing
+import discord
+from utils.constants import (
+    blank_color,
+    BLANK_COLOR,
+)
+from utils.utils import (
+    int_invis_embed,
+    generalised_interaction_check_failure,
+)
+
+
+class CustomDropdown(discord.ui.Select):
+    def __init__(self, user_id, options: list, limit=1):
+        self.user_id = user_id
+        optionList = []
+
+        for option in options:
+            if isinstance(option, str):
+                optionList.append(
+                    discord.SelectOption(
+                        label=option.replace("_", " ").title(), value=option
+                    )
+                )
+            elif isinstance(option, discord.SelectOption):
+                optionList.append(option)
+
+        # The placeholder is what will be shown when no option is chosen
+        # The min and max values indicate we can only pick one of the three options
+        # The options parameter defines the dropdown options. We defined this above
+        super().__init__(
+            placeholder="Select an option",
+            min_values=1,
+            max_values=limit,
+            options=optionList,
+        )
+
+    async def callback(self, interaction: discord.Interaction):
+        if interaction.user.id == self.user_id:
+            await interaction.response.defer()
+            if len(self.values) == 1:
+                self.view.value = self.values[0]
+            else:
+                self.view.value = self.values
+            self.view.stop()
+        else:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            return await generalised_interaction_check_failure(interaction.followup)
+
+
+class YesNoMenu(discord.ui.View):
+    def __init__(self, user_id):
+        super().__init__(timeout=600.0)
+        self.value = None
+        self.user_id = user_id
+
+    # When the confirm button is pressed, set the inner value to `True` and
+    # stop the View from listening to more input.
+    # We also send the user an ephemeral message that we're confirming their choice.
+    @discord.ui.button(label="Yes", style=discord.ButtonStyle.green)
+    async def yes(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if interaction.user.id != self.user_id:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            await generalised_interaction_check_failure(interaction.followup)
+            return
+        await interaction.response.defer()
+        for item in self.children:
+            item.disabled = True
+        self.value = True
+        await interaction.edit_original_response(view=self)
+        self.stop()
+
+    # This one is similar to the confirmation button except sets the inner value to `False`
+    @discord.ui.button(label="No", style=discord.ButtonStyle.danger)
+    async def no(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if interaction.user.id != self.user_id:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            await generalised_interaction_check_failure(interaction.followup)
+            return
+        await interaction.response.defer()
+        for item in self.children:
+            item.disabled = True
+        self.value = False
+        await interaction.edit_original_response(view=self)
+        self.stop()
+
+
+class YesNoColourMenu(discord.ui.View):
+    def __init__(self, user_id):
+        super().__init__(timeout=600.0)
+        self.value = None
+        self.user_id = user_id
+
+    # When the confirm button is pressed, set the inner value to `True` and
+    # stop the View from listening to more input.
+    # We also send the user an ephemeral message that we're confirming their choice.
+    @discord.ui.button(label="Yes", style=discord.ButtonStyle.primary)
+    async def yes(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if interaction.user.id != self.user_id:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            await generalised_interaction_check_failure(interaction.followup)
+            return
+        await interaction.response.defer()
+        for item in self.children:
+            item.disabled = True
+        self.value = True
+        await interaction.edit_original_response(view=self)
+        self.stop()
+
+    # This one is similar to the confirmation button except sets the inner value to `False`
+    @discord.ui.button(label="No", style=discord.ButtonStyle.secondary)
+    async def no(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if interaction.user.id != self.user_id:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            await generalised_interaction_check_failure(interaction.followup)
+            return
+
+        await interaction.response.defer()
+        for item in self.children:
+            item.disabled = True
+        self.value = False
+        await interaction.edit_original_response(view=self)
+        self.stop()
+
+
+class CustomExecutionButton(discord.ui.Button):
+    def __init__(self, user_id, label, style, emoji=None, func=None, row=0, disabled=False):
+        """
+
+        A button used for custom execution functions. This is often used to subvert pagination limitations.
+
+        :param user_id: the user who can use this button
+        :param label: the label of the button
+        :param style: style of the button : discord.ButtonStyle
+        :param emoji: emoji of the button
+        :param func: function to be executed when pressed
+        """
+
+        super().__init__(label=label, style=style, emoji=emoji, row=row, disabled=disabled)
+        self.func = func
+        self.user_id = user_id
+
+    async def callback(self, interaction: discord.Interaction):
+        if interaction.user.id == self.user_id:
+            await self.func(interaction, self)
+        else:
+            return await interaction.response.send_message(
+                embed=discord.Embed(
+                    title="Not Permitted",
+                    description="You are not permitted to interact with these buttons.",
+                    color=blank_color,
+                ),
+                ephemeral=True,
+            )
+
+
+class CounterButton(discord.ui.Button):
+    def __init__(self, row):
+        super().__init__(label="0", style=discord.ButtonStyle.primary, row=row)
+        self.voters = set()
+
+    async def callback(self, interaction: discord.Interaction):
+        user = interaction.user
+        if user.id in self.voters:
+            self.voters.remove(user.id)
+            self.label = str(int(self.label) - 1)
+            await interaction.response.send_message(
+                f"Your vote has been removed.", ephemeral=True
+            )
+        else:
+            self.voters.add(user.id)
+            self.label = str(int(self.label) + 1)
+            await interaction.response.send_message(
+                f"Your vote has been added.", ephemeral=True
+            )
+        await interaction.message.edit(view=self.view)
+
+
+class ViewVotersButton(discord.ui.Button):
+    def __init__(self, row, counter_button):
+        super().__init__(
+            label="🔍View Voters", style=discord.ButtonStyle.secondary, row=row
+        )
+        self.counter_button = counter_button
+
+    async def callback(self, interaction: discord.Interaction):
+        voters = [
+            interaction.guild.get_member(user_id).mention
+            for user_id in self.counter_button.voters
+        ]
+        voter_list = "\n".join(voters) if voters else "No votes yet."
+        await interaction.response.send_message(
+            embed=discord.Embed(
+                title="Voters", description=voter_list, color=BLANK_COLOR
+            ),
+            ephemeral=True,
+        )
+
+
+class MessageCustomisation(discord.ui.View):
+    def __init__(self, user_id, data=None, persist=False, external=False):
+        super().__init__(timeout=600.0)
+        if data is None:
+            data = {}
+        self.persist = persist
+        self.value: typing.Union[str, None] = None
+        self.modal: typing.Union[discord.ui.Modal, None] = None
+        self.newView: typing.Union[EmbedCustomisation, None] = None
+        self.msg = None
+        self.has_embeds = False
+        self.sustained_interaction = None
+        self.external = external
+        if data != {}:
+            msg = data.get("message", data)
+            content = msg["content"]
+            embeds = msg.get("embeds")
+            if embeds != []:
+                self.has_embeds = True
+        self.user_id = user_id
+
+    async def check_ability(self, message):
+        if message.content or message.embeds is not None:
+            for item in self.children:
+                if isinstance(item, discord.ui.Button):
+                    if item.label == "Finish":
+                        item.disabled = False
+
+            await message.edit(view=self)
+        else:
+            for item in self.children:
+                if isinstance(item, discord.ui.Button):
+                    if item.label == "Finish":
+                        item.disabled = True
+            await message.edit(view=self)
+
+    @discord.ui.button(
+        label="Set Message",
+        style=discord.ButtonStyle.secondary,
+    )
+    async def content(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        if interaction.user.id == self.user_id:
+            modal = SetContent()
+            await interaction.response.send_modal(modal)
+            await modal.wait()
+            self.modal = modal
+            if self.sustained_interaction:
+                await self.check_ability(
+                    await self.sustained_interaction.original_response()
+                )
+                return await (
+                    await self.sustained_interaction.original_response()
+                ).edit(content=modal.name.value)
+            await interaction.message.edit(content=modal.name.value)
+            await self.check_ability(interaction.message)
+        else:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            return await generalised_interaction_check_failure(interaction.followup)
+
+    @discord.ui.button(
+        label="Add Embed",
+        style=discord.ButtonStyle.secondary,
+    )
+    async def addembed(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        if interaction.user.id == self.user_id:
+            if len(interaction.message.embeds) > 0:
+                return await interaction.response.send_message(
+                    embed=discord.Embed(
+                        title="Limitation",
+                        description="You can only have one embed per custom command message.",
+                        color=BLANK_COLOR,
+                    ),
+                    ephemeral=True,
+                )
+
+            newView = EmbedCustomisation(interaction.user.id, self)
+            newView.sustained_interaction = self.sustained_interaction
+            self.newView = newView
+
+            if self.sustained_interaction:
+                chosen_interaction_message = (
+                    await self.sustained_interaction.original_response()
+                )
+            else:
+                chosen_interaction_message = interaction.message
+
+            await chosen_interaction_message.edit(
+                view=newView,
+                embed=discord.Embed(colour=BLANK_COLOR, description="\u200b"),
+            )
+            await interaction.response.defer(thinking=False)
+            # await self.check_ability(chosen_interaction_message)
+        else:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            return await generalised_interaction_check_failure(interaction.followup)
+
+    @discord.ui.button(label="Finish", style=discord.ButtonStyle.success, disabled=True)
+    async def finish(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if interaction.user.id == self.user_id:
+            self.msg = interaction.message
+            self.newView = self
+            self.value = "finish"
+            if not self.external:
+                await interaction.response.defer(thinking=False)
+            else:
+                await int_invis_embed(
+                    interaction,
+                    "your custom message has been saved. You can now continue with your configuration.",
+                )
+            if not self.persist and not self.sustained_interaction:
+                await interaction.message.delete()
+            self.stop()
+        else:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            return await generalised_interaction_check_failure(interaction.followup)
+
+
+class EmbedCustomisation(discord.ui.View):
+    def __init__(self, user_id, view=None, external=False):
+        super().__init__(timeout=600.0)
+        self.value: typing.Union[str, None] = None
+        self.modal: typing.Union[discord.ui.Modal, None] = None
+        self.msg = None
+        self.user_id = user_id
+        self.external = external
+        self.sustained_interaction = None
+        if view is not None:
+            self.parent_view = view
+        else:
+            self.parent_view = None
+
+    async def check_ability(self, message):
+        if message.content or message.embeds is not None:
+            for item in self.children:
+                if isinstance(item, discord.ui.Button):
+                    if item.label == "Finish":
+                        item.disabled = False
+
+            await message.edit(view=self)
+        else:
+            for item in self.children:
+                if isinstance(item, discord.ui.Button):
+                    if item.label == "Finish":
+                        item.disabled = True
+            await message.edit(view=self)
+
+    @discord.ui.button(
+        label="Set Message",
+        style=discord.ButtonStyle.secondary,
+    )
+    async def content(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        if interaction.user.id == self.user_id:
+            modal = SetContent()
+            await interaction.response.send_modal(modal)
+            await modal.wait()
+            self.modal = modal
+            if self.sustained_interaction:
+                chosen_interaction_message = (
+                    await self.sustained_interaction.original_response()
+                )
+            else:
+                chosen_interaction_message = interaction.message
+            await chosen_interaction_message.edit(content=modal.name.value)
+            await self.check_ability(chosen_interaction_message)
+        else:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            return await generalised_interaction_check_failure(interaction.followup)
+
+    @discord.ui.button(
+        label="Remove Embed",
+        style=discord.ButtonStyle.secondary,
+    )
+    async def remove_embed(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        if interaction.user.id == self.user_id:
+            if len(interaction.message.embeds) > 0:
+                if self.parent_view is not None:
+                    if self.sustained_interaction:
+                        chosen_interaction_message = (
+                            await self.sustained_interaction.original_response()
+                        )
+                    else:
+                        chosen_interaction_message = interaction.message
+                    await chosen_interaction_message.edit(
+                        view=self.parent_view, embed=None
+                    )
+                    await int_invis_embed(interaction, "embed removed.", ephemeral=True)
+                else:
+                    newView = MessageCustomisation(interaction.user.id)
+                    self.parent_view = newView
+                    await interaction.message.edit(view=newView, embed=None)
+                    return await int_invis_embed(
+                        interaction, "embed removed.", ephemeral=True
+                    )
+        else:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            return await generalised_interaction_check_failure(interaction.followup)
+
+    @discord.ui.button(label="Finish", style=discord.ButtonStyle.success, disabled=True)
+    async def finish(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if interaction.user.id == self.user_id:
+            for item in self.children:
+                item.disabled = True
+            self.msg = interaction.message
+            self.value = "finish"
+            if not self.external:
+                await interaction.response.defer(thinking=False)
+            else:
+                await int_invis_embed(
+                    interaction,
+                    "your custom message has been created. You can now continue with your configuration.",
+                )
+            if not self.sustained_interaction:
+                await interaction.message.edit(view=None)
+            if self.parent_view is not None:
+                self.parent_view.stop()
+            self.stop()
+        else:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            return await generalised_interaction_check_failure(interaction.followup)
+
+    @discord.ui.button(
+        label="Set Title",
+        row=1,
+        style=discord.ButtonStyle.secondary,
+    )
+    async def set_title(self, interaction: discord.Interaction, _: discord.ui.Button):
+        if interaction.user.id == self.user_id:
+            modal = SetTitle()
+            await interaction.response.send_modal(modal)
+            await modal.wait()
+            self.modal = modal
+            embed = interaction.message.embeds[0]
+            embed.title = modal.name.value
+            if self.sustained_interaction:
+                chosen_interaction_message = (
+                    await self.sustained_interaction.original_response()
+                )
+            else:
+                chosen_interaction_message = interaction.message
+            await chosen_interaction_message.edit(embed=embed)
+            await self.check_ability(chosen_interaction_message)
+        else:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            return await generalised_interaction_check_failure(interaction.followup)
+
+    @discord.ui.button(
+        label="Set Description",
+        row=1,
+        style=discord.ButtonStyle.secondary,
+    )
+    async def set_description(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        if interaction.user.id == self.user_id:
+            modal = SetDescription()
+            await interaction.response.send_modal(modal)
+            await modal.wait()
+            self.modal = modal
+            embed = interaction.message.embeds[0]
+            embed.description = modal.name.value
+            if self.sustained_interaction:
+                chosen_interaction_message = (
+                    await self.sustained_interaction.original_response()
+                )
+            else:
+                chosen_interaction_message = interaction.message
+            await chosen_interaction_message.edit(embed=embed)
+            await self.check_ability(chosen_interaction_message)
+        else:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            return await generalised_interaction_check_failure(interaction.followup)
+
+    @discord.ui.button(
+        label="Set Embed Colour",
+        row=1,
+        style=discord.ButtonStyle.secondary,
+    )
+    async def set_color(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        if interaction.user.id == self.user_id:
+            modal = SetColour()
+            await interaction.response.send_modal(modal)
+            await modal.wait()
+            self.modal = modal
+            embed = interaction.message.embeds[0]
+            if self.sustained_interaction:
+                chosen_interaction_message = (
+                    await self.sustained_interaction.original_response()
+                )
+            else:
+                chosen_interaction_message = interaction.message
+            try:
+                embed.colour = modal.name.value
+            except TypeError:
+                try:
+                    embed.colour = int(modal.name.value.replace("#", ""), 16)
+                except TypeError:
+                    return await interaction.response.send_message(
+                        embed=discord.Embed(
+                            title="Invalid Colour",
+                            description="This colour is invalid.",
+                            color=BLANK_COLOR,
+                        ),
+                        ephemeral=True,
+                    )
+            await chosen_interaction_message.edit(embed=embed)
+            await self.check_ability(chosen_interaction_message)
+
+        else:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            return await generalised_interaction_check_failure(interaction.followup)
+
+    @discord.ui.button(
+        label="Set Thumbnail",
+        row=2,
+        style=discord.ButtonStyle.secondary,
+    )
+    async def set_thumbnail(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        if interaction.user.id == self.user_id:
+            modal = SetThumbnail()
+            if self.sustained_interaction:
+                chosen_interaction_message = (
+                    await self.sustained_interaction.original_response()
+                )
+            else:
+                chosen_interaction_message = interaction.message
+            await interaction.response.send_modal(modal)
+            await modal.wait()
+            self.modal = modal
+            embed = interaction.message.embeds[0]
+            embed.set_thumbnail(url=modal.thumbnail.value)
+
+            try:
+                await chosen_interaction_message.edit(embed=embed)
+            except discord.HTTPException:
+                return await interaction.response.send_message(
+                    embed=discord.Embed(
+                        title="Unavailable URL",
+                        description="This URL is invalid or unavailable.",
+                        color=BLANK_COLOR,
+                    ),
+                    ephemeral=True,
+                )
+            await self.check_ability(chosen_interaction_message)
+
+        else:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            return await generalised_interaction_check_failure(interaction.followup)
+
+    @discord.ui.button(
+        label="Set Image",
+        row=2,
+        style=discord.ButtonStyle.secondary,
+    )
+    async def set_image(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        if interaction.user.id == self.user_id:
+            modal = SetImage()
+            await interaction.response.send_modal(modal)
+            await modal.wait()
+            self.modal = modal
+            if self.sustained_interaction:
+                chosen_interaction_message = (
+                    await self.sustained_interaction.original_response()
+                )
+            else:
+                chosen_interaction_message = interaction.message
+            embed = interaction.message.embeds[0]
+            embed.set_image(url=modal.image.value)
+            try:
+                await chosen_interaction_message.edit(embed=embed)
+            except discord.HTTPException:
+                return await interaction.response.send_message(
+                    embed=discord.Embed(
+                        title="Unavailable URL",
+                        description="This URL is invalid or unavailable.",
+                        color=BLANK_COLOR,
+                    ),
+                    ephemeral=True,
+                )
+            await self.check_ability(chosen_interaction_message)
+
+        else:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            return await generalised_interaction_check_failure(interaction.followup)
+
+    @discord.ui.button(
+        label="Add Field",
+        row=3,
+        style=discord.ButtonStyle.secondary,
+    )
+    async def add_field(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        if interaction.user.id == self.user_id:
+            modal = AddField()
+            if self.sustained_interaction:
+                chosen_interaction_message = (
+                    await self.sustained_interaction.original_response()
+                )
+            else:
+                chosen_interaction_message = interaction.message
+
+            await interaction.response.send_modal(modal)
+            timeout = await modal.wait()
+            if timeout:
+                return
+            self.modal = modal
+            if len(interaction.message.embeds) == 0:
+                return
+            embed = interaction.message.embeds[0]
+            try:
+                inline = modal.inline.value
+                if inline.lower() in ["yes", "y", "true"]:
+                    inline = True
+                elif inline.lower() in ["no", "n", "false"]:
+                    inline = False
+                else:
+                    inline = False
+                embed.add_field(
+                    name=modal.name.value, value=modal.value.value, inline=inline
+                )
+            except AttributeError:
+                return
+            await chosen_interaction_message.edit(embed=embed)
+            await self.check_ability(chosen_interaction_message)
+        else:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            return await generalised_interaction_check_failure(interaction.followup)
+
+    @discord.ui.button(
+        label="Set Footer",
+        row=3,
+        style=discord.ButtonStyle.secondary,
+    )
+    async def set_footer(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        if interaction.user.id == self.user_id:
+            if self.sustained_interaction:
+                chosen_interaction_message = (
+                    await self.sustained_interaction.original_response()
+                )
+            else:
+                chosen_interaction_message = interaction.message
+            modal = SetFooter()
+            await interaction.response.send_modal(modal)
+            await modal.wait()
+            self.modal = modal
+            embed = interaction.message.embeds[0]
+            embed.set_footer(text=modal.name.value, icon_url=modal.icon.value)
+            try:
+                await chosen_interaction_message.edit(embed=embed)
+            except discord.HTTPException:
+                return await interaction.response.send_message(
+                    embed=discord.Embed(
+                        title="Unavailable URL",
+                        description="This URL is invalid or unavailable.",
+                        color=BLANK_COLOR,
+                    ),
+                    ephemeral=True,
+                )
+            await self.check_ability(chosen_interaction_message)
+
+        else:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            return await generalised_interaction_check_failure(interaction.followup)
+
+    @discord.ui.button(
+        label="Set Author",
+        row=3,
+        style=discord.ButtonStyle.secondary,
+    )
+    async def set_author(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        if interaction.user.id == self.user_id:
+            modal = SetAuthor()
+            await interaction.response.send_modal(modal)
+            await modal.wait()
+            self.modal = modal
+            if self.sustained_interaction:
+                chosen_interaction_message = (
+                    await self.sustained_interaction.original_response()
+                )
+            else:
+                chosen_interaction_message = interaction.message
+            embed = interaction.message.embeds[0]
+            embed.set_author(
+                name=modal.name.value,
+                url=modal.url.value,
+                icon_url=modal.icon.value,
+            )
+            try:
+                await chosen_interaction_message.edit(embed=embed)
+            except discord.HTTPException:
+                return await interaction.response.send_message(
+                    embed=discord.Embed(
+                        title="Unavailable URL",
+                        description="This URL is invalid or unavailable.",
+                        color=BLANK_COLOR,
+                    ),
+                    ephemeral=True,
+                )
+            await self.check_ability(chosen_interaction_message)
+
+        else:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            return await generalised_interaction_check_failure(interaction.followup)
+
+
+class CustomModal(discord.ui.Modal, title="Edit Reason"):
+    def __init__(self, title, options, epher_args: dict = None):
+        super().__init__(title=title)
+        if epher_args is None:
+            epher_args = {}
+        self.saved_items = {}
+        self.epher_args = epher_args
+        self.interaction = None
+
+        for name, option in options:
+            self.add_item(option)
+            self.saved_items[name] = option
+
+    async def on_submit(self, interaction: discord.Interaction):
+        for key, item in self.saved_items.items():
+            setattr(self, key, item)
+        self.interaction = interaction
+        await interaction.response.defer(**self.epher_args)
+        self.stop()
+
+
+class SetContent(discord.ui.Modal, title="Set Message Content"):
+    name = discord.ui.TextInput(
+        label="Content",
+        placeholder="Content of the message",
+        max_length=2000,
+        style=discord.TextStyle.long,
+    )
+
+    async def on_submit(self, interaction: discord.Interaction):
+        await interaction.response.defer(thinking=False)
+        self.stop()
+
+
+class SetTitle(discord.ui.Modal, title="Set Embed Title"):
+    name = discord.ui.TextInput(
+        label="Title", placeholder="Title of the embed", style=discord.TextStyle.short
+    )
+    url = discord.ui.TextInput(
+        label="Title URL",
+        placeholder="URL of the title",
+        style=discord.TextStyle.short,
+        required=False,
+    )
+
+    async def on_submit(self, interaction: discord.Interaction):
+        await interaction.response.defer(thinking=False)
+
+        self.stop()
+
+
+class SetDescription(discord.ui.Modal, title="Set Embed Description"):
+    name = discord.ui.TextInput(
+        label="Description",
+        placeholder="Description of the embed",
+        style=discord.TextStyle.long,
+        max_length=2000,
+    )
+
+    async def on_submit(self, interaction: discord.Interaction):
+        await interaction.response.defer(thinking=False)
+
+        self.stop()
+
+
+class SetColour(discord.ui.Modal, title="Set Embed Colour"):
+    name = discord.ui.TextInput(
+        label="Colour", placeholder="#DB514F", style=discord.TextStyle.short
+    )
+
+    async def on_submit(self, interaction: discord.Interaction):
+        await interaction.response.defer(thinking=False)
+
+        self.stop()
+
+
+class SetImage(discord.ui.Modal, title="Set Image"):
+    image = discord.ui.TextInput(
+        label="Image URL", placeholder="Image URL", style=discord.TextStyle.short
+    )
+
+    async def on_submit(self, interaction: discord.Interaction):
+        await interaction.response.defer(thinking=False)
+
+        self.stop()
+
+
+class AddField(discord.ui.Modal, title="Add Field"):
+    name = discord.ui.TextInput(
+        label="Field Name", placeholder="Field Name", style=discord.TextStyle.short
+    )
+    value = discord.ui.TextInput(
+        label="Field Value", placeholder="Field Value", style=discord.TextStyle.short
+    )
+    inline = discord.ui.TextInput(
+        label="Inline?",
+        placeholder="Yes/No",
+        default="Yes",
+        style=discord.TextStyle.short,
+        required=False,
+    )
+
+    async def on_submit(self, interaction: discord.Interaction):
+        await interaction.response.defer(thinking=False)
+
+        self.stop()
+
+
+class SetFooter(discord.ui.Modal, title="Set Footer"):
+    name = discord.ui.TextInput(
+        label="Footer Text", placeholder="Footer Text", style=discord.TextStyle.short
+    )
+    icon = discord.ui.TextInput(
+        label="Footer Icon URL",
+        placeholder="Footer Icon URL",
+        default="",
+        style=discord.TextStyle.short,
+        required=False,
+    )
+
+    async def on_submit(self, interaction: discord.Interaction):
+        await interaction.response.defer(thinking=False)
+
+        self.stop()
+
+
+class SetAuthor(discord.ui.Modal, title="Set Author"):
+    name = discord.ui.TextInput(
+        label="Author Name", placeholder="Author Name", style=discord.TextStyle.short
+    )
+    url = discord.ui.TextInput(
+        label="Author URL",
+        placeholder="Author URL",
+        default="",
+        style=discord.TextStyle.short,
+        required=False,
+    )
+    icon = discord.ui.TextInput(
+        label="Author Icon URL",
+        placeholder="Author Icon URL",
+        default="",
+        style=discord.TextStyle.short,
+        required=False,
+    )
+
+    async def on_submit(self, interaction: discord.Interaction):
+        await interaction.response.defer(thinking=False)
+
+        self.stop()
+
+
+class SetThumbnail(discord.ui.Modal, title="Set Thumbnail"):
+    thumbnail = discord.ui.TextInput(
+        label="Thumbnail URL",
+        placeholder="Thumbnail URL",
+        style=discord.TextStyle.short,
+    )
+
+    async def on_submit(self, interaction: discord.Interaction):
+        await interaction.response.defer(thinking=False)
+
+        self.stop()
+
+
+class CustomModalView(discord.ui.View):
+    def __init__(
+        self,
+        user_id,
+        title: str,
+        label: str,
+        options: typing.List[typing.Tuple[str, discord.ui.TextInput]],
+        epher_args: typing.Optional[dict] = None,
+    ):
+        super().__init__(timeout=600.0)
+        self.value = None
+        self.user_id = user_id
+        self.modal: typing.Union[None, CustomModal] = None
+        self.title = title
+        self.label = label
+        self.options = options
+        self.epher_args = epher_args or {}
+
+        for item in self.children:
+            item.label = self.title
+
+    # When the confirm button is pressed, set the inner value to `True` and
+    # stop the View from listening to more input.
+    # We also send the user an ephemeral message that we're confirming their choice.
+    @discord.ui.button(label="Enter Strike Amount", style=discord.ButtonStyle.secondary)
+    async def yes(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if interaction.user.id != self.user_id:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            return await generalised_interaction_check_failure(interaction.followup)
+
+        self.modal = CustomModal(self.label, self.options, self.epher_args)
+
+        await interaction.response.send_modal(self.modal)
+        await self.modal.wait()
+        self.stop()
+
+
+class CustomSelectMenu(discord.ui.View):
+    def __init__(self, user_id, options: list, limit: typing.Optional[int] = 1):
+        super().__init__(timeout=600.0)
+        self.value = None
+        self.user_id = user_id
+
+        self.add_item(CustomDropdown(self.user_id, options, limit))
+
+
+class RoleSelect(discord.ui.View):
+    def __init__(self, user_id, **kwargs):
+        super().__init__(timeout=600.0)
+        self.value = None
+        self.user_id = user_id
+        self.limit = 25
+
+        for key, value in kwargs.items():
+            if key == "limit":
+                self.limit = value
+
+        if self.limit > 1:
+            self.placeholder = "Select roles"
+        else:
+            self.placeholder = "Select a role"
+
+        for child in self.children:
+            child.placeholder = self.placeholder
+            child.max_values = self.limit
+            child.min_values = 1
+
+    @discord.ui.select(cls=discord.ui.RoleSelect)
+    async def role_select(
+        self, interaction: discord.Interaction, select: discord.ui.Select
+    ):
+        await interaction.response.defer()
+
+    @discord.ui.button(label="Finish", style=discord.ButtonStyle.success, row=2)
+    async def done(self, interaction: discord.Interaction, button: discord.ui.Button):
+        for child in self.children:
+            if isinstance(child, discord.ui.RoleSelect):
+                select = child
+
+        if interaction.user.id == self.user_id:
+            await interaction.response.defer()
+            self.value = select.values
+            self.stop()
+        else:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            return await generalised_interaction_check_failure(interaction.followup)
+
+
+class UserSelect(discord.ui.View):
+    def __init__(self, user_id, **kwargs):
+        super().__init__(timeout=600.0)
+        self.value = None
+        self.user_id = user_id
+        self.limit = 25
+
+        for key, value in kwargs.items():
+            if key == "limit":
+                self.limit = value
+
+        if self.limit > 1:
+            self.placeholder = "Select users"
+        else:
+            self.placeholder = "Select a user"
+
+        for child in self.children:
+            child.placeholder = self.placeholder
+            child.max_values = self.limit
+            child.min_values = 1
+
+    @discord.ui.select(cls=discord.ui.UserSelect)
+    async def user_select(
+        self, interaction: discord.Interaction, select: discord.ui.Select
+    ):
+        await interaction.response.defer()
+
+    @discord.ui.button(label="Finish", style=discord.ButtonStyle.success, row=2)
+    async def done(self, interaction: discord.Interaction, button: discord.ui.Button):
+        for child in self.children:
+            if isinstance(child, discord.ui.UserSelect):
+                select = child
+
+        if interaction.user.id == self.user_id:
+            await interaction.response.defer()
+            self.value = select.values
+            self.stop()
+        else:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            return await generalised_interaction_check_failure(interaction.followup)
+
+
+class ChannelSelect(discord.ui.View):
+    def __init__(self, user_id, **kwargs):
+        super().__init__(timeout=600.0)
+        self.value = None
+        self.user_id = user_id
+        self.limit = 25
+
+        for key, value in kwargs.items():
+            if key == "limit":
+                self.limit = value
+
+        if self.limit > 1:
+            self.placeholder = "Select channels"
+        else:
+            self.placeholder = "Select a channel"
+
+        for child in self.children:
+            child.placeholder = self.placeholder
+            child.max_values = self.limit
+            child.min_values = 1
+
+    @discord.ui.select(
+        cls=discord.ui.ChannelSelect, channel_types=[discord.ChannelType.text]
+    )
+    async def channel_select(
+        self, interaction: discord.Interaction, select: discord.ui.Select
+    ):
+        await interaction.response.defer()
+
+    @discord.ui.button(label="Finish", style=discord.ButtonStyle.success, row=2)
+    async def done(self, interaction: discord.Interaction, button: discord.ui.Button):
+        for child in self.children:
+            if isinstance(child, discord.ui.ChannelSelect):
+                select = child
+
+        if interaction.user.id == self.user_id:
+            await interaction.response.defer()
+            self.value = select.values
+            self.stop()
+        else:
+            return await interaction.response.send_message(
+                embed=discord.Embed(
+                    title="Not Permitted",
+                    description="You are not permitted to interact with these buttons.",
+                    color=blank_color,
+                ),
+                ephemeral=True,
+            )
@@ -0,0 +1,682 @@
+import discord
+from discord import Interaction
+from utils.constants import (
+    blank_color,
+    BLANK_COLOR,
+)
+from utils.utils import generalised_interaction_check_failure
+from ui.Common import (
+    CounterButton,
+    ViewVotersButton,
+    MessageCustomisation,
+    CustomModal,
+)
+
+
+class CustomCommandModification(discord.ui.View):
+    def __init__(self, user_id: int, command_data: dict):
+        super().__init__(timeout=600)
+        self.user_id = user_id
+        self.value = None
+        self.command_data = command_data
+
+        if self.command_data.get("channel") is not None:
+            for select in list(
+                filter(lambda x: isinstance(x, discord.ui.ChannelSelect), self.children)
+            ):
+                select.default_values = [
+                    discord.Object(id=self.command_data.get("channel"))
+                ]
+
+    async def check_ability(self, message):
+        if self.command_data.get("message", None) and self.command_data.get(
+            "name", None
+        ):
+            for item in self.children:
+                if isinstance(item, discord.ui.Button):
+                    if item.label == "Finish":
+                        item.disabled = False
+
+            await message.edit(view=self)
+        else:
+            for item in self.children:
+                if isinstance(item, discord.ui.Button):
+                    if item.label == "Finish":
+                        item.disabled = True
+            await message.edit(view=self)
+
+    async def interaction_check(self, interaction: Interaction, /) -> bool:
+        if interaction.user.id == self.user_id:
+            return True
+        else:
+            await interaction.response.send_message(
+                embed=discord.Embed(
+                    title="Not Permitted",
+                    description="You are not permitted to interact with these buttons.",
+                    color=BLANK_COLOR,
+                ),
+                ephemeral=True,
+            )
+            return False
+
+    async def refresh_ui(self, message: discord.Message):
+        embed = discord.Embed(
+            title="Custom Commands",
+            description=(
+                "**Command Information**\n"
+                f"> **Command ID:** `{self.command_data['id']}`\n"
+                f"> **Command Name:** {self.command_data['name']}\n"
+                f"> **Creator:** <@{self.command_data['author']}>\n"
+                f"> **Default Channel:** {'<#{}>'.format(self.command_data.get('channel')) if self.command_data.get('channel') is not None else 'None selected'}\n"
+                f"\n**Message:**\n"
+                f"View the message below by clicking 'View Message'."
+            ),
+            color=BLANK_COLOR,
+        )
+        await message.edit(embed=embed)
+
+    @discord.ui.button(label="View Variables", row=0)
+    async def view_variables(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        return await interaction.response.send_message(
+            embed=discord.Embed(
+                description=(
+                    "With **ERM Custom Commands**, you can use custom variables to adapt to the current circumstances when the command is ran.\n"
+                    "`{user}` - Mention of the person using the command.\n"
+                    "`{username}` - Name of the person using the command.\n"
+                    "`{display_name}` - Display name of the person using the command.\n"
+                    "`{time}` - Timestamp format of the time of the command execution.\n"
+                    "`{server}` - Name of the server this is being ran in.\n"
+                    "`{channel}` - Mention of the channel the command is being ran in.\n"
+                    "`{prefix}` - The custom prefix of the bot.\n"
+                    "`{onduty}` - Number of staff which are on duty within your server.\n"
+                    "\n**PRC Specific Variables**\n"
+                    "`{join_code}` - Join Code of the ER:LC server\n"
+                    "`{players}` - Current players in the ER:LC server\n"
+                    "`{max_players}` - Maximum players of the ER:LC server\n"
+                    "`{queue}` - Number of players in the queue\n"
+                    "`{staff}` - Number of staff members in-game\n"
+                    "`{mods}` - Number of mods in-game\n"
+                    "`{admins}` - Number of admins in-game\n"
+                ),
+                color=BLANK_COLOR,
+            ),
+            ephemeral=True,
+        )
+
+    @discord.ui.button(label="Edit Name", row=0)
+    async def edit_custom_command_name(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        modal = CustomModal(
+            "Edit Custom Command Name",
+            [
+                (
+                    "name",
+                    discord.ui.TextInput(label="Custom Command Name", max_length=50),
+                )
+            ],
+        )
+
+        await interaction.response.send_modal(modal)
+        await modal.wait()
+        try:
+            chosen_identifier = modal.name.value
+        except ValueError:
+            return
+
+        if not chosen_identifier:
+            return
+
+        self.command_data["name"] = chosen_identifier
+        await self.check_ability(interaction.message)
+        await self.refresh_ui(interaction.message)
+
+    @discord.ui.button(label="View Message", row=0)
+    async def view_custom_command_message(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        await interaction.response.defer(ephemeral=True)
+
+        async def _return_failure():
+            return await interaction.followup.send(
+                embed=discord.Embed(
+                    title="No Message Found",
+                    description="There is currently no message associated with this Custom Command.\nYou can add one using 'Edit Message'.",
+                    color=BLANK_COLOR,
+                ),
+                ephemeral=True,
+            )
+
+        view = discord.ui.View()
+        for item in self.command_data.get("buttons") or []:
+            view.add_item(
+                discord.ui.Button(
+                    label=item["label"],
+                    url=item["url"],
+                    row=item["row"],
+                    style=discord.ButtonStyle.url,
+                )
+            )
+
+        if not self.command_data.get("message", None):
+            return await _return_failure()
+
+        if (
+            not self.command_data.get("message", {}).get("content", None)
+            and not len(self.command_data.get("message", {}).get("embeds", [])) > 0
+        ):
+            return await _return_failure()
+
+        converted = []
+        for item in self.command_data.get("message").get("embeds", []):
+            converted.append(discord.Embed.from_dict(item))
+
+        await interaction.followup.send(
+            embeds=converted,
+            content=self.command_data["message"].get("content", None),
+            ephemeral=True,
+            view=view,
+        )
+
+    @discord.ui.button(label="Edit Message", row=0)
+    async def edit_message(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        view = MessageCustomisation(
+            interaction.user.id,
+            self.command_data.get("message", None),
+            external=False,
+            persist=False,
+        )
+        view.sustained_interaction = interaction
+
+        if not self.command_data.get("message", None):
+            await interaction.response.send_message(view=view, ephemeral=True)
+        else:
+            converted = []
+            for item in self.command_data.get("message", {}).get("embeds", []):
+                converted.append(discord.Embed.from_dict(item))
+
+            await interaction.response.send_message(
+                content=self.command_data.get("message", {}).get("content", None),
+                embeds=converted,
+                view=view,
+                ephemeral=True,
+            )
+
+        await view.wait()
+        if view.newView:
+            await view.newView.wait()
+            chosen_message = view.newView.msg
+        else:
+            chosen_message = view.msg
+
+        new_content = chosen_message.content
+        new_embeds = []
+        for item in chosen_message.embeds or []:
+            new_embeds.append(item.to_dict())
+
+        self.command_data["message"] = {"content": new_content, "embeds": new_embeds}
+        await self.check_ability(interaction.message)
+        await self.refresh_ui(interaction.message)
+        await (await interaction.original_response()).delete()
+
+    @discord.ui.button(label="Edit Buttons", row=0)
+    async def edit_buttons(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        view = ButtonCustomisation(self.command_data, interaction.user.id)
+        view.sustained_interaction = interaction
+
+        if not self.command_data.get("message", None):
+            await interaction.response.send_message(view=view, ephemeral=True)
+        else:
+            converted = []
+            for item in self.command_data.get("message", {}).get("embeds", []):
+                converted.append(discord.Embed.from_dict(item))
+
+            await interaction.response.send_message(
+                content=self.command_data.get("message", {}).get("content", None),
+                embeds=converted,
+                view=view,
+                ephemeral=True,
+            )
+
+        timeout = await view.wait()
+        if timeout or not view.value:
+            return
+
+        self.command_data["buttons"] = view.command_data.get("buttons", [])
+        await self.check_ability(interaction.message)
+        await self.refresh_ui(interaction.message)
+        await (await interaction.original_response()).delete()
+
+    @discord.ui.select(
+        cls=discord.ui.ChannelSelect,
+        placeholder="Default Channel",
+        row=1,
+        min_values=0,
+        max_values=1,
+        channel_types=[discord.ChannelType.text],
+    )
+    async def channel_select(
+        self, interaction: discord.Interaction, select: discord.ui.Select
+    ):
+        value = await self.interaction_check(interaction)
+        if not value:
+            return
+
+        self.command_data["channel"] = (
+            select.values[0].id if len(select.values) > 0 else None
+        )
+        await interaction.response.defer(thinking=False)
+        await self.check_ability(interaction.message)
+        await self.refresh_ui(interaction.message)
+
+    @discord.ui.button(label="Cancel", style=discord.ButtonStyle.danger, row=2)
+    async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.defer(thinking=False)
+        self.value = False
+        pass
+
+    @discord.ui.button(
+        label="Finish", style=discord.ButtonStyle.green, row=2, disabled=True
+    )
+    async def finish(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.defer(thinking=False)
+        self.value = True
+        self.stop()
+
+
+class ButtonCustomisation(discord.ui.View):
+    def __init__(self, command_data: dict, user_id: int):
+        super().__init__(timeout=600)
+        for item in command_data.get("buttons") or []:
+            self.add_item(
+                discord.ui.Button(
+                    label=item["label"],
+                    url=item["url"],
+                    row=item["row"],
+                    style=discord.ButtonStyle.url,
+                )
+            )
+
+        self.command_data = command_data
+        self.sustained_interaction = None
+        self.value = None
+        self.user_id = user_id
+
+    @discord.ui.button(label="Add Button", row=4)
+    async def add_button(self, interaction: discord.Interaction, _):
+        if len(self.children) >= 25:
+            return await interaction.response.send_message(
+                embed=discord.Embed(
+                    title="Limitation",
+                    description="You can only have a maximum of 25 buttons per custom command.",
+                    color=BLANK_COLOR,
+                ),
+                ephemeral=True,
+            )
+
+        modal = CustomModal(
+            "Add a Button",
+            [
+                (
+                    "label",
+                    discord.ui.TextInput(
+                        label="Label",
+                        max_length=80,
+                        placeholder="Label of the button",
+                        required=True,
+                    ),
+                ),
+                (
+                    "url",
+                    discord.ui.TextInput(
+                        label="URL",
+                        max_length=500,
+                        placeholder="URL of the button",
+                        required=True,
+                    ),
+                ),
+                (
+                    "row",
+                    discord.ui.TextInput(
+                        label="Row", placeholder="Row of the button (e.g. 0, 1, 2, 3)"
+                    ),
+                ),
+            ],
+            {"ephemeral": True},
+        )
+        await interaction.response.send_modal(modal)
+        await modal.wait()
+        # Input validations
+        if not all([i.isdigit() for i in modal.row.value.strip()]):
+            return await interaction.followup.send(
+                embed=discord.Embed(
+                    title="Invalid Row",
+                    description="The row you provided is not a valid number.",
+                    color=BLANK_COLOR,
+                ),
+                ephemeral=True,
+            )
+
+        if int(modal.row.value.strip()) > 4:
+            return await interaction.followup.send(
+                embed=discord.Embed(
+                    title="Invalid Row",
+                    description="The row you provided must be within the range 0-4.",
+                    color=BLANK_COLOR,
+                ),
+                ephemeral=True,
+            )
+
+        if int(modal.row.value.strip()) < 0:
+            return await interaction.followup.send(
+                embed=discord.Embed(
+                    title="Invalid Row",
+                    description="The row you provided must be within the range 0-4.",
+                    color=BLANK_COLOR,
+                ),
+                ephemeral=True,
+            )
+
+        if not modal.label.value.strip():
+            return await interaction.followup.send(
+                embed=discord.Embed(
+                    title="Invalid Label",
+                    description="The label you provided is not valid.",
+                    color=BLANK_COLOR,
+                ),
+                ephemeral=True,
+            )
+
+        if not modal.url.value.strip():
+            return await interaction.followup.send(
+                embed=discord.Embed(
+                    title="Invalid URL",
+                    description="The URL you provided is not valid.",
+                    color=BLANK_COLOR,
+                ),
+                ephemeral=True,
+            )
+
+        if not any(
+            [
+                modal.url.value.strip().startswith(prefix)
+                for prefix in ["https://", "http://"]
+            ]
+        ):
+            return await interaction.followup.send(
+                embed=discord.Embed(
+                    title="Invalid URL",
+                    description="The URL you provided is not valid.",
+                    color=BLANK_COLOR,
+                ),
+                ephemeral=True,
+            )
+
+        message = interaction.message
+        if self.sustained_interaction:
+            message = await self.sustained_interaction.original_response()
+
+        relevant_item = discord.ui.Button(
+            label=modal.label.value.strip(),
+            url=modal.url.value.strip(),
+            row=int(modal.row.value.strip()),
+            style=discord.ButtonStyle.url,
+        )
+        self.add_item(relevant_item)
+
+        try:
+            await message.edit(view=self)
+        except discord.HTTPException:
+            self.remove_item(relevant_item)
+            return
+
+        if self.command_data.get("buttons") is not None:
+            self.command_data["buttons"].append(
+                {
+                    "label": modal.label.value.strip(),
+                    "url": modal.url.value.strip(),
+                    "row": int(modal.row.value.strip()),
+                }
+            )
+        else:
+            self.command_data["buttons"] = [
+                {
+                    "label": modal.label.value.strip(),
+                    "url": modal.url.value.strip(),
+                    "row": int(modal.row.value.strip()),
+                }
+            ]
+
+    @discord.ui.button(label="Remove Button", row=4)
+    async def remove_button(self, interaction: discord.Interaction, _):
+        modal = CustomModal(
+            "Remove a Button",
+            [
+                (
+                    "label",
+                    discord.ui.TextInput(
+                        label="Label",
+                        max_length=80,
+                        placeholder="Label of the button",
+                        required=True,
+                    ),
+                ),
+            ],
+            {"ephemeral": True},
+        )
+        await interaction.response.send_modal(modal)
+        await modal.wait()
+        # Input validations
+
+        message = interaction.message
+        if self.sustained_interaction:
+            message = await self.sustained_interaction.original_response()
+
+        for item in self.command_data.get("buttons") or []:
+            if item["label"].lower() == modal.label.value.strip().lower():
+                self.command_data["buttons"].remove(item)
+
+        for button in self.children:
+            if isinstance(button, discord.ui.Button):
+                if button.label.lower() == modal.label.value.strip().lower():
+                    if button.label not in [
+                        "Add Button",
+                        "Remove Button",
+                        "Counter Button",
+                        "Cancel",
+                        "Finish",
+                    ]:
+                        self.remove_item(button)
+                        break
+
+        await message.edit(view=self)
+
+    @discord.ui.button(label="Counter Button", row=4)
+    async def add_counter(self, interaction: discord.Interaction, _):
+        if len(self.children) >= 25:
+            return await interaction.response.send_message(
+                embed=discord.Embed(
+                    title="Limitation",
+                    description="You can only have a maximum of 25 buttons per custom command.",
+                    color=BLANK_COLOR,
+                ),
+                ephemeral=True,
+            )
+
+        modal = CustomModal(
+            "Add a Button",
+            [
+                (
+                    "row",
+                    discord.ui.TextInput(
+                        label="Row", placeholder="Row of the button (e.g. 0, 1, 2, 3)"
+                    ),
+                )
+            ],
+            {"ephemeral": True},
+        )
+        await interaction.response.send_modal(modal)
+        await modal.wait()
+
+        if not modal.children[0].value.isdigit():
+            return await interaction.followup.send(
+                embed=discord.Embed(
+                    title="Invalid Row",
+                    description="The row you provided is not a valid number.",
+                    color=BLANK_COLOR,
+                ),
+                ephemeral=True,
+            )
+
+        row = int(modal.children[0].value.strip())
+
+        if row > 4 or row < 0:
+            return await interaction.followup.send(
+                embed=discord.Embed(
+                    title="Invalid Row",
+                    description="The row you provided must be within the range 0-4.",
+                    color=BLANK_COLOR,
+                ),
+                ephemeral=True,
+            )
+
+        counter_button = CounterButton(row=row)
+        view_voters_button = ViewVotersButton(row=row, counter_button=counter_button)
+
+        self.add_item(counter_button)
+        self.add_item(view_voters_button)
+
+        message = interaction.message
+        if self.sustained_interaction:
+            message = await self.sustained_interaction.original_response()
+
+        try:
+            await message.edit(view=self)
+        except discord.HTTPException:
+            self.remove_item(counter_button)
+            self.remove_item(view_voters_button)
+            return
+
+        if self.command_data.get("buttons") is not None:
+            self.command_data["buttons"].append({"label": "0", "row": row})
+        else:
+            self.command_data["buttons"] = [{"label": "0", "row": row}]
+
+    @discord.ui.button(label="Cancel", style=discord.ButtonStyle.danger, row=4)
+    async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.defer(thinking=False)
+        self.value = False
+        pass
+
+    @discord.ui.button(
+        label="Finish", style=discord.ButtonStyle.green, row=4, disabled=False
+    )
+    async def finish(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.defer(thinking=False)
+        self.value = True
+        self.stop()
+
+
+class RemoveCustomCommand(discord.ui.View):
+    def __init__(self, user_id):
+        super().__init__(timeout=600.0)
+        self.value = None
+        self.user_id = user_id
+
+    @discord.ui.button(
+        label="Delete a custom command", style=discord.ButtonStyle.danger
+    )
+    async def accept(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if interaction.user.id == self.user_id:
+            await interaction.response.defer()
+            for item in self.children:
+                item.disabled = True
+            await interaction.edit_original_response(view=self)
+            self.value = "delete"
+            self.stop()
+        else:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            return await generalised_interaction_check_failure(interaction.followup)
+
+
+class CustomCommandOptionSelect(discord.ui.View):
+    def __init__(self, user_id: int):
+        super().__init__(timeout=900.0)
+        self.user_id = user_id
+        self.modal = None
+        self.value = None
+
+    async def interaction_check(self, interaction: Interaction, /) -> bool:
+        if interaction.user.id == self.user_id:
+            return True
+        else:
+            await interaction.response.send_message(
+                embed=discord.Embed(
+                    title="Not Permitted",
+                    description="You are not permitted to interact with these buttons.",
+                    color=blank_color,
+                ),
+                ephemeral=True,
+            )
+            return False
+
+    @discord.ui.button(label="Create", style=discord.ButtonStyle.green, row=0)
+    async def create_custom_command(
+        self, interaction: discord.Interaction, _: discord.Button
+    ):
+        self.value = "create"
+        self.modal = CustomModal(
+            "Create a Custom Command",
+            [("name", discord.ui.TextInput(label="Custom Command Name"))],
+            {"thinking": False},
+        )
+        await interaction.response.send_modal(self.modal)
+        await self.modal.wait()
+        if self.modal.name.value is None:
+            return
+
+        self.stop()
+
+    @discord.ui.button(label="Edit", style=discord.ButtonStyle.secondary, row=0)
+    async def edit_custom_command(
+        self, interaction: discord.Interaction, _: discord.Button
+    ):
+        self.value = "edit"
+        self.modal = CustomModal(
+            "Edit a Custom Command",
+            [("id", discord.ui.TextInput(label="Custom Command ID"))],
+            {"thinking": False},
+        )
+        await interaction.response.send_modal(self.modal)
+        await self.modal.wait()
+        if self.modal.id.value is None:
+            return
+        self.stop()
+
+    @discord.ui.button(label="Delete", style=discord.ButtonStyle.danger, row=0)
+    async def delete_custom_command(
+        self, interaction: discord.Interaction, _: discord.Button
+    ):
+        self.value = "delete"
+        self.modal = CustomModal(
+            "Delete a custom command",
+            [
+                (
+                    "name",
+                    discord.ui.TextInput(
+                        placeholder="Command Name", label="Command Name"
+                    ),
+                )
+            ],
+        )
+        await interaction.response.send_modal(self.modal)
+        await self.modal.wait()
+        if self.modal.name.value is None:
+            return
+        self.stop()
@@ -1,7 +1,11 @@
 from discord.ext import commands
-from utils.constants import blank_color
+from utils.constants import blank_color, BLANK_COLOR, GREEN_COLOR
 from utils.utils import config_change_log
 import discord
+import asyncio
+import datetime
+import typing
+import pytz
 
 class callSignCheck(discord.ui.View):
     def __init__(self, bot: commands.Bot, user_id: int, settings: dict = None):
@@ -68,4 +72,298 @@ class callSignCheck(discord.ui.View):
             description="DUMMY",
             color=blank_color
         )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
\ No newline at end of file
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+
+class ReloadView(discord.ui.View):
+    def __init__(self, bot, user_id: int, custom_callback: typing.Callable, args: list):
+        super().__init__(timeout=900)
+        self.bot = bot
+        self.user_id = user_id
+        self.custom_callback = custom_callback
+        self.callback_args = args
+        self.message = None
+
+    async def on_timeout(self) -> None:
+        for item in self.children:
+            item.disabled = True
+        await self.message.edit(view=self)
+
+    async def _temp_disable(self, timer: int):
+        for item in self.children:
+            item.disabled = True
+        await self.message.edit(view=self)
+        await asyncio.sleep(timer)
+        for item in self.children:
+            item.disabled = False
+        await self.message.edit(view=self)
+
+    async def interaction_check(self, interaction: discord.Interaction, /) -> bool:
+        if interaction.user.id == self.user_id:
+            return True
+        else:
+            await interaction.response.send_message(
+                embed=discord.Embed(
+                    title="Not Permitted",
+                    description="You are not permitted to interact with these buttons.",
+                    color=blank_color,
+                ),
+                ephemeral=True,
+            )
+            return False
+
+    @discord.ui.button(
+        label="Reload",
+        emoji="<:lastupdated:1176999148084535326>",
+        style=discord.ButtonStyle.secondary,
+    )
+    async def _reload(self, interaction: discord.Interaction, button: discord.Button):
+        await interaction.response.defer()
+        await self.custom_callback(*self.callback_args)
+        await self._temp_disable(30)
+
+
+class AvatarCheckView(discord.ui.View):
+    def __init__(self, bot, user_id: str, message: str):
+        super().__init__(timeout=None)
+        self.bot = bot
+        self.user_id = user_id
+        self.message = message
+
+    @discord.ui.button(label="Mark as Reviewed", style=discord.ButtonStyle.success)
+    async def mark_reviewed(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        embed = interaction.message.embeds[0]
+        embed.title = f"{self.bot.emoji_controller.get_emoji('success')} Unrealistic Avatar Reviewed"
+        embed.color = GREEN_COLOR
+
+        for item in self.children:
+            item.disabled = True
+            if item.label == "Mark as Reviewed":
+                item.label = f"Reviewed by {interaction.user.name}"
+
+        await interaction.message.edit(embed=embed, view=self)
+        await interaction.response.defer()
+
+    @discord.ui.button(label="Kick Player", style=discord.ButtonStyle.secondary)
+    async def kick_player(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        await interaction.response.defer(ephemeral=True)
+        try:
+            await self.bot.prc_api.run_command(
+                interaction.guild.id, f":kick {self.user_id}"
+            )
+            await interaction.followup.send(
+                embed=discord.Embed(
+                    title=f"{self.bot.emoji_controller.get_emoji('success')} Kicked Player",
+                    description="The player has been kicked from the server.",
+                    color=GREEN_COLOR,
+                ),
+                ephemeral=True,
+            )
+            for item in self.children:
+                if item == button:
+                    item.disabled = True
+
+            await interaction.message.edit(view=self)
+
+        except Exception as e:
+            await interaction.followup.send(
+                embed=discord.Embed(
+                    title=f"Not Executed",
+                    description=f"Failed to kick player: {str(e)}",
+                    color=BLANK_COLOR,
+                ),
+                ephemeral=True,
+            )
+
+
+class RefreshConfirmation(discord.ui.View):
+    def __init__(self, author_id: int):
+        super().__init__(timeout=30.0)
+        self.value = None
+        self.author_id = author_id
+
+    @discord.ui.button(label="Yes", style=discord.ButtonStyle.green)
+    async def confirm(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        if interaction.user.id != self.author_id:
+            return await interaction.response.send_message(
+                embed=discord.Embed(
+                    title="Not Permitted",
+                    description="You are not permitted to interact with these buttons.",
+                    color=blank_color,
+                ),
+                ephemeral=True,
+            )
+        await interaction.response.defer()
+        self.value = True
+        for item in self.children:
+            item.disabled = True
+        await interaction.message.edit(view=self)
+        self.stop()
+
+    @discord.ui.button(label="No", style=discord.ButtonStyle.red)
+    async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if interaction.user.id != self.author_id:
+            return await interaction.response.send_message(
+                embed=discord.Embed(
+                    title="Not Permitted",
+                    description="You are not permitted to interact with these buttons.",
+                    color=blank_color,
+                ),
+                ephemeral=True,
+            )
+        await interaction.response.defer()
+        self.value = False
+        for item in self.children:
+            item.disabled = True
+        await interaction.message.edit(view=self)
+        self.stop()
+
+    async def on_timeout(self):
+        for item in self.children:
+            item.disabled = True
+        try:
+            await self.message.edit(view=self)
+        except:
+            pass
+
+
+class RiskyUsersMenu(discord.ui.View):
+    def __init__(self, bot, guild_id, risky_users, user_id):
+        super().__init__(timeout=600.0)
+        self.bot = bot
+        self.guild_id = guild_id
+        self.risky_users = risky_users
+        self.user_id = user_id
+        self.add_item(BanOptions(bot, guild_id, risky_users, user_id))
+
+
+class BanOptions(discord.ui.Select):
+    def __init__(self, bot, guild_id, risky_users, user_id):
+        self.bot = bot
+        self.guild_id = guild_id
+        self.risky_users = risky_users
+        self.user_id = user_id
+        options = [
+            discord.SelectOption(label="Ban All Risk Users", description="Ban all detected risk users"),
+            discord.SelectOption(label="Ban Specific User", description="Specify a user to ban")
+        ]
+        super().__init__(placeholder="Actions", options=options)
+
+    async def callback(self, interaction: discord.Interaction):
+        if interaction.user.id != self.user_id:
+            await interaction.response.send_message(
+                embed=discord.Embed(
+                    title="Not Permitted",
+                    description="You are not permitted to interact with these buttons.",
+                    color=BLANK_COLOR
+                ), ephemeral=True
+            )
+            return
+
+        await interaction.response.defer()
+        self.view.clear_items()
+
+        if self.values[0] == "Ban All Risk Users":
+            await interaction.followup.send(
+                embed=discord.Embed(
+                    title=f"{await self.bot.emoji_controller.get_emoji('Clock')} Banning users",
+                    description="We are banning all the risk users in your server. Please wait...",
+                    color=BLANK_COLOR
+                ), ephemeral=True
+            )
+            for user in self.risky_users:
+                ban_command = f":ban {user.id}"
+                await self.bot.prc_api.run_command(self.guild_id, ban_command)
+                await self.bot.punishments.insert_warning(
+                    staff_id=int(interaction.user.id), # interaction id
+                    staff_name= interaction.user.name, #interaction usr name
+                    user_id=int(user.id),
+                    user_name=user.username,
+                    guild_id= interaction.guild.id,
+                    moderation_type="Ban",
+                    reason="Having a user with all or others.",
+                    time_epoch= datetime.datetime.now(tz=pytz.UTC).timestamp(),
+                )
+                await asyncio.sleep(5)  # Rate limit: 1 command every 5 seconds
+            await interaction.followup.send(
+                embed=discord.Embed(
+                    title=f"{await self.bot.emoji_controller.get_emoji('success')} Players Banned",
+                    description="All risk players have been banned from the server.",
+                    color=GREEN_COLOR
+                ), ephemeral=True
+            )
+
+        elif self.values[0] == "Ban Specific User":
+            new_view = RiskyUsersMenu(self.bot, self.guild_id, self.risky_users, self.user_id)
+            new_view.clear_items()
+            new_view.add_item(SpecificUserSelect(self.bot, self.guild_id, self.risky_users, self.user_id))
+            await interaction.followup.send(
+                embed=discord.Embed(
+                    title="Select a User to Ban",
+                    description="Please select a user from the dropdown below.",
+                    color=BLANK_COLOR
+                ), ephemeral=True, view=new_view
+            )
+
+
+class SpecificUserSelect(discord.ui.Select):
+    def __init__(self, bot, guild_id, risky_users, user_id):
+        self.bot = bot
+        self.guild_id = guild_id
+        self.risky_users = risky_users
+        self.user_id = user_id
+        options = [
+            discord.SelectOption(label=user.username, value=str(user.id))
+            for user in risky_users
+        ]
+        super().__init__(placeholder="Select a user to ban", options=options, max_values=len(options), min_values=1)
+
+    async def callback(self, interaction: discord.Interaction):
+        if interaction.user.id != self.user_id:
+            await interaction.response.send_message(
+                embed=discord.Embed(
+                    title="Not Permitted",
+                    description="You are not permitted to interact with these buttons.",
+                    color=BLANK_COLOR
+                ), ephemeral=True
+            )
+            return
+
+        await interaction.response.defer()
+        await interaction.followup.send(
+            embed=discord.Embed(
+                title=f"{await self.bot.emoji_controller.get_emoji('Clock')} Banning users",
+                description="We are banning the specified risk users in the server. Please wait...",
+                color=BLANK_COLOR
+            ), ephemeral=True
+        )
+        for user_id in self.values:
+            user_id = int(user_id)
+            ban_command = f":ban {user_id}"
+            await self.bot.prc_api.run_command(self.guild_id, ban_command)
+            user = next((u for u in self.risky_users if u.id == user_id), None)
+            if user:
+                await self.bot.punishments.insert_warning(
+                    staff_id=interaction.user.id,  # usr id
+                    staff_name= interaction.user.name,  # interaction usr
+                    user_id=int(user.id),
+                    user_name=user.username,
+                    guild_id=interaction.guild.id,
+                    moderation_type="Ban",
+                    reason="Having a user with all or others.",
+                    time_epoch=datetime.datetime.now(tz=pytz.UTC).timestamp(),
+                )
+            await asyncio.sleep(5)  # Rate limit: 1 command every 5 seconds
+        await interaction.followup.send(
+            embed=discord.Embed(
+                title=f"{await self.bot.emoji_controller.get_emoji('success')} Players Banned",
+                description="The selected players have been banned from the server.",
+                color=GREEN_COLOR
+            ), ephemeral=True
+        )
@@ -0,0 +1,210 @@
+import discord
+from utils.constants import (
+    BLANK_COLOR,
+    GREEN_COLOR,
+)
+from ui.Common import CustomModal
+
+
+class GameSecurityActions(discord.ui.View):
+    def __init__(self, bot):
+        super().__init__(timeout=None)
+        self.bot = bot
+
+    def enable_reflective_action(self):
+        # enables the button that allows for unbanning all affected users
+        for item in self.children:
+            if isinstance(item, discord.ui.Button):
+                if item.label == "Unban Affected Players":
+                    item.disabled = False
+
+    @discord.ui.button(label="Mark as Justified", style=discord.ButtonStyle.success)
+    async def mark_as_justified(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        await interaction.response.send_modal(
+            (
+                modal := CustomModal(
+                    "Reason",
+                    [
+                        (
+                            "reason",
+                            discord.ui.TextInput(
+                                label="Reason",
+                                placeholder="e.g. SSD, permitted by owners, etc.",
+                                style=discord.TextStyle.long,
+                            ),
+                        )
+                    ],
+                    {"thinking": False},
+                )
+            )
+        )
+        timeout = await modal.wait()
+        if timeout:
+            return
+
+        await interaction.message.edit(
+            embed=interaction.message.embeds[0].add_field(
+                name="Justification",
+                value=f"> {modal.reason.value}\n- {interaction.user.mention}",
+            ),
+            view=self.clear_items(),
+        )
+
+    @discord.ui.button(
+        label="Unadmin Staff Member", style=discord.ButtonStyle.secondary
+    )
+    async def unadmin_staff_member(
+        self, interaction: discord.Interaction, button: discord.ui.View
+    ):
+        bot = self.bot
+        guild = interaction.guild
+        field1 = interaction.message.embeds[0].fields[0]
+        user_id = field1.value.split("**User ID:** ")[1].split("\n")
+
+        user_id = "".join(filter(str.isdigit, user_id))
+        await interaction.response.defer(ephemeral=True, thinking=False)
+
+        command_response = await bot.prc_api.run_command(
+            interaction.guild.id, f":unadmin {user_id}"
+        )
+        cr_2 = await bot.prc_api.run_command(interaction.guild.id, f":unmod {user_id}")
+
+        for item in self.children:
+            item.disabled = False
+        await interaction.message.edit(view=self)
+
+        if command_response[0] == 200 and cr_2[0] == 200:
+            return await interaction.followup.send(
+                embed=discord.Embed(
+                    title=f"{self.bot.emoji_controller.get_emoji('success')} Revoked Permissions",
+                    description="This command has been sent to the server. Their permissions should now be removed.",
+                    color=GREEN_COLOR,
+                ),
+                ephemeral=True,
+            )
+        else:
+            return await interaction.followup.send(
+                embed=discord.Embed(
+                    title=f"Not Executed ({command_response[0]})",
+                    description="These commands have not been executed successfully. Try again.",
+                    color=BLANK_COLOR,
+                ),
+                ephemeral=True,
+            )
+
+    @discord.ui.button(
+        label="Unban Affected Players",
+        style=discord.ButtonStyle.secondary,
+        row=0,
+        disabled=False,
+    )
+    async def unban_affected_players(
+        self, interaction: discord.Interaction, button: discord.ui.View
+    ):
+        bot = self.bot
+        guild = interaction.guild
+        field1 = interaction.message.embeds[0].fields[1]
+
+        users_ids = []
+        affected_players = [
+            i.strip() for i in field1.value.split("]:**")[1].split("\n")[0].split(", ")
+        ]
+        print(affected_players)
+        users = [
+            await bot.roblox.get_user_by_username(item) for item in affected_players
+        ]
+        print(users)
+        for item in users:
+            if item is not None:
+                users_ids.append(str(item.id))
+
+        await interaction.response.defer(ephemeral=True, thinking=False)
+        command_response = await bot.prc_api.run_command(
+            interaction.guild.id, f":unban {','.join(users_ids)}"
+        )
+
+        if command_response[0] == 200:
+            return await interaction.followup.send(
+                embed=discord.Embed(
+                    title=f"{self.bot.emoji_controller.get_emoji('success')} Unbanned Affected Players",
+                    description=f"This command has been sent to the server.\n\n-# **Command Executed:** `:unban {','.join(users_ids)}`",
+                    color=GREEN_COLOR,
+                )
+            )
+        else:
+            return await interaction.followup.send(
+                embed=discord.Embed(
+                    title=f"Not Executed ({command_response[0]})",
+                    description=f"This command has not been executed successfully.\n\n-# **Attempted Command:** `:unban {','.join(users_ids)}`",
+                    color=BLANK_COLOR,
+                )
+            )
+
+    @discord.ui.button(
+        label="Kick Abuser", style=discord.ButtonStyle.secondary, row=1, disabled=True
+    )
+    async def kick_abuser(
+        self, interaction: discord.Interaction, button: discord.ui.View
+    ):
+        bot = self.bot
+        guild = interaction.guild
+        field1 = interaction.message.embeds[0].fields[0]
+        user_id = field1.value.split("**User ID:** ")[1].split("\n")
+        user_id = "".join(filter(str.isdigit, user_id))
+        await interaction.response.defer(ephemeral=True, thinking=False)
+
+        command_response = await bot.prc_api.run_command(
+            interaction.guild.id, f":kick {user_id}"
+        )
+
+        if command_response[0] == 200:
+            return await interaction.followup.send(
+                embed=discord.Embed(
+                    title=f"{self.bot.emoji_controller.get_emoji('success')} Kicked Abuser",
+                    description="This command has been sent to the server. They should now be removed from the server.",
+                    color=GREEN_COLOR,
+                )
+            )
+        else:
+            return await interaction.followup.send(
+                embed=discord.Embed(
+                    title=f"Not Executed ({command_response[0]})",
+                    description="These commands have not been executed successfully. Try again.",
+                    color=BLANK_COLOR,
+                )
+            )
+
+    @discord.ui.button(
+        label="Ban Abuser", style=discord.ButtonStyle.secondary, row=1, disabled=True
+    )
+    async def ban_abuser(
+        self, interaction: discord.Interaction, button: discord.ui.View
+    ):
+        bot = self.bot
+        guild = interaction.guild
+        field1 = interaction.message.embeds[0].fields[0]
+        user_id = field1.value.split("**User ID:** ")[1].split("\n")
+        user_id = "".join(filter(str.isdigit, user_id))
+        await interaction.response.defer(ephemeral=True, thinking=False)
+        command_response = await bot.prc_api.run_command(
+            interaction.guild.id, f":ban {user_id}"
+        )
+
+        if command_response[0] == 200:
+            return await interaction.followup.send(
+                embed=discord.Embed(
+                    title=f"{self.bot.emoji_controller.get_emoji('success')} Banned Abuser",
+                    description="This command has been sent to the server. They should now be removed from the server.",
+                    color=GREEN_COLOR,
+                )
+            )
+        else:
+            return await interaction.followup.send(
+                embed=discord.Embed(
+                    title=f"Not Executed ({command_response[0]})",
+                    description="These commands have not been executed successfully. Try again.",
+                    color=BLANK_COLOR,
+                )
+            )
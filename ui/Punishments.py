@@ -0,0 +1,745 @@
+import typing
+import discord
+from discord import Interaction
+from discord.ext import commands
+from utils.constants import (
+    blank_color,
+    BLANK_COLOR,
+    GREEN_COLOR,
+)
+from utils.utils import (
+    int_failure_embed,
+    generalised_interaction_check_failure,
+)
+from ui.Common import CustomModal
+
+
+class CustomisePunishmentType(discord.ui.View):
+    def __init__(self, user_id):
+        super().__init__(timeout=600.0)
+        self.value = None
+        self.user_id = user_id
+        self.modal: typing.Union[CreatePunishmentType, DeletePunishmentType, None] = (
+            None
+        )
+
+    @discord.ui.button(label="Create", style=discord.ButtonStyle.green)
+    async def accept(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if interaction.user.id == self.user_id:
+            modal = CreatePunishmentType()
+            await interaction.response.send_modal(modal)
+            await modal.wait()
+            self.modal = modal
+            for item in self.children:
+                item.disabled = True
+            await interaction.edit_original_response(view=self)
+            self.value = "create"
+            self.stop()
+        else:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            return await generalised_interaction_check_failure(interaction.followup)
+
+    @discord.ui.button(label="Delete", style=discord.ButtonStyle.danger)
+    async def deny(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if interaction.user.id == self.user_id:
+            modal = DeletePunishmentType()
+            await interaction.response.send_modal(modal)
+            await modal.wait()
+            self.modal = modal
+            for item in self.children:
+                item.disabled = True
+            await interaction.edit_original_response(view=self)
+            self.value = "delete"
+            self.stop()
+        else:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            return await generalised_interaction_check_failure(interaction.followup)
+
+
+class RemoveWarning(discord.ui.View):
+    def __init__(self, bot, user_id):
+        super().__init__(timeout=600.0)
+        self.value = None
+        self.bot = bot
+        self.user_id = user_id
+
+    # When the confirm button is pressed, set the inner value to `True` and
+    # stop the View from listening to more input.
+    # We also send the user an ephemeral message that we're confirming their choice.
+    @discord.ui.button(label="Yes", style=discord.ButtonStyle.green)
+    async def yes(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if interaction.user.id != self.user_id:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            return await generalised_interaction_check_failure(interaction.followup)
+        await interaction.response.defer()
+        for item in self.children:
+            self.remove_item(item)
+        self.value = True
+
+        # success = discord.Embed(
+        #     title="<:CheckIcon:1035018951043842088> Removed Punishment",
+        #     description="<:ArrowRightW:1035023450592514048>I've successfully removed the punishment from the user.",
+        #     color=0x71C15F,
+        # )
+
+        # await interaction.edit_original_response(embed=success, view=self)
+        self.stop()
+
+    # This one is similar to the confirmation button except sets the inner value to `False`
+    @discord.ui.button(label="No", style=discord.ButtonStyle.danger)
+    async def no(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if interaction.user.id != self.user_id:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            return await generalised_interaction_check_failure(interaction.followup)
+        await interaction.response.defer()
+        for item in self.children:
+            self.remove_item(item)
+        self.value = False
+
+        # success = discord.Embed(
+        #     title="<:ErrorIcon:1035000018165321808> Cancelled",
+        #     description="<:ArrowRightW:1035023450592514048>The punishment has not been removed from the user.",
+        #     color=0xFF3C3C,
+        # )
+        #
+        # await interaction.edit_original_response(embed=success, view=self)
+        self.stop()
+
+
+class RequestReason(discord.ui.Modal, title="Edit Reason"):
+    name = discord.ui.TextInput(label="Reason")
+
+    async def on_submit(self, interaction: discord.Interaction):
+        await interaction.response.defer(thinking=False)
+
+        self.stop()
+
+
+class RequestData(discord.ui.Modal, title="Edit Reason"):
+    data = discord.ui.TextInput(label="Reason")
+
+    def __init__(self, title="PLACEHOLDER", label="PLACEHOLDER"):
+        self.data.label = label
+        super().__init__(title=title)
+
+    async def on_submit(self, interaction: discord.Interaction):
+        await interaction.response.defer(thinking=False)
+
+        self.stop()
+
+
+class CreatePunishmentType(discord.ui.Modal, title="Create Punishment Type"):
+    name = discord.ui.TextInput(
+        label="Name",
+        placeholder="e.g. Verbal Warning",
+        max_length=20,
+        style=discord.TextStyle.short,
+    )
+
+    async def on_submit(self, interaction: discord.Interaction):
+        await interaction.response.defer(thinking=False)
+        self.stop()
+
+
+class DeletePunishmentType(discord.ui.Modal, title="Delete Punishment Type"):
+    name = discord.ui.TextInput(
+        label="Name",
+        placeholder="e.g. Verbal Warning",
+        max_length=20,
+        style=discord.TextStyle.short,
+    )
+
+    async def on_submit(self, interaction: discord.Interaction):
+        await interaction.response.defer(thinking=False)
+
+        self.stop()
+
+
+class TimeRequest(discord.ui.Modal, title="Temporary Ban"):
+    time = discord.ui.TextInput(label="Time (s/m/h/d)")
+
+    async def on_submit(self, interaction: discord.Interaction):
+        await interaction.response.defer(thinking=False)
+
+        self.stop()
+
+
+class ChangeWarningType(discord.ui.Select):
+    def __init__(self, user_id, options: list):
+        self.user_id: int = user_id
+
+        selected_options = []
+        using_options = False
+        for option in options:
+            if isinstance(option, str | int):
+                option = discord.SelectOption(
+                    label=str(option),
+                    value=str(option),
+                )
+                selected_options.append(option)
+                using_options = True
+            elif isinstance(option, discord.SelectOption):
+                option.emoji = "<:MalletWhite:1035258530422341672>"
+                selected_options.append(option)
+                using_options = True
+
+        if not using_options:
+            selected_options = [
+                discord.SelectOption(
+                    label="Warning",
+                    value="Warn",
+                    description="A warning, the smallest form of logged punishment",
+                ),
+                discord.SelectOption(
+                    label="Kick",
+                    value="Kick",
+                    description="Removing a user from the game, usually given after warnings",
+                ),
+                discord.SelectOption(
+                    label="Ban",
+                    value="Ban",
+                    description="A permanent form of removing a user from the game, given after kicks",
+                ),
+                discord.SelectOption(
+                    label="Temporary Ban",
+                    value="Temporary Ban",
+                    description="Given after kicks, not enough to warrant a permanent removal",
+                ),
+                discord.SelectOption(
+                    label="BOLO",
+                    value="BOLO",
+                    description="Cannot be found in the game, be on the lookout",
+                ),
+            ]
+        super().__init__(
+            placeholder="Select a warning type",
+            min_values=1,
+            max_values=1,
+            options=selected_options,
+        )
+
+    async def callback(self, interaction: discord.Interaction):
+        if interaction.user.id == self.user_id:
+            if self.values[0] == "Temporary Ban":
+                modal = TimeRequest()
+                await interaction.response.send_modal(modal)
+                seconds = 0
+                if modal.time.value.endswith("s", "m", "h", "d"):
+                    if modal.time.value.endswith("s"):
+                        seconds = int(modal.time.value.removesuffix("s"))
+                    elif modal.time.value.endswith("m"):
+                        seconds = int(modal.time.value.removesuffix("m")) * 60
+                    elif modal.time.value.endswith("h"):
+                        seconds = int(modal.time.value.removesuffix("h")) * 60 * 60
+                    else:
+                        seconds = int(modal.time.value.removesuffix("d")) * 60 * 60 * 24
+                else:
+                    seconds = int(modal.time.value)
+            await interaction.response.defer()
+            try:
+                self.view.value = [self.values[0], seconds]
+            except UnboundLocalError:
+                self.view.value = self.values[0]
+            self.view.stop()
+        else:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            return await generalised_interaction_check_failure(interaction.followup)
+
+
+class EditWarningSelect(discord.ui.Select):
+    def __init__(self, user_id: int, inherited_options: list):
+        self.user_id: int = user_id
+        self.inherited_options = inherited_options
+
+        options = [
+            discord.SelectOption(
+                label="Edit reason",
+                value="edit",
+                description="Edit the reason of the punishment",
+            ),
+            discord.SelectOption(
+                label="Change punishment type",
+                value="change",
+                description="Change the punishment type to a higher or lower severity",
+            ),
+            discord.SelectOption(
+                label="Delete punishment",
+                value="delete",
+                description="Delete the punishment from the database. This is irreversible.",
+            ),
+        ]
+
+        super().__init__(
+            placeholder="Select an option", min_values=1, max_values=1, options=options
+        )
+
+    # This one is similar to the confirmation button except sets the inner value to `False`
+    async def callback(self, interaction: discord.Interaction):
+        if interaction.user.id == self.user_id:
+            self.view.value = self.values[0]
+            if self.view.value == "edit":
+                if interaction.user.id != self.user_id:
+                    return
+                # await interaction.response.defer()
+                for item in self.view.children:
+                    item.disabled = True
+                self.view.value = "edit"
+
+                self.view.modal = RequestReason()
+                await interaction.response.send_modal(self.view.modal)
+                await self.view.modal.wait()
+                self.view.further_value = self.view.modal.name.value
+                self.view.stop()
+            elif self.view.value == "change":
+                if interaction.user.id != self.user_id:
+                    return
+                for item in self.view.children:
+                    item.disabled = True
+                self.value = "type"
+                view = WarningDropdownMenu(interaction.user.id, self.inherited_options)
+                await interaction.message.edit(
+                    content="<:ERMPending:1111097561588183121> **{},** please select a new punishment type.".format(
+                        interaction.user.name
+                    ),
+                    embed=None,
+                    view=view,
+                )
+                await view.wait()
+                self.view.further_value = view.value
+
+                self.view.stop()
+            elif self.view.value == "delete":
+                if interaction.user.id != self.user_id:
+                    return
+                await interaction.response.defer()
+                for item in self.view.children:
+                    item.disabled = True
+                self.value = "delete"
+                await interaction.edit_original_response(view=self.view)
+                self.view.stop()
+            else:
+                await int_failure_embed(interaction, "you have not picked an option.")
+        else:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            return await generalised_interaction_check_failure(interaction.followup)
+
+
+class EditWarning(discord.ui.View):
+    def __init__(self, bot, user_id, options):
+        super().__init__(timeout=600.0)
+        self.value: typing.Union[None, str] = None
+        self.bot: typing.Union[
+            discord.ext.commands.Bot, discord.ext.commands.AutoShardedBot
+        ] = bot
+        self.user_id: int = user_id
+        self.modal: typing.Union[None, discord.ui.Modal] = None
+        self.further_value: typing.Union[None, str] = None
+        self.options = options
+        self.add_item(EditWarningSelect(user_id, options))
+
+
+class RequestDataView(discord.ui.View):
+    def __init__(self, user_id, title: str, label: str):
+        super().__init__(timeout=600.0)
+        self.value = None
+        self.user_id = user_id
+        self.modal: typing.Union[None, RequestData] = None
+        self.title = title
+        self.label = label
+        for item in self.children:
+            item.label = self.title
+
+    # When the confirm button is pressed, set the inner value to `True` and
+    # stop the View from listening to more input.
+    # We also send the user an ephemeral message that we're confirming their choice.
+    @discord.ui.button(label="Enter Strike Amount", style=discord.ButtonStyle.secondary)
+    async def yes(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if interaction.user.id != self.user_id:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            return await generalised_interaction_check_failure(interaction.followup)
+        self.modal = RequestData(self.title, self.label)
+        await interaction.response.send_modal(self.modal)
+        await self.modal.wait()
+        self.stop()
+
+
+class WarningDropdownMenu(discord.ui.View):
+    def __init__(self, user_id, options: list):
+        super().__init__(timeout=600.0)
+        self.value = None
+        self.user_id = user_id
+        new_options = []
+
+        for option in options:
+            if isinstance(option, discord.SelectOption):
+                new_options.append(option)
+            else:
+                if isinstance(option, dict):
+                    new_options.append(
+                        discord.SelectOption(label=option["name"], value=option["name"])
+                    )
+                else:
+                    new_options.append(discord.SelectOption(label=option, value=option))
+
+        self.add_item(ChangeWarningType(self.user_id, new_options))
+
+
+class ManagementOptions(discord.ui.View):
+    def __init__(self, user_id: int):
+        super().__init__(timeout=900.0)
+        self.user_id = user_id
+        self.value = None
+
+    async def interaction_check(self, interaction: Interaction, /) -> bool:
+        if interaction.user.id == self.user_id:
+            return True
+        else:
+            await interaction.response.send_message(
+                embed=discord.Embed(
+                    title="Not Permitted",
+                    description="You are not permitted to interact with these buttons.",
+                    color=blank_color,
+                ),
+                ephemeral=True,
+            )
+            return False
+
+    @discord.ui.button(label="Manage Types")
+    async def manage_types(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        val = await self.interaction_check(interaction)
+        if not val:
+            return
+        await interaction.response.defer(thinking=False)
+        self.value = "types"
+        self.stop()
+
+    @discord.ui.button(label="Modify Punishment")
+    async def modify_punishment(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        val = await self.interaction_check(interaction)
+        if not val:
+            return
+        self.modal = CustomModal(
+            "Modify Punishment",
+            [("punishment_id", discord.ui.TextInput(label="Punishment ID"))],
+        )
+        await interaction.response.send_modal(self.modal)
+        await self.modal.wait()
+        if not self.modal.punishment_id.value:
+            return
+
+        self.value = "modify"
+        self.stop()
+
+
+class ManageTypesView(discord.ui.View):
+    def __init__(self, bot: commands.Bot, user_id: int):
+        super().__init__(timeout=900.0)
+        self.bot = bot
+        self.value = None
+        self.user_id = user_id
+        self.selected_for_deletion = None
+        self.name_for_creation = None
+
+    async def interaction_check(self, interaction: Interaction, /) -> bool:
+        if interaction.user.id == self.user_id:
+            return True
+        else:
+            await interaction.response.send_message(
+                embed=discord.Embed(
+                    title="Not Permitted",
+                    description="You are not permitted to interact with these buttons.",
+                    color=blank_color,
+                ),
+                ephemeral=True,
+            )
+            return False
+
+    @discord.ui.button(label="Create", style=discord.ButtonStyle.green)
+    async def create_punishment_type(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        val = await self.interaction_check(interaction)
+        if not val:
+            return
+        modal = CustomModal(
+            "Create Type",
+            [
+                (
+                    "punishment_type",
+                    discord.ui.TextInput(
+                        label="Punishment Type Name",
+                        placeholder="Name of the punishment type you want to create.",
+                    ),
+                )
+            ],
+        )
+        await interaction.response.send_modal(modal)
+        await modal.wait()
+        if not modal.punishment_type.value:
+            return
+        self.name_for_creation = modal.punishment_type.value
+        self.value = "create"
+        self.stop()
+
+    @discord.ui.button(label="Delete", style=discord.ButtonStyle.danger)
+    async def delete_punishment_type(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        val = await self.interaction_check(interaction)
+        if not val:
+            return
+
+        modal = CustomModal(
+            "Delete Type",
+            [
+                (
+                    "punishment_type",
+                    discord.ui.TextInput(
+                        label="Punishment Type ID",
+                        placeholder="ID of the punishment type you want to delete.",
+                    ),
+                )
+            ],
+        )
+        await interaction.response.send_modal(modal)
+        await modal.wait()
+        if not modal.punishment_type.value:
+            return
+        self.selected_for_deletion = modal.punishment_type.value
+        self.value = "delete"
+        self.stop()
+
+
+class PunishmentTypeCreator(discord.ui.View):
+    def __init__(self, user_id: int, dataset: dict):
+        super().__init__(timeout=900.0)
+        self.user_id = user_id
+        self.restored_interaction = None
+        self.dataset = dataset
+        self.cancelled = None
+
+    async def interaction_check(self, interaction: Interaction, /) -> bool:
+        if interaction.user.id == self.user_id:
+            return True
+        else:
+            await interaction.response.send_message(
+                embed=discord.Embed(
+                    title="Not Permitted",
+                    description="You are not permitted to interact with these buttons.",
+                    color=blank_color,
+                ),
+                ephemeral=True,
+            )
+            return False
+
+    async def refresh_ui(self, message: discord.Message):
+        embed = discord.Embed(
+            title="Punishment Type Creation",
+            description=(
+                f"> **Name:** {self.dataset['name']}\n"
+                f"> **ID:** {self.dataset['id']}\n"
+                f"> **Punishment Channel:** {'<#{}>'.format(self.dataset.get('channel', None)) if self.dataset.get('channel', None) is not None else 'Not set'}\n"
+            ),
+            color=BLANK_COLOR,
+        )
+
+        if all([self.dataset.get("channel") is not None]):
+            for item in self.children:
+                if isinstance(item, discord.ui.Button):
+                    if item.label == "Finish":
+                        item.disabled = False
+        else:
+            for item in self.children:
+                if isinstance(item, discord.ui.Button):
+                    if item.label == "Finish":
+                        item.disabled = True
+
+        await message.edit(embed=embed, view=self)
+
+    @discord.ui.select(
+        cls=discord.ui.ChannelSelect,
+        placeholder="Punishment Channel",
+        row=1,
+        max_values=1,
+        channel_types=[discord.ChannelType.text],
+    )
+    async def channel_select(
+        self, interaction: discord.Interaction, select: discord.ui.ChannelSelect
+    ):
+        await interaction.response.defer()
+
+        self.dataset["channel"] = [i.id for i in select.values][0]
+        try:
+            await self.refresh_ui(interaction.message)
+        except discord.NotFound:
+            await self.refresh_ui(await self.restored_interaction.original_response())
+
+    @discord.ui.button(label="Cancel", style=discord.ButtonStyle.danger, row=3)
+    async def cancel(self, interaction: discord.Interaction, button: discord.Button):
+        await interaction.response.defer(ephemeral=True)
+        self.cancelled = True
+        await interaction.followup.send(
+            embed=discord.Embed(
+                title="Successfully cancelled",
+                description="This Punishment Type has not been created.",
+                color=BLANK_COLOR,
+            ),
+            ephemeral=True,
+        )
+        try:
+            await interaction.message.delete()
+        except discord.NotFound:
+            await (await self.restored_interaction.original_response()).delete()
+        self.stop()
+
+    @discord.ui.button(
+        label="Finish", style=discord.ButtonStyle.green, disabled=True, row=3
+    )
+    async def finish(self, interaction: discord.Interaction, _: discord.Button):
+        await interaction.response.defer()
+        self.cancelled = False
+        self.stop()
+
+
+class PunishmentModifier(discord.ui.View):
+    def __init__(self, bot, user_id: int, dataset: dict):
+        super().__init__(timeout=900.0)
+        self.user_id = user_id
+        self.restored_interaction = None
+        self.bot = bot
+        self.dataset = dataset
+        self.root_dataset = dataset
+        self.cancelled = None
+
+    async def interaction_check(self, interaction: Interaction, /) -> bool:
+        if interaction.user.id == self.user_id:
+            return True
+        else:
+            await interaction.response.send_message(
+                embed=discord.Embed(
+                    title="Not Permitted",
+                    description="You are not permitted to interact with these buttons.",
+                    color=blank_color,
+                ),
+                ephemeral=True,
+            )
+            return False
+
+    async def refresh_ui(self, message: discord.Message):
+        embed = discord.Embed(
+            title="Punishment Modification",
+            description=(
+                f"> **Username:** {self.dataset['Username']}\n"
+                f"> **Type:** {self.dataset['Type']}\n"
+                f"> **ID:** {self.dataset['Snowflake']}\n"
+                f"> **Reason:** {self.dataset['Reason']}"
+            ),
+            color=BLANK_COLOR,
+        )
+
+        await message.edit(embed=embed, view=self)
+
+    @discord.ui.button(label="Change Type", row=0)
+    async def change_type(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        modal = CustomModal(
+            "Edit Punishment Type",
+            [("punishment_type", discord.ui.TextInput(label="Punishment Type Name"))],
+        )
+
+        await interaction.response.send_modal(modal)
+        await modal.wait()
+        try:
+            chosen_type = modal.punishment_type.value
+        except ValueError:
+            return
+
+        punishment_types = (
+            await self.bot.punishment_types.get_punishment_types(interaction.guild.id)
+        ) or {"types": []}
+        chosen_identifier = None
+        for item in punishment_types["types"] + ["Warning", "Kick", "Ban", "BOLO"]:
+            if isinstance(item, str) and item.lower() == chosen_type.lower():
+                chosen_identifier = item
+                break
+            elif isinstance(item, dict) and item["name"].lower() == chosen_type.lower():
+                chosen_identifier = item["name"]
+                break
+
+        if not chosen_identifier:
+            return await modal.interaction.followup.send(
+                embed=discord.Embed(
+                    title="Could not find type",
+                    description="This punishment type does not exist.",
+                    color=BLANK_COLOR,
+                )
+            )
+
+        self.dataset["Type"] = chosen_identifier
+        await self.refresh_ui(interaction.message)
+
+    @discord.ui.button(label="Edit Reason", row=0)
+    async def edit_reason(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        modal = CustomModal(
+            "Edit Reason", [("reason", discord.ui.TextInput(label="Reason"))]
+        )
+
+        await interaction.response.send_modal(modal)
+        await modal.wait()
+
+        self.dataset["Reason"] = modal.reason.value
+        await self.refresh_ui(interaction.message)
+
+    @discord.ui.button(label="Delete Punishment", row=0)
+    async def delete_punishment(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+
+        punishment = await self.bot.punishments.db.find_one(self.root_dataset)
+        if punishment:
+            await self.bot.punishments.remove_warning_by_snowflake(
+                punishment["Snowflake"]
+            )
+            await interaction.message.delete()
+            await interaction.response.send_message(
+                embed=discord.Embed(
+                    title=f"{self.bot.emoji_controller.get_emoji('success')} Punishment Deleted",
+                    color=GREEN_COLOR,
+                    description="This punishment has been deleted successfully!",
+                )
+            )
+
+    @discord.ui.button(label="Cancel", style=discord.ButtonStyle.danger, row=3)
+    async def cancel(self, interaction: discord.Interaction, button: discord.Button):
+        await interaction.response.defer(ephemeral=True)
+        self.cancelled = True
+        await interaction.followup.send(
+            embed=discord.Embed(
+                title="Successfully cancelled",
+                description="This punishment has not been modified.",
+                color=BLANK_COLOR,
+            ),
+            ephemeral=True,
+        )
+        try:
+            await interaction.message.delete()
+        except discord.NotFound:
+            await (await self.restored_interaction.original_response()).delete()
+        self.stop()
+
+    @discord.ui.button(
+        label="Finish", style=discord.ButtonStyle.green, disabled=False, row=3
+    )
+    async def finish(self, interaction: discord.Interaction, _: discord.Button):
+        punishment = await self.bot.punishments.find_by_id(self.dataset["_id"])
+        if punishment:
+            await self.bot.punishments.upsert(self.dataset)
+        self.cancelled = False
+        self.stop()
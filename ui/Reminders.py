@@ -0,0 +1,499 @@
+import datetime
+import typing
+import discord
+from discord import Interaction
+from utils.constants import (
+    blank_color,
+    BLANK_COLOR,
+    GREEN_COLOR,
+)
+from utils.timestamp import td_format
+from utils.utils import time_converter
+from ui.Common import CustomModal
+
+
+class ManageReminders(discord.ui.View):
+    def __init__(self, user_id):
+        super().__init__(timeout=600.0)
+        self.value = None
+        self.user_id = user_id
+        self.modal: typing.Union[None, CustomModal] = None
+
+    @discord.ui.button(label="Create", style=discord.ButtonStyle.green)
+    async def create(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if interaction.user.id == self.user_id:
+            self.modal = CustomModal(
+                f"Create a reminder",
+                [
+                    (
+                        "name",
+                        discord.ui.TextInput(
+                            label="Name",
+                            placeholder="Name of your reminder",
+                            required=True,
+                        ),
+                    ),
+                    (
+                        "content",
+                        discord.ui.TextInput(
+                            label="Content",
+                            style=discord.TextStyle.long,
+                            placeholder="Content of your reminder",
+                            required=True,
+                        ),
+                    ),
+                    (
+                        "time",
+                        discord.ui.TextInput(
+                            label="Interval",
+                            placeholder="What would you like you like the interval to be? (e.g. 5m)",
+                            required=True,
+                            style=discord.TextStyle.short,
+                        ),
+                    ),
+                ],
+            )
+            await interaction.response.send_modal(self.modal)
+            await self.modal.wait()
+            self.value = "create"
+            self.stop()
+        else:
+            return await interaction.response.send_message(
+                embed=discord.Embed(
+                    title="Not Permitted",
+                    description="You are not permitted to interact with these buttons.",
+                    color=blank_color,
+                ),
+                ephemeral=True,
+            )
+
+    @discord.ui.button(label="Edit", style=discord.ButtonStyle.primary)
+    async def edit(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if interaction.user.id == self.user_id:
+            self.modal = CustomModal(
+                f"Edit a reminder",
+                [
+                    (
+                        "identifier",
+                        discord.ui.TextInput(
+                            label="ID",
+                            placeholder="ID of your reminder",
+                            required=True,
+                        ),
+                    ),
+                ],
+            )
+            await interaction.response.send_modal(self.modal)
+            await self.modal.wait()
+            self.value = "edit"
+            self.stop()
+        else:
+            return await interaction.response.send_message(
+                embed=discord.Embed(
+                    title="Not Permitted",
+                    description="You are not permitted to interact with these buttons.",
+                    color=blank_color,
+                ),
+                ephemeral=True,
+            )
+
+    @discord.ui.button(label="Pause", style=discord.ButtonStyle.secondary)
+    async def pause(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if interaction.user.id == self.user_id:
+            self.modal = CustomModal(
+                f"Pause a reminder",
+                [
+                    (
+                        "id_value",
+                        discord.ui.TextInput(
+                            label="ID",
+                            placeholder="ID of your reminder",
+                            required=True,
+                        ),
+                    ),
+                ],
+            )
+            await interaction.response.send_modal(self.modal)
+            await self.modal.wait()
+            self.value = "pause"
+            self.stop()
+        else:
+            return await interaction.response.send_message(
+                embed=discord.Embed(
+                    title="Not Permitted",
+                    description="You are not permitted to interact with these buttons.",
+                    color=blank_color,
+                ),
+                ephemeral=True,
+            )
+
+    @discord.ui.button(label="Delete", style=discord.ButtonStyle.red)
+    async def delete(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if interaction.user.id == self.user_id:
+            self.modal = CustomModal(
+                f"Delete a reminder",
+                [
+                    (
+                        "id_value",
+                        discord.ui.TextInput(
+                            label="ID",
+                            placeholder="ID of your reminder",
+                            required=True,
+                        ),
+                    ),
+                ],
+            )
+            await interaction.response.send_modal(self.modal)
+            await self.modal.wait()
+            self.value = "delete"
+            self.stop()
+        else:
+            return await interaction.response.send_message(
+                embed=discord.Embed(
+                    title="Not Permitted",
+                    description="You are not permitted to interact with these buttons.",
+                    color=blank_color,
+                ),
+                ephemeral=True,
+            )
+
+
+class ERLCIntegrationToolkit(discord.ui.View):
+    def __init__(self, user_id: int):
+        super().__init__(timeout=900)
+        self.selected_option = None
+        self.user_id = user_id
+        self.content = None
+        self.message = None
+
+    @discord.ui.button(label="Message", style=discord.ButtonStyle.secondary)
+    async def message(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        await interaction.response.send_modal(
+            modal := CustomModal(
+                "Edit Message Content",
+                [
+                    (
+                        "msg_content",
+                        discord.ui.TextInput(
+                            label="Message Content", max_length=250, required=True
+                        ),
+                    )
+                ],
+                {"ephemeral": True},
+            )
+        )
+        timeout = await modal.wait()
+        if timeout:
+            return
+
+        self.content = modal.msg_content.value
+        self.selected_option = "Message"
+        await self.message.edit(
+            embed=discord.Embed(
+                title="<:success:1163149118366040106> Success!",
+                description="Message integration has successfully been setup.",
+                color=GREEN_COLOR,
+            ),
+            view=None,
+        )
+        self.stop()
+
+    @discord.ui.button(label="Hint", style=discord.ButtonStyle.secondary)
+    async def hint(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.send_modal(
+            modal := CustomModal(
+                "Edit Hint Content",
+                [
+                    (
+                        "hint_content",
+                        discord.ui.TextInput(
+                            label="Hint Content", max_length=250, required=True
+                        ),
+                    )
+                ],
+                {"thinking": False},
+            )
+        )
+        timeout = await modal.wait()
+        if timeout:
+            return
+
+        self.content = modal.hint_content.value
+        self.selected_option = "Hint"
+
+        await self.message.edit(
+            embed=discord.Embed(
+                title="<:success:1163149118366040106> Success!",
+                description="Hint integration has successfully been setup.",
+                color=GREEN_COLOR,
+            ),
+            view=None,
+        )
+        self.stop()
+
+
+class ReminderCreationToolkit(discord.ui.View):
+    def __init__(
+        self,
+        user_id: int,
+        dataset: dict,
+        option: typing.Literal["create", "edit"],
+        preset_values: dict | None = None,
+    ):
+        super().__init__(timeout=900.0)
+        self.user_id = user_id
+        self.dataset = dataset
+        self.cancelled = None
+        self.option = option
+
+        for key, value in (preset_values or {}).items():
+            for item in self.children:
+                if isinstance(item, discord.ui.RoleSelect) or isinstance(
+                    item, discord.ui.ChannelSelect
+                ):
+                    if item.placeholder == key:
+                        item.default_values = value
+                if isinstance(item, discord.ui.Button):
+                    if item.label == key:
+                        item.label = value["label"]
+                        item.style = value["style"]
+
+    async def interaction_check(self, interaction: Interaction, /) -> bool:
+        if interaction.user.id == self.user_id:
+            return True
+        else:
+            await interaction.response.send_message(
+                embed=discord.Embed(
+                    title="Not Permitted",
+                    description="You are not permitted to interact with these buttons.",
+                    color=blank_color,
+                ),
+                ephemeral=True,
+            )
+            return False
+
+    async def refresh_ui(self, message: discord.Message):
+        embed = discord.Embed(
+            title=f"{self.option.title()} a Reminder",
+            description=(
+                f"> **Name:** {self.dataset['name']}\n"
+                f"> **ID:** {self.dataset['id']}\n"
+                f"> **Channel:** {'<#{}>'.format(self.dataset.get('channel', None)) if self.dataset.get('channel', None) is not None else 'Not set'}\n"
+                f"> **Completion Ability:** {self.dataset.get('completion_ability') or 'Not set'}\n"
+                f"> **Mentioned Roles:** {', '.join(['<@&{}>'.format(r) for r in self.dataset.get('role', [])]) or 'Not set'}\n"
+                f"> **Interval:** {td_format(datetime.timedelta(seconds=self.dataset.get('interval', 0))) or 'Not set'}"
+                f"\n\n**Content:**\n{self.dataset['message']}"
+            ),
+            color=BLANK_COLOR,
+        )
+
+        if all(
+            [
+                self.dataset.get("channel") is not None,
+                self.dataset.get("interval") is not None,
+            ]
+        ):
+            for item in self.children:
+                if isinstance(item, discord.ui.Button):
+                    if item.label == "Finish":
+                        item.disabled = False
+        else:
+            for item in self.children:
+                if isinstance(item, discord.ui.Button):
+                    if item.label == "Finish":
+                        item.disabled = True
+
+        await message.edit(embed=embed, view=self)
+
+    @discord.ui.select(
+        cls=discord.ui.RoleSelect, placeholder="Mentioned Roles", row=0, max_values=25
+    )
+    async def mentioned_roles_select(
+        self, interaction: discord.Interaction, select: discord.ui.RoleSelect
+    ):
+        await interaction.response.defer()
+
+        self.dataset["role"] = [i.id for i in select.values]
+        await self.refresh_ui(interaction.message)
+
+    @discord.ui.select(
+        cls=discord.ui.ChannelSelect,
+        placeholder="Reminder Channel",
+        row=1,
+        max_values=1,
+        channel_types=[discord.ChannelType.text],
+    )
+    async def channel_select(
+        self, interaction: discord.Interaction, select: discord.ui.ChannelSelect
+    ):
+        await interaction.response.defer()
+
+        self.dataset["channel"] = [i.id for i in select.values][0]
+        await self.refresh_ui(interaction.message)
+
+    @discord.ui.button(label="Set Interval", style=discord.ButtonStyle.secondary, row=2)
+    async def set_interval(
+        self, interaction: discord.Interaction, button: discord.Button
+    ):
+        self.modal = CustomModal(
+            "Set Interval",
+            [
+                (
+                    "interval",
+                    discord.ui.TextInput(
+                        label="Interval",
+                        placeholder="The interval between each reminder. (hours/minutes/seconds/days)",
+                        default=str(self.dataset.get("interval", 0)),
+                        required=False,
+                    ),
+                )
+            ],
+            {"ephemeral": True},
+        )
+        await interaction.response.send_modal(self.modal)
+        await self.modal.wait()
+        try:
+            new_time = time_converter(self.modal.interval.value)
+        except ValueError:
+            return await self.modal.interaction.followup.send(
+                embed=discord.Embed(
+                    title="Invalid Time",
+                    description="You did not enter a valid time.",
+                    color=BLANK_COLOR,
+                )
+            )
+
+        self.dataset["interval"] = new_time
+        await self.refresh_ui(interaction.message)
+
+    @discord.ui.button(
+        label="Edit ER:LC Integration", style=discord.ButtonStyle.secondary, row=2
+    )
+    async def edit_integration(
+        self, interaction: discord.Interaction, button: discord.Button
+    ):
+        msg = await interaction.response.send_message(
+            embed=discord.Embed(
+                title="Edit ER:LC Integration",
+                description="Here you can edit your reminder's integrations with Emergency Response: Liberty County, such as sending an automatic message or hint on a reminder activation. **As of right now, you can only have one integration type per reminder.**",
+                color=BLANK_COLOR,
+            ),
+            ephemeral=True,
+            view=(view := ERLCIntegrationToolkit(interaction.user.id)),
+        )
+        view.message = await interaction.original_response()
+        timeout = await view.wait()
+        if timeout:
+            return
+        selected_integration = view.selected_option
+        content = view.content
+
+        self.dataset["integration"] = {
+            "type": selected_integration,
+            "content": view.content,
+        }
+        await self.refresh_ui(interaction.message)
+
+    @discord.ui.button(label="Edit Content", style=discord.ButtonStyle.secondary, row=2)
+    async def edit_content(
+        self, interaction: discord.Interaction, button: discord.Button
+    ):
+        self.modal = CustomModal(
+            "Edit Content",
+            [
+                (
+                    "content",
+                    discord.ui.TextInput(
+                        label="Content",
+                        placeholder="The content of the reminder",
+                        default=str(self.dataset.get("message", "")),
+                        style=discord.TextStyle.long,
+                        max_length=2000,
+                        required=False,
+                    ),
+                )
+            ],
+        )
+        await interaction.response.send_modal(self.modal)
+        await self.modal.wait()
+        content = self.modal.content.value
+
+        self.dataset["message"] = content
+        await self.refresh_ui(interaction.message)
+
+    @discord.ui.button(
+        label="Completion Ability: Disabled", style=discord.ButtonStyle.danger, row=2
+    )
+    async def edit_completion_ability(
+        self, interaction: discord.Interaction, button: discord.Button
+    ):
+        await interaction.response.defer(thinking=False)
+        if button.label == "Completion Ability: Disabled":
+            self.dataset["completion_ability"] = True
+            button.label = "Completion Ability: Enabled"
+            button.style = discord.ButtonStyle.green
+        else:
+            self.dataset["completion_ability"] = False
+            button.label = "Completion Ability: Disabled"
+            button.style = discord.ButtonStyle.danger
+
+        await self.refresh_ui(interaction.message)
+
+    @discord.ui.button(label="Cancel", style=discord.ButtonStyle.danger, row=3)
+    async def cancel(self, interaction: discord.Interaction, button: discord.Button):
+        await interaction.response.defer(ephemeral=True)
+        self.cancelled = True
+        await interaction.followup.send(
+            embed=discord.Embed(
+                title="Successfully cancelled",
+                description="This reminder has not been created.",
+                color=BLANK_COLOR,
+            )
+        )
+        await interaction.message.delete()
+        self.stop()
+
+    @discord.ui.button(
+        label="Finish", style=discord.ButtonStyle.green, disabled=True, row=3
+    )
+    async def finish(self, interaction: discord.Interaction, _: discord.Button):
+        await interaction.response.defer()
+        self.cancelled = False
+        self.stop()
+
+
+class CompleteReminder(discord.ui.View):
+    def __init__(self, bot):
+        self.bot = bot
+        super().__init__(timeout=1200.0)
+
+    # When the confirm button is pressed, set the inner value to `True` and
+    # stop the View from listening to more input.
+    # We also send the user an ephemeral message that we're confirming their choice.
+    @discord.ui.button(label="Mark as Complete", style=discord.ButtonStyle.gray)
+    async def yes(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.defer()
+        embed = interaction.message.embeds[0]
+        embed.set_footer(
+            text="Completed by {0.name}".format(interaction.user),
+            icon_url=interaction.user.display_avatar.url,
+        )
+        embed.timestamp = datetime.datetime.now()
+        embed.color = GREEN_COLOR
+        embed.title = (
+            f"{self.bot.emoji_controller.get_emoji('success')} Reminder Completed"
+        )
+
+        for item in self.children:
+            item.disabled = True
+            item.label = "Completed"
+            item.style = discord.ButtonStyle.green
+
+        await interaction.message.edit(
+            embed=embed,
+            view=self,
+        )
+
+        self.stop()
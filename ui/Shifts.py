@@ -0,0 +1,1016 @@
+import asyncio
+import copy
+import datetime
+import typing
+import discord
+import pytz
+import logging
+from discord import Interaction
+from discord.ext import commands
+from bson import ObjectId
+from datamodels.ShiftManagement import ShiftItem
+from utils.internal_events import ShiftEvent
+from utils.constants import (
+    blank_color,
+    BLANK_COLOR,
+    GREEN_COLOR,
+    ORANGE_COLOR,
+    RED_COLOR,
+)
+from utils.timestamp import td_format
+from utils.utils import (
+    time_converter,
+    get_elapsed_time,
+)
+import gspread
+from ui.Common import CustomModal
+
+
+REQUIREMENTS = ["gspread", "oauth2client"]
+
+
+class GoogleSpreadsheetModification(discord.ui.View):
+    def __init__(self, bot, config: dict, scopes: list, label: str, url: str):
+        super().__init__(timeout=600.0)
+        self.add_item(discord.ui.Button(label=label, url=url))
+        self.bot = bot
+        self.config = config
+        self.scopes = scopes
+        self.url = url
+
+    @discord.ui.button(label="Request Ownership", style=discord.ButtonStyle.secondary)
+    async def yes(self, interaction: discord.Interaction, button: discord.ui.Button):
+        modal = CustomModal(
+            "Request Ownership",
+            [
+                (
+                    "email",
+                    discord.ui.TextInput(
+                        placeholder="Email",
+                        min_length=1,
+                        max_length=100,
+                        label="Email",
+                        custom_id="email",
+                    ),
+                )
+            ],
+        )
+
+        await interaction.response.send_modal(modal)
+
+        timeout = await modal.wait()
+        if timeout:
+            return
+
+        email = modal.email.value
+
+        client = gspread.service_account_from_dict(self.config)
+        sheet = client.open_by_url(self.url)
+        client.insert_permission(sheet.id, value=email, perm_type="user", role="writer")
+        permission_id = (sheet.list_permissions())[0]["id"]
+        sheet.transfer_ownership(permission_id)
+
+        self.remove_item(button)
+
+        await interaction.edit_original_response(
+            embed=discord.Embed(
+                title=f"{self.bot.emoji_controller.get_emoji('success')} Ownership Transferred",
+                description="An ownership transfer request has been sent to your email.",
+                color=GREEN_COLOR,
+            ),
+            view=self,
+        )
+
+
+class RequestGoogleSpreadsheet(discord.ui.View):
+    def __init__(
+        self,
+        bot,
+        user_id,
+        config: dict,
+        scopes: list,
+        data: list,
+        template: str,
+        total_seconds: int,
+        type="lb",
+        additional_data=None,
+        label="Google Spreadsheet",
+    ):
+        self.bot = bot
+        if type:
+            self.type = type
+        else:
+            self.type = "lb"
+        if additional_data:
+            self.additional_data = additional_data
+        else:
+            self.additional_data = []
+
+        super().__init__(timeout=600.0)
+        self.user_id = user_id
+        self.config = config
+        self.scopes = scopes
+        self.data = data
+        self.template = template
+        self.total_seconds = total_seconds
+        if label:
+            for item in self.children:
+                item.label = label
+
+    # When the confirm button is pressed, set the inner value to `True` and
+    # stop the View from listening to more input.
+    # We also send the user an ephemeral message that we're confirming their choice.
+    @discord.ui.button(label="Google Spreadsheet", style=discord.ButtonStyle.secondary)
+    async def googlespreadsheet(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        await interaction.response.defer(ephemeral=True, thinking=True)
+
+        if interaction.user.id != self.user_id:
+            return await interaction.followup.send(
+                embed=discord.Embed(
+                    title="Not Permitted",
+                    description="You are not permitted to interact with these buttons.",
+                    color=blank_color,
+                )
+            )
+
+        await interaction.followup.send(
+            embed=discord.Embed(
+                title="Generating...",
+                description="We are currently generating your Google Spreadsheet.",
+                color=BLANK_COLOR,
+            )
+        )
+
+        client = gspread.service_account_from_dict(self.config)
+
+        sheet: gspread.Spreadsheet = client.copy(
+            self.template, interaction.guild.name, copy_permissions=True
+        )
+        new_sheet = sheet.get_worksheet(0)
+        try:
+            new_sheet.update_cell(4, 2, f'=IMAGE("{interaction.guild.icon.url}")')
+        except AttributeError:
+            pass
+
+        if self.type == "lb":
+            cell_list = new_sheet.range("D13:H999")
+        elif self.type == "ar":
+            cell_list = new_sheet.range("D13:I999")
+
+        try:
+            new_sheet.update_cell(
+                12, 1, td_format(datetime.timedelta(seconds=self.total_seconds))
+            )
+        except OverflowError:
+            pass
+
+        for c, n_v in zip(cell_list, self.data):
+            c.value = str(n_v)
+
+        new_sheet.update_cells(cell_list, "USER_ENTERED")
+        if self.type == "ar":
+            LoAs = sheet.get_worksheet(1)
+            LoAs.update_cell(4, 2, f'=IMAGE("{interaction.guild.icon.url}")')
+            cell_list = LoAs.range("D13:H999")
+
+            for cell, new_value in zip(cell_list, self.additional_data):
+                if isinstance(new_value, int):
+                    cell.value = f"=({new_value}/ 86400 + DATE(1970, 1, 1))"
+                else:
+                    cell.value = str(new_value)
+            LoAs.update_cells(cell_list, "USER_ENTERED")
+
+        client.insert_permission(
+            sheet.id, value=None, perm_type="anyone", role="writer"
+        )
+
+        view = GoogleSpreadsheetModification(
+            self.bot, self.config, self.scopes, "Open Google Spreadsheet", sheet.url
+        )
+
+        await interaction.edit_original_response(
+            embed=discord.Embed(
+                title=f"{self.bot.emoji_controller.get_emoji('success')} Successfully generated",
+                description="Your Google Spreadsheet has been successfully generated.",
+                color=GREEN_COLOR,
+            ),
+            view=view,
+        )
+
+        self.stop()
+
+
+class ShiftMenu(discord.ui.View):
+    def __init__(
+        self,
+        bot: commands.Bot,
+        starting_state: typing.Literal["on", "break", "off"],
+        user_id: int,
+        shift_type: str,
+        starting_document: dict | None = None,
+        starting_container: ShiftItem | None = None,
+        settings: dict | None = None,
+    ):
+        super().__init__(timeout=None)
+        self.user_id = user_id
+        self.state = starting_state
+        self.bot = bot
+        self.shift_type = shift_type
+        self.shift = starting_document
+        self.contained_document = starting_container
+        self.settings = settings
+        self.message = None
+
+        self.check_buttons(self.state)
+
+    def check_buttons(self, option: typing.Literal["on", "break", "off"]):
+        if option == "on":
+            buttons = ["Toggle Break", "Off-Duty"]
+        elif option == "break":
+            buttons = ["On-Duty", "Off-Duty"]
+        else:
+            buttons = ["On-Duty"]
+
+        for item in self.children:
+            if item.label not in buttons:
+                item.disabled = True
+            else:
+                item.disabled = False
+
+    async def interaction_check(self, interaction: Interaction, /) -> bool:
+
+        if interaction.user.id == self.user_id:
+            # Refresh current data to ensure state has not changed
+            current_shift = await self.bot.shift_management.get_current_shift(
+                interaction.user, interaction.guild.id
+            )
+            self.shift = current_shift
+            if self.shift:
+                self.contained_document = await self.bot.shift_management.fetch_shift(
+                    self.shift["_id"]
+                )
+            else:
+                self.contained_document = None
+            if self.contained_document:
+                if self.contained_document.breaks:
+                    if self.contained_document.breaks[-1].end_epoch == 0:
+                        self.state = "break"
+                    else:
+                        self.state = "on"
+                else:
+                    self.state = "on"
+            else:
+                self.state = "off"
+            return True
+        else:
+            await interaction.response.send_message(
+                embed=discord.Embed(
+                    title="Not Permitted",
+                    description="You are not permitted to interact with these buttons.",
+                    color=blank_color,
+                ),
+                ephemeral=True,
+            )
+            return False
+
+    async def cycle_ui(
+        self, option: typing.Literal["on", "break", "off"], message: discord.Message
+    ):
+        shift = self.shift
+        contained_document = self.contained_document
+        if not contained_document and not shift:
+            return
+        uis = {
+            "on": discord.Embed(
+                title=f"{self.bot.emoji_controller.get_emoji('ShiftStarted')} **Shift Started**",
+                color=GREEN_COLOR,
+            )
+            .set_author(
+                name=message.guild.name,
+                icon_url=message.guild.icon.url if message.guild.icon else "",
+            )
+            .add_field(
+                name="Current Shift",
+                value=(
+                    f"> **Started:** <t:{int(contained_document.start_epoch)}:R>\n"
+                    f"> **Breaks:** {len(self.shift['Breaks'])}\n"
+                    f"> **Elapsed Time:** {td_format(datetime.timedelta(seconds=get_elapsed_time(shift)))}"
+                ),
+                inline=False,
+            ),
+            "off": discord.Embed(
+                title=f"{self.bot.emoji_controller.get_emoji('ShiftEnded')} **Off-Duty**",
+                color=RED_COLOR,
+            )
+            .set_author(
+                name=message.guild.name,
+                icon_url=message.guild.icon.url if message.guild.icon else "",
+            )
+            .add_field(
+                name="Shift Overview",
+                value=(
+                    f"> **Started:** <t:{int(contained_document.start_epoch)}:R>\n"
+                    f"> **Breaks:** {len(self.shift['Breaks'])}\n"
+                    f"> **Ended:** <t:{int(contained_document.end_epoch or datetime.datetime.now(tz=pytz.UTC).timestamp())}:R>"
+                ),
+                inline=False,
+            ),
+        }
+        if option == "break":
+            current_break = None
+            for break_item in contained_document.breaks:
+                logging.info(
+                    f"Checking break: {break_item}"
+                )  # Debugging log to print each break
+                if (
+                    break_item.end_epoch == 0
+                ):  # Assuming end_epoch is 0 if the break hasn't ended yet
+                    current_break = break_item
+                    break
+
+            if current_break:
+                break_start_time = (
+                    f"> **Break Started:** <t:{int(current_break.start_epoch)}:R>\n"
+                )
+            else:
+                break_start_time = "> **Break Started:** No ongoing break\n"
+
+            selected_ui = (
+                discord.Embed(
+                    title=f"{self.bot.emoji_controller.get_emoji('ShiftBreak')} **On-Break**",
+                    color=ORANGE_COLOR,
+                )
+                .set_author(
+                    name=message.guild.name,
+                    icon_url=message.guild.icon.url if message.guild.icon else "",
+                )
+                .add_field(
+                    name="Current Shift",
+                    value=(
+                        f"> **Shift Started:** <t:{int(contained_document.start_epoch)}:R>\n"
+                        f"{break_start_time}"
+                        f"> **Breaks:** {len(self.shift['Breaks'])}\n"
+                        f"> **Elapsed Time:** {td_format(datetime.timedelta(seconds=get_elapsed_time(shift)))}"
+                    ),
+                    inline=False,
+                )
+            )
+        else:
+            selected_ui = uis[option]
+
+        if not selected_ui:
+            return
+        self.check_buttons(option)
+        await message.edit(embed=selected_ui, view=self)
+
+    async def on_timeout(self) -> None:
+        if not self.message:
+            for item in self.children:
+                item.disabled = True
+
+            return await self.message.edit(view=self)
+
+    @discord.ui.button(label="On-Duty", style=discord.ButtonStyle.green)
+    async def on_duty_button(self, interaction: discord.Interaction, _: discord.Button):
+        await interaction.response.defer(thinking=False)
+        if self.state == "break":
+            self.shift["Breaks"][-1]["EndEpoch"] = datetime.datetime.now(
+                tz=pytz.UTC
+            ).timestamp()
+            self.shift["_id"] = self.contained_document.id
+            await self.bot.shift_management.shifts.update_by_id(self.shift)
+            self.shift["_id"] = self.contained_document.id  # update_by_id pops the _id
+            await asyncio.sleep(1)
+            self.contained_document = await self.bot.shift_management.fetch_shift(
+                self.contained_document.id
+            )
+            await self.cycle_ui("on", interaction.message)
+            self.bot.dispatch(
+                "break_end",
+                ShiftEvent(document=copy.deepcopy(self.shift), settings=self.settings),
+            )
+            return
+
+        settings = await self.bot.settings.find_by_id(interaction.guild.id)
+        self.settings = settings
+        access = True
+        for item in settings.get("shift_management", {}).get("shift_types", []):
+            if isinstance(item, dict):
+                if item["name"] == self.shift_type:
+                    access_roles = item.get("access_roles") or []
+                    if len(access_roles) > 0:
+                        access = False
+                        for role in access_roles:
+                            if role in [i.id for i in interaction.user.roles]:
+                                access = True
+                                break
+        if not access:
+            return await interaction.response.send_message(
+                embed=discord.Embed(
+                    title="No Access",
+                    description="You are not permitted to go on-duty as this Shift Type.",
+                    color=blank_color,
+                ),
+                ephemeral=True,
+            )
+
+        if self.state == "on" or self.state == "break":
+            return await self.cycle_ui(self.state, interaction.message)
+
+        self.shift = await self.bot.shift_management.create_shift(
+            interaction.user, self.shift_type, [], interaction.guild.id
+        )
+        self.contained_document: ShiftItem = (
+            self.bot.shift_management.shift_item_from_document(self.shift)
+        )
+        await self.cycle_ui("on", interaction.message)
+        self.bot.dispatch(
+            "shift_start",
+            ShiftEvent(document=copy.deepcopy(self.shift), settings=self.settings),
+        )
+        return
+
+    @discord.ui.button(label="Toggle Break", style=discord.ButtonStyle.secondary)
+    async def toggle_break_button(
+        self, interaction: discord.Interaction, _: discord.Button
+    ):
+        await interaction.response.defer(thinking=False)
+        self.shift["Breaks"].append(
+            {
+                "StartEpoch": datetime.datetime.now(tz=pytz.UTC).timestamp(),
+                "EndEpoch": 0,
+            }
+        )
+        self.shift["_id"] = self.contained_document.id
+        await self.bot.shift_management.shifts.update_by_id(self.shift)
+        self.shift["_id"] = self.contained_document.id  # update_by_id pops the _id
+        self.contained_document = await self.bot.shift_management.fetch_shift(
+            self.contained_document.id
+        )
+        await self.cycle_ui("break", interaction.message)
+        self.bot.dispatch(
+            "break_start",
+            ShiftEvent(document=copy.deepcopy(self.shift), settings=self.settings),
+        )
+        return
+
+    @discord.ui.button(label="Off-Duty", style=discord.ButtonStyle.red)
+    async def off_duty_button(
+        self, interaction: discord.Interaction, _: discord.Button
+    ):
+        await interaction.response.defer(thinking=False)
+        self.shift = await self.bot.shift_management.end_shift(
+            self.contained_document.id, self.contained_document.guild
+        )
+        self.contained_document = self.bot.shift_management.shift_item_from_document(
+            self.shift
+        )
+        await self.cycle_ui("off", interaction.message)
+        try:
+            self.bot.dispatch(
+                "shift_end",
+                ShiftEvent(document=copy.deepcopy(self.shift), settings=self.settings),
+            )
+        except Exception as e:
+            logging.info(f"Error dispatching shift_end: {e}")
+        return
+
+
+class AdministratedShiftMenu(discord.ui.View):
+    def __init__(
+        self,
+        bot: commands.Bot,
+        starting_state: typing.Literal["on", "break", "off"],
+        user_id: int,
+        target_id: int,
+        shift_type: str,
+        starting_document: dict | None = None,
+        starting_container: ShiftItem | None = None,
+        settings: dict | None = None,
+    ):
+        super().__init__(timeout=None)
+        self.user_id = user_id
+        self.target_id = target_id
+        self.state = starting_state
+        self.bot = bot
+        self.shift_type = shift_type
+        self.shift = starting_document
+        self.contained_document = starting_container
+        self.settings = settings
+        self.message = None
+
+        self.check_buttons(self.state)
+
+    def check_buttons(self, option: typing.Literal["on", "break", "off"]):
+        if option == "on":
+            buttons = ["Toggle Break", "Off-Duty", "Other Options"]
+        elif option == "break":
+            buttons = ["On-Duty", "Off-Duty", "Other Options"]
+        else:
+            buttons = ["On-Duty", "Other Options"]
+
+        for item in self.children:
+            if isinstance(item, discord.ui.Button):
+                if item.label not in buttons:
+                    item.disabled = True
+                else:
+                    item.disabled = False
+
+    async def interaction_check(self, interaction: Interaction, /) -> bool:
+        if interaction.user.id == self.user_id:
+            return True
+        else:
+            await interaction.response.send_message(
+                embed=discord.Embed(
+                    title="Not Permitted",
+                    description="You are not permitted to interact with these buttons.",
+                    color=blank_color,
+                ),
+                ephemeral=True,
+            )
+            return False
+
+    async def cycle_ui(
+        self,
+        option: typing.Literal["on", "break", "off", "void"],
+        message: discord.Message,
+    ):
+        shift = self.shift
+        contained_document = self.contained_document
+        previous_shifts = [
+            i
+            async for i in self.bot.shift_management.shifts.db.find(
+                {
+                    "UserID": self.target_id,
+                    "Guild": message.guild.id,
+                    "EndEpoch": {"$ne": 0},
+                }
+            )
+        ]
+        self.state = option
+        if option == "void":
+            selected_ui = (
+                discord.Embed(
+                    title=f"{self.bot.emoji_controller.get_emoji('ShiftEnded')} **Off-Duty**",
+                    color=RED_COLOR,
+                )
+                .set_author(
+                    name=message.guild.name,
+                    icon_url=message.guild.icon.url if message.guild.icon else "",
+                )
+                .add_field(
+                    name="Current Statistics",
+                    value=(
+                        f"> **Total Shift Duration:** {td_format(datetime.timedelta(seconds=sum([get_elapsed_time(item) for item in previous_shifts])))}\n"
+                        f"> **Total Shifts:** {len(previous_shifts)}\n"
+                        f"> **Average Shift Duration:** {td_format(datetime.timedelta(seconds=(sum([get_elapsed_time(item) for item in previous_shifts]).__truediv__(len(previous_shifts) or 1))))}\n"
+                    ),
+                    inline=False,
+                )
+            )
+        elif option not in ["void", "break"]:
+            if not contained_document:
+                return
+            uis = {
+                "on": discord.Embed(
+                    title=f"{self.bot.emoji_controller.get_emoji('ShiftStarted')} **Shift Started**",
+                    color=GREEN_COLOR,
+                )
+                .set_author(
+                    name=message.guild.name,
+                    icon_url=message.guild.icon.url if message.guild.icon else "",
+                )
+                .add_field(
+                    name="Current Statistics",
+                    value=(
+                        f"> **Total Shift Duration:** {td_format(datetime.timedelta(seconds=sum([get_elapsed_time(item) for item in previous_shifts])))}\n"
+                        f"> **Total Shifts:** {len(previous_shifts)}\n"
+                        f"> **Average Shift Duration:** {td_format(datetime.timedelta(seconds=(sum([get_elapsed_time(item) for item in previous_shifts]).__truediv__(len(previous_shifts) or 1))))}\n"
+                    ),
+                    inline=False,
+                )
+                .add_field(
+                    name="Current Shift",
+                    value=(
+                        f"> **Started:** <t:{int(contained_document.start_epoch)}:R>\n"
+                        f"> **Breaks:** {len(contained_document.breaks)}\n"
+                        f"> **Elapsed Time:** {td_format(datetime.timedelta(seconds=get_elapsed_time(shift)))}"
+                    ),
+                    inline=False,
+                ),
+                "off": discord.Embed(
+                    title=f"{self.bot.emoji_controller.get_emoji('ShiftEnded')} **Off-Duty**",
+                    color=RED_COLOR,
+                )
+                .set_author(
+                    name=message.guild.name,
+                    icon_url=message.guild.icon.url if message.guild.icon else "",
+                )
+                .add_field(
+                    name="Shift Overview",
+                    value=(
+                        f"> **Started:** <t:{int(contained_document.start_epoch)}:R>\n"
+                        f"> **Breaks:** {len(contained_document.breaks)}\n"
+                        f"> **Ended:** <t:{int(contained_document.end_epoch or datetime.datetime.now(tz=pytz.UTC).timestamp())}:R>"
+                    ),
+                    inline=False,
+                ),
+            }
+        if option == "break":
+            selected_ui = (
+                discord.Embed(
+                    title=f"{self.bot.emoji_controller.get_emoji('ShiftBreak')} **On-Break**",
+                    color=ORANGE_COLOR,
+                )
+                .set_author(
+                    name=message.guild.name,
+                    icon_url=message.guild.icon.url if message.guild.icon else "",
+                )
+                .add_field(
+                    name="Current Statistics",
+                    value=(
+                        f"> **Total Shift Duration:** {td_format(datetime.timedelta(seconds=sum([get_elapsed_time(item) for item in previous_shifts])))}\n"
+                        f"> **Total Shifts:** {len(previous_shifts)}\n"
+                        f"> **Average Shift Duration:** {td_format(datetime.timedelta(seconds=(sum([get_elapsed_time(item) for item in previous_shifts]).__truediv__(len(previous_shifts) or 1))))}\n"
+                    ),
+                    inline=False,
+                )
+                .add_field(
+                    name="Current Shift",
+                    value=(
+                        f"> **Shift Started:** <t:{int(contained_document.start_epoch)}:R>\n"
+                        f"> **Break Started:** <t:{int(contained_document.breaks[0].start_epoch)}:R>\n"
+                        f"> **Breaks:** {len(contained_document.breaks)}\n"
+                        f"> **Elapsed Time:** {td_format(datetime.timedelta(seconds=get_elapsed_time(shift)))}"
+                    ),
+                    inline=False,
+                )
+            )
+        elif option not in ["void", "break"]:
+            selected_ui = uis[option]
+
+        # if not selected_ui:
+        #     return
+        self.check_buttons(option)
+        await message.edit(embed=selected_ui, view=self)
+
+    async def on_timeout(self) -> None:
+        if not self.message:
+            for item in self.children:
+                item.disabled = True
+
+            return await self.message.edit(view=self)
+
+    async def _manipulate_shift_time(
+        self, message, op: typing.Literal["add", "subtract"], amount: int
+    ):
+        self.message = message
+        member = await self.message.guild.fetch_member(self.target_id)
+        guild = self.message.guild
+
+        operations = {
+            "add": self.bot.shift_management.add_time_to_shift,
+            "subtract": self.bot.shift_management.remove_time_from_shift,
+        }
+
+        chosen_operation = operations[op]
+        if self.contained_document is not None:
+            check_for_update = await self.bot.shift_management.shifts.find_by_id(
+                ObjectId(self.shift["_id"])
+            )
+            if check_for_update != self.shift:
+                self.shift = check_for_update
+                self.contained_document = await self.bot.shift_management.fetch_shift(
+                    self.shift["_id"]
+                )
+
+        if self.contained_document is not None:
+            if self.contained_document.end_epoch == 0:
+                await chosen_operation(self.contained_document.id, amount)
+                new_contained_document = await self.bot.shift_management.fetch_shift(
+                    self.contained_document.id
+                )
+                self.contained_document = new_contained_document
+                self.shift = await self.bot.shift_management.shifts.find_by_id(
+                    self.contained_document.id
+                )
+
+                self.bot.dispatch(
+                    "shift_edit",
+                    self.contained_document.id,
+                    "added_time" if op == "add" else "removed_time",
+                    (await self.message.guild.fetch_member(self.user_id)),
+                )
+                return
+
+        oid = await self.bot.shift_management.add_shift_by_user(
+            member, self.shift_type, [], guild.id
+        )
+        await chosen_operation(oid, amount)
+        await self.bot.shift_management.end_shift(oid, guild.id)
+        self.contained_document = None
+        self.shift = None
+
+    @discord.ui.button(label="On-Duty", style=discord.ButtonStyle.green)
+    async def on_duty_button(self, interaction: discord.Interaction, _: discord.Button):
+        await interaction.response.defer(thinking=False)
+        if self.state == "break":
+            self.shift["Breaks"][-1]["EndEpoch"] = datetime.datetime.now(
+                tz=pytz.UTC
+            ).timestamp()
+            self.shift["_id"] = self.contained_document.id
+            await self.bot.shift_management.shifts.update_by_id(self.shift)
+            self.shift["_id"] = self.contained_document.id  # update_by_id pops the _id
+            self.contained_document = await self.bot.shift_management.fetch_shift(
+                self.contained_document.id
+            )
+            await self.cycle_ui("on", interaction.message)
+            self.bot.dispatch(
+                "break_end",
+                ShiftEvent(document=copy.deepcopy(self.shift), settings=self.settings),
+            )
+            return
+
+        self.shift = await self.bot.shift_management.create_shift(
+            await interaction.guild.fetch_member(self.target_id),
+            self.shift_type,
+            [],
+            interaction.guild.id,
+        )
+        self.contained_document: ShiftItem = (
+            self.bot.shift_management.shift_item_from_document(self.shift)
+        )
+        await self.cycle_ui("on", interaction.message)
+        self.bot.dispatch(
+            "shift_start",
+            ShiftEvent(document=copy.deepcopy(self.shift), settings=self.settings),
+        )
+        return
+
+    @discord.ui.button(label="Toggle Break", style=discord.ButtonStyle.secondary)
+    async def toggle_break_button(
+        self, interaction: discord.Interaction, _: discord.Button
+    ):
+        await interaction.response.defer(thinking=False)
+        self.shift["Breaks"].append(
+            {
+                "StartEpoch": datetime.datetime.now(tz=pytz.UTC).timestamp(),
+                "EndEpoch": 0,
+            }
+        )
+        self.shift["_id"] = self.contained_document.id
+        await self.bot.shift_management.shifts.update_by_id(self.shift)
+        self.shift["_id"] = self.contained_document.id  # update_by_id pops the _id
+        self.contained_document = await self.bot.shift_management.fetch_shift(
+            self.contained_document.id
+        )
+        await self.cycle_ui("break", interaction.message)
+        self.bot.dispatch(
+            "break_start",
+            ShiftEvent(document=copy.deepcopy(self.shift), settings=self.settings),
+        )
+        return
+
+    @discord.ui.button(label="Off-Duty", style=discord.ButtonStyle.red)
+    async def off_duty_button(
+        self, interaction: discord.Interaction, _: discord.Button
+    ):
+        await interaction.response.defer(thinking=False)
+        self.shift = await self.bot.shift_management.end_shift(
+            self.contained_document.id, self.contained_document.guild
+        )
+        self.contained_document = self.bot.shift_management.shift_item_from_document(
+            self.shift
+        )
+        await self.cycle_ui("off", interaction.message)
+        self.bot.dispatch(
+            "shift_end",
+            ShiftEvent(document=copy.deepcopy(self.shift), settings=self.settings),
+        )
+        return
+
+    @discord.ui.select(
+        placeholder="Other Options",
+        options=[
+            discord.SelectOption(
+                label="Add Time",
+                value="add",
+                description="Add time to an ongoing shift.",
+            ),
+            discord.SelectOption(
+                label="Subtract Time",
+                value="subtract",
+                description="Subtract time to an ongoing shift.",
+            ),
+            discord.SelectOption(
+                label="Void shift",
+                value="void",
+                description="Void an ongoing shift.",
+            ),
+            discord.SelectOption(
+                label="Clear Member Shifts",
+                value="clear",
+                description="Remove all shifts associated with this member.",
+            ),
+        ],
+        row=1,
+    )
+    async def other_options(
+        self, interaction: discord.Interaction, select: discord.ui.Select
+    ):
+        value = select.values[0]
+        if value not in ["add", "subtract"]:
+            await interaction.response.defer(thinking=False)
+        if value == "add":
+            self.modal = CustomModal(
+                title="Add Time",
+                options=[
+                    (
+                        "time",
+                        discord.ui.TextInput(
+                            label="Time",
+                            placeholder="How much time to add to this shift?",
+                        ),
+                    )
+                ],
+                epher_args={"ephemeral": True, "thinking": False},
+            )
+            await interaction.response.send_modal(self.modal)
+            await self.modal.wait()
+            unfiltered = self.modal.time.value
+            try:
+                converted = time_converter(unfiltered)
+            except ValueError:
+                return await self.modal.interaction.followup.send(
+                    embed=discord.Embed(
+                        title="Invalid Time",
+                        description="I could not convert this time. Please try again.",
+                        color=BLANK_COLOR,
+                    )
+                )
+            except OverflowError:
+                return await self.modal.interaction.followup.send(
+                    embed=discord.Embed(
+                        title="Invalid Time",
+                        description="You can't add more than 6 months in shift time.",
+                        color=BLANK_COLOR,
+                    )
+                )
+
+            await self._manipulate_shift_time(interaction.message, "add", converted)
+            settings = await self.bot.settings.find_by_id(interaction.guild.id)
+            previous_shifts = [
+                i
+                async for i in self.bot.shift_management.shifts.db.find(
+                    {
+                        "UserID": self.target_id,
+                        "Guild": interaction.guild.id,
+                        "EndEpoch": {"$ne": 0},
+                    }
+                )
+            ]
+            if settings.get("shift_management", {}).get("channel"):
+                log_channel = interaction.guild.get_channel(
+                    settings["shift_management"]["channel"]
+                )
+                if log_channel:
+                    embed = discord.Embed(
+                        title="Shift Time Added",
+                        description=(
+                            f"> **User:** <@{self.target_id}> \n"
+                            f"> **Shift Type:** {self.shift_type}\n"
+                            f"> **Time Added:** {td_format(datetime.timedelta(seconds=converted))}"
+                        ),
+                        color=0x2F3136,
+                    )
+                    embed.add_field(
+                        name="Added By:", value=f"> {interaction.user.mention}"
+                    )
+                    embed.add_field(
+                        name="New Total Shift Time:",
+                        value=f"> **Total Shift Duration:** {td_format(datetime.timedelta(seconds=sum([get_elapsed_time(item) for item in previous_shifts])))}\n",
+                        inline=False,
+                    )
+                    embed.set_thumbnail(
+                        url=interaction.guild.get_member(
+                            self.target_id
+                        ).display_avatar.url
+                    )
+                    await log_channel.send(embed=embed)
+            await asyncio.sleep(0.02)
+            # # print(t(t(t(t(self.state)
+            if self.state not in ["void", "off"]:
+                await self.cycle_ui(self.state, interaction.message)
+            else:
+                await self.cycle_ui("void", interaction.message)
+        elif value == "subtract":
+            self.modal = CustomModal(
+                title="Subtract Time",
+                options=[
+                    (
+                        "time",
+                        discord.ui.TextInput(
+                            label="Time",
+                            placeholder="How much time to subtract from this shift?",
+                        ),
+                    )
+                ],
+                epher_args={"ephemeral": True, "thinking": False},
+            )
+            await interaction.response.send_modal(self.modal)
+            await self.modal.wait()
+            unfiltered = self.modal.time.value
+            try:
+                converted = time_converter(unfiltered)
+            except ValueError:
+                return await self.modal.interaction.followup.send(
+                    embed=discord.Embed(
+                        title="Invalid Time",
+                        description="I could not convert this time. Please try again.",
+                        color=BLANK_COLOR,
+                    )
+                )
+
+            await self._manipulate_shift_time(
+                interaction.message, "subtract", converted
+            )
+            settings = await self.bot.settings.find_by_id(interaction.guild.id)
+            previous_shifts = [
+                i
+                async for i in self.bot.shift_management.shifts.db.find(
+                    {
+                        "UserID": self.target_id,
+                        "Guild": interaction.guild.id,
+                        "EndEpoch": {"$ne": 0},
+                    }
+                )
+            ]
+            if settings.get("shift_management", {}).get("channel"):
+                log_channel = interaction.guild.get_channel(
+                    settings["shift_management"]["channel"]
+                )
+                if log_channel:
+                    embed = discord.Embed(
+                        title="Shift Time Subtracted",
+                        description=(
+                            f"> **User:** <@{self.target_id}> \n"
+                            f"> **Shift Type:** {self.shift_type}\n"
+                            f"> **Time Subtracted:** {td_format(datetime.timedelta(seconds=converted))}"
+                        ),
+                        color=0x2F3136,
+                    )
+                    embed.add_field(
+                        name="Subtracted By:", value=f"> {interaction.user.mention}"
+                    )
+                    embed.add_field(
+                        name="New Total Shift Time:",
+                        value=f"> **Total Shift Duration:** {td_format(datetime.timedelta(seconds=sum([get_elapsed_time(item) for item in previous_shifts])))}\n",
+                        inline=False,
+                    )
+                    embed.set_thumbnail(
+                        url=interaction.guild.get_member(
+                            self.target_id
+                        ).display_avatar.url
+                    )
+                    await log_channel.send(embed=embed)
+            await asyncio.sleep(0.02)
+            # # print(t(t(t(t(self.state)
+            if self.state not in ["void", "off"]:
+                await self.cycle_ui(self.state, interaction.message)
+            else:
+                await self.cycle_ui("void", interaction.message)
+
+        elif value == "void":
+            if not self.contained_document:
+                try:
+                    self.contained_document = (
+                        await self.bot.shift_management.fetch_shift(self.shift["_id"])
+                    )
+                except TypeError:
+                    return
+
+            self.bot.dispatch(
+                "shift_void", interaction.user, self.contained_document.id
+            )
+            await asyncio.sleep(2)
+            await self.bot.shift_management.shifts.delete_by_id(
+                self.contained_document.id
+            )
+            self.contained_document = None
+            self.shift = None
+            await self.cycle_ui("void", interaction.message)
+
+        elif value == "clear":
+            all_target_shifts = [
+                shift
+                async for shift in self.bot.shift_management.shifts.db.find(
+                    {"UserID": self.target_id, "Guild": interaction.guild.id}
+                )
+            ]
+            for item in all_target_shifts:
+                await self.bot.shift_management.shifts.delete_by_id(item["_id"])
+            self.shift = None
+            self.contained_document = None
+            await self.cycle_ui("void", interaction.message)
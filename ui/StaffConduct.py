@@ -0,0 +1,200 @@
+import discord
+from utils.utils import generalised_interaction_check_failure
+
+
+# noinspection PyUnresolvedReferences
+class MultiDropdown(discord.ui.Select):
+    def __init__(self, user_id, options: list):
+        self.user_id = user_id
+        optionList = []
+
+        for option in options:
+            if isinstance(option, str):
+                optionList.append(
+                    discord.SelectOption(
+                        label=option.replace("_", " ").title(), value=option
+                    )
+                )
+            elif isinstance(option, discord.SelectOption):
+                optionList.append(option)
+
+        # # # # print(t(t(t(t(optionList)
+
+        # The placeholder is what will be shown when no option is chosen
+        # The min and max values indicate we can only pick one of the three options
+        # The options parameter defines the dropdown options. We defined this above
+        super().__init__(
+            placeholder="Select an option",
+            max_values=len(optionList),
+            options=optionList,
+        )
+
+    async def callback(self, interaction: discord.Interaction):
+        if interaction.user.id == self.user_id:
+            await interaction.response.defer()
+            if len(self.values) == 1:
+                self.view.value = self.values[0]
+            else:
+                self.view.value = self.values
+            self.view.stop()
+        else:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            await generalised_interaction_check_failure(interaction.followup)
+            return
+
+
+class AcknowledgeMenu(discord.ui.View):
+    def __init__(self, user_id, note: str):
+        super().__init__(timeout=600.0)
+        self.value = None
+        self.user_id = user_id
+        if note:
+            for child in self.children:
+                if child.label == "NOTE":
+                    child.label = note
+
+    # When the confirm button is pressed, set the inner value to `True` and
+    # stop the View from listening to more input.
+    # We also send the user an ephemeral message that we're confirming their choice.
+    @discord.ui.button(
+        label="I acknowledge and understand", style=discord.ButtonStyle.green
+    )
+    async def yes(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if interaction.user.id != self.user_id:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            await generalised_interaction_check_failure(interaction.followup)
+            return
+        await interaction.response.defer()
+        for item in self.children:
+            item.disabled = True
+        self.value = True
+        await interaction.edit_original_response(view=self)
+        self.stop()
+
+    # This one is similar to the confirmation button except sets the inner value to `False`
+    @discord.ui.button(
+        label="NOTE", style=discord.ButtonStyle.secondary, row=1, disabled=True
+    )
+    async def note(self, interaction: discord.Interaction, button: discord.ui.Button):
+        pass
+
+
+class YesNoExpandedMenu(discord.ui.View):
+    def __init__(self, user_id):
+        super().__init__(timeout=600.0)
+        self.value = None
+        self.user_id = user_id
+
+    # When the confirm button is pressed, set the inner value to `True` and
+    # stop the View from listening to more input.
+    # We also send the user an ephemeral message that we're confirming their choice.
+    @discord.ui.button(label="Yes, continue", style=discord.ButtonStyle.primary)
+    async def yes(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if interaction.user.id != self.user_id:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            await generalised_interaction_check_failure(interaction.followup)
+            return
+        await interaction.response.defer()
+        for item in self.children:
+            item.disabled = True
+        self.value = True
+        await interaction.edit_original_response(view=self)
+        self.stop()
+
+    # This one is similar to the confirmation button except sets the inner value to `False`
+    @discord.ui.button(
+        label="I'll do this another time", style=discord.ButtonStyle.secondary
+    )
+    async def no(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if interaction.user.id != self.user_id:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            await generalised_interaction_check_failure(interaction.followup)
+            return
+        await interaction.response.defer()
+        for item in self.children:
+            item.disabled = True
+        self.value = False
+        await interaction.edit_original_response(view=self)
+        self.stop()
+
+
+class MultiSelectMenu(discord.ui.View):
+    def __init__(self, user_id, options: list):
+        super().__init__(timeout=600.0)
+        self.value = None
+        self.user_id = user_id
+
+        self.add_item(MultiDropdown(self.user_id, options))
+
+
+class ExpandedRoleSelect(discord.ui.View):
+    def __init__(self, user_id, **kwargs):
+        super().__init__(timeout=600.0)
+        self.value = None
+        self.user_id = user_id
+        self.limit = 25
+
+        for key, value in kwargs.items():
+            if key == "limit":
+                self.limit = value
+
+        if self.limit > 1:
+            self.placeholder = "Select roles"
+        else:
+            self.placeholder = "Select a role"
+
+        for child in self.children:
+            child.placeholder = self.placeholder
+            child.max_values = self.limit
+            child.min_values = 1
+
+    @discord.ui.select(cls=discord.ui.RoleSelect, row=0)
+    async def role_select(
+        self, interaction: discord.Interaction, select: discord.ui.Select
+    ):
+        await interaction.response.defer()
+
+    @discord.ui.button(label="Finish", style=discord.ButtonStyle.success, row=3)
+    async def done(self, interaction: discord.Interaction, button: discord.ui.Button):
+        selects = []
+        for child in self.children:
+            if isinstance(child, discord.ui.RoleSelect):
+                selects.append(child)
+
+        if interaction.user.id == self.user_id:
+            await interaction.response.defer()
+            value_list = [s.values for s in selects]
+            new_list = []
+            for list_of_values in value_list:
+                for value in list_of_values:
+                    if value not in new_list:
+                        new_list.append(value)
+            self.value = new_list
+            self.stop()
+        else:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            return await generalised_interaction_check_failure(interaction.followup)
+
+    @discord.ui.button(
+        label="I have more than 25 roles", style=discord.ButtonStyle.secondary, row=4
+    )
+    async def expand(self, interaction: discord.Interaction, button: discord.ui.Button):
+        for i in self.children:
+            # # print(t(t(t(t(i)
+            if isinstance(i, discord.ui.RoleSelect):
+                for value in range(1, 3):
+                    # # print(t(t(t(t(value)
+                    instance = discord.ui.RoleSelect(
+                        row=value, placeholder="Select roles", max_values=25
+                    )
+                    # # print(t(t(t(t('?')
+                    # async def callback(interaction: discord.Interaction, select: discord.ui.Select):
+                    #     await interaction.response.defer()
+
+                    instance.callback = i.callback
+                    # # print(t(t(t(t('*')
+                    self.add_item(instance)
+                    # # print(t(t(t(t('!')
+        button.disabled = True
+        await interaction.message.edit(view=self)
+        await interaction.response.defer()
@@ -0,0 +1,97 @@
+import discord
+from utils.constants import blank_color
+from utils.utils import generalised_interaction_check_failure
+
+
+class MultiPaginatorDropdown(discord.ui.Select):
+    def __init__(self, user_id, options: list, pages: dict, limit=1):
+        self.user_id = user_id
+        self.pages = pages
+        optionList = []
+
+        for option in options:
+            if isinstance(option, str):
+                optionList.append(
+                    discord.SelectOption(
+                        label=option.replace("_", " ").title(), value=option
+                    )
+                )
+            elif isinstance(option, discord.SelectOption):
+                optionList.append(option)
+
+        # The placeholder is what will be shown when no option is chosen
+        # The min and max values indicate we can only pick one of the three options
+        # The options parameter defines the dropdown options. We defined this above
+        super().__init__(
+            placeholder="Select an option",
+            min_values=1,
+            max_values=limit,
+            options=optionList,
+        )
+
+    async def callback(self, interaction: discord.Interaction):
+        if interaction.user.id == self.user_id:
+            await interaction.response.defer()
+            await interaction.message.edit(
+                content=f"<:ERMCheck:1111089850720976906>  **{interaction.user.name},** you're currently viewing the **{self.values[0].replace('_', ' ').title()}** commands!",
+                embed=self.pages.get(self.values[0]),
+            )
+        else:
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            await generalised_interaction_check_failure(interaction.followup)
+            return
+
+
+class LinkView(discord.ui.View):
+    def __init__(self, label: str, url: str):
+        super().__init__(timeout=600.0)
+        self.add_item(discord.ui.Button(label=label, url=url))
+
+
+class MultiPaginatorMenu(discord.ui.View):
+    def __init__(self, user_id, options: list, pages: dict):
+        super().__init__(timeout=600.0)
+        self.value = None
+        self.user_id = user_id
+
+        self.add_item(MultiPaginatorDropdown(self.user_id, options, pages))
+
+
+class APIKeyConfirmation(discord.ui.View):
+    def __init__(self, user_id: int):
+        super().__init__(timeout=600.0)
+        self.user_id = user_id
+        self.value = None
+
+    async def interaction_check(self, interaction: discord.Interaction, /) -> bool:
+        if interaction.user.id == self.user_id:
+            return True
+        await interaction.response.send_message(
+            embed=discord.Embed(
+                title="Not Permitted",
+                description="You are not permitted to interact with these buttons.",
+                color=blank_color,
+            ),
+            ephemeral=True,
+        )
+        return False
+
+    @discord.ui.button(label="Yes", style=discord.ButtonStyle.success)
+    async def confirm(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        await interaction.response.defer(thinking=False)
+        self.value = True
+        for item in self.children:
+            item.disabled = True
+        await interaction.message.edit(view=self)
+        self.stop()
+
+    @discord.ui.button(label="No", style=discord.ButtonStyle.danger)
+    async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.defer(thinking=False)
+        self.value = False
+        for item in self.children:
+            item.disabled = True
+        await interaction.message.edit(view=self)
+        self.stop()
@@ -1,36 +1,36 @@
 import asyncio
 import copy
 import datetime
+import json
 import typing
-from collections import defaultdict
+from urllib.parse import parse_qs
 
 import aiohttp
 import pytz
 import uvicorn
 from bson import ObjectId
 from fastapi import FastAPI, APIRouter, Header, HTTPException, Request
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from discord.ext import commands
 import discord
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
 
 from erm import (
     Bot,
     management_predicate,
     is_staff,
     staff_predicate,
-    staff_check,
-    management_check,
-    admin_check,
 )
 from typing import Annotated
 from decouple import config
 import copy
-from menus import LOAMenu
+from utils.view_registry import get_view
 from utils.constants import BLANK_COLOR, GREEN_COLOR
 from utils.utils import get_elapsed_time, secure_logging
 from pydantic import BaseModel
 
+from utils import metrics
+from utils.member_index import DASHBOARD_PRIORITY, MemberIndexManager
+from utils.rate_limiter import SlidingWindowRateLimiter, RateLimitExceeded
 from utils.timestamp import td_format
 from utils.utils import tokenGenerator, system_code_gen
 import logging
@@ -38,23 +38,26 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-_api_rate_limiter = defaultdict(list)
-_rate_limit_window = 60
-_max_requests_per_window = 50
+_api_rate_limiter = SlidingWindowRateLimiter(
+    default_quota=(50, 60),
+    route_quotas={
+        "all_members": (50, 60),
+        "search_members": (50, 60),
+    },
+)
+
 
-async def check_rate_limit(identifier: str):
+async def check_rate_limit(route: str, identifier: str | int):
     """Check if we're hitting rate limits"""
-    now = datetime.datetime.now().timestamp()
-    
-    _api_rate_limiter[identifier] = [
-        req_time for req_time in _api_rate_limiter[identifier]
-        if now - req_time < _rate_limit_window
-    ]
-
-    if len(_api_rate_limiter[identifier]) >= _max_requests_per_window:
-        raise HTTPException(status_code=429, detail="Rate limit exceeded")
-    
-    _api_rate_limiter[identifier].append(now)
+    try:
+        _api_rate_limiter.hit(route, identifier)
+    except RateLimitExceeded as e:
+        raise HTTPException(
+            status_code=429,
+            detail="Rate limit exceeded",
+            headers={"Retry-After": str(e.retry_after)},
+        )
+
 
 class Identification(BaseModel):
     license: typing.Optional[typing.Any]
@@ -136,6 +139,22 @@ class APIRoutes:
 
         return {"shard_pings": shard_pings}
 
+    async def GET_metrics(self, authorization: Annotated[str | None, Header()] = None):
+        if not authorization:
+            raise HTTPException(status_code=401, detail="Invalid authorization")
+
+        # Prometheus sends its credentials as a bearer token.
+        if not await validate_authorization(
+            self.bot, authorization.removeprefix("Bearer ")
+        ):
+            raise HTTPException(
+                status_code=401, detail="Invalid or expired authorization."
+            )
+
+        return PlainTextResponse(
+            metrics.render(), media_type="text/plain; version=0.0.4"
+        )
+
     async def GET_guild_shard(
         self, authorization: Annotated[str | None, Header()], guild_id: int
     ):
@@ -620,7 +639,7 @@ class APIRoutes:
             ),
         )
 
-        view = LOAMenu(
+        view = get_view("LOAMenu")(
             self.bot,
             management_roles,
             loa_roles,
@@ -746,7 +765,11 @@ class APIRoutes:
         await channel.send(embeds=embeds)
 
     async def POST_all_members(
-        self, authorization: Annotated[str | None, Header()], guild_id: int
+        self,
+        authorization: Annotated[str | None, Header()],
+        guild_id: int,
+        cursor: int | None = None,
+        limit: int | None = None,
     ):
         if not authorization:
             raise HTTPException(status_code=401, detail="Invalid authorization")
@@ -756,23 +779,21 @@ class APIRoutes:
                 status_code=401, detail="Invalid or expired authorization."
             )
 
-        await check_rate_limit(f"all_members_{guild_id}")
+        await check_rate_limit("all_members", guild_id)
 
         guild = self.bot.get_guild(guild_id)
         if not guild:
-            try:
-                guild = await self.bot.fetch_guild(guild_id)
-            except discord.HTTPException:
-                raise HTTPException(status_code=404, detail="Guild not found")
+            raise HTTPException(status_code=404, detail="Guild not found")
 
-        if not guild.chunked and guild.member_count > len(guild.members):
-            try:
-                await guild.chunk(cache=True)
-            except Exception as e:
-                logger.warning(f"Failed to chunk guild {guild_id}: {e}")
+        # Chunking a large guild can take minutes, so it happens in the
+        # background and this request is served from whatever is cached.
+        self.bot.member_index.request_chunk(guild, DASHBOARD_PRIORITY)
+        index = await self.bot.member_index.get(guild)
+        member_ids, next_cursor = index.page(
+            cursor, min(limit, 1000) if limit is not None else None
+        )
 
-        member_data = []
-        for member in guild.members:
+        def serialize(member: discord.Member) -> dict:
             voice_state = member.voice
             member_info = {
                 "id": member.id,
@@ -791,11 +812,29 @@ class APIRoutes:
                         voice_state.channel.name if voice_state.channel else None
                     ),
                 }
+            return member_info
 
-            member_data.append(member_info)
-
-        response = {"members": member_data, "total_members": len(member_data)}
-        return response
+        async def stream():
+            yield (
+                f'{{"total_members": {len(index)}, "chunked": {json.dumps(guild.chunked)}, '
+                f'"next_cursor": {json.dumps(str(next_cursor) if next_cursor else None)}, '
+                '"members": ['
+            )
+            first = True
+            for offset in range(0, len(member_ids), 500):
+                batch = []
+                for member_id in member_ids[offset : offset + 500]:
+                    member = guild.get_member(member_id)
+                    if member is None:
+                        continue
+                    batch.append(json.dumps(serialize(member)))
+                if batch:
+                    yield ("" if first else ",") + ",".join(batch)
+                    first = False
+                await asyncio.sleep(0)
+            yield "]}"
+
+        return StreamingResponse(stream(), media_type="application/json")
 
     async def POST_send_logging(
         self, authorization: Annotated[str | None, Header()], request: Request
@@ -826,81 +865,40 @@ class APIRoutes:
         if not guild_ids:
             raise HTTPException(status_code=400, detail="No guilds specified")
 
-        semaphore = asyncio.Semaphore(3)
-
-        async def get_or_fetch(guild: discord.Guild, member_id: int):
-            m = guild.get_member(member_id)
-            if m:
-                return m
+        guilds = []
+        for guild_id in guild_ids:
             try:
-                await asyncio.sleep(0.1)
-                m = await guild.fetch_member(member_id)
-            except discord.HTTPException:
-                m = None
-            return m
+                guild = self.bot.get_guild(int(guild_id))
+            except (TypeError, ValueError):
+                continue
+            if guild is not None:
+                guilds.append(guild)
 
-        async def process_guild(guild_id):
-            async with semaphore:
-                try:
-                    guild: discord.Guild = self.bot.get_guild(int(guild_id))
-                    if not guild:
-                        return None
-                        
-                    try:
-                        icon = guild.icon.with_size(512)
-                        icon = icon.with_format("png")
-                        icon = str(icon)
-                    except AttributeError:
-                        icon = "https://cdn.discordapp.com/embed/avatars/0.png?size=512"
+        levels = await self.bot.permission_resolver.resolve_many(int(user_id), guilds)
 
-                    try:
-                        user = await asyncio.wait_for(
-                            get_or_fetch(guild, user_id), timeout=10.0
-                        )
-                    except (discord.NotFound, asyncio.TimeoutError, discord.HTTPException):
-                        return None
-
-                    if user is None:
-                        return None
-
-                    permission_level = 0
-                    if await management_check(self.bot, guild, user):
-                        permission_level = 2
-                    elif await admin_check(self.bot, guild, user):
-                        permission_level = 3
-                    elif await staff_check(self.bot, guild, user):
-                        permission_level = 1
-                        
-                    if permission_level > 0:
-                        return {
-                            "id": str(guild.id),
-                            "name": str(guild.name),
-                            "member_count": str(guild.member_count),
-                            "icon_url": icon,
-                            "permission_level": permission_level,
-                        }
-                    return None
-                except Exception as e:
-                    logger.error(f"Error processing guild {guild_id}: {e}")
-                    return None
-
-        batch_size = 5
-        all_results = []
-        
-        for i in range(0, len(guild_ids), batch_size):
-            batch = guild_ids[i:i + batch_size]
-            batch_results = await asyncio.gather(
-                *[process_guild(guild_id) for guild_id in batch],
-                return_exceptions=True
-            )
-            all_results.extend(batch_results)
-            
-            # Add delay between batches
-            if i + batch_size < len(guild_ids):
-                await asyncio.sleep(1)
+        results = []
+        for guild in guilds:
+            permission_level = levels.get(guild.id, 0)
+            if permission_level == 0:
+                continue
 
-        guilds = [x for x in all_results if x is not None and not isinstance(x, Exception)]
-        return guilds
+            try:
+                icon = guild.icon.with_size(512)
+                icon = icon.with_format("png")
+                icon = str(icon)
+            except AttributeError:
+                icon = "https://cdn.discordapp.com/embed/avatars/0.png?size=512"
+
+            results.append(
+                {
+                    "id": str(guild.id),
+                    "name": str(guild.name),
+                    "member_count": str(guild.member_count),
+                    "icon_url": icon,
+                    "permission_level": permission_level,
+                }
+            )
+        return results
 
     async def POST_check_staff_level(self, request: Request):
         json_data = await request.json()
@@ -927,15 +925,8 @@ class APIRoutes:
             except (discord.Forbidden, discord.HTTPException):
                 return {"permission_level": 0}
 
-        permission_level = 0
-        if await management_check(self.bot, guild, user):
-            permission_level = 2
-        elif await admin_check(self.bot, guild, user):
-            permission_level = 3
-        elif await staff_check(self.bot, guild, user):
-            permission_level = 1
-
-        return {"permission_level": permission_level}
+        permissions = await self.bot.permission_resolver.permissions(guild, user)
+        return {"permission_level": permissions.level}
 
     async def POST_get_guild_settings(self, request: Request):
         json_data = await request.json()
@@ -1985,66 +1976,50 @@ class APIRoutes:
             query = json_data.get("query")
             limit = min(int(json_data.get("limit", 1000)), 500)  # Reduced max limit
 
-            await check_rate_limit(f"search_members_{guild_id}")
+            await check_rate_limit("search_members", guild_id)
 
             guild = self.bot.get_guild(guild_id)
             if not guild:
-                try:
-                    guild = await self.bot.fetch_guild(guild_id)
-                except discord.NotFound:
-                    raise HTTPException(status_code=404, detail="Guild not found")
-
-            if not guild.chunked and guild.member_count < 5000:
-                try:
-                    await guild.chunk()
-                except Exception as e:
-                    logger.warning(f"Failed to chunk guild {guild_id}: {e}")
+                raise HTTPException(status_code=404, detail="Guild not found")
 
+            self.bot.member_index.request_chunk(guild, DASHBOARD_PRIORITY)
             matching_members = []
-            processed_count = 0
-            
-            for member in guild.members:
-                if processed_count % 100 == 0:
-                    await asyncio.sleep(0.01)
-                    
-                processed_count += 1
-                
-                name_matches = query.lower() in member.name.lower()
-                nick_matches = member.nick and query.lower() in member.nick.lower()
-
-                if name_matches or nick_matches:
-                    member_data = {
-                        "user": {
-                            "id": str(member.id),
-                            "username": member.name,
-                            "discriminator": member.discriminator,
-                            "global_name": member.global_name,
-                            "avatar": str(member.display_avatar.url),
-                        },
-                        "nick": member.nick,
-                        "roles": [str(role.id) for role in member.roles],
-                        "joined_at": (
-                            member.joined_at.isoformat() if member.joined_at else None
-                        ),
-                        "premium_since": (
-                            member.premium_since.isoformat()
-                            if member.premium_since
-                            else None
-                        ),
-                        "pending": member.pending,
-                        "communication_disabled_until": (
-                            member.timed_out_until.isoformat()
-                            if member.timed_out_until
-                            else None
-                        ),
-                    }
-                    matching_members.append(member_data)
-
-                if len(matching_members) >= limit:
-                    break
+            index = await self.bot.member_index.get(guild)
+            for member_id in index.search(query, limit):
+                member = guild.get_member(member_id)
+                if member is None:
+                    continue
+                member_data = {
+                    "user": {
+                        "id": str(member.id),
+                        "username": member.name,
+                        "discriminator": member.discriminator,
+                        "global_name": member.global_name,
+                        "avatar": str(member.display_avatar.url),
+                    },
+                    "nick": member.nick,
+                    "roles": [str(role.id) for role in member.roles],
+                    "joined_at": (
+                        member.joined_at.isoformat() if member.joined_at else None
+                    ),
+                    "premium_since": (
+                        member.premium_since.isoformat()
+                        if member.premium_since
+                        else None
+                    ),
+                    "pending": member.pending,
+                    "communication_disabled_until": (
+                        member.timed_out_until.isoformat()
+                        if member.timed_out_until
+                        else None
+                    ),
+                }
+                matching_members.append(member_data)
 
             return {"members": matching_members[:limit], "total": len(matching_members)}
 
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error searching members: {str(e)}")
             raise HTTPException(
@@ -2057,47 +2032,183 @@ api = FastAPI()
 from fastapi import Request
 
 
-class MyMiddleware:
-    def __init__(
-        self,
-        bot: commands.Bot,
-    ):
-        self.bot = bot
+# Methods whose JSON body may identify the guild of a request, for routes
+# which don't carry it as a query parameter.
+_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+_GUILD_KEYS = ("guild_id", "guild", "GuildID")
+_HOP_BY_HOP_HEADERS = frozenset(
+    {
+        b"connection",
+        b"keep-alive",
+        b"proxy-authenticate",
+        b"proxy-authorization",
+        b"te",
+        b"trailers",
+        b"transfer-encoding",
+        b"upgrade",
+        b"host",
+        b"content-length",
+    }
+)
 
-    async def __call__(self, request: Request, call_next):
-        guild_id = ""
-        try:
-            if config("ENVIRONMENT") == "CUSTOM":
-                raise Exception("We're already redirected.")
-
-            request_json = await request.json()
-            guild_id = int(
-                request_json.get("guild_id")
-                or request_json.get("guild")
-                or request_json.get("GuildID")
-            )
 
-            doc = self.bot.whitelabel.db.find_one({"GuildID": str(guild_id)})
-            if not doc:
-                raise Exception("doc not found")
+def _parse_guild_id(value) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
 
-            async with aiohttp.ClientSession() as session:
-                async with session.request(
-                    method=request.method,
-                    url=request.url._url.replace(
-                        request.url._url.split("https://")[1].split("/")[0],
-                        f"core-{guild_id}.erlc.site",
-                    ),
-                    body=request.body,
-                    headers=request.headers,
-                ) as resp:
-                    resp_body = await resp.read()
-                    return Response(
-                        content=resp_body, status_code=resp.status, headers=resp.headers
+
+def _has_json_body(scope) -> bool:
+    if scope.get("method") not in _BODY_METHODS:
+        return False
+    content_type = next(
+        (value for key, value in scope["headers"] if key.lower() == b"content-type"),
+        b"",
+    )
+    media_type = content_type.split(b";")[0].strip().lower()
+    # FastAPI reads a body without a content type as JSON as well.
+    return (
+        not media_type
+        or media_type == b"application/json"
+        or media_type.endswith(b"+json")
+    )
+
+
+class WhitelabelProxyMiddleware:
+    """
+    ASGI middleware which forwards requests for whitelabel guilds to their
+    own instance. Guild routing comes from `bot.whitelabel_cache`, so no
+    database call is made per request, and request and response bodies
+    are streamed through a single pooled client session.
+    """
+
+    def __init__(self, app, bot: commands.Bot):
+        self.app = app
+        self.bot = bot
+        self.enabled = config("ENVIRONMENT") != "CUSTOM"
+        self.session: aiohttp.ClientSession | None = None
+
+    def get_session(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(auto_decompress=False)
+            self.bot.external_http_sessions.append(self.session)
+        return self.session
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or not self.enabled
+            or not self.bot.whitelabel_cache.instances
+        ):
+            return await self.app(scope, receive, send)
+
+        guild_id = None
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        for key in _GUILD_KEYS:
+            if key in query:
+                guild_id = _parse_guild_id(query[key][0])
+                break
+
+        body = None
+        if guild_id is None and _has_json_body(scope):
+            body, receive = await self._buffer_body(receive)
+            try:
+                request_json = json.loads(body or b"{}")
+            except ValueError:
+                request_json = None
+            if isinstance(request_json, dict):
+                guild_id = _parse_guild_id(
+                    next(
+                        (request_json[k] for k in _GUILD_KEYS if request_json.get(k)),
+                        None,
                     )
-        except:
-            response = await call_next(request)
-            return response
+                )
+
+        if guild_id is None or guild_id not in self.bot.whitelabel_cache:
+            return await self.app(scope, receive, send)
+
+        await self._proxy(scope, receive, send, guild_id, body)
+
+    @staticmethod
+    async def _buffer_body(receive):
+        chunks = []
+        while True:
+            message = await receive()
+            if message["type"] != "http.request":
+                break
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+        body = b"".join(chunks)
+        replayed = False
+
+        async def replay():
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        return body, replay
+
+    @staticmethod
+    async def _stream_body(receive):
+        while True:
+            message = await receive()
+            if message["type"] != "http.request":
+                return
+            if chunk := message.get("body", b""):
+                yield chunk
+            if not message.get("more_body", False):
+                return
+
+    async def _proxy(self, scope, receive, send, guild_id: int, body: bytes | None):
+        url = f"https://core-{guild_id}.erlc.site{scope['path']}"
+        if scope.get("query_string"):
+            url += "?" + scope["query_string"].decode("latin-1")
+        headers = [
+            (key.decode("latin-1"), value.decode("latin-1"))
+            for key, value in scope["headers"]
+            if key.lower() not in _HOP_BY_HOP_HEADERS
+        ]
+
+        started = False
+        try:
+            async with self.get_session().request(
+                scope["method"],
+                url,
+                headers=headers,
+                data=body if body is not None else self._stream_body(receive),
+            ) as resp:
+                await send(
+                    {
+                        "type": "http.response.start",
+                        "status": resp.status,
+                        "headers": [
+                            (key, value)
+                            for key, value in resp.raw_headers
+                            if key.lower() not in _HOP_BY_HOP_HEADERS
+                        ],
+                    }
+                )
+                started = True
+                async for chunk in resp.content.iter_any():
+                    await send(
+                        {"type": "http.response.body", "body": chunk, "more_body": True}
+                    )
+                await send({"type": "http.response.body", "body": b""})
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"Failed to proxy request for whitelabel guild {guild_id}: {e}")
+            if not started:
+                await send(
+                    {
+                        "type": "http.response.start",
+                        "status": 502,
+                        "headers": [(b"content-type", b"text/plain")],
+                    }
+                )
+                await send({"type": "http.response.body", "body": b"Bad Gateway"})
 
 
 class ServerAPI(commands.Cog):
@@ -2105,11 +2216,11 @@ class ServerAPI(commands.Cog):
         self.bot = bot
         self.server = None
         self.server_task = None
+        self.bot.member_index = MemberIndexManager(bot)
 
     async def start_server(self):
         try:
-            middleware = MyMiddleware(bot=self.bot)
-            api.add_middleware(BaseHTTPMiddleware, dispatch=middleware)
+            api.add_middleware(WhitelabelProxyMiddleware, bot=self.bot)
             api.include_router(APIRoutes(self.bot).router)
             self.config = uvicorn.Config(
                 "utils.api:api", port=int(config("BIND_PORT", default=5000)), log_level="debug", host="0.0.0.0"
@@ -2130,7 +2241,33 @@ class ServerAPI(commands.Cog):
         except Exception as e:
             logger.error(f"Error stopping server: {e}")
 
+    @commands.Cog.listener("on_guild_join")
+    async def on_guild_join(self, guild: discord.Guild):
+        self.bot.member_index.request_chunk(guild)
+
+    @commands.Cog.listener("on_member_join")
+    async def on_member_join(self, member: discord.Member):
+        self.bot.member_index.on_member_add(member)
+
+    @commands.Cog.listener("on_member_remove")
+    async def on_member_remove(self, member: discord.Member):
+        self.bot.member_index.on_member_remove(member.guild.id, member.id)
+
+    @commands.Cog.listener("on_member_update")
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if before.nick != after.nick or before.name != after.name:
+            self.bot.member_index.on_member_add(after)
+
+    @commands.Cog.listener("on_user_update")
+    async def on_user_update(self, before: discord.User, after: discord.User):
+        if before.name == after.name:
+            return
+        for guild in after.mutual_guilds:
+            if (member := guild.get_member(after.id)) is not None:
+                self.bot.member_index.on_member_add(member)
+
     async def cog_load(self) -> None:
+        self.bot.member_index.start()
         self.server_task = asyncio.create_task(self.start_server())
         self.server_task.add_done_callback(self.server_error_handler)
 
@@ -2144,6 +2281,7 @@ class ServerAPI(commands.Cog):
             self.server_task = asyncio.create_task(self.start_server())
 
     async def cog_unload(self) -> None:
+        self.bot.member_index.stop()
         try:
             if self.server_task:
                 self.server_task.cancel()
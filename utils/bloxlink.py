@@ -2,11 +2,13 @@ import discord
 from discord.ext import commands
 import aiohttp
 
+from utils.metrics import http_trace
+
 
 class Bloxlink:
     def __init__(self, bot: commands.Bot, key: str):
         self.api_key = key
-        self.session = aiohttp.ClientSession()
+        self.session = aiohttp.ClientSession(trace_configs=[http_trace("bloxlink")])
         bot.external_http_sessions.append(self.session)
         self.bot = bot
 
@@ -34,7 +36,7 @@ class Bloxlink:
         if not user_id:
             return {}
 
-        async with aiohttp.ClientSession() as session:
+        async with aiohttp.ClientSession(trace_configs=[http_trace("roblox")]) as session:
             async with session.get(
                 "https://users.roblox.com/v1/users/{}".format(user_id)
             ) as resp:
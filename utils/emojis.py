@@ -1,8 +1,13 @@
 import os
 import asyncio
-import nest_asyncio
+import hashlib
+import json
+import logging
 
-nest_asyncio.apply()  # dangerous!
+import discord
+
+EMOJI_DIRECTORY = "assets/emojis"
+MANIFEST_PATH = os.path.join(EMOJI_DIRECTORY, "manifest.json")
 
 default_emojis = {
     "check": 1163142000271429662,
@@ -23,30 +28,91 @@ default_emojis = {
 }
 
 
+def _hash_emoji_files() -> dict[str, str]:
+    hashes = {}
+    for item in os.listdir(EMOJI_DIRECTORY):
+        if item.endswith(".png"):
+            with open(os.path.join(EMOJI_DIRECTORY, item), "rb") as f:
+                hashes[item.removesuffix(".png")] = hashlib.sha256(f.read()).hexdigest()
+    return hashes
+
+
+def _read_manifest() -> dict:
+    try:
+        with open(MANIFEST_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_manifest(manifest: dict):
+    with open(MANIFEST_PATH, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
 class EmojiController:
+    """
+    Resolves ERM's emojis to the application emojis of the running bot.
+
+    Emojis are resolved once, in `prefetch_emojis` during startup. The files
+    in `assets/emojis` are hashed and compared against a manifest of what
+    was uploaded for this application, so Discord is only contacted when a
+    file was added or changed. `get_emoji` is then a plain dictionary lookup.
+    """
+
     def __init__(self, bot):
         self.environment = bot.environment
         self.bot = bot
         self.emojis = {}
 
     async def prefetch_emojis(self):
+        hashes = await asyncio.to_thread(_hash_emoji_files)
+        manifest = await asyncio.to_thread(_read_manifest)
+        application_id = str(self.bot.application_id)
+        uploaded = manifest.get(application_id, {})
 
-        application_emojis = await self.bot.fetch_application_emojis()
-        for item in os.listdir("assets/emojis"):
-            if item.endswith(".png"):
-                if item.replace(".png", "") not in [i.name for i in application_emojis]:
-                    emoji_name = item.replace(".png", "")
-                    image_data = open(f"assets/emojis/{item}", "rb").read()
-                    await self.bot.create_application_emoji(
-                        name=emoji_name, image=image_data
-                    )
+        if all(
+            uploaded.get(name, {}).get("hash") == file_hash
+            for name, file_hash in hashes.items()
+        ):
+            self.emojis = {name: entry["id"] for name, entry in uploaded.items()}
+            return
 
-        new_application_emojis = await self.bot.fetch_application_emojis()
-        for emoji in new_application_emojis:
-            self.emojis[emoji.name] = emoji.id
+        application_emojis = {
+            emoji.name: emoji for emoji in await self.bot.fetch_application_emojis()
+        }
+        for name, file_hash in hashes.items():
+            existing = application_emojis.get(name)
+            recorded = uploaded.get(name, {}).get("hash")
+            # Emojis which exist but aren't in the manifest yet were uploaded
+            # before it existed, and are assumed to be current.
+            if existing is not None and recorded in (None, file_hash):
+                uploaded[name] = {"id": existing.id, "hash": file_hash}
+                continue
 
-    def get_emoji(self, emoji_name):
-        if not self.emojis:
-            asyncio.run(self.prefetch_emojis())
+            try:
+                if existing is not None:
+                    await existing.delete()
+                with open(os.path.join(EMOJI_DIRECTORY, f"{name}.png"), "rb") as f:
+                    image_data = f.read()
+                emoji = await self.bot.create_application_emoji(
+                    name=name, image=image_data
+                )
+            except discord.HTTPException as e:
+                logging.error(f"Failed to upload emoji {name}: {e}")
+                continue
+            uploaded[name] = {"id": emoji.id, "hash": file_hash}
+
+        manifest[application_id] = uploaded
+        try:
+            await asyncio.to_thread(_write_manifest, manifest)
+        except OSError as e:
+            logging.warning(f"Failed to write emoji manifest: {e}")
+        self.emojis = {name: entry["id"] for name, entry in uploaded.items()}
 
-        return "<:{}:{}>".format(emoji_name, self.emojis[emoji_name])
+    def get_emoji(self, emoji_name):
+        emoji_id = self.emojis.get(emoji_name) or default_emojis.get(emoji_name)
+        if emoji_id is None:
+            logging.warning(f"Unknown emoji {emoji_name}")
+            return ""
+        return "<:{}:{}>".format(emoji_name, emoji_id)
@@ -0,0 +1,208 @@
+import asyncio
+import logging
+import time
+import typing
+
+from utils.basedataclass import BaseDataClass
+from utils.metrics import Counter, guild_processing_seconds
+
+logger = logging.getLogger(__name__)
+
+sweep_outcomes = Counter(
+    "erm_sweep_guilds_total",
+    "Guilds handled by background sweeps, by lane and outcome.",
+    ("task", "lane", "outcome"),
+)
+
+
+class BreakerState(BaseDataClass):
+    failures: int
+    open_until: float
+    reason: str
+
+
+class GuildCircuitBreaker:
+    """
+    Backs background sweeps off guilds which keep failing, such as those
+    with an invalid or revoked server key.
+
+    After `threshold` consecutive failures a guild is skipped for
+    `base_backoff` seconds, doubling with every further failure up to
+    `max_backoff`. Once the backoff passes the guild is tried again, and
+    a single success closes the breaker.
+    """
+
+    def __init__(self, threshold: int = 3, base_backoff: float = 300, max_backoff: float = 3600):
+        self.threshold = threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.states: dict[int, BreakerState] = {}
+
+    def allows(self, guild_id: int) -> bool:
+        state = self.states.get(guild_id)
+        return state is None or state.open_until <= time.time()
+
+    def record_success(self, guild_id: int):
+        self.states.pop(guild_id, None)
+
+    def record_failure(self, guild_id: int, reason: str):
+        state = self.states.get(guild_id)
+        if state is None:
+            state = self.states[guild_id] = BreakerState(failures=0, open_until=0, reason=reason)
+        state.failures += 1
+        state.reason = reason
+        if state.failures >= self.threshold:
+            backoff = min(
+                self.base_backoff * 2 ** (state.failures - self.threshold), self.max_backoff
+            )
+            state.open_until = time.time() + backoff
+            logger.info(
+                f"Backing off guild {guild_id} for {backoff:.0f}s after "
+                f"{state.failures} failures ({reason})"
+            )
+
+    @property
+    def open_count(self) -> int:
+        now = time.time()
+        return sum(1 for state in self.states.values() if state.open_until > now)
+
+
+class SweepStats(BaseDataClass):
+    processed: int
+    timed_out: int
+    failed: int
+    backed_off: int
+    slow_lane: int
+    duration: float
+
+
+class GuildSweep:
+    """
+    Runs one background task's work over its guilds so that a slow guild
+    can't hold up everyone else.
+
+    Each guild gets `budget` seconds once it has a slot, after which its
+    work is cancelled. A guild that runs over is moved to the slow lane for
+    its next `slow_sweeps` sweeps: the slow lane has its own
+    `slow_concurrency` slots and a `slow_budget`, and the sweep doesn't
+    wait for it, so a guild still running there is skipped by later sweeps
+    until it finishes. Guilds the bot's circuit breaker has backed off are
+    skipped, and guilds which fail or time out in the slow lane count
+    towards it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        concurrency: int = 3,
+        budget: float = 60,
+        slow_concurrency: int = 1,
+        slow_budget: float = 180,
+        slow_sweeps: int = 3,
+    ):
+        self.name = name
+        self.budget = budget
+        self.slow_budget = slow_budget
+        self.slow_sweeps = slow_sweeps
+        self._fast = asyncio.Semaphore(concurrency)
+        self._slow = asyncio.Semaphore(slow_concurrency)
+        # Guild ID => sweeps left in the slow lane.
+        self.slow: dict[int, int] = {}
+        self._running: dict[int, asyncio.Task] = {}
+
+    async def _run_guild(
+        self,
+        breaker: GuildCircuitBreaker,
+        guild_id: int,
+        item,
+        process: typing.Callable[[typing.Any], typing.Awaitable],
+        slow: bool,
+        stats: SweepStats,
+    ):
+        lane, semaphore, budget = (
+            ("slow", self._slow, self.slow_budget)
+            if slow
+            else ("fast", self._fast, self.budget)
+        )
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await asyncio.wait_for(process(item), budget)
+            except asyncio.TimeoutError:
+                stats.timed_out += 1
+                sweep_outcomes.inc(self.name, lane, "timed_out")
+                logger.warning(f"[{self.name}] Guild {guild_id} ran over its {budget}s budget")
+                self.slow[guild_id] = self.slow_sweeps
+                if slow:
+                    breaker.record_failure(guild_id, f"{self.name} timed out")
+                return
+            except Exception as e:
+                stats.failed += 1
+                sweep_outcomes.inc(self.name, lane, "failed")
+                logger.error(
+                    f"[{self.name}] Error processing guild {guild_id}: {e}", exc_info=True
+                )
+                breaker.record_failure(guild_id, f"{self.name}: {type(e).__name__}")
+                return
+            finally:
+                guild_processing_seconds.observe(time.perf_counter() - start, self.name)
+
+        stats.processed += 1
+        sweep_outcomes.inc(self.name, lane, "processed")
+        # Failures reported by the API clients are only cleared by them.
+        state = breaker.states.get(guild_id)
+        if state is not None and state.reason.startswith(self.name):
+            breaker.record_success(guild_id)
+        if slow:
+            if self.slow.get(guild_id, 0) <= 1:
+                self.slow.pop(guild_id, None)
+            else:
+                self.slow[guild_id] -= 1
+
+    async def run(
+        self,
+        bot,
+        items: typing.Iterable,
+        process: typing.Callable[[typing.Any], typing.Awaitable],
+        key: typing.Callable[[typing.Any], int] = lambda item: item["_id"],
+    ) -> SweepStats:
+        """
+        Calls `process` for every item, keyed by guild ID with `key`, and
+        returns once the guilds in the fast lane are done.
+        """
+        start = time.time()
+        stats = SweepStats(
+            processed=0, timed_out=0, failed=0, backed_off=0, slow_lane=0, duration=0
+        )
+        fast = []
+        for item in items:
+            guild_id = key(item)
+            if guild_id in self._running:
+                continue
+            if not bot.guild_breaker.allows(guild_id):
+                stats.backed_off += 1
+                sweep_outcomes.inc(self.name, "none", "backed_off")
+                continue
+            if guild_id in self.slow:
+                stats.slow_lane += 1
+                task = asyncio.create_task(
+                    self._run_guild(bot.guild_breaker, guild_id, item, process, True, stats)
+                )
+                self._running[guild_id] = task
+                task.add_done_callback(
+                    lambda _, guild_id=guild_id: self._running.pop(guild_id, None)
+                )
+            else:
+                fast.append(
+                    self._run_guild(bot.guild_breaker, guild_id, item, process, False, stats)
+                )
+
+        await asyncio.gather(*fast)
+        stats.duration = time.time() - start
+        logger.info(
+            f"[{self.name}] Sweep finished in {stats.duration:.2f}s: "
+            f"{stats.processed} processed, {stats.timed_out} timed out, "
+            f"{stats.failed} failed, {stats.backed_off} backed off, "
+            f"{stats.slow_lane} in the slow lane"
+        )
+        return stats
@@ -0,0 +1,68 @@
+"""
+Payloads for ERM's internal lifecycle events.
+
+Commands already hold the shift or punishment they just wrote, so they
+dispatch it (and the guild settings, when they have them) instead of a bare
+ObjectId. Listeners call `resolve` on whatever they receive, which only goes
+to the database for the parts the dispatcher didn't provide. Bare ObjectIds
+are still accepted, for dispatchers which only know the identifier (such as
+the internal API).
+"""
+
+from bson import ObjectId
+
+from datamodels.ShiftManagement import ShiftItem, ShiftManagement
+from datamodels.Warnings import WarningItem
+from utils.basedataclass import BaseDataClass
+
+
+class ShiftEvent(BaseDataClass):
+    """
+    Dispatched as `shift_start`, `shift_end`, `break_start` and `break_end`.
+    """
+
+    document: dict
+    settings: dict | None = None
+
+    @property
+    def shift(self) -> ShiftItem:
+        return ShiftManagement.shift_item_from_document(self.document)
+
+    @classmethod
+    async def resolve(cls, bot, payload: "ShiftEvent | ObjectId | dict"):
+        if isinstance(payload, cls):
+            event = payload
+        elif isinstance(payload, dict):
+            event = cls(document=payload)
+        else:
+            document = await bot.shift_management.shifts.find_by_id(payload)
+            if not document:
+                return None
+            event = cls(document=document)
+
+        if event.settings is None:
+            event.settings = await bot.settings.find_by_id(event.document["Guild"])
+        return event
+
+
+class PunishmentEvent(BaseDataClass):
+    """
+    Dispatched as `punishment`.
+    """
+
+    warning: WarningItem
+    settings: dict | None = None
+
+    @classmethod
+    async def resolve(cls, bot, payload: "PunishmentEvent | ObjectId | str"):
+        if isinstance(payload, cls):
+            event = payload
+        else:
+            warning = await bot.punishments.fetch_warning(payload)
+            if warning is None:
+                return None
+            event = cls(warning=warning)
+
+        if event.settings is None:
+            event.settings = await bot.settings.find_by_id(event.warning.guild_id)
+        return event
@@ -0,0 +1,253 @@
+import asyncio
+import logging
+import time
+import typing
+
+from pymongo.errors import PyMongoError
+
+from utils.basedataclass import BaseDataClass
+
+logger = logging.getLogger(__name__)
+
+ERLC = "erlc"
+MC = "mc"
+
+# Only the integration settings are kept in memory.
+PROJECTION = {"ERLC": 1, "MC": 1}
+
+
+def _channel_set(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and value != 0
+
+
+def _prc_logs(doc: dict) -> bool:
+    erlc = doc.get("ERLC") or {}
+    return (
+        any(_channel_set(erlc.get(name)) for name in ("rdm_channel", "kill_logs", "player_logs"))
+        or "welcome_message" in erlc
+        or (erlc.get("automatic_shifts") or {}).get("enabled") is True
+        or "team_restrictions" in erlc
+    )
+
+
+def _vehicle_restrictions(doc: dict) -> bool:
+    return ((doc.get("ERLC") or {}).get("vehicle_restrictions") or {}).get("enabled") is True
+
+
+def _prc_automations(doc: dict) -> bool:
+    return doc.get("ERLC") is not None
+
+
+def _weather(doc: dict) -> bool:
+    weather = (doc.get("ERLC") or {}).get("weather")
+    if not isinstance(weather, dict):
+        return False
+    return (
+        (weather.get("sync_time") is True or weather.get("sync_weather") is True)
+        and weather.get("location") not in (None, "")
+    )
+
+
+def _mc_discord_checks(doc: dict) -> bool:
+    return ((doc.get("MC") or {}).get("discord_checks") or {}).get("enabled") is True
+
+
+class Feature(BaseDataClass):
+    key: str
+    predicate: typing.Callable[[dict], bool]
+
+
+FEATURES = {
+    "prc_logs": Feature(key=ERLC, predicate=_prc_logs),
+    "vehicle_restrictions": Feature(key=ERLC, predicate=_vehicle_restrictions),
+    "prc_automations": Feature(key=ERLC, predicate=_prc_automations),
+    "weather": Feature(key=ERLC, predicate=_weather),
+    "mc_discord_checks": Feature(key=MC, predicate=_mc_discord_checks),
+}
+
+
+class LinkedGuildRegistry:
+    """
+    In-memory view of which guilds have a linked server and which
+    integration features they have enabled, so background tasks can find
+    their guilds without aggregating over `settings` on every tick.
+
+    The `ERLC` and `MC` settings of every guild are loaded once, along with
+    the IDs in `server_keys` and `mc_keys`. Each guild's eligibility for
+    every feature in `FEATURES` is indexed when its settings or keys
+    change: writes through the `Settings` and `ServerKeys` models apply
+    immediately, and change streams pick up everything else. Deployments
+    without change stream support fall back to a full reload every
+    `refresh_interval` seconds.
+    """
+
+    def __init__(self, bot, refresh_interval: int = 300):
+        self.bot = bot
+        self.refresh_interval = refresh_interval
+        self.settings: dict[int, dict] = {}
+        self.keys: dict[str, set[int]] = {ERLC: set(), MC: set()}
+        self.eligible: dict[str, set[int]] = {name: set() for name in FEATURES}
+        self.ready = asyncio.Event()
+        self.last_refreshed: float = 0
+        self.last_refresh_lag: float = 0
+        self.polling = False
+        self._tasks: list[asyncio.Task] = []
+
+    def _key_collections(self) -> dict:
+        return {ERLC: self.bot.server_keys.db, MC: self.bot.db["mc_keys"]}
+
+    @property
+    def refresh_lag(self) -> float:
+        if self.polling:
+            return time.time() - self.last_refreshed
+        return self.last_refresh_lag
+
+    def _index(self, guild_id: int):
+        doc = self.settings.get(guild_id)
+        for name, feature in FEATURES.items():
+            if (
+                doc is not None
+                and guild_id in self.keys[feature.key]
+                and feature.predicate(doc)
+            ):
+                self.eligible[name].add(guild_id)
+            else:
+                self.eligible[name].discard(guild_id)
+
+    def guilds(self, feature: str) -> list[dict]:
+        """
+        The settings of every guild owned by this process which is linked
+        and has `feature` enabled, shaped like the `settings` documents the
+        tasks used to aggregate (`_id`, `ERLC` and `MC`).
+        """
+        partition = self.bot.partition
+        return [
+            {"_id": guild_id, **self.settings[guild_id]}
+            for guild_id in self.eligible[feature]
+            if partition.owns(guild_id)
+        ]
+
+    def count(self, feature: str) -> int:
+        partition = self.bot.partition
+        return sum(1 for guild_id in self.eligible[feature] if partition.owns(guild_id))
+
+    def update_settings(self, guild_id: int, doc: dict | None):
+        doc = {name: doc[name] for name in PROJECTION if name in (doc or {})}
+        if doc:
+            self.settings[guild_id] = doc
+        else:
+            self.settings.pop(guild_id, None)
+        self._index(guild_id)
+
+    def update_key(self, key: str, guild_id: int, linked: bool):
+        if linked:
+            self.keys[key].add(guild_id)
+        else:
+            self.keys[key].discard(guild_id)
+        self._index(guild_id)
+
+    async def settings_changed(self, guild_id: int):
+        self.update_settings(
+            guild_id, await self.bot.settings.db.find_one({"_id": guild_id}, PROJECTION)
+        )
+
+    async def key_changed(self, key: str, guild_id: int):
+        linked = bool(await self._key_collections()[key].count_documents({"_id": guild_id}))
+        self.update_key(key, guild_id, linked)
+
+    async def load(self):
+        settings = {}
+        async for doc in self.bot.settings.db.find(
+            {"$or": [{name: {"$exists": True}} for name in PROJECTION]}, PROJECTION
+        ):
+            settings[doc.pop("_id")] = doc
+        keys = {}
+        for key, collection in self._key_collections().items():
+            keys[key] = {doc["_id"] async for doc in collection.find({}, {"_id": 1})}
+
+        self.settings = settings
+        self.keys = keys
+        self.eligible = {
+            name: {
+                guild_id
+                for guild_id in keys[feature.key]
+                if guild_id in settings and feature.predicate(settings[guild_id])
+            }
+            for name, feature in FEATURES.items()
+        }
+        self.last_refreshed = time.time()
+        self.ready.set()
+        logger.info(
+            f"Loaded {len(settings)} integration settings, "
+            + ", ".join(f"{name}: {len(ids)}" for name, ids in self.eligible.items())
+        )
+
+    def start(self):
+        if not self._tasks:
+            self._tasks.append(asyncio.create_task(self._run()))
+
+    def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+
+    def _applied(self, change: dict):
+        if (cluster_time := change.get("clusterTime")) is not None:
+            self.last_refresh_lag = max(0, time.time() - cluster_time.time)
+
+    async def _watch_settings(self, start_at):
+        async with self.bot.settings.db.watch(
+            [{"$match": {"operationType": {"$in": ["insert", "update", "replace", "delete"]}}}],
+            full_document="updateLookup",
+            start_at_operation_time=start_at,
+        ) as stream:
+            async for change in stream:
+                self.update_settings(
+                    change["documentKey"]["_id"], change.get("fullDocument")
+                )
+                self._applied(change)
+
+    async def _watch_keys(self, key: str, collection, start_at):
+        async with collection.watch(
+            [{"$match": {"operationType": {"$in": ["insert", "replace", "delete"]}}}],
+            start_at_operation_time=start_at,
+        ) as stream:
+            async for change in stream:
+                self.update_key(
+                    key,
+                    change["documentKey"]["_id"],
+                    change["operationType"] != "delete",
+                )
+                self._applied(change)
+
+    async def _run(self):
+        while not self.ready.is_set():
+            try:
+                # The streams replay everything from before the load, so no
+                # write made while it runs is missed. Standalone servers
+                # don't report an operation time, nor support streams.
+                start_at = (await self.bot.db.command("ping")).get("operationTime")
+                await self.load()
+            except PyMongoError as e:
+                logger.warning(f"Failed to load linked guilds, retrying: {e}")
+                await asyncio.sleep(10)
+
+        watchers = [asyncio.create_task(self._watch_settings(start_at))] + [
+            asyncio.create_task(self._watch_keys(key, collection, start_at))
+            for key, collection in self._key_collections().items()
+        ]
+        self._tasks.extend(watchers)
+        try:
+            await asyncio.gather(*watchers)
+        except PyMongoError as e:
+            logger.info(f"Linked guild change streams unavailable, polling instead: {e}")
+        for watcher in watchers:
+            watcher.cancel()
+
+        self.polling = True
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.load()
+            except PyMongoError as e:
+                logger.warning(f"Failed to refresh linked guilds: {e}")
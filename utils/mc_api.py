@@ -2,13 +2,14 @@ import asyncio
 import typing
 import aiohttp
 from datamodels.ServerKeys import ServerKey
+from utils.metrics import http_trace
 from utils.prc_api import ResponseFailure, ServerStatus, Player, CommandLog, BanItem
 
 
 class MCApiClient:
     def __init__(self, bot, base_url: str, api_key: str):
         self.bot = bot
-        self.session = aiohttp.ClientSession()
+        self.session = aiohttp.ClientSession(trace_configs=[http_trace("mc")])
         self.api_key = api_key
         self.base_url = base_url
 
@@ -0,0 +1,203 @@
+import asyncio
+import bisect
+import collections
+import itertools
+import logging
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+NGRAM_SIZE = 3
+
+# Chunk priorities, lower runs first.
+DASHBOARD_PRIORITY = 0
+BACKGROUND_PRIORITY = 1
+
+
+def _ngrams(value: str) -> set[str]:
+    return {value[i : i + NGRAM_SIZE] for i in range(len(value) - NGRAM_SIZE + 1)}
+
+
+class GuildMemberIndex:
+    """
+    Searchable index of a guild's cached members.
+
+    Names and nicknames are casefolded once when a member is added, and each
+    of their trigrams points back at the member IDs containing it. A search
+    intersects the postings of the query's trigrams and only verifies that
+    small candidate set, instead of lowering every member's name per query.
+    Member IDs are also kept sorted so the member list can be paginated
+    with an ID cursor.
+    """
+
+    def __init__(self, guild: discord.Guild):
+        self.guild_id = guild.id
+        self.complete = guild.chunked
+        self.entries: dict[int, tuple[str, str]] = {}
+        self.postings: dict[str, set[int]] = {}
+        self.sorted_ids: list[int] = []
+
+    @classmethod
+    async def build(cls, guild: discord.Guild) -> "GuildMemberIndex":
+        index = cls(guild)
+        for position, member in enumerate(guild.members):
+            index._index(member)
+            if position % 5000 == 4999:
+                await asyncio.sleep(0)  # large guilds take a while, don't block the loop
+        index.sorted_ids = sorted(index.entries)
+        return index
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _index(self, member: discord.Member):
+        name = member.name.casefold()
+        nick = (member.nick or "").casefold()
+        self.entries[member.id] = (name, nick)
+        for gram in _ngrams(name) | _ngrams(nick):
+            self.postings.setdefault(gram, set()).add(member.id)
+
+    def add(self, member: discord.Member):
+        if member.id in self.entries:
+            self.remove(member.id)
+        self._index(member)
+        bisect.insort(self.sorted_ids, member.id)
+
+    def remove(self, member_id: int):
+        entry = self.entries.pop(member_id, None)
+        if entry is None:
+            return
+        for gram in _ngrams(entry[0]) | _ngrams(entry[1]):
+            posting = self.postings.get(gram)
+            if posting is None:
+                continue
+            posting.discard(member_id)
+            if not posting:
+                del self.postings[gram]
+        index = bisect.bisect_left(self.sorted_ids, member_id)
+        if index < len(self.sorted_ids) and self.sorted_ids[index] == member_id:
+            del self.sorted_ids[index]
+
+    def search(self, query: str, limit: int) -> list[int]:
+        query = query.casefold()
+        if len(query) < NGRAM_SIZE:
+            candidates = self.sorted_ids
+        else:
+            postings = sorted(
+                (self.postings.get(gram, set()) for gram in _ngrams(query)), key=len
+            )
+            candidates = sorted(set.intersection(*postings)) if postings[0] else []
+
+        results = []
+        for member_id in candidates:
+            name, nick = self.entries[member_id]
+            if query in name or query in nick:
+                results.append(member_id)
+                if len(results) >= limit:
+                    break
+        return results
+
+    def page(self, cursor: int | None, limit: int | None) -> tuple[list[int], int | None]:
+        """
+        Returns the member IDs after `cursor`, and the cursor for the next
+        page if there is one.
+        """
+        start = 0 if cursor is None else bisect.bisect_right(self.sorted_ids, cursor)
+        if limit is None:
+            return self.sorted_ids[start:], None
+        page = self.sorted_ids[start : start + limit]
+        next_cursor = page[-1] if start + limit < len(self.sorted_ids) else None
+        return page, next_cursor
+
+
+class MemberIndexManager:
+    """
+    Holds a `GuildMemberIndex` for the `max_indexes` guilds the API was most
+    recently asked about, and chunks guilds in the background.
+
+    Once the bot is ready, every guild which wasn't chunked at startup (and
+    every guild joined later) is queued for a background warm-up. Guilds
+    requested by the dashboard jump that queue, and background chunks are
+    spaced `background_delay` seconds apart so a warm-up never holds up a
+    dashboard request for long. When a guild with an index finishes
+    chunking, its index is rebuilt then rather than on the next request.
+    """
+
+    def __init__(self, bot, max_indexes: int = 100, background_delay: float = 1):
+        self.bot = bot
+        self.max_indexes = max_indexes
+        self.background_delay = background_delay
+        self.indexes: collections.OrderedDict[int, GuildMemberIndex] = (
+            collections.OrderedDict()
+        )
+        self.chunk_queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._queued: dict[int, int] = {}
+        self._counter = itertools.count()
+        self._tasks: list[asyncio.Task] = []
+
+    def start(self):
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._chunk_worker()),
+                asyncio.create_task(self._warm_up()),
+            ]
+
+    def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+
+    def _store(self, index: GuildMemberIndex):
+        self.indexes[index.guild_id] = index
+        self.indexes.move_to_end(index.guild_id)
+        while len(self.indexes) > self.max_indexes:
+            self.indexes.popitem(last=False)
+
+    async def get(self, guild: discord.Guild) -> GuildMemberIndex:
+        index = self.indexes.get(guild.id)
+        if index is None or (not index.complete and guild.chunked):
+            index = await GuildMemberIndex.build(guild)
+        self._store(index)
+        return index
+
+    async def _warm_up(self):
+        await self.bot.wait_until_ready()
+        for guild in self.bot.guilds:
+            self.request_chunk(guild, BACKGROUND_PRIORITY)
+
+    def request_chunk(self, guild: discord.Guild, priority: int = BACKGROUND_PRIORITY):
+        if guild.chunked:
+            return
+        if self._queued.get(guild.id, priority + 1) <= priority:
+            return
+        self._queued[guild.id] = priority
+        self.chunk_queue.put_nowait((priority, next(self._counter), guild.id))
+
+    async def _chunk_worker(self):
+        while True:
+            priority, _, guild_id = await self.chunk_queue.get()
+            if self._queued.get(guild_id) != priority:
+                continue  # superseded by a higher priority request
+            del self._queued[guild_id]
+
+            guild = self.bot.get_guild(guild_id)
+            if guild is None or guild.chunked:
+                continue
+            try:
+                await guild.chunk(cache=True)
+            except Exception as e:
+                logger.warning(f"Failed to chunk guild {guild_id}: {e}")
+                continue
+            if guild_id in self.indexes:
+                self.indexes[guild_id] = await GuildMemberIndex.build(guild)
+            if priority == BACKGROUND_PRIORITY:
+                await asyncio.sleep(self.background_delay)
+
+    def on_member_add(self, member: discord.Member):
+        if (index := self.indexes.get(member.guild.id)) is not None:
+            index.add(member)
+
+    def on_member_remove(self, guild_id: int, member_id: int):
+        if (index := self.indexes.get(guild_id)) is not None:
+            index.remove(member_id)
@@ -0,0 +1,362 @@
+import bisect
+import functools
+import logging
+import re
+import threading
+import time
+import typing
+from urllib.parse import urlsplit
+
+import aiohttp
+from pymongo import monitoring
+
+from utils import ttl_store
+
+logger = logging.getLogger(__name__)
+
+# Seconds, from a cached lookup up to a sweep over every guild.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300)
+
+_metrics: dict[str, "Metric"] = {}
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: tuple[str, ...], values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Metric:
+    type: str
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        # The Mongo listener records from pymongo's threads, while the values
+        # are rendered from the event loop.
+        self._lock = threading.Lock()
+        _metrics[name] = self
+
+    def samples(self) -> typing.Iterator[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        return "\n".join(
+            [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type}"]
+            + list(self.samples())
+        )
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()):
+        super().__init__(name, documentation, labels)
+        self.values: dict[tuple, float] = {}
+
+    def inc(self, *labels, amount: float = 1):
+        with self._lock:
+            self.values[labels] = self.values.get(labels, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            values = list(self.values.items())
+        for labels, value in values:
+            yield f"{self.name}{_format_labels(self.labels, labels)} {value}"
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labels)
+        self.buckets = buckets
+        # Per label set: a count per bucket (plus +Inf), and the sum.
+        self.values: dict[tuple, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, *labels):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            if (entry := self.values.get(labels)) is None:
+                entry = self.values[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+            entry[0][index] += 1
+            entry[1][0] += value
+
+    def time(self, *labels) -> "_Timer":
+        return _Timer(self, labels)
+
+    def samples(self):
+        with self._lock:
+            values = [
+                (labels, list(counts), total[0])
+                for labels, (counts, total) in self.values.items()
+            ]
+        for labels, counts, total in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(float(bound))
+                bucket_labels = _format_labels(self.labels, labels, f'le="{le}"')
+                yield f"{self.name}_bucket{bucket_labels} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(self.labels, labels)} {total}"
+            yield f"{self.name}_count{_format_labels(self.labels, labels)} {cumulative}"
+
+
+class _Timer:
+    """Observes the time spent in a `with` or `async with` block."""
+
+    __slots__ = ("histogram", "labels", "start")
+
+    def __init__(self, histogram: Histogram, labels: tuple):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        self.histogram.observe(time.perf_counter() - self.start, *self.labels)
+
+    async def __aenter__(self):
+        self.__enter__()
+
+    async def __aexit__(self, *exc_info):
+        self.__exit__()
+
+
+class Gauge(Metric):
+    """
+    A value read when the metrics are scraped: `callback` returns either a
+    number, or a mapping of label values to numbers.
+    """
+
+    type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        callback: typing.Callable[[], typing.Any] | None = None,
+    ):
+        super().__init__(name, documentation, labels)
+        self.callback = callback
+
+    def samples(self):
+        if self.callback is None:
+            return
+        try:
+            values = self.callback()
+        except Exception as e:
+            logger.warning(f"Failed to read metric {self.name}: {e}")
+            return
+        if not isinstance(values, dict):
+            values = {(): values}
+        for labels, value in values.items():
+            if not isinstance(labels, tuple):
+                labels = (labels,)
+            yield f"{self.name}{_format_labels(self.labels, labels)} {float(value)}"
+
+
+def render() -> str:
+    return "\n".join(metric.render() for metric in _metrics.values()) + "\n"
+
+
+command_seconds = Histogram(
+    "erm_command_seconds", "Time taken to run a command.", ("command",)
+)
+task_cycle_seconds = Histogram(
+    "erm_task_cycle_seconds", "Time taken by one iteration of a background task.", ("task",)
+)
+guild_processing_seconds = Histogram(
+    "erm_guild_processing_seconds",
+    "Time taken to process one guild within a background task.",
+    ("task",),
+)
+http_request_seconds = Histogram(
+    "erm_http_request_seconds",
+    "Latency of requests to external APIs.",
+    ("service", "method"),
+)
+http_responses = Counter(
+    "erm_http_responses_total", "Responses from external APIs by status code.", ("service", "status")
+)
+mongo_command_seconds = Histogram(
+    "erm_mongo_command_seconds",
+    "Latency of MongoDB commands.",
+    ("collection", "command"),
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5),
+)
+mongo_command_failures = Counter(
+    "erm_mongo_command_failures_total", "Failed MongoDB commands.", ("collection", "command")
+)
+discord_rate_limits = Counter(
+    "erm_discord_rate_limits_total", "429 responses from Discord.", ("route",)
+)
+
+
+def timed_loop(name: str, coro):
+    """Wraps the coroutine of a `tasks.loop` to time each iteration."""
+
+    @functools.wraps(coro)
+    async def wrapper(*args, **kwargs):
+        with task_cycle_seconds.time(name):
+            return await coro(*args, **kwargs)
+
+    return wrapper
+
+
+def http_trace(service: str) -> aiohttp.TraceConfig:
+    """
+    A trace config for aiohttp sessions, recording the latency and status
+    of every request made through them under `service`.
+    """
+
+    async def on_request_start(session, context, params):
+        context.start = time.perf_counter()
+
+    async def on_request_end(session, context, params):
+        http_request_seconds.observe(
+            time.perf_counter() - context.start, service, params.method
+        )
+        http_responses.inc(service, params.response.status)
+
+    async def on_request_exception(session, context, params):
+        http_request_seconds.observe(
+            time.perf_counter() - context.start, service, params.method
+        )
+        http_responses.inc(service, type(params.exception).__name__)
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_end.append(on_request_end)
+    trace_config.on_request_exception.append(on_request_exception)
+    return trace_config
+
+
+class MongoCommandListener(monitoring.CommandListener):
+    """Records the latency of every command sent by the Mongo client."""
+
+    def __init__(self):
+        self._collections: dict[int, str] = {}
+
+    def started(self, event):
+        # getMore names its cursor ID instead, and the collection separately.
+        collection = event.command.get(event.command_name)
+        if event.command_name == "getMore":
+            collection = event.command.get("collection")
+        self._collections[event.request_id] = (
+            collection if isinstance(collection, str) else event.database_name
+        )
+
+    def succeeded(self, event):
+        collection = self._collections.pop(event.request_id, event.database_name)
+        mongo_command_seconds.observe(
+            event.duration_micros / 1_000_000, collection, event.command_name
+        )
+
+    def failed(self, event):
+        collection = self._collections.pop(event.request_id, event.database_name)
+        mongo_command_seconds.observe(
+            event.duration_micros / 1_000_000, collection, event.command_name
+        )
+        mongo_command_failures.inc(collection, event.command_name)
+
+
+_SNOWFLAKE = re.compile(r"/\d{15,}")
+
+
+class DiscordRateLimitHandler(logging.Handler):
+    """
+    Counts the rate limits discord.py reports, by route, from the warnings
+    its HTTP client logs when it receives a 429.
+    """
+
+    def emit(self, record: logging.LogRecord):
+        if "429" not in str(record.msg) and "rate limit" not in str(record.msg).lower():
+            return
+        url = next(
+            (arg for arg in record.args or () if isinstance(arg, str) and "://" in arg),
+            None,
+        )
+        route = _SNOWFLAKE.sub("/{id}", urlsplit(url).path) if url else "global"
+        discord_rate_limits.inc(route)
+
+
+def install_discord_rate_limit_handler():
+    discord_logger = logging.getLogger("discord.http")
+    if not any(isinstance(h, DiscordRateLimitHandler) for h in discord_logger.handlers):
+        discord_logger.addHandler(DiscordRateLimitHandler(logging.WARNING))
+
+
+def register_bot_gauges(bot):
+    """Gauges for the queues and caches kept on the bot."""
+    Gauge(
+        "erm_queue_depth",
+        "Items waiting in in-process queues.",
+        ("queue",),
+        lambda: {
+            "sync_bus": bot.sync_bus.queue_depth,
+            "permission_sync": bot.permission_sync.queue_depth,
+            "scheduled_pms": bot.scheduled_pm_queue.qsize(),
+            "deadline_scheduler": len(bot.scheduler),
+        },
+    )
+    Gauge(
+        "erm_cache_entries",
+        "Entries held by each bounded cache.",
+        ("cache",),
+        lambda: {name: len(store) for name, store in ttl_store.stores.items()},
+    )
+    Gauge(
+        "erm_cache_evictions",
+        "Entries evicted from each bounded cache before they expired.",
+        ("cache",),
+        lambda: {name: store.evictions for name, store in ttl_store.stores.items()},
+    )
+    Gauge(
+        "erm_refresh_lag_seconds",
+        "How stale each change-stream backed cache may be.",
+        ("cache",),
+        lambda: {
+            "whitelabel": bot.whitelabel_cache.refresh_lag,
+            "linked_guilds": bot.linked_guilds.refresh_lag,
+        },
+    )
+    Gauge(
+        "erm_delivery_lag_seconds",
+        "Delay between an event and its delivery, for the last delivery.",
+        ("queue",),
+        lambda: {
+            "sync_bus": bot.sync_bus.last_delivery_lag,
+            "permission_sync": bot.permission_sync.last_flush_latency,
+            "deadline_scheduler": bot.scheduler.last_fire_lag,
+        },
+    )
+    Gauge(
+        "erm_task_time_to_first_run_seconds",
+        "Time from boot until each background task first ran.",
+        ("task",),
+        lambda: dict(bot.startup.time_to_first_run) if hasattr(bot, "startup") else {},
+    )
+    Gauge(
+        "erm_guilds", "Guilds in the cache of this process.", (), lambda: len(bot.guilds)
+    )
+    Gauge(
+        "erm_guilds_backed_off",
+        "Guilds background sweeps are currently skipping after repeated failures.",
+        (),
+        lambda: bot.guild_breaker.open_count,
+    )
@@ -6,10 +6,9 @@ import reactionmenu
 import typing
 
 from erm import Bot
-from menus import CustomSelectMenu
+from utils.view_registry import get_view
 from utils.constants import blank_color
 import asyncio
-import nest_asyncio
 
 
 class CustomPage:
@@ -195,7 +194,7 @@ class SelectPagination(discord.ui.View):
                 color=blank_color,
             ),
             view=(
-                view := CustomSelectMenu(
+                view := get_view("CustomSelectMenu")(
                     self.user_id,
                     [
                         discord.SelectOption(label=page.identifier, value=str(index))
@@ -226,3 +225,91 @@ class SelectPagination(discord.ui.View):
             )
         await interaction.response.defer()
         await self._paginate(interaction, 1, "increment")
+
+
+class CursorPagination(discord.ui.View):
+    """
+    Pages through results which are fetched a page at a time.
+
+    `fetch_page(cursor)` returns the embeds of the page starting at `cursor`
+    (None for the first page) and the cursor of the next page, or None on
+    the last page. The cursors of visited pages are kept, so going back
+    fetches only the page being shown.
+    """
+
+    def __init__(
+        self,
+        bot: Bot,
+        user_id: int,
+        fetch_page: typing.Callable[
+            [typing.Any], typing.Awaitable[tuple[list[discord.Embed], typing.Any]]
+        ],
+        total_pages: typing.Optional[int] = None,
+    ):
+        super().__init__(timeout=600)
+        names_to_emojis = {"1": "l_arrow", "2": "arrow"}
+        for button in self.children:
+            if isinstance(button, discord.ui.Button) and button.emoji is not None:
+                button.emoji = discord.PartialEmoji.from_str(
+                    bot.emoji_controller.get_emoji(names_to_emojis[button.label])
+                )
+                button.label = ""
+
+        self.user_id = user_id
+        self.fetch_page = fetch_page
+        self.total_pages = total_pages
+        self.cursors = [None]
+        self.current_index = 0
+        self.next_cursor = None
+
+    async def start(self) -> list[discord.Embed]:
+        embeds, self.next_cursor = await self.fetch_page(None)
+        self._update_buttons()
+        return embeds
+
+    def _update_buttons(self):
+        self.back_button.disabled = self.current_index == 0
+        self.next_button.disabled = self.next_cursor is None
+        self.page_indicator.label = (
+            f"{self.current_index + 1}/{self.total_pages}"
+            if self.total_pages
+            else str(self.current_index + 1)
+        )
+
+    async def _go_to(self, interaction: discord.Interaction, index: int):
+        if interaction.user.id != self.user_id:
+            return await interaction.response.send_message(
+                embed=discord.Embed(
+                    title="Not Permitted",
+                    description="You are not permitted to interact with these buttons.",
+                    color=blank_color,
+                ),
+                ephemeral=True,
+            )
+        await interaction.response.defer()
+        if index == len(self.cursors):
+            self.cursors.append(self.next_cursor)
+        embeds, self.next_cursor = await self.fetch_page(self.cursors[index])
+        self.current_index = index
+        self._update_buttons()
+        await interaction.message.edit(embeds=embeds, view=self)
+
+    @discord.ui.button(label="1", emoji="<:l_arrow:1169754353326903407>", row=4)
+    async def back_button(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        await self._go_to(interaction, max(self.current_index - 1, 0))
+
+    @discord.ui.button(label="1", disabled=True, row=4)
+    async def page_indicator(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        pass
+
+    @discord.ui.button(label="2", emoji="<:arrow:1169695690784518154>", row=4)
+    async def next_button(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        if self.next_cursor is None:
+            return await interaction.response.defer()
+        await self._go_to(interaction, self.current_index + 1)
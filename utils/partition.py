@@ -0,0 +1,98 @@
+import copy
+
+from decouple import config
+
+# Discord assigns a guild to shard (guild_id >> 22) % shard_count.
+_SHARD_DIVISOR = 1 << 22
+
+
+def shard_config() -> dict:
+    """
+    Sharding options for the bot, read from SHARD_COUNT and SHARD_IDS (a
+    comma separated list). When these aren't set, discord.py connects every
+    shard in this process, as before.
+    """
+    shard_count = config("SHARD_COUNT", default=0, cast=int)
+    if not shard_count:
+        return {}
+    options = {"shard_count": shard_count}
+    if shard_ids := config("SHARD_IDS", default=""):
+        options["shard_ids"] = [int(shard_id) for shard_id in shard_ids.split(",")]
+    return options
+
+
+class WorkPartition:
+    """
+    Decides which guilds background tasks should process in this process.
+
+    Each process of a clustered deployment connects a subset of the shards,
+    and only has the guilds of those shards in its cache, so it owns exactly
+    the guilds of its shards. Failover comes from the shards themselves:
+    whichever process connects a shard takes over its guilds. A process
+    running every shard owns every guild, and the filters below are empty.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @property
+    def shard_count(self) -> int:
+        return getattr(self.bot, "shard_count", None) or 1
+
+    @property
+    def shard_ids(self) -> list[int]:
+        shard_ids = getattr(self.bot, "shard_ids", None)
+        if shard_ids is None:
+            return list(range(self.shard_count))
+        return sorted(shard_ids)
+
+    @property
+    def partitioned(self) -> bool:
+        return len(self.shard_ids) < self.shard_count
+
+    def owns(self, guild_id: int) -> bool:
+        return (int(guild_id) >> 22) % self.shard_count in self.shard_ids
+
+    def match(self, field: str = "_id") -> dict:
+        """
+        A query filter matching the documents whose `field` is a guild ID
+        owned by this process.
+        """
+        if not self.partitioned:
+            return {}
+        guild_id = {
+            "$convert": {"input": f"${field}", "to": "long", "onError": -1, "onNull": -1}
+        }
+        # Subtracting the remainder first keeps the division exact, as the
+        # result is a multiple of 2^22 which a double can represent.
+        shard_id = {
+            "$mod": [
+                {
+                    "$divide": [
+                        {"$subtract": [guild_id, {"$mod": [guild_id, _SHARD_DIVISOR]}]},
+                        _SHARD_DIVISOR,
+                    ]
+                },
+                self.shard_count,
+            ]
+        }
+        return {"$expr": {"$in": [shard_id, self.shard_ids]}}
+
+    def query(self, query: dict, field: str = "_id") -> dict:
+        return {**query, **self.match(field)}
+
+    def pipeline(self, pipeline: list[dict], field: str = "_id") -> list[dict]:
+        """
+        Returns `pipeline` with the partition filter added to its first
+        `$match` stage, so later stages (such as lookups) only see owned
+        guilds.
+        """
+        match = self.match(field)
+        if not match:
+            return pipeline
+        pipeline = copy.deepcopy(pipeline)
+        if pipeline and "$match" in pipeline[0]:
+            pipeline[0]["$match"].update(match)
+        else:
+            pipeline.insert(0, {"$match": match})
+        return pipeline
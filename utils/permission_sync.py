@@ -0,0 +1,130 @@
+import asyncio
+import logging
+import time
+
+from utils.basedataclass import BaseDataClass
+from utils.sync_bus import SyncEvent
+
+logger = logging.getLogger(__name__)
+
+
+class PendingChange(BaseDataClass):
+    previous_level: int
+    first_seen: float
+    last_seen: float
+
+
+def panel_level(permissions) -> int:
+    """
+    The permission level the ERM API and the panel cache: management is 2,
+    staff (including admin) is 1.
+    """
+    if permissions.management:
+        return 2
+    if permissions.staff:
+        return 1
+    return 0
+
+
+class PermissionSync:
+    """
+    Tells the ERM API and the panel about members whose permission level
+    changed, without sending a request per role update.
+
+    Role changes are coalesced per (guild, user): a member is only looked at
+    again once `window` seconds pass without another change to them (or
+    `max_delay` seconds after their first change), and an update is only
+    published if their level differs from the one before the first change.
+    Updates go out through the sync bus, which delivers them in batches
+    over its pooled session and retries failures.
+    """
+
+    def __init__(self, bot, window: float = 5, max_delay: float = 30):
+        self.bot = bot
+        self.window = window
+        self.max_delay = max_delay
+        self.pending: dict[tuple[int, int], PendingChange] = {}
+        self._task: asyncio.Task | None = None
+
+        self.changes = 0
+        self.coalesced = 0
+        self.published = 0
+        self.unchanged = 0
+        self.last_flush_latency: float = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self.pending)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await self.flush(list(self.pending))
+
+    def mark(self, guild_id: int, user_id: int, previous_level: int):
+        self.changes += 1
+        now = time.time()
+        if (change := self.pending.get((guild_id, user_id))) is not None:
+            self.coalesced += 1
+            change.last_seen = now
+            return
+        self.pending[(guild_id, user_id)] = PendingChange(
+            previous_level=previous_level, first_seen=now, last_seen=now
+        )
+
+    async def member_updated(self, before, after):
+        key = (after.guild.id, after.id)
+        if key in self.pending:
+            # Compared against the level before the first change on flush.
+            self.mark(*key, self.pending[key].previous_level)
+            return
+        resolver = self.bot.permission_resolver
+        previous_level = panel_level(await resolver.permissions(before.guild, before))
+        if panel_level(await resolver.permissions(after.guild, after)) != previous_level:
+            self.mark(*key, previous_level)
+
+    async def _current_level(self, guild_id: int, user_id: int) -> int:
+        guild = self.bot.get_guild(guild_id)
+        member = guild.get_member(user_id) if guild else None
+        if member is None:
+            return 0
+        return panel_level(await self.bot.permission_resolver.permissions(guild, member))
+
+    async def flush(self, keys: list[tuple[int, int]]):
+        for guild_id, user_id in keys:
+            change = self.pending.pop((guild_id, user_id), None)
+            if change is None:
+                continue
+            try:
+                level = await self._current_level(guild_id, user_id)
+                if level == change.previous_level:
+                    self.unchanged += 1
+                    continue
+                await self.bot.sync_bus.publish(
+                    SyncEvent("SyncPermissionLevel", guild_id, user_id=user_id, level=level)
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Failed to propagate permissions of {user_id} in {guild_id}: {e}"
+                )
+                continue
+            self.published += 1
+            self.last_flush_latency = time.time() - change.first_seen
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(1)
+            now = time.time()
+            due = [
+                key
+                for key, change in self.pending.items()
+                if now - change.last_seen >= self.window
+                or now - change.first_seen >= self.max_delay
+            ]
+            if due:
+                await self.flush(due)
@@ -0,0 +1,206 @@
+import asyncio
+import logging
+import typing
+
+import discord
+
+from utils.ttl_store import TTLStore
+
+logger = logging.getLogger(__name__)
+
+# Permission levels as reported to the dashboard. These intentionally mirror
+# the order of checks in `POST_check_staff_level`, where management wins over
+# admin and admin over staff.
+NO_PERMISSION = 0
+STAFF_PERMISSION = 1
+MANAGEMENT_PERMISSION = 2
+ADMIN_PERMISSION = 3
+
+
+def _role_ids(value) -> frozenset[int]:
+    if isinstance(value, list):
+        return frozenset(value)
+    if isinstance(value, int):
+        return frozenset({value})
+    return frozenset()
+
+
+class GuildRoles(typing.NamedTuple):
+    """
+    A guild's staff, admin and management role IDs. Management roles also
+    count as admin roles, and both count as staff roles, so a member's
+    permissions follow from one intersection with `staff`.
+    """
+
+    staff: frozenset[int]
+    admin: frozenset[int]
+    management: frozenset[int]
+
+    @classmethod
+    def from_settings(cls, settings: dict | None) -> "GuildRoles":
+        staff_management = (settings or {}).get("staff_management") or {}
+        management = _role_ids(staff_management.get("management_role"))
+        admin = _role_ids(staff_management.get("admin_role")) | management
+        staff = _role_ids(staff_management.get("role")) | admin
+        return cls(staff, admin, management)
+
+
+class MemberPermissions(typing.NamedTuple):
+    staff: bool
+    admin: bool
+    management: bool
+
+    @property
+    def level(self) -> int:
+        # Management wins over admin, and admin over staff.
+        if self.management:
+            return MANAGEMENT_PERMISSION
+        if self.admin:
+            return ADMIN_PERMISSION
+        if self.staff:
+            return STAFF_PERMISSION
+        return NO_PERMISSION
+
+
+def compute_member_permissions(
+    roles: GuildRoles, member: discord.Member, role_ids: frozenset[int] | None = None
+) -> MemberPermissions:
+    if role_ids is None:
+        role_ids = frozenset(role.id for role in member.roles)
+    matched = roles.staff & role_ids
+    permissions = member.guild_permissions
+    management = not matched.isdisjoint(roles.management) or permissions.manage_guild
+    admin = not matched.isdisjoint(roles.admin) or permissions.administrator
+    staff = bool(matched) or admin or permissions.manage_messages
+    return MemberPermissions(staff, admin, management)
+
+
+def compute_permission_level(settings: dict | None, member: discord.Member) -> int:
+    """
+    Computes the dashboard permission level of `member`. This gives the same
+    result as running `management_check`, `admin_check` and `staff_check`
+    one after another.
+    """
+    return compute_member_permissions(GuildRoles.from_settings(settings), member).level
+
+
+class PermissionResolver:
+    """
+    Resolves staff, admin and management permissions of members.
+
+    Each guild's configured roles are compiled into `GuildRoles` once, and
+    rebuilt when its settings are written (or after `roles_ttl` seconds, for
+    writes from elsewhere). A member's permissions are memoised per
+    (guild, member, roles), so repeated checks don't read settings again.
+
+    For the dashboard, `resolve_many` resolves a user across many guilds at
+    once: settings for every requested guild are loaded with a single `$in`
+    query, members are only fetched from Discord when they aren't cached,
+    and results are cached per (guild, user) until the member's roles change
+    or `ttl` seconds pass.
+    """
+
+    def __init__(
+        self, bot, ttl: int = 300, max_entries: int = 50_000, roles_ttl: int = 60
+    ):
+        self.bot = bot
+        self._guild_roles = TTLStore("guild_roles", ttl=roles_ttl, max_entries=20_000)
+        self._members = TTLStore(
+            "member_permissions", ttl=roles_ttl, max_entries=max_entries
+        )
+        self._levels = TTLStore("permission_levels", ttl=ttl, max_entries=max_entries)
+
+    async def guild_roles(self, guild_id: int) -> GuildRoles:
+        roles = self._guild_roles.get(guild_id, "roles")
+        if roles is None:
+            roles = GuildRoles.from_settings(await self.bot.settings.find_by_id(guild_id))
+            self._guild_roles.set(guild_id, "roles", roles)
+        return roles
+
+    async def permissions(
+        self, guild: discord.Guild, member: discord.Member
+    ) -> MemberPermissions:
+        role_ids = frozenset(role.id for role in member.roles)
+        key = (member.id, role_ids)
+        permissions = self._members.get(guild.id, key)
+        if permissions is None:
+            permissions = compute_member_permissions(
+                await self.guild_roles(guild.id), member, role_ids
+            )
+            self._members.set(guild.id, key, permissions)
+        return permissions
+
+    def settings_changed(self, guild_id: int):
+        self._guild_roles.pop(guild_id, "roles")
+        self._members.clear_namespace(guild_id)
+        self.invalidate(guild_id)
+
+    def get_cached(self, guild_id: int, user_id: int) -> int | None:
+        return self._levels.get(guild_id, user_id)
+
+    def store(self, guild_id: int, user_id: int, level: int):
+        self._levels.set(guild_id, user_id, level)
+
+    def invalidate(self, guild_id: int, user_id: int | None = None):
+        if user_id is not None:
+            self._levels.pop(guild_id, user_id)
+        else:
+            self._levels.clear_namespace(guild_id)
+
+    async def _get_or_fetch_member(
+        self, guild: discord.Guild, user_id: int, semaphore: asyncio.Semaphore
+    ) -> discord.Member | None:
+        if (member := guild.get_member(user_id)) is not None:
+            return member
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(guild.fetch_member(user_id), timeout=10.0)
+            except (discord.HTTPException, asyncio.TimeoutError):
+                return None
+
+    async def resolve_many(
+        self, user_id: int, guilds: list[discord.Guild]
+    ) -> dict[int, int]:
+        """
+        Returns a mapping of guild ID to permission level for `user_id`.
+        Guilds the user isn't a member of are left out.
+        """
+        levels = {}
+        pending = []
+        for guild in guilds:
+            if (level := self.get_cached(guild.id, user_id)) is not None:
+                levels[guild.id] = level
+            else:
+                pending.append(guild)
+
+        if not pending:
+            return levels
+
+        roles = {
+            guild.id: cached
+            for guild in pending
+            if (cached := self._guild_roles.get(guild.id, "roles")) is not None
+        }
+        async for document in self.bot.settings.db.find(
+            {"_id": {"$in": [guild.id for guild in pending if guild.id not in roles]}},
+            {"staff_management": 1},
+        ):
+            roles[document["_id"]] = GuildRoles.from_settings(document)
+            self._guild_roles.set(document["_id"], "roles", roles[document["_id"]])
+
+        semaphore = asyncio.Semaphore(3)
+        members = await asyncio.gather(
+            *[
+                self._get_or_fetch_member(guild, user_id, semaphore)
+                for guild in pending
+            ]
+        )
+        for guild, member in zip(pending, members):
+            if member is None:
+                continue
+            level = compute_member_permissions(
+                roles.get(guild.id) or GuildRoles.from_settings(None), member
+            ).level
+            self.store(guild.id, user_id, level)
+            levels[guild.id] = level
+        return levels
@@ -9,6 +9,7 @@ import aiohttp
 from decouple import config
 from bson import ObjectId
 from utils.basedataclass import BaseDataClass
+from utils.metrics import http_trace
 from datamodels.ServerKeys import ServerKey
 
 
@@ -110,7 +111,7 @@ class ServerLinkNotFound(commands.CheckFailure):
 class PRCApiClient:
     def __init__(self, bot, base_url: str, api_key: str):
         self.bot = bot
-        self.session = aiohttp.ClientSession()
+        self.session = aiohttp.ClientSession(trace_configs=[http_trace("prc")])
         self.api_key = api_key
         self.base_url = base_url
 
@@ -159,8 +160,14 @@ class PRCApiClient:
             #         "ServerKey": internal_server_key,
             #         "ProhibitedUntil": 9999999999
             #     })
+            if response.status in {401, 403}:
+                self.bot.guild_breaker.record_failure(guild_id, f"PRC {response.status}")
+            elif response.status < 400:
+                self.bot.guild_breaker.record_success(guild_id)
             if response.status in {429, 502}:
                 if max_retries <= 0:
+                    if response.status == 502:
+                        self.bot.guild_breaker.record_failure(guild_id, "PRC 502")
                     raise ResponseFailure(
                         status_code=response.status,
                         json_data={"error": "Max retries exceeded"},
@@ -0,0 +1,107 @@
+import math
+import time
+from collections import OrderedDict
+
+
+class RateLimitExceeded(Exception):
+    def __init__(self, retry_after: int):
+        self.retry_after = retry_after
+        super().__init__(f"Rate limit exceeded, retry after {retry_after} seconds")
+
+
+class _WindowState:
+    # A sliding window counter only needs the current and previous
+    # fixed window counts, so each key is a constant size no matter
+    # how many requests it has made.
+    __slots__ = ("window", "current", "previous", "last_seen")
+
+    def __init__(self, window: int, now: float):
+        self.window = window
+        self.current = 0
+        self.previous = 0
+        self.last_seen = now
+
+
+class SlidingWindowRateLimiter:
+    """
+    Approximate sliding window rate limiter with idle key eviction.
+
+    Quotas are configured per route as ``(max_requests, window_seconds)``.
+    Keys that have been idle for longer than two windows carry no state
+    worth keeping, so they are dropped as new requests come in.
+    """
+
+    def __init__(
+        self,
+        default_quota: tuple[int, int] = (50, 60),
+        route_quotas: dict[str, tuple[int, int]] | None = None,
+        max_keys: int = 100_000,
+    ):
+        self.default_quota = default_quota
+        self.route_quotas = route_quotas or {}
+        self.max_keys = max_keys
+        self._states: OrderedDict[tuple[str, str], _WindowState] = OrderedDict()
+
+    def get_quota(self, route: str) -> tuple[int, int]:
+        return self.route_quotas.get(route, self.default_quota)
+
+    def __len__(self):
+        return len(self._states)
+
+    def _evict(self, now: float):
+        # Keys are kept in least-recently-seen order, so we only ever
+        # have to look at the front of the dict.
+        while self._states:
+            (route, _), state = next(iter(self._states.items()))
+            _, period = self.get_quota(route)
+            if now - state.last_seen < period * 2 and len(self._states) <= self.max_keys:
+                break
+            self._states.popitem(last=False)
+
+    def hit(self, route: str, identifier: str | int, now: float | None = None) -> int:
+        """
+        Registers a request for ``identifier`` on ``route``.
+        Returns the amount of requests remaining in the window, or raises
+        ``RateLimitExceeded`` with the number of seconds to wait.
+        """
+        now = time.time() if now is None else now
+        limit, period = self.get_quota(route)
+        key = (route, str(identifier))
+        window = int(now // period)
+
+        state = self._states.get(key)
+        if state is None:
+            state = _WindowState(window, now)
+            self._states[key] = state
+        else:
+            self._states.move_to_end(key)
+            if window != state.window:
+                state.previous = state.current if window == state.window + 1 else 0
+                state.current = 0
+                state.window = window
+        state.last_seen = now
+
+        elapsed = now - window * period
+        weight = 1 - (elapsed / period)
+        estimate = state.previous * weight + state.current
+
+        if estimate + 1 > limit:
+            if state.current + 1 > limit:
+                # Wait for the window to roll over, then for this window's
+                # count to decay as the new previous window.
+                retry_after = (period - elapsed) + period * (
+                    1 - (limit - 1) / state.current
+                )
+            elif state.previous == 0:
+                retry_after = period - elapsed
+            else:
+                # Time until the previous window's weight has decayed enough
+                # for one more request to fit.
+                required = period * (1 - (limit - 1 - state.current) / state.previous)
+                retry_after = max(required - elapsed, 0)
+            self._evict(now)
+            raise RateLimitExceeded(max(1, math.ceil(retry_after)))
+
+        state.current += 1
+        self._evict(now)
+        return max(0, int(limit - estimate - 1))
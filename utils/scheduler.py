@@ -0,0 +1,138 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+import typing
+
+logger = logging.getLogger(__name__)
+
+# loader(bot) -> {key: due timestamp}, handler(bot, key) -> next due timestamp or None
+Loader = typing.Callable[[typing.Any], typing.Awaitable[dict]]
+Handler = typing.Callable[[typing.Any, typing.Any], typing.Awaitable[float | None]]
+
+
+class DeadlineScheduler:
+    """
+    Fires jobs at their due time from a single heap of deadlines.
+
+    Each job kind registers a loader, which returns the due time of every
+    pending job of that kind, and a handler which runs a job once it is due.
+    Handlers re-read whatever they act on, and return the job's next due
+    time if it should run again (or is no longer due), or None when it's
+    finished. Jobs are (re)scheduled by whoever creates or edits them, and
+    every loader runs again every `resync_interval` seconds to pick up
+    writes which bypassed that.
+    """
+
+    def __init__(self, bot, resync_interval: int = 300, concurrency: int = 10):
+        self.bot = bot
+        self.resync_interval = resync_interval
+        self._loaders: dict[str, Loader] = {}
+        self._handlers: dict[str, Handler] = {}
+        self._heap: list[tuple[float, int, str, typing.Any]] = []
+        self._due: dict[tuple[str, typing.Any], float] = {}
+        self._running: set[tuple[str, typing.Any]] = set()
+        self._rerun: dict[tuple[str, typing.Any], float] = {}
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._tasks: list[asyncio.Task] = []
+
+        self.fired = 0
+        self.failed = 0
+        self.last_fire_lag: float = 0
+
+    def register(self, kind: str, loader: Loader, handler: Handler):
+        self._loaders[kind] = loader
+        self._handlers[kind] = handler
+
+    def __len__(self):
+        return len(self._due)
+
+    def schedule(self, kind: str, key, due: float):
+        """
+        Schedules (or reschedules) a job. Safe to call before `start`.
+        """
+        if kind not in self._handlers:
+            raise ValueError(f"Unknown job kind: {kind}")
+        self._due[(kind, key)] = due
+        heapq.heappush(self._heap, (due, next(self._counter), kind, key))
+        if self._heap[0][2:] == (kind, key):
+            self._wakeup.set()
+
+    def cancel(self, kind: str, key):
+        self._due.pop((kind, key), None)
+
+    async def start(self):
+        if self._tasks:
+            return
+        await self.resync()
+        self._tasks = [
+            asyncio.create_task(self._run()),
+            asyncio.create_task(self._resync_loop()),
+        ]
+
+    def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+
+    async def resync(self):
+        for kind, loader in self._loaders.items():
+            try:
+                jobs = await loader(self.bot)
+            except Exception as e:
+                logger.warning(f"Failed to load {kind} jobs: {e}")
+                continue
+            for key, due in jobs.items():
+                if self._due.get((kind, key)) != due:
+                    self.schedule(kind, key, due)
+
+    async def _resync_loop(self):
+        while True:
+            await asyncio.sleep(self.resync_interval)
+            await self.resync()
+
+    async def _run(self):
+        while True:
+            self._wakeup.clear()
+            while self._heap:
+                due, _, kind, key = self._heap[0]
+                if self._due.get((kind, key)) != due:
+                    heapq.heappop(self._heap)  # rescheduled or cancelled since
+                    continue
+                if due > time.time():
+                    break
+                heapq.heappop(self._heap)
+                del self._due[(kind, key)]
+                if (kind, key) in self._running:
+                    self._rerun[(kind, key)] = due
+                    continue
+                self._running.add((kind, key))
+                asyncio.create_task(self._fire(kind, key, due))
+
+            timeout = self._heap[0][0] - time.time() if self._heap else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _fire(self, kind: str, key, due: float):
+        try:
+            async with self._semaphore:
+                self.last_fire_lag = max(0.0, time.time() - due)
+                next_due = await self._handlers[kind](self.bot, key)
+            self.fired += 1
+        except Exception as e:
+            self.failed += 1
+            logger.warning(f"{kind} job {key} failed: {e}")
+            next_due = None
+        finally:
+            self._running.discard((kind, key))
+
+        # A job that was rescheduled while it ran keeps its new due time.
+        if (kind, key) in self._rerun:
+            self.schedule(kind, key, self._rerun.pop((kind, key)))
+        elif next_due is not None and (kind, key) not in self._due:
+            self.schedule(kind, key, next_due)
@@ -0,0 +1,115 @@
+import asyncio
+import logging
+import random
+import time
+import typing
+
+from discord.ext import tasks
+
+from utils import metrics
+from utils.basedataclass import BaseDataClass
+
+logger = logging.getLogger(__name__)
+
+GATEWAY = "gateway"
+GUILD_CACHE = "guild_cache"
+DATABASE = "database"
+LINKED_GUILDS = "linked_guilds"
+
+
+class StartupItem(BaseDataClass):
+    name: str
+    start: typing.Callable[[], typing.Any]
+    requires: tuple[str, ...]
+    interval: float
+
+
+class StartupOrchestrator:
+    """
+    Starts background loops as soon as what they depend on is ready.
+
+    Each loop declares its prerequisites, and waits for them plus a random
+    offset within its own interval (capped at `max_offset` seconds) so that
+    loops sharing an interval don't all fire at once. The time from boot
+    to each loop's first run is kept in `time_to_first_run`.
+    """
+
+    def __init__(self, bot, max_offset: float = 90, chunk_timeout: float = 300):
+        self.bot = bot
+        self.max_offset = max_offset
+        self.chunk_timeout = chunk_timeout
+        self.started_at = getattr(bot, "start_time", None) or time.time()
+        self.items: list[StartupItem] = []
+        self.time_to_first_run: dict[str, float] = {}
+        self._prerequisites: dict[str, asyncio.Task] = {}
+
+    def add_loop(self, name: str, loop: tasks.Loop, *requires: str, **kwargs):
+        interval = (loop.hours or 0) * 3600 + (loop.minutes or 0) * 60 + (loop.seconds or 0)
+        loop.coro = metrics.timed_loop(name, loop.coro)
+        self.add(name, lambda: loop.start(self.bot, **kwargs), *requires, interval=interval)
+
+    def add(
+        self,
+        name: str,
+        start: typing.Callable[[], typing.Any],
+        *requires: str,
+        interval: float = 0,
+    ):
+        self.items.append(
+            StartupItem(name=name, start=start, requires=requires, interval=interval)
+        )
+
+    async def _gateway(self):
+        await self.bot.wait_until_ready()
+
+    async def _guild_cache(self):
+        await self.prerequisite(GATEWAY)
+        deadline = time.time() + self.chunk_timeout
+        while time.time() < deadline:
+            if all(guild.chunked for guild in self.bot.guilds):
+                return
+            await asyncio.sleep(5)
+        logger.warning(
+            f"Guild cache still not chunked after {self.chunk_timeout}s, starting anyway"
+        )
+
+    async def _database(self):
+        await self.bot.db.command("ping")
+
+    async def _linked_guilds(self):
+        await self.bot.linked_guilds.ready.wait()
+
+    def prerequisite(self, name: str) -> asyncio.Task:
+        if name not in self._prerequisites:
+            waiter = {
+                GATEWAY: self._gateway,
+                GUILD_CACHE: self._guild_cache,
+                DATABASE: self._database,
+                LINKED_GUILDS: self._linked_guilds,
+            }[name]
+            self._prerequisites[name] = asyncio.create_task(waiter())
+        return self._prerequisites[name]
+
+    async def _start(self, item: StartupItem):
+        try:
+            await asyncio.gather(*[self.prerequisite(name) for name in item.requires])
+        except Exception as e:
+            logger.error(f"Prerequisite for {item.name} failed, starting anyway: {e}")
+        if item.interval:
+            await asyncio.sleep(random.uniform(0, min(item.interval, self.max_offset)))
+
+        try:
+            result = item.start()
+            if asyncio.iscoroutine(result):
+                await result
+        except Exception as e:
+            logger.error(f"Failed to start {item.name}: {e}")
+            return
+        self.time_to_first_run[item.name] = time.time() - self.started_at
+        logger.info(
+            f"Started {item.name} {self.time_to_first_run[item.name]:.1f}s after boot"
+        )
+
+    async def run(self):
+        await asyncio.gather(*[self._start(item) for item in self.items])
+        logger.info("All tasks are now running!")
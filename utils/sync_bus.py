@@ -0,0 +1,264 @@
+import asyncio
+import logging
+import time
+
+import aiohttp
+from bson import ObjectId
+from decouple import config
+from pymongo.errors import PyMongoError
+
+from utils.basedataclass import BaseDataClass
+from utils.mongo import Document
+
+logger = logging.getLogger(__name__)
+
+
+class SyncEvent(BaseDataClass):
+    """
+    A data model change the ERM API and the panel need to hear about.
+
+    `kind` is one of the keys of `SYNC_ROUTES`, and `params` holds whatever
+    that route needs to build its URLs (document IDs, user IDs).
+    """
+
+    id: str
+    kind: str
+    guild_id: int
+    params: dict
+    created_at: float
+
+    def __init__(self, kind: str, guild_id: int, **params):
+        super().__init__(
+            id=str(ObjectId()),
+            kind=kind,
+            guild_id=guild_id,
+            params=params,
+            created_at=time.time(),
+        )
+
+
+class SyncDelivery(BaseDataClass):
+    event: SyncEvent
+    target: str
+    attempts: int
+
+
+# event kind -> target -> (method, path template, auth header, auth config key)
+SYNC_ROUTES = {
+    "SyncStartShift": {
+        "base": ("GET", "/Internal/SyncStartShift/{shift_id}", "Authorization", "INTERNAL_API_AUTH"),
+        "panel": ("POST", "/{guild_id}/SyncStartShift?ID={shift_id}", "X-Static-Token", "PANEL_STATIC_AUTH"),
+    },
+    "SyncEndShift": {
+        "base": ("GET", "/Internal/SyncEndShift/{user_id}/{guild_id}", "Authorization", "INTERNAL_API_AUTH"),
+        "panel": ("DELETE", "/{guild_id}/SyncEndShift?ID={shift_id}", "X-Static-Token", "PANEL_STATIC_AUTH"),
+    },
+    "SyncCreatePunishment": {
+        "base": ("GET", "/Internal/SyncCreatePunishment/{punishment_id}", "Authorization", "INTERNAL_API_AUTH"),
+        "panel": ("GET", "/{guild_id}/SyncCreatePunishment?ID={punishment_id}", "Authorization", "INTERNAL_API_AUTH"),
+    },
+    "SyncDeletePunishment": {
+        "base": ("GET", "/Internal/SyncDeletePunishment/{punishment_id}", "Authorization", "INTERNAL_API_AUTH"),
+        "panel": ("GET", "/{guild_id}/SyncDeletePunishment?ID={snowflake}", "Authorization", "INTERNAL_API_AUTH"),
+    },
+    "SyncPermissionLevel": {
+        "base": ("GET", "/Auth/UpdatePermissionCache/{user_id}/{guild_id}/{level}", "Authorization", "INTERNAL_API_AUTH"),
+        "panel": ("POST", "/Internal/UpdatePermissionsCache/{guild_id}/{user_id}/{level}", "Authorization", "INTERNAL_API_AUTH"),
+    },
+}
+
+
+class SyncBus:
+    """
+    Delivers `SyncEvent`s to BASE_API_URL and PANEL_API_URL in the background.
+
+    Publishing never waits on HTTP: events go onto an in-process queue, or
+    into the `sync_outbox` collection when the queue is full. Workers drain
+    the queue in small batches, send them concurrently over one pooled
+    session and retry with exponential backoff. Retries are put back onto
+    the queue once their backoff passes, so a failing target never holds up
+    a worker. Deliveries which keep failing are parked in the outbox and
+    retried later rather than dropped.
+    """
+
+    def __init__(
+        self,
+        bot,
+        workers: int = 4,
+        batch_size: int = 10,
+        max_queue: int = 5000,
+        max_attempts: int = 4,
+    ):
+        self.bot = bot
+        self.outbox = Document(bot.db, "sync_outbox")
+        self.targets = {
+            target: url.rstrip("/")
+            for target, url in (
+                ("base", config("BASE_API_URL", default="")),
+                ("panel", config("PANEL_API_URL", default="")),
+            )
+            if url
+        }
+        self.worker_count = workers
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.queue: asyncio.Queue[SyncDelivery] = asyncio.Queue(maxsize=max_queue)
+        self.session: aiohttp.ClientSession | None = None
+        self._tasks: list[asyncio.Task] = []
+        # (event ID, target) => the timer requeueing a delivery, and the delivery.
+        self._retrying: dict[tuple[str, str], tuple[asyncio.TimerHandle, SyncDelivery]] = {}
+        self._spilling: set[asyncio.Task] = set()
+
+        self.delivered = 0
+        self.failed = 0
+        self.retried = 0
+        self.spilled = 0
+        self.last_delivery_lag: float = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return self.queue.qsize()
+
+    def start(self):
+        if self._tasks:
+            return
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=self.batch_size),
+            timeout=aiohttp.ClientTimeout(total=15),
+        )
+        self.bot.external_http_sessions.append(self.session)
+        self._tasks = [
+            asyncio.create_task(self._worker()) for _ in range(self.worker_count)
+        ]
+        self._tasks.append(asyncio.create_task(self._replay_outbox()))
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        pending = []
+        for handle, delivery in self._retrying.values():
+            handle.cancel()
+            pending.append(delivery)
+        self._retrying.clear()
+        while not self.queue.empty():
+            pending.append(self.queue.get_nowait())
+        for delivery in pending:
+            await self._spill(delivery)
+
+    async def publish(self, event: SyncEvent):
+        if event.kind not in SYNC_ROUTES:
+            raise ValueError(f"Unknown sync event: {event.kind}")
+        for target in self.targets:
+            delivery = SyncDelivery(event=event, target=target, attempts=0)
+            try:
+                self.queue.put_nowait(delivery)
+            except asyncio.QueueFull:
+                await self._spill(delivery)
+
+    async def _spill(self, delivery: SyncDelivery, delay: int = 0):
+        self.spilled += 1
+        try:
+            await self.outbox.insert(
+                {
+                    "_id": ObjectId(),
+                    "EventID": delivery.event.id,
+                    "Kind": delivery.event.kind,
+                    "Guild": delivery.event.guild_id,
+                    "Params": delivery.event.params,
+                    "Target": delivery.target,
+                    "Attempts": delivery.attempts,
+                    "CreatedAt": delivery.event.created_at,
+                    "NextAttempt": int(time.time()) + delay,
+                }
+            )
+        except PyMongoError as e:
+            logger.error(f"Failed to spill sync delivery {delivery.event.id}: {e}")
+
+    def _retry_later(self, delivery: SyncDelivery, delay: float):
+        key = (delivery.event.id, delivery.target)
+        handle = asyncio.get_running_loop().call_later(delay, self._requeue, delivery)
+        self._retrying[key] = (handle, delivery)
+
+    def _requeue(self, delivery: SyncDelivery):
+        self._retrying.pop((delivery.event.id, delivery.target), None)
+        try:
+            self.queue.put_nowait(delivery)
+        except asyncio.QueueFull:
+            task = asyncio.create_task(self._spill(delivery))
+            self._spilling.add(task)
+            task.add_done_callback(self._spilling.discard)
+
+    async def _replay_outbox(self):
+        while True:
+            await asyncio.sleep(60)
+            try:
+                async for document in self.outbox.db.find(
+                    {"NextAttempt": {"$lte": int(time.time())}}
+                ).limit(self.queue.maxsize // 2):
+                    if self.queue.full():
+                        break
+                    event = SyncEvent(document["Kind"], document["Guild"], **document["Params"])
+                    event.id = document["EventID"]
+                    event.created_at = document["CreatedAt"]
+                    self.queue.put_nowait(
+                        SyncDelivery(
+                            event=event,
+                            target=document["Target"],
+                            attempts=document["Attempts"],
+                        )
+                    )
+                    await self.outbox.db.delete_one({"_id": document["_id"]})
+            except PyMongoError as e:
+                logger.warning(f"Failed to replay sync outbox: {e}")
+
+    async def _worker(self):
+        while True:
+            batch = [await self.queue.get()]
+            while len(batch) < self.batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            await asyncio.gather(*[self._deliver(delivery) for delivery in batch])
+
+    async def _deliver(self, delivery: SyncDelivery):
+        event = delivery.event
+        base_url = self.targets.get(delivery.target)
+        if base_url is None:
+            return  # target was unconfigured since the delivery was spilled
+        method, path, auth_header, auth_key = SYNC_ROUTES[event.kind][delivery.target]
+        url = base_url + path.format(guild_id=event.guild_id, **event.params)
+        headers = {
+            auth_header: config(auth_key, default=""),
+            "Idempotency-Key": f"{event.id}:{delivery.target}",
+        }
+
+        delivery.attempts += 1
+        try:
+            async with self.session.request(
+                method, url, headers=headers, raise_for_status=True
+            ):
+                pass
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            status = getattr(e, "status", None)
+            permanent = status is not None and 400 <= status < 500 and status != 429
+            if permanent:
+                self.failed += 1
+                logger.error(f"{event.kind} sync to {delivery.target} rejected: {e}")
+                return
+            if delivery.attempts >= self.max_attempts:
+                self.failed += 1
+                if time.time() - event.created_at > 86400:
+                    logger.error(
+                        f"Dropping {event.kind} sync to {delivery.target} after a day of failures: {e}"
+                    )
+                    return
+                logger.warning(
+                    f"{event.kind} sync to {delivery.target} failed after {delivery.attempts} attempts, parking: {e}"
+                )
+                await self._spill(delivery, delay=300)
+                return
+            self.retried += 1
+            self._retry_later(delivery, 2 ** delivery.attempts)
+            return
+
+        self.delivered += 1
+        self.last_delivery_lag = time.time() - event.created_at
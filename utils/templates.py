@@ -0,0 +1,224 @@
+import datetime
+import functools
+import logging
+import re
+import typing
+
+import discord
+
+from utils import prc_api
+from utils.prc_api import Player, ServerStatus
+
+logger = logging.getLogger(__name__)
+
+CONTEXT = "context"
+PREFIX = "prefix"
+SHIFTS = "shifts"
+ERLC = "erlc"
+
+# Every variable a template can use, and the data source it comes from.
+TEMPLATE_VARIABLES = {
+    "user": CONTEXT,
+    "username": CONTEXT,
+    "display_name": CONTEXT,
+    "time": CONTEXT,
+    "server": CONTEXT,
+    "channel": CONTEXT,
+    "prefix": PREFIX,
+    "onduty": SHIFTS,
+    "join_code": ERLC,
+    "players": ERLC,
+    "max_players": ERLC,
+    "queue": ERLC,
+    "staff": ERLC,
+    "admins": ERLC,
+    "mods": ERLC,
+}
+
+_VARIABLE_PATTERN = re.compile(r"\{(\w+)\}")
+
+
+class CompiledTemplate(typing.NamedTuple):
+    # Literal text at even indexes, variable names at odd indexes.
+    tokens: tuple[str, ...]
+    variables: frozenset[str]
+
+    def render(self, values: dict) -> str:
+        return "".join(
+            token
+            if index % 2 == 0
+            else str(values[token]) if token in values else "{%s}" % token
+            for index, token in enumerate(self.tokens)
+        )
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_template(template: str) -> CompiledTemplate:
+    tokens = []
+    position = 0
+    for match in _VARIABLE_PATTERN.finditer(template):
+        if match.group(1) not in TEMPLATE_VARIABLES:
+            continue
+        tokens.append(template[position : match.start()])
+        tokens.append(match.group(1))
+        position = match.end()
+    tokens.append(template[position:])
+    return CompiledTemplate(tuple(tokens), frozenset(tokens[1::2]))
+
+
+def erlc_data(status: ServerStatus, queue: int, players: list[Player]) -> dict:
+    """
+    The ER:LC variables, in the shape they're kept in Integration Command
+    Storage.
+    """
+    return {
+        "join_code": status.join_key,
+        "players": status.current_players,
+        "max_players": status.max_players,
+        "queue": queue,
+        "staff": len([i for i in players if i.permission != "Normal"]),
+        "admins": len([i for i in players if i.permission == "Server Administrator"]),
+        "mods": len([i for i in players if i.permission == "Server Moderator"]),
+    }
+
+
+class TemplateRenderer:
+    """
+    Renders custom command templates for one message.
+
+    Templates are compiled once and cached, so only the data sources which
+    the templates actually use are loaded, each at most once per renderer.
+    Use one renderer for the content and every embed of a message.
+    """
+
+    def __init__(self, bot, ctx, channel, values: dict | None = None):
+        self.bot = bot
+        self.ctx = ctx
+        self.channel = channel
+        self.values = dict(values or {})
+        self._loaded: set[str] = set()
+        self._has_server_key: bool | None = None
+        # ICS entries already updated with this renderer's data.
+        self.stored_ics: set[int] = set()
+
+    async def _load_context(self):
+        self.values.update(
+            user=self.ctx.author.mention,
+            username=self.ctx.author.name,
+            display_name=self.ctx.author.display_name,
+            time=f"<t:{int(datetime.datetime.now().timestamp())}>",
+            server=self.ctx.guild.name,
+            channel=self.channel.mention,
+        )
+
+    async def _load_prefix(self):
+        from utils.utils import get_prefix
+
+        self.values["prefix"] = list(await get_prefix(self.bot, self.ctx))[-1]
+
+    async def _load_shifts(self):
+        self.values["onduty"] = await self.bot.shift_management.shifts.db.count_documents(
+            {"Guild": self.ctx.guild.id, "EndEpoch": 0}
+        )
+
+    async def has_server_key(self) -> bool:
+        if self._has_server_key is None:
+            self._has_server_key = bool(
+                await self.bot.server_keys.db.count_documents({"_id": self.ctx.guild.id})
+            )
+        return self._has_server_key
+
+    async def _load_erlc(self):
+        if not await self.has_server_key():
+            return
+        try:
+            status = await self.bot.prc_api.get_server_status(self.ctx.guild.id)
+        except prc_api.ResponseFailure:
+            return
+        if not isinstance(status, ServerStatus):
+            return  # Invalid key
+        try:
+            queue: int = await self.bot.prc_api.get_server_queue(
+                self.ctx.guild.id, minimal=True
+            )
+            players: list[Player] = await self.bot.prc_api.get_server_players(
+                self.ctx.guild.id
+            )
+        except prc_api.ResponseFailure:
+            return
+        self.values.update(erlc_data(status, queue, players))
+
+    async def load(self, variables: typing.Iterable[str]):
+        loaders = {
+            CONTEXT: self._load_context,
+            PREFIX: self._load_prefix,
+            SHIFTS: self._load_shifts,
+            ERLC: self._load_erlc,
+        }
+        for source in {TEMPLATE_VARIABLES[i] for i in variables if i not in self.values}:
+            if source in self._loaded:
+                continue
+            self._loaded.add(source)
+            try:
+                await loaders[source]()
+            except Exception as e:
+                logger.warning(f"Failed to load template source {source}: {e}")
+
+    async def erlc(self) -> dict | None:
+        """
+        The guild's ER:LC variables, or None if the server can't be reached.
+        """
+        await self.load(["join_code"])
+        if "join_code" not in self.values:
+            return None
+        return {
+            key: self.values[key]
+            for key, source in TEMPLATE_VARIABLES.items()
+            if source == ERLC
+        }
+
+    async def render(self, template: str | None) -> str | None:
+        if not template:
+            return template
+        compiled = compile_template(template)
+        await self.load(compiled.variables)
+        return compiled.render(self.values)
+
+    async def render_embed(self, embed: dict) -> discord.Embed:
+        embed = discord.Embed.from_dict(embed)
+        compiled = [
+            compile_template(text)
+            for text in [
+                embed.title,
+                embed.author.name,
+                embed.description,
+                embed.footer.text,
+                *[text for field in embed.fields for text in (field.name, field.value)],
+            ]
+            if text
+        ]
+        await self.load(set().union(*[i.variables for i in compiled]))
+
+        if embed.title:
+            embed.title = await self.render(embed.title)
+        if embed.author.name:
+            embed.set_author(
+                name=await self.render(embed.author.name),
+                url=embed.author.url,
+                icon_url=embed.author.icon_url,
+            )
+        if embed.description:
+            embed.description = await self.render(embed.description)
+        if embed.footer.text:
+            embed.set_footer(
+                text=await self.render(embed.footer.text),
+                icon_url=embed.footer.icon_url,
+            )
+        for index, field in enumerate(embed.fields):
+            embed.set_field_at(
+                index,
+                name=await self.render(field.name),
+                value=await self.render(field.value),
+                inline=field.inline,
+            )
+        return embed
@@ -0,0 +1,196 @@
+import asyncio
+import collections
+import datetime
+import logging
+import time
+import typing
+
+from pymongo import DeleteOne, UpdateOne
+from pymongo.errors import PyMongoError
+
+logger = logging.getLogger(__name__)
+
+MISSING = object()
+
+# Every store by name, for reporting their sizes and evictions.
+stores: dict[str, "TTLStore"] = {}
+
+
+class TTLStore:
+    """
+    A bounded cache whose entries expire `ttl` seconds after they were
+    last written.
+
+    Keys live in namespaces (usually a guild ID), and once the store holds
+    `max_entries` the least recently used entries are evicted, so it stays
+    flat however long the process runs. Expired entries are dropped when
+    they're read, and from the least recently used end when the store
+    fills up.
+    """
+
+    def __init__(self, name: str, ttl: float, max_entries: int = 10_000):
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: collections.OrderedDict[tuple, tuple[typing.Any, float]] = (
+            collections.OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        stores[name] = self
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, namespace, key, default=None):
+        entry = self._entries.get((namespace, key))
+        if entry is None:
+            self.misses += 1
+            return default
+        value, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[(namespace, key)]
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self._entries.move_to_end((namespace, key))
+        self.hits += 1
+        return value
+
+    def set(self, namespace, key, value, expires_at: float | None = None):
+        self._entries[(namespace, key)] = (
+            value,
+            expires_at if expires_at is not None else time.time() + self.ttl,
+        )
+        self._entries.move_to_end((namespace, key))
+        self._evict()
+
+    def pop(self, namespace, key, default=None):
+        entry = self._entries.pop((namespace, key), None)
+        return default if entry is None else entry[0]
+
+    def clear_namespace(self, namespace):
+        for entry_key in [k for k in self._entries if k[0] == namespace]:
+            del self._entries[entry_key]
+
+    def _evict(self):
+        now = time.time()
+        while len(self._entries) > self.max_entries:
+            _, (_, expires_at) = self._entries.popitem(last=False)
+            if expires_at <= now:
+                self.expirations += 1
+            else:
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+class CounterStore(TTLStore):
+    """
+    Counts repeated events (such as warnings sent to a player) within a
+    decay window: a count resets once `window` seconds pass without it
+    being incremented.
+
+    With a `collection`, counts are loaded back from MongoDB the first time
+    the store is used, so they survive restarts. Changes are only made in
+    memory until `flush` writes them all in one bulk write, which sweeps
+    call once they're done. A TTL index on the collection removes the
+    counts which have decayed.
+    """
+
+    def __init__(self, name: str, window: float, max_entries: int = 50_000, collection=None):
+        super().__init__(name, window, max_entries)
+        self.collection = collection
+        self._loaded = collection is None
+        self._load_lock = asyncio.Lock()
+        self._dirty: set[tuple] = set()
+
+    async def _ensure_loaded(self):
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+            try:
+                await self.collection.create_index("expires_at", expireAfterSeconds=0)
+                async for doc in self.collection.find(
+                    {
+                        "store": self.name,
+                        "expires_at": {"$gt": datetime.datetime.now(tz=datetime.timezone.utc)},
+                    }
+                ):
+                    self.set(
+                        doc["namespace"],
+                        doc["key"],
+                        doc["count"],
+                        expires_at=doc["expires_at"]
+                        .replace(tzinfo=datetime.timezone.utc)
+                        .timestamp(),
+                    )
+            except Exception as e:
+                logger.warning(f"Failed to load {self.name} counters: {e}")
+            self._loaded = True
+
+    def _document_id(self, namespace, key) -> str:
+        return f"{self.name}:{namespace}:{key}"
+
+    async def incr(self, namespace, key, amount: int = 1) -> int:
+        await self._ensure_loaded()
+        count = self.get(namespace, key, 0) + amount
+        self.set(namespace, key, count)
+        if self.collection is not None:
+            self._dirty.add((namespace, key))
+        return count
+
+    async def reset(self, namespace, key):
+        await self._ensure_loaded()
+        self.pop(namespace, key)
+        if self.collection is not None:
+            self._dirty.add((namespace, key))
+
+    async def flush(self):
+        """Writes the counts changed since the last flush."""
+        if not self._dirty:
+            return
+        dirty, self._dirty = self._dirty, set()
+        operations = []
+        for namespace, key in dirty:
+            document_id = self._document_id(namespace, key)
+            entry = self._entries.get((namespace, key))
+            if entry is None:
+                operations.append(DeleteOne({"_id": document_id}))
+                continue
+            count, expires_at = entry
+            operations.append(
+                UpdateOne(
+                    {"_id": document_id},
+                    {
+                        "$set": {
+                            "store": self.name,
+                            "namespace": namespace,
+                            "key": key,
+                            "count": count,
+                            "expires_at": datetime.datetime.fromtimestamp(
+                                expires_at, tz=datetime.timezone.utc
+                            ),
+                        }
+                    },
+                    upsert=True,
+                )
+            )
+        try:
+            await self.collection.bulk_write(operations, ordered=False)
+        except PyMongoError as e:
+            # Kept for the next flush, unless changed again by then.
+            logger.warning(f"Failed to save {self.name} counters: {e}")
+            self._dirty |= dirty
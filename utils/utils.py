@@ -1,8 +1,6 @@
 import asyncio
-import base64
 import datetime
 import logging
-import re
 import typing
 
 import aiohttp
@@ -13,13 +11,13 @@ from decouple import config
 import roblox.users
 from discord import Embed, InteractionResponse, Webhook
 from discord.ext import commands
-from fuzzywuzzy import fuzz
 from snowflake import SnowflakeGenerator
 from zuid import ZUID
 
-import utils.prc_api as prc_api
 from utils.constants import BLANK_COLOR, RED_COLOR
-from utils.prc_api import ServerStatus, Player
+from utils.metrics import http_trace
+from utils.prc_api import ServerStatus
+from utils.templates import TemplateRenderer
 
 
 class ArgumentMockingInstance:
@@ -81,19 +79,22 @@ async def generalised_interaction_check_failure(
 
 
 async def has_whitelabel(bot, guild_id: int) -> bool:
-    if (item := await bot.whitelabel.db.find_one({"GuildID": str(guild_id)})) is not None and config("ENVIRONMENT") not in ["ALPHA", "DEVELOPMENT"]:
-        guild = bot.get_guild(guild_id)
-        token = item.get("Token")
-        b64_userid = token.split(".")[0]
-        user_id = base64.b64decode(b64_userid + "==").decode("utf-8")
-        member = guild.get_member(int(user_id))
-        if not member:
-            try:
-                member = await guild.fetch_member(int(user_id))
-            except discord.NotFound:
-                return False
-        return True
-    return False
+    if config("ENVIRONMENT") in ["ALPHA", "DEVELOPMENT"]:
+        return False
+    if guild_id not in bot.whitelabel_cache:
+        return False
+
+    user_id = bot.whitelabel_cache.get_bot_id(guild_id)
+    guild = bot.get_guild(guild_id)
+    if user_id is None or guild is None:
+        return False
+    member = guild.get_member(user_id)
+    if not member:
+        try:
+            member = await guild.fetch_member(user_id)
+        except discord.NotFound:
+            return False
+    return True
 
 async def get_roblox_by_username(user: str, bot, ctx: commands.Context):
     if "<@" in user:
@@ -120,59 +121,11 @@ async def get_roblox_by_username(user: str, bot, ctx: commands.Context):
 
 
 async def staff_check(bot_obj, guild, member):
-    guild_settings = await bot_obj.settings.find_by_id(guild.id)
-    if guild_settings:
-        if "role" in guild_settings["staff_management"].keys():
-            if guild_settings["staff_management"]["role"] != "":
-                if isinstance(guild_settings["staff_management"]["role"], list):
-                    for role in guild_settings["staff_management"]["role"]:
-                        if role in [role.id for role in member.roles]:
-                            return True
-                elif isinstance(guild_settings["staff_management"]["role"], int):
-                    if guild_settings["staff_management"]["role"] in [
-                        role.id for role in member.roles
-                    ]:
-                        return True
-    if (
-        member.guild_permissions.manage_messages
-        or member.guild_permissions.administrator
-    ):
-        return True
-    return False
+    return (await bot_obj.permission_resolver.permissions(guild, member)).staff
 
 
 async def admin_check(bot_obj, guild, member):
-    guild_settings = await bot_obj.settings.find_by_id(guild.id)
-    if guild_settings:
-        if "admin_role" in guild_settings["staff_management"].keys():
-            if guild_settings["staff_management"]["admin_role"] != "":
-                if isinstance(guild_settings["staff_management"]["admin_role"], list):
-                    for role in guild_settings["staff_management"]["admin_role"]:
-                        if role in [role.id for role in member.roles]:
-                            return True
-                elif isinstance(guild_settings["staff_management"]["admin_role"], int):
-                    if guild_settings["staff_management"]["admin_role"] in [
-                        role.id for role in member.roles
-                    ]:
-                        return True
-        if "management_role" in guild_settings["staff_management"].keys():
-            if guild_settings["staff_management"]["management_role"] != "":
-                if isinstance(
-                    guild_settings["staff_management"]["management_role"], list
-                ):
-                    for role in guild_settings["staff_management"]["management_role"]:
-                        if role in [role.id for role in member.roles]:
-                            return True
-                elif isinstance(
-                    guild_settings["staff_management"]["management_role"], int
-                ):
-                    if guild_settings["staff_management"]["management_role"] in [
-                        role.id for role in member.roles
-                    ]:
-                        return True
-    if member.guild_permissions.administrator:
-        return True
-    return False
+    return (await bot_obj.permission_resolver.permissions(guild, member)).admin
 
     
 
@@ -220,158 +173,53 @@ def require_settings():
     return commands.check(predicate)
 
 
-async def update_ics(bot, ctx, channel, return_val: dict, ics_id: int):
-    try:
-        status: ServerStatus = await bot.prc_api.get_server_status(ctx.guild.id)
-    except prc_api.ResponseFailure:
-        status = None
-    if not isinstance(status, ServerStatus):
-        return return_val  # Invalid key
-
-    try:
-        queue: int = await bot.prc_api.get_server_queue(ctx.guild.id, minimal=True)
-        players: list[Player] = await bot.prc_api.get_server_players(ctx.guild.id)
-    except prc_api.ResponseFailure:
-        return return_val  # fuck knows why
-    mods: int = len(list(filter(lambda x: x.permission == "Server Moderator", players)))
-    admins: int = len(
-        list(filter(lambda x: x.permission == "Server Administrator", players))
-    )
-    total_staff: int = len(list(filter(lambda x: x.permission != "Normal", players)))
-
+async def store_ics_data(bot, guild_id: int, ics_id: int, data: dict):
     if await bot.ics.db.count_documents({"_id": ics_id}):
         await bot.ics.db.update_one(
-            {"_id": ics_id, "guild": ctx.guild.id},
-            {
-                "$set": {
-                    "data": {
-                        "join_code": status.join_key,
-                        "players": status.current_players,
-                        "max_players": status.max_players,
-                        "queue": queue,
-                        "staff": total_staff,
-                        "admins": admins,
-                        "mods": mods,
-                    }
-                }
-            },
+            {"_id": ics_id, "guild": guild_id},
+            {"$set": {"data": data}},
         )
     else:
         await bot.ics.insert(
             {
                 "_id": ics_id,
-                "guild": ctx.guild.id,
-                "data": {
-                    "join_code": status.join_key,
-                    "players": status.current_players,
-                    "max_players": status.max_players,
-                    "queue": queue,
-                    "staff": total_staff,
-                    "admins": admins,
-                    "mods": mods,
-                },
+                "guild": guild_id,
+                "data": data,
                 "associated_messages": [],
             }
         )
 
-    return return_val
 
+async def update_ics(bot, ctx, channel, return_val, ics_id: int, renderer=None):
+    renderer = renderer or TemplateRenderer(bot, ctx, channel)
+    if ics_id in renderer.stored_ics:
+        return return_val
+    data = await renderer.erlc()
+    if data is None:
+        return return_val  # No key, or the server couldn't be reached
 
-async def interpret_embed(bot, ctx, channel, embed: dict, ics_id: int):
-    embed = discord.Embed.from_dict(embed)
-    try:
-        embed.title = await sub_vars(bot, ctx, channel, embed.title)
-    except AttributeError:
-        pass
+    await store_ics_data(bot, ctx.guild.id, ics_id, data)
+    renderer.stored_ics.add(ics_id)
+    return return_val
 
-    if str(var := await sub_vars(bot, ctx, channel, embed.author.name)) != "None":
-        try:
-            embed.set_author(name=await sub_vars(bot, ctx, channel, embed.author.name))
-        except AttributeError:
-            pass
-    try:
-        embed.description = await sub_vars(bot, ctx, channel, embed.description)
-    except AttributeError:
-        pass
-    try:
-        embed.set_footer(
-            text=await sub_vars(bot, ctx, channel, embed.footer.text),
-            icon_url=embed.footer.icon_url,
-        )
-    except AttributeError:
-        pass
-    for index, i in enumerate(embed.fields):
-        embed.set_field_at(
-            index,
-            name=await sub_vars(bot, ctx, channel, i.name),
-            value=await sub_vars(bot, ctx, channel, i.value),
-        )
 
-    if await bot.server_keys.db.count_documents({"_id": ctx.guild.id}) == 0:
+async def interpret_embed(bot, ctx, channel, embed: dict, ics_id: int, renderer=None):
+    renderer = renderer or TemplateRenderer(bot, ctx, channel)
+    embed = await renderer.render_embed(embed)
+    if not await renderer.has_server_key():
         return embed
 
-    return await update_ics(bot, ctx, channel, embed, ics_id)
+    return await update_ics(bot, ctx, channel, embed, ics_id, renderer=renderer)
 
 
-async def interpret_content(bot, ctx, channel, content: str, ics_id):
-    await update_ics(bot, ctx, channel, content, ics_id)
-    return await sub_vars(bot, ctx, channel, content)
+async def interpret_content(bot, ctx, channel, content: str, ics_id, renderer=None):
+    renderer = renderer or TemplateRenderer(bot, ctx, channel)
+    await update_ics(bot, ctx, channel, content, ics_id, renderer=renderer)
+    return await renderer.render(content)
 
 
 async def sub_vars(bot, ctx: commands.Context, channel, string, **kwargs):
-    try:
-        string = string.replace("{user}", ctx.author.mention)
-        string = string.replace("{username}", ctx.author.name)
-        string = string.replace("{display_name}", ctx.author.display_name)
-        string = string.replace(
-            "{time}", f"<t:{int(datetime.datetime.now().timestamp())}>"
-        )
-        string = string.replace("{server}", ctx.guild.name)
-        string = string.replace("{channel}", channel.mention)
-        string = string.replace("{prefix}", list(await get_prefix(bot, ctx))[-1])
-
-        onduty: int = len(
-            [
-                i
-                async for i in bot.shift_management.shifts.db.find(
-                    {"Guild": ctx.guild.id, "EndEpoch": 0}
-                )
-            ]
-        )
-
-        string = string.replace("{onduty}", str(onduty))
-
-        #### CUSTOM ER:LC VARS
-        # Fetch whether they should even be allowed to use ER:LC vars
-        if await bot.server_keys.db.count_documents({"_id": ctx.guild.id}) == 0:
-            return string  # end here no point
-
-        status: ServerStatus = await bot.prc_api.get_server_status(ctx.guild.id)
-        if not isinstance(status, ServerStatus):
-            return string  # Invalid key
-        queue: int = await bot.prc_api.get_server_queue(ctx.guild.id, minimal=True)
-        players: list[Player] = await bot.prc_api.get_server_players(ctx.guild.id)
-        mods: int = len(
-            list(filter(lambda x: x.permission == "Server Moderator", players))
-        )
-        admins: int = len(
-            list(filter(lambda x: x.permission == "Server Administrator", players))
-        )
-        total_staff: int = len(
-            list(filter(lambda x: x.permission != "Normal", players))
-        )
-
-        string = string.replace("{join_code}", status.join_key)
-        string = string.replace("{players}", str(status.current_players))
-        string = string.replace("{max_players}", str(status.max_players))
-        string = string.replace("{queue}", str(queue))
-        string = string.replace("{staff}", str(total_staff))
-        string = string.replace("{admins}", str(admins))
-        string = string.replace("{mods}", str(mods))
-
-        return string
-    except:
-        return string
+    return await TemplateRenderer(bot, ctx, channel).render(string)
 
 
 def get_elapsed_time(document):
@@ -457,7 +305,7 @@ async def new_failure_embed(
 
 async def get_player_avatar_url(player_id):
     url = f"https://thumbnails.roblox.com/v1/users/avatar?userIds={player_id}&size=180x180&format=Png&isCircular=false"
-    async with aiohttp.ClientSession() as session:
+    async with aiohttp.ClientSession(trace_configs=[http_trace("roblox")]) as session:
         async with session.get(url) as response:
             data = await response.json()
             return data["data"][0]["imageUrl"]
@@ -479,24 +327,6 @@ async def run_command(bot, guild_id, username, message):
             break
 
 
-def is_whitelisted(vehicle_name, whitelisted_vehicle):
-    vehicle_year_match = re.search(r"\d{4}$", vehicle_name)
-    whitelisted_year_match = re.search(r"\d{4}$", whitelisted_vehicle)
-    if vehicle_year_match and whitelisted_year_match:
-        vehicle_year = vehicle_year_match.group()
-        whitelisted_year = whitelisted_year_match.group()
-        if vehicle_year != whitelisted_year:
-            return False
-        vehicle_name_base = vehicle_name[: vehicle_year_match.start()].strip()
-        whitelisted_vehicle_base = whitelisted_vehicle[
-            : whitelisted_year_match.start()
-        ].strip()
-        return (
-            fuzz.ratio(vehicle_name_base.lower(), whitelisted_vehicle_base.lower()) > 80
-        )
-    return False
-
-
 async def int_failure_embed(interaction, content, **kwargs):
     try:
         await interaction.response.send_message(
@@ -0,0 +1,69 @@
+import collections
+import re
+
+_YEAR_PATTERN = re.compile(r"\b(19|20)\d{2}\b")
+
+
+def normalize_vehicle_name(name: str) -> tuple[str, str | None]:
+    """
+    Splits a vehicle name into its lowercased base name and its model year,
+    if it has one.
+    """
+    name = name.lower().strip()
+    year = None
+    if year_match := _YEAR_PATTERN.search(name):
+        year = year_match.group(0)
+        name = name.replace(year, "")
+    return " ".join(name.split()), year
+
+
+class VehicleWhitelist:
+    """
+    A guild's whitelisted vehicles, compiled for lookups.
+
+    Base names map to the set of whitelisted years (None meaning any year),
+    so a check is one dictionary lookup. Results are memoised, as the same
+    vehicles show up on a server sweep after sweep.
+    """
+
+    def __init__(self, vehicles: list):
+        self.years: dict[str, set[str | None]] = collections.defaultdict(set)
+        for vehicle in vehicles:
+            name, year = normalize_vehicle_name(str(vehicle))
+            self.years[name].add(year)
+        self.years = dict(self.years)
+        self._results: dict[str, bool] = {}
+
+    def __len__(self):
+        return len(self.years)
+
+    def _year_matches(self, name: str, year: str | None) -> bool:
+        years = self.years[name]
+        return year is None or None in years or year in years
+
+    def matches(self, vehicle_name: str) -> bool:
+        if (result := self._results.get(vehicle_name)) is not None:
+            return result
+
+        name, year = normalize_vehicle_name(vehicle_name)
+        result = name in self.years and self._year_matches(name, year)
+
+        if len(self._results) >= 4096:
+            self._results.clear()
+        self._results[vehicle_name] = result
+        return result
+
+
+_compiled: dict[int, tuple[tuple, VehicleWhitelist]] = {}
+
+
+def get_vehicle_whitelist(guild_id: int, vehicles: list) -> VehicleWhitelist:
+    """
+    The compiled whitelist of a guild, recompiled only when its list of
+    vehicles changes.
+    """
+    version = tuple(str(vehicle) for vehicle in vehicles)
+    cached = _compiled.get(guild_id)
+    if cached is None or cached[0] != version:
+        cached = _compiled[guild_id] = (version, VehicleWhitelist(vehicles))
+    return cached[1]
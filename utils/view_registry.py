@@ -0,0 +1,82 @@
+"""
+Lazy lookup of views by name.
+
+Views live in per-feature modules under `ui`, and most of the places that
+need a view only need one or two of them, long after startup. Looking views
+up here instead of importing them at module level defers importing a
+feature's views until one is first used, which keeps them out of the import
+path of the bot core, the cogs, the internal API and the background tasks.
+"""
+
+import importlib
+
+# View name -> module which defines it.
+VIEW_MODULES = {
+    "AccountLinkingMenu": "ui.OAuth2",
+    "AcknowledgeMenu": "ui.StaffConduct",
+    "AcknowledgeStaffRequest": "ui.StaffRequests",
+    "ActivityNoticeAdministration": "ui.ActivityNotices",
+    "ActivityNoticeManagement": "ui.Configuration",
+    "AdministratedShiftMenu": "ui.Shifts",
+    "AntipingConfiguration": "ui.Configuration",
+    "APIKeyConfirmation": "ui.Utility",
+    "AvatarCheckView": "ui.ERLC",
+    "BasicConfiguration": "ui.Configuration",
+    "ChannelSelect": "ui.Common",
+    "CompleteReminder": "ui.Reminders",
+    "CounterButton": "ui.Common",
+    "CustomCommandModification": "ui.CustomCommands",
+    "CustomCommandOptionSelect": "ui.CustomCommands",
+    "CustomExecutionButton": "ui.Common",
+    "CustomModal": "ui.Common",
+    "CustomModalView": "ui.Common",
+    "CustomSelectMenu": "ui.Common",
+    "EmbedCustomisation": "ui.Common",
+    "ERLCIntegrationConfiguration": "ui.Configuration",
+    "ERMCommandLog": "ui.Configuration",
+    "ExpandedRoleSelect": "ui.StaffConduct",
+    "GameLoggingConfiguration": "ui.Configuration",
+    "GameSecurityActions": "ui.GameSecurity",
+    "GameSecurityConfiguration": "ui.Configuration",
+    "LinkView": "ui.Utility",
+    "LOAConfiguration": "ui.Configuration",
+    "LOAMenu": "ui.ActivityNotices",
+    "ManageActions": "ui.Actions",
+    "ManagementOptions": "ui.Punishments",
+    "ManageReminders": "ui.Reminders",
+    "ManageTypesView": "ui.Punishments",
+    "MapleCountyConfiguration": "ui.MapleCounty",
+    "MessageCustomisation": "ui.Common",
+    "NextView": "ui.Configuration",
+    "PriorityRequestConfiguration": "ui.Configuration",
+    "PunishmentManagement": "ui.Configuration",
+    "PunishmentModifier": "ui.Punishments",
+    "PunishmentsConfiguration": "ui.Configuration",
+    "PunishmentTypeCreator": "ui.Punishments",
+    "RAConfiguration": "ui.Configuration",
+    "RefreshConfirmation": "ui.ERLC",
+    "ReloadView": "ui.ERLC",
+    "ReminderCreationToolkit": "ui.Reminders",
+    "RequestGoogleSpreadsheet": "ui.Shifts",
+    "RoleSelect": "ui.Common",
+    "ShiftConfiguration": "ui.Configuration",
+    "ShiftLoggingManagement": "ui.Configuration",
+    "ShiftMenu": "ui.Shifts",
+    "UserSelect": "ui.Common",
+    "ViewVotersButton": "ui.Common",
+    "YesNoColourMenu": "ui.Common",
+    "YesNoExpandedMenu": "ui.StaffConduct",
+    "YesNoMenu": "ui.Common",
+}
+
+_resolved: dict[str, type] = {}
+
+
+def get_view(name: str) -> type:
+    if (view := _resolved.get(name)) is None:
+        try:
+            module = VIEW_MODULES[name]
+        except KeyError:
+            raise KeyError(f"Unknown view: {name}") from None
+        view = _resolved[name] = getattr(importlib.import_module(module), name)
+    return view
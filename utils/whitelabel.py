@@ -0,0 +1,107 @@
+import asyncio
+import base64
+import binascii
+import logging
+import time
+
+from pymongo.errors import PyMongoError
+
+logger = logging.getLogger(__name__)
+
+
+class WhitelabelCache:
+    """
+    In-memory view of the whitelabel `Instances` collection, keyed by guild ID.
+
+    The collection is loaded once at startup and then kept fresh through a
+    change stream. Deployments without change stream support (standalone
+    MongoDB) fall back to polling every `refresh_interval` seconds.
+    """
+
+    def __init__(self, bot, refresh_interval: int = 30):
+        self.bot = bot
+        self.refresh_interval = refresh_interval
+        self.instances: dict[int, dict] = {}
+        self.bot_ids: dict[int, int] = {}
+        self.last_refreshed: float = 0
+        self.last_refresh_lag: float = 0
+        self._task: asyncio.Task | None = None
+        self.polling = False
+
+    def get(self, guild_id: int) -> dict | None:
+        return self.instances.get(guild_id)
+
+    def __contains__(self, guild_id: int) -> bool:
+        return guild_id in self.instances
+
+    def get_bot_id(self, guild_id: int) -> int | None:
+        """
+        Returns the user ID of the whitelabel bot for a guild, decoded from
+        the first segment of the instance's bot token.
+        """
+        return self.bot_ids.get(guild_id)
+
+    @property
+    def refresh_lag(self) -> float:
+        """
+        How stale the cache may be, in seconds. With a change stream this is
+        the delay between the last write and it being applied here; when
+        polling it is the time since the last successful poll.
+        """
+        if self.polling:
+            return time.time() - self.last_refreshed
+        return self.last_refresh_lag
+
+    async def load(self):
+        instances = {}
+        bot_ids = {}
+        async for document in self.bot.whitelabel.db.find({}):
+            try:
+                guild_id = int(document["GuildID"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            instances[guild_id] = document
+            try:
+                b64_userid = (document.get("Token") or "").split(".")[0]
+                bot_ids[guild_id] = int(base64.b64decode(b64_userid + "==").decode("utf-8"))
+            except (binascii.Error, UnicodeDecodeError, ValueError):
+                pass
+        self.instances = instances
+        self.bot_ids = bot_ids
+        self.last_refreshed = time.time()
+
+    async def start(self):
+        await self.load()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._watch())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+
+    async def _watch(self):
+        try:
+            async with self.bot.whitelabel.db.watch() as stream:
+                async for change in stream:
+                    # Delete events only carry the document key, and the
+                    # collection is small, so a full reload is the simplest
+                    # way to stay consistent.
+                    await self.load()
+                    if (cluster_time := change.get("clusterTime")) is not None:
+                        self.last_refresh_lag = max(
+                            0, self.last_refreshed - cluster_time.time
+                        )
+                        logger.debug(
+                            f"Whitelabel cache refreshed, lag {self.last_refresh_lag:.2f}s"
+                        )
+        except PyMongoError as e:
+            logger.info(f"Whitelabel change stream unavailable, polling instead: {e}")
+
+        self.polling = True
+
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.load()
+            except PyMongoError as e:
+                logger.warning(f"Failed to refresh whitelabel instances: {e}")